@@ -0,0 +1,102 @@
+"""
+Per-device new-advert notification.
+
+Fingerprint training used to poll: the training button slept a fixed poll
+interval, then asked the coordinator to rescan the device's adverts and
+compare their stamps against the previous sample. Devices advertise every
+1-10 seconds, so most polls found nothing new, and each training session
+was its own polling loop.
+
+AdvertWaiters lets a coroutine await the next genuinely new advert (a stamp
+change, not a cached advert re-fed to the coordinator) from any of a set of
+addresses. The coordinator notifies the address as it ingests the advert,
+so a waiter resumes on the first coordinator cycle that has new data and
+several devices can train at once without any polling tasks. Addresses
+nobody waits for cost one dict lookup per advert.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class AdvertWaiters:
+    """
+    Futures waiting for a new advert, keyed by device address.
+
+    Attributes
+    ----------
+        notified: Waits woken by a new advert (diagnostics).
+        timed_out: Waits that ended without one (diagnostics).
+
+    """
+
+    __slots__ = ("_waiters", "notified", "timed_out")
+
+    def __init__(self) -> None:
+        """Initialise with nobody waiting."""
+        # address -> futures waiting on it. A wait on several addresses
+        # registers the same future under each.
+        self._waiters: dict[str, set[asyncio.Future[None]]] = {}
+        self.notified: int = 0
+        self.timed_out: int = 0
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if anything waits for adverts from address."""
+        return address in self._waiters
+
+    def notify(self, address: str) -> None:
+        """Wake everything waiting on address."""
+        futures = self._waiters.pop(address, None)
+        if futures is None:
+            return
+        for future in futures:
+            if not future.done():
+                future.set_result(None)
+                self.notified += 1
+
+    async def wait(self, addresses: Iterable[str], wait_seconds: float) -> bool:
+        """
+        Wait for a new advert from any of addresses.
+
+        Args:
+        ----
+            addresses: Device addresses to wait on (a device and its metadevice sources).
+            wait_seconds: Seconds to wait at most.
+
+        Returns:
+        -------
+            True if a new advert arrived, False on timeout.
+
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        addresses = list(addresses)
+        waiters = self._waiters
+        for address in addresses:
+            waiters.setdefault(address, set()).add(future)
+        try:
+            async with asyncio.timeout(wait_seconds):
+                await future
+        except TimeoutError:
+            self.timed_out += 1
+            return False
+        finally:
+            for address in addresses:
+                futures = waiters.get(address)
+                if futures is not None:
+                    futures.discard(future)
+                    if not futures:
+                        del waiters[address]
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise waiting activity for diagnostics."""
+        return {
+            "addresses": len(self._waiters),
+            "notified": self.notified,
+            "timed_out": self.timed_out,
+        }
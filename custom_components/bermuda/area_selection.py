@@ -10,6 +10,7 @@ This module contains all area/room selection algorithms including:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import statistics
@@ -21,6 +22,7 @@ from bluetooth_data_tools import monotonic_time_coarse
 from .area_selection_helpers import AdvertAnalyzer
 from .const import (
     ABSOLUTE_Z_SCORE_MAX,
+    AREA_DIAGNOSTICS_HOLD_SECONDS,
     AREA_MAX_AD_AGE_DEFAULT,
     AREA_MAX_AD_AGE_LIMIT,
     AUTO_LEARNING_MAX_RSSI_VARIANCE,
@@ -110,6 +112,7 @@ from .const import (
 )
 from .correlation import AreaProfile, AutoLearningStats, RoomProfile, z_scores_to_confidence
 from .filters import UnscentedKalmanFilter
+from .scanner_topology import ScannerTopology
 
 if TYPE_CHECKING:
     from homeassistant.helpers.area_registry import AreaRegistry
@@ -478,8 +481,19 @@ class AreaSelectionHandler:
         self._scanner_status: dict[str, ScannerOnlineStatus] = {}
         # Per-cycle cache of offline scanner addresses (computed once, used 4x per device)
         self._cycle_offline_addrs: frozenset[str] = frozenset()
+        # Precomputed area/floor/scanner lookups, invalidated by the coordinator
+        # on registry events and scanner list changes.
+        self.topology = ScannerTopology()
         # Reference tracker diagnostic data (last aggregation results)
         self._last_ref_tracker_aggregation: dict[str, tuple[float, str | None, dict[str, float], dict[str, float]]] = {}
+        # AreaTests capture opt-in: addresses with an enabled area switch reason
+        # sensor, and a deadline for capturing all devices after a diagnostics dump.
+        self._diagnostic_devices: set[str] = set()
+        self._diagnostics_until: float = 0.0
+        # Whether the last refresh captured AreaTests for every device, and
+        # dump_devices calls waiting for a refresh that does.
+        self._captured_all_diagnostics: bool = False
+        self._diagnostics_waiters: list[asyncio.Future[None]] = []
 
     # =========================================================================
     # Property accessors for coordinator state
@@ -524,6 +538,86 @@ class AreaSelectionHandler:
     # Diagnostic methods
     # =========================================================================
 
+    def enable_diagnostics(self, address: str) -> None:
+        """Capture full AreaTests for a device (its area switch reason sensor is enabled)."""
+        self._diagnostic_devices.add(address)
+
+    def disable_diagnostics(self, address: str) -> None:
+        """Stop capturing full AreaTests for a device unless requested otherwise."""
+        self._diagnostic_devices.discard(address)
+
+    def request_diagnostics(self, duration: float = AREA_DIAGNOSTICS_HOLD_SECONDS) -> None:
+        """Capture full AreaTests for every device for the next duration seconds."""
+        self._diagnostics_until = max(self._diagnostics_until, monotonic_time_coarse() + duration)
+
+    async def async_capture_diagnostics(self, wait_seconds: float) -> bool:
+        """
+        Capture full AreaTests for every device and wait until a refresh has them.
+
+        Args:
+        ----
+            wait_seconds: Seconds to wait for the next area refresh at most.
+
+        Returns:
+        -------
+            True if the latest refresh captured AreaTests for every device.
+
+        """
+        self.request_diagnostics()
+        if self._captured_all_diagnostics:
+            return True
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._diagnostics_waiters.append(future)
+        try:
+            async with asyncio.timeout(wait_seconds):
+                await future
+        except TimeoutError:
+            return False
+        finally:
+            if future in self._diagnostics_waiters:
+                self._diagnostics_waiters.remove(future)
+        return True
+
+    def _wants_diagnostics(self, device: BermudaDevice, nowstamp: float) -> bool:
+        """
+        Return True if this cycle should build AreaTests for the device.
+
+        Building them costs a dataclass and several formatted strings per device
+        per cycle, and nothing reads them unless the device's area switch reason
+        sensor is enabled, a diagnostics dump was requested recently, or debug
+        logging is on.
+        """
+        return (
+            device.address in self._diagnostic_devices
+            or nowstamp < self._diagnostics_until
+            or _LOGGER.isEnabledFor(logging.DEBUG)
+        )
+
+    @staticmethod
+    def _record_area_decision(
+        device: BermudaDevice, decision: str, tests: AreaTests | None, *, keep_tests: bool = False
+    ) -> None:
+        """
+        Record the outcome of an area selection on the device.
+
+        Args:
+        ----
+            device: The device the decision was made for.
+            decision: Cheap decision code ("<PATH>:<outcome>"), always recorded.
+            tests: Captured diagnostics, or None when nobody will read them.
+            keep_tests: Also expose tests via device.area_tests (UKF path).
+
+        """
+        device.area_decision = decision
+        if tests is None:
+            device.diag_area_switch = None
+            if keep_tests:
+                device.area_tests = None
+            return
+        device.diag_area_switch = tests.sensortext()
+        if keep_tests:
+            device.area_tests = tests
+
     def get_auto_learning_diagnostics(self) -> dict[str, Any]:
         """
         Get diagnostic information about auto-learning.
@@ -582,16 +676,15 @@ class AreaSelectionHandler:
         scanner is online and functional. By checking adverts from ALL tracked
         devices, a scanner is considered online as long as it sees ANY device.
 
+        The per-scanner maximum is kept as a high-water mark at advert ingest
+        (coordinator.freshness), so this is O(scanners) rather than a walk over
+        every advert.
+
         Uses SCANNER_ALGO_TIMEOUT (120s), not SCANNER_ACTIVITY_TIMEOUT (30s).
         """
-        # Collect latest advert timestamp per scanner across ALL devices
-        scanner_latest: dict[str, float] = {}
-        for device in self.devices.values():
-            for advert in device.adverts.values():
-                if advert.scanner_address is not None and advert.stamp is not None:
-                    prev = scanner_latest.get(advert.scanner_address, 0.0)
-                    if advert.stamp > prev:
-                        scanner_latest[advert.scanner_address] = advert.stamp
+        if not self._scanners:
+            return
+        scanner_latest = self.coordinator.freshness.scanner_stamps
 
         # Update status for each registered scanner
         for scanner in self._scanners:
@@ -770,19 +863,21 @@ class AreaSelectionHandler:
     # Registry helper functions (access ar, _scanners)
     # =========================================================================
 
+    def _get_topology(self) -> ScannerTopology:
+        """Return the scanner topology index, rebuilding it first if stale."""
+        return self.topology.ensure(self._scanners, self.ar)
+
     def _resolve_floor_id_for_area(self, area_id: str | None) -> str | None:
         """
         Resolve floor_id for an area_id using the Home Assistant area registry.
 
         This is essential for scannerless rooms where we can't get floor_id from
-        a scanner_device - we must look up the area directly.
+        a scanner_device - we must look up the area directly. Served from the
+        topology index, so repeated calls are dict reads.
         """
-        if area_id is None or self.ar is None:
+        if area_id is None:
             return None
-        area = self.ar.async_get_area(area_id)
-        if area is not None:
-            return getattr(area, "floor_id", None)
-        return None
+        return self._get_topology().floor_id_for_area(area_id, self.ar)
 
     def _area_has_scanner(self, area_id: str) -> bool:
         """
@@ -797,7 +892,7 @@ class AreaSelectionHandler:
             True if the area contains at least one scanner device.
 
         """
-        return any(scanner.area_id == area_id for scanner in self._scanners)
+        return self._get_topology().area_has_scanner(area_id)
 
     def _area_has_active_scanner(self, area_id: str, nowstamp: float) -> bool:
         """
@@ -827,20 +922,19 @@ class AreaSelectionHandler:
             seen within SCANNER_ACTIVITY_TIMEOUT (30 seconds).
 
         """
-        for scanner in self._scanners:
-            if scanner.area_id == area_id:
-                # Check if this scanner is active (has recent data)
-                scanner_last_seen = getattr(scanner, "last_seen", None)
-                # NOTE: last_seen defaults to 0 for new scanners, so we must check
-                # that it's > 0 to ensure the scanner has actually reported data.
-                # Otherwise, during startup (nowstamp < 30s) or for newly-registered
-                # scanners, we'd incorrectly treat them as "active".
-                if (
-                    scanner_last_seen is not None
-                    and scanner_last_seen > 0
-                    and nowstamp - scanner_last_seen < SCANNER_ACTIVITY_TIMEOUT
-                ):
-                    return True
+        for scanner in self._get_topology().scanners_in_area(area_id):
+            # Check if this scanner is active (has recent data)
+            scanner_last_seen = getattr(scanner, "last_seen", None)
+            # NOTE: last_seen defaults to 0 for new scanners, so we must check
+            # that it's > 0 to ensure the scanner has actually reported data.
+            # Otherwise, during startup (nowstamp < 30s) or for newly-registered
+            # scanners, we'd incorrectly treat them as "active".
+            if (
+                scanner_last_seen is not None
+                and scanner_last_seen > 0
+                and nowstamp - scanner_last_seen < SCANNER_ACTIVITY_TIMEOUT
+            ):
+                return True
         return False
 
     def resolve_area_name(self, area_id: str | None) -> str | None:
@@ -850,13 +944,9 @@ class AreaSelectionHandler:
         Will return None if the area id does *not* resolve to a single
         known area name.
         """
-        if area_id is None or self.ar is None:
+        if area_id is None:
             return None
-
-        areas = self.ar.async_get_area(area_id)
-        if hasattr(areas, "name"):
-            return getattr(areas, "name", "invalid_area")
-        return None
+        return self._get_topology().area_name(area_id, self.ar)
 
     def effective_distance(self, advert: BermudaAdvert | None, nowstamp: float) -> float | None:
         """
@@ -1622,6 +1712,9 @@ class AreaSelectionHandler:
         """Set area for ALL devices based on UKF+RoomProfile or min-distance fallback."""
         nowstamp = monotonic_time_coarse()
 
+        # Refresh the topology index once up front (no-op unless invalidated)
+        self._get_topology()
+
         # Phase 0: Update scanner online/offline status before processing devices.
         # This must run ONCE per cycle, before any device iteration, so all devices
         # see a consistent scanner status snapshot.
@@ -1643,6 +1736,13 @@ class AreaSelectionHandler:
         for device in self.devices.values():
             self._determine_area_for_device(device, has_mature_profiles=has_mature_profiles)
 
+        self._captured_all_diagnostics = nowstamp < self._diagnostics_until or _LOGGER.isEnabledFor(logging.DEBUG)
+        if self._captured_all_diagnostics and self._diagnostics_waiters:
+            waiters, self._diagnostics_waiters = self._diagnostics_waiters, []
+            for future in waiters:
+                if not future.done():
+                    future.set_result(None)
+
     def _determine_area_for_device(self, device: BermudaDevice, *, has_mature_profiles: bool) -> None:
         """
         Determine and set the area for a single device.
@@ -1798,10 +1898,10 @@ class AreaSelectionHandler:
         """
         nowstamp = monotonic_time_coarse()
 
-        # Create AreaTests for diagnostic output
-        tests = AreaTests()
-        tests.device = device.name or device.address
-        tests.decision_path = "UKF"
+        # Create AreaTests for diagnostic output, only if anyone will read it
+        tests: AreaTests | None = None
+        if self._wants_diagnostics(device, nowstamp):
+            tests = AreaTests(device=device.name or device.address, decision_path="UKF")
 
         # Collect RSSI readings from all visible scanners
         rssi_readings: dict[str, float] = {}
@@ -1848,7 +1948,8 @@ class AreaSelectionHandler:
         )
 
         if len(rssi_readings) < UKF_MIN_SCANNERS and not can_retain_with_single_scanner:
-            tests.reason = f"SKIP - insufficient scanners ({len(rssi_readings)} < {UKF_MIN_SCANNERS})"
+            if tests is not None:
+                tests.reason = f"SKIP - insufficient scanners ({len(rssi_readings)} < {UKF_MIN_SCANNERS})"
             # Don't set device.area_tests here - let min_distance handle it
             return False
 
@@ -1886,17 +1987,17 @@ class AreaSelectionHandler:
                             device.apply_scanner_selection(device.area_advert, nowstamp=nowstamp)
 
                         # Populate AreaTests for single-scanner retention
-                        tests.ukf_retention_mode = True
-                        tests.areas = (current_area_id or "", current_area_id or "")
-                        tests.same_area = True
-                        tests.profile_has_button = area_profile.has_button_training if area_profile else False
-                        tests.profile_sample_count = area_profile.sample_count if area_profile else None
-                        tests.reason = (
-                            f"WIN - single-scanner retention "
-                            f"(RSSI {current_rssi:.0f} ≈ {expected_rssi:.0f}±{rssi_threshold:.0f})"
-                        )
-                        device.area_tests = tests
-                        device.diag_area_switch = tests.sensortext()
+                        if tests is not None:
+                            tests.ukf_retention_mode = True
+                            tests.areas = (current_area_id or "", current_area_id or "")
+                            tests.same_area = True
+                            tests.profile_has_button = area_profile.has_button_training if area_profile else False
+                            tests.profile_sample_count = area_profile.sample_count if area_profile else None
+                            tests.reason = (
+                                f"WIN - single-scanner retention "
+                                f"(RSSI {current_rssi:.0f} ≈ {expected_rssi:.0f}±{rssi_threshold:.0f})"
+                            )
+                        self._record_area_decision(device, "UKF:retain_single", tests, keep_tests=True)
                         return True
                     # RSSI doesn't match profile - fall back to min_distance
                     if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -1907,12 +2008,13 @@ class AreaSelectionHandler:
                             expected_rssi,
                             rssi_threshold,
                         )
-                    tests.reason = (
-                        f"REJECT - single-scanner RSSI mismatch "
-                        f"({current_rssi:.0f} vs {expected_rssi:.0f}±{rssi_threshold:.0f})"
-                    )
+                    if tests is not None:
+                        tests.reason = (
+                            f"REJECT - single-scanner RSSI mismatch "
+                            f"({current_rssi:.0f} vs {expected_rssi:.0f}±{rssi_threshold:.0f})"
+                        )
             # No usable profile - fall back to min_distance
-            if tests.reason is None:
+            if tests is not None and tests.reason is None:
                 tests.reason = "SKIP - no usable profile for single-scanner retention"
             return False
 
@@ -1930,7 +2032,8 @@ class AreaSelectionHandler:
 
         # Need either device profiles or room profiles
         if not device_profiles and not self.room_profiles:
-            tests.reason = "SKIP - no device or room profiles"
+            if tests is not None:
+                tests.reason = "SKIP - no device or room profiles"
             return False
 
         # Match against both device-specific and room-level fingerprints
@@ -1939,31 +2042,33 @@ class AreaSelectionHandler:
         matches = ukf.match_fingerprints(device_profiles, self.room_profiles, offline_addrs)
 
         # Populate offline diagnostics into AreaTests
-        if offline_addrs:
+        if tests is not None and offline_addrs:
             tests.offline_scanners_count = len(offline_addrs)
             tests.offline_scanner_addrs = ",".join(sorted(offline_addrs))
 
         if not matches:
-            tests.reason = "SKIP - no fingerprint matches"
+            if tests is not None:
+                tests.reason = "SKIP - no fingerprint matches"
             return False
 
         # Get best match (includes coverage_penalty computed by match_fingerprints)
         best_area_id, _d_squared, match_score, best_coverage_penalty = matches[0]
 
-        # Populate top candidates for diagnostics
-        tests.top_candidates = [
-            {"area": area_id, "score": round(score, 3), "type": "UKF"} for area_id, _, score, _ in matches[:5]
-        ]
+        if tests is not None:
+            # Populate top candidates for diagnostics
+            tests.top_candidates = [
+                {"area": area_id, "score": round(score, 3), "type": "UKF"} for area_id, _, score, _ in matches[:5]
+            ]
 
-        # Coverage penalty diagnostic — read directly from match_fingerprints result
-        if best_coverage_penalty > 0.0:
-            tests.coverage_penalty_applied = best_coverage_penalty
+            # Coverage penalty diagnostic — read directly from match_fingerprints result
+            if best_coverage_penalty > 0.0:
+                tests.coverage_penalty_applied = best_coverage_penalty
 
-        # Phase 3 diagnostic: Will auto-learning be blocked for the winning area?
-        if offline_addrs and best_area_id in device_profiles:
-            _trained_addrs = device_profiles[best_area_id].trained_scanner_addresses
-            if _trained_addrs & offline_addrs:
-                tests.auto_learning_blocked_offline = True
+            # Phase 3 diagnostic: Will auto-learning be blocked for the winning area?
+            if offline_addrs and best_area_id in device_profiles:
+                _trained_addrs = device_profiles[best_area_id].trained_scanner_addresses
+                if _trained_addrs & offline_addrs:
+                    tests.auto_learning_blocked_offline = True
 
         # FIX: Sticky Virtual Rooms - Apply stickiness bonus for current area
         # When the device is already in an area (especially a scannerless one),
@@ -1996,7 +2101,8 @@ class AreaSelectionHandler:
                     # Current area wins with stickiness bonus
                     best_area_id = current_area_id
                     effective_match_score = current_area_match_score
-                    tests.ukf_stickiness_applied = True
+                    if tests is not None:
+                        tests.ukf_stickiness_applied = True
                     if _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug(
                             "UKF stickiness for %s: keeping %s (score=%.2f+%.2f bonus) over challenger (score=%.2f)",
@@ -2017,10 +2123,11 @@ class AreaSelectionHandler:
         effective_threshold = UKF_RETENTION_THRESHOLD if is_retention else UKF_MIN_MATCH_SCORE
 
         # Populate UKF diagnostic fields
-        tests.ukf_match_score = match_score
-        tests.ukf_current_area_score = current_area_match_score
-        tests.ukf_retention_mode = is_retention
-        tests.ukf_threshold_used = effective_threshold
+        if tests is not None:
+            tests.ukf_match_score = match_score
+            tests.ukf_current_area_score = current_area_match_score
+            tests.ukf_retention_mode = is_retention
+            tests.ukf_threshold_used = effective_threshold
 
         if effective_match_score < effective_threshold:
             if is_retention:
@@ -2040,13 +2147,16 @@ class AreaSelectionHandler:
                     device.apply_scanner_selection(device.area_advert, nowstamp=nowstamp)
 
                 # Populate AreaTests for low-score retention
-                tests.areas = (current_area_id or "", current_area_id or "")
-                tests.same_area = True
-                tests.reason = f"WIN - low-score retention ({effective_match_score:.2f} < {effective_threshold:.2f})"
-                device.area_tests = tests
-                device.diag_area_switch = tests.sensortext()
+                if tests is not None:
+                    tests.areas = (current_area_id or "", current_area_id or "")
+                    tests.same_area = True
+                    tests.reason = (
+                        f"WIN - low-score retention ({effective_match_score:.2f} < {effective_threshold:.2f})"
+                    )
+                self._record_area_decision(device, "UKF:retain_low_score", tests, keep_tests=True)
                 return True
-            tests.reason = f"REJECT - score too low ({effective_match_score:.2f} < {effective_threshold:.2f})"
+            if tests is not None:
+                tests.reason = f"REJECT - score too low ({effective_match_score:.2f} < {effective_threshold:.2f})"
             return False
 
         # Find the advert corresponding to the best area
@@ -2096,7 +2206,8 @@ class AreaSelectionHandler:
                         best_area_id,
                         device.name,
                     )
-                tests.reason = f"REJECT - scanner in {self.resolve_area_name(best_area_id)} doesn't see device"
+                if tests is not None:
+                    tests.reason = f"REJECT - scanner in {self.resolve_area_name(best_area_id)} doesn't see device"
                 return False
 
             # True scannerless room: UKF matched an area with no registered scanner.
@@ -2113,11 +2224,13 @@ class AreaSelectionHandler:
                     best_advert = advert
 
             if best_advert is None:
-                tests.reason = "REJECT - no advert available for scannerless room"
+                if tests is not None:
+                    tests.reason = "REJECT - no advert available for scannerless room"
                 return False
 
             scanner_less_room = True
-            tests.is_scannerless_room = True
+            if tests is not None:
+                tests.is_scannerless_room = True
 
             # BUG 21 FIX: TOPOLOGICAL SANITY CHECK FOR SCANNERLESS ROOMS
             # When UKF picks a scannerless room on floor X, at least ONE scanner on floor X
@@ -2151,7 +2264,8 @@ class AreaSelectionHandler:
                             scanner_on_target_floor_sees_device = True
                             break
 
-                tests.passed_topological_check = scanner_on_target_floor_sees_device
+                if tests is not None:
+                    tests.passed_topological_check = scanner_on_target_floor_sees_device
 
                 if not scanner_on_target_floor_sees_device:
                     # UKF picked a scannerless room on a floor where NO scanner sees
@@ -2165,7 +2279,8 @@ class AreaSelectionHandler:
                             best_area_id,
                             target_area_floor_id,
                         )
-                    tests.reason = f"REJECT - topological check (no scanner on floor {target_area_floor_id})"
+                    if tests is not None:
+                        tests.reason = f"REJECT - topological check (no scanner on floor {target_area_floor_id})"
                     return False
 
         # Track whether current area is scannerless (for stickiness in future cycles)
@@ -2199,7 +2314,8 @@ class AreaSelectionHandler:
                 and strongest_visible_rssi > RSSI_INVALID_SENTINEL
                 and strongest_visible_rssi - best_advert_rssi > UKF_RSSI_SANITY_MARGIN
             )
-            tests.passed_rssi_sanity = not rssi_sanity_failed
+            if tests is not None:
+                tests.passed_rssi_sanity = not rssi_sanity_failed
 
             if rssi_sanity_failed:
                 # Low confidence UKF picked a room with weak signal - suspicious
@@ -2214,7 +2330,8 @@ class AreaSelectionHandler:
                         best_advert_rssi,
                         rssi_diff,
                     )
-                tests.reason = f"REJECT - RSSI sanity (score {effective_match_score:.2f}, diff {rssi_diff:.0f}dB)"
+                if tests is not None:
+                    tests.reason = f"REJECT - RSSI sanity (score {effective_match_score:.2f}, diff {rssi_diff:.0f}dB)"
                 return False
 
         # DISTANCE-BASED SANITY CHECK (BUG 14):
@@ -2246,7 +2363,7 @@ class AreaSelectionHandler:
                     nearest_scanner_floor_id = getattr(advert.scanner_device, "floor_id", None)
 
         # Populate proximity info for diagnostics
-        if nearest_scanner_distance < DISTANCE_INFINITE_SENTINEL:
+        if tests is not None and nearest_scanner_distance < DISTANCE_INFINITE_SENTINEL:
             tests.nearest_scanner_distance = nearest_scanner_distance
             tests.nearest_scanner_area = (
                 self.resolve_area_name(nearest_scanner_area_id) if nearest_scanner_area_id else None
@@ -2269,7 +2386,8 @@ class AreaSelectionHandler:
             if is_cross_floor_ukf:
                 # UKF picked a room on a DIFFERENT floor while device is <2m from a scanner.
                 # This is almost certainly wrong - fall back to min-distance.
-                tests.passed_proximity_check = False
+                if tests is not None:
+                    tests.passed_proximity_check = False
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         "UKF distance sanity check FAILED for %s: Device is %.1fm from scanner "
@@ -2281,12 +2399,14 @@ class AreaSelectionHandler:
                         best_area_id,
                         ukf_floor_id,
                     )
-                tests.reason = f"REJECT - proximity cross-floor ({nearest_scanner_distance:.1f}m)"
+                if tests is not None:
+                    tests.reason = f"REJECT - proximity cross-floor ({nearest_scanner_distance:.1f}m)"
                 return False
 
             # Same floor but different room while very close - allow only with very high confidence
             if effective_match_score < UKF_HIGH_CONFIDENCE_OVERRIDE:
-                tests.passed_proximity_check = False
+                if tests is not None:
+                    tests.passed_proximity_check = False
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         "UKF distance sanity check FAILED for %s: Device is %.1fm from scanner "
@@ -2298,14 +2418,17 @@ class AreaSelectionHandler:
                         effective_match_score,
                         UKF_HIGH_CONFIDENCE_OVERRIDE,
                     )
-                tests.reason = (
-                    f"REJECT - proximity low-conf ({nearest_scanner_distance:.1f}m, score {effective_match_score:.2f})"
-                )
+                if tests is not None:
+                    tests.reason = (
+                        f"REJECT - proximity low-conf "
+                        f"({nearest_scanner_distance:.1f}m, score {effective_match_score:.2f})"
+                    )
                 return False
 
             # Passed proximity check with high confidence
-            tests.passed_proximity_check = True
-        else:
+            if tests is not None:
+                tests.passed_proximity_check = True
+        elif tests is not None:
             # No proximity conflict
             tests.passed_proximity_check = True
 
@@ -2347,7 +2470,7 @@ class AreaSelectionHandler:
 
         # Populate profile info from best area
         best_profile = device_profiles.get(best_area_id)
-        if best_profile is not None:
+        if tests is not None and best_profile is not None:
             tests.profile_has_button = best_profile.has_button_training
             tests.profile_sample_count = best_profile.sample_count
             if best_profile.has_button_training:
@@ -2369,12 +2492,12 @@ class AreaSelectionHandler:
             )
 
             # Populate AreaTests for same-area refresh
-            tests.areas = (current_device_area_id, best_area_id)
-            tests.same_area = True
-            scannerless_indicator = " (scannerless)" if scanner_less_room else ""
-            tests.reason = f"WIN - same area refresh{scannerless_indicator} (score {effective_match_score:.2f})"
-            device.area_tests = tests
-            device.diag_area_switch = tests.sensortext()
+            if tests is not None:
+                tests.areas = (current_device_area_id, best_area_id)
+                tests.same_area = True
+                scannerless_indicator = " (scannerless)" if scanner_less_room else ""
+                tests.reason = f"WIN - same area refresh{scannerless_indicator} (score {effective_match_score:.2f})"
+            self._record_area_decision(device, "UKF:same_area", tests, keep_tests=True)
             return True
 
         # If no current area, bootstrap immediately
@@ -2391,12 +2514,12 @@ class AreaSelectionHandler:
             )
 
             # Populate AreaTests for bootstrap
-            tests.areas = ("", best_area_id)
-            tests.same_area = False
-            scannerless_indicator = " (scannerless)" if scanner_less_room else ""
-            tests.reason = f"WIN - bootstrap{scannerless_indicator} (score {effective_match_score:.2f})"
-            device.area_tests = tests
-            device.diag_area_switch = tests.sensortext()
+            if tests is not None:
+                tests.areas = ("", best_area_id)
+                tests.same_area = False
+                scannerless_indicator = " (scannerless)" if scanner_less_room else ""
+                tests.reason = f"WIN - bootstrap{scannerless_indicator} (score {effective_match_score:.2f})"
+            self._record_area_decision(device, "UKF:bootstrap", tests, keep_tests=True)
             return True
 
         # Determine streak target based on floor change
@@ -2443,16 +2566,16 @@ class AreaSelectionHandler:
             )
 
             # Populate AreaTests for streak-complete switch
-            tests.areas = (current_device_area_id or "", best_area_id)
-            tests.same_area = False
-            floor_indicator = " cross-floor" if is_cross_floor else ""
-            scannerless_indicator = " (scannerless)" if scanner_less_room else ""
-            tests.reason = (
-                f"WIN -{floor_indicator} switch{scannerless_indicator} "
-                f"(streak {device.pending_streak}/{streak_target}, score {effective_match_score:.2f})"
-            )
-            device.area_tests = tests
-            device.diag_area_switch = tests.sensortext()
+            if tests is not None:
+                tests.areas = (current_device_area_id or "", best_area_id)
+                tests.same_area = False
+                floor_indicator = " cross-floor" if is_cross_floor else ""
+                scannerless_indicator = " (scannerless)" if scanner_less_room else ""
+                tests.reason = (
+                    f"WIN -{floor_indicator} switch{scannerless_indicator} "
+                    f"(streak {device.pending_streak}/{streak_target}, score {effective_match_score:.2f})"
+                )
+            self._record_area_decision(device, "UKF:switch", tests, keep_tests=True)
         # Streak not reached - keep current area
         # NOTE: Use device.area_advert here (the actual advert object), not current_device_area_id.
         # apply_scanner_selection needs an advert object. The area_id determination above
@@ -2461,15 +2584,15 @@ class AreaSelectionHandler:
             device.apply_scanner_selection(device.area_advert, nowstamp=nowstamp)
 
             # Populate AreaTests for streak-pending (keeping current)
-            tests.areas = (current_device_area_id or "", best_area_id)
-            tests.same_area = current_device_area_id == best_area_id
-            floor_indicator = " cross-floor" if is_cross_floor else ""
-            tests.reason = (
-                f"PENDING -{floor_indicator} streak {device.pending_streak}/{streak_target} "
-                f"(score {effective_match_score:.2f})"
-            )
-            device.area_tests = tests
-            device.diag_area_switch = tests.sensortext()
+            if tests is not None:
+                tests.areas = (current_device_area_id or "", best_area_id)
+                tests.same_area = current_device_area_id == best_area_id
+                floor_indicator = " cross-floor" if is_cross_floor else ""
+                tests.reason = (
+                    f"PENDING -{floor_indicator} streak {device.pending_streak}/{streak_target} "
+                    f"(score {effective_match_score:.2f})"
+                )
+            self._record_area_decision(device, "UKF:pending", tests, keep_tests=True)
 
         return True
 
@@ -2490,9 +2613,12 @@ class AreaSelectionHandler:
         nowstamp = monotonic_time_coarse()
         evidence_cutoff = nowstamp - EVIDENCE_WINDOW_SECONDS
 
+        # AreaTests doubles as working state for the comparisons below, so it is
+        # always built; only its text rendering is skipped when nobody reads it.
         tests = AreaTests()
         tests.device = device.name
         tests.decision_path = "MIN_DISTANCE"
+        capture_diagnostics = self._wants_diagnostics(device, nowstamp)
 
         _superchatty = False  # Set to true for very verbose logging about area wins
 
@@ -2583,11 +2709,14 @@ class AreaSelectionHandler:
             if _protect_scannerless_area and current_incumbent is not None:
                 challenger_dist = analyzer.effective_distance(challenger)
                 if challenger_dist is not None and challenger_dist >= _scannerless_min_dist_override:
-                    floor_type = "cross-floor" if cross_floor else "same-floor"
-                    tests.reason = (
-                        f"LOSS - scannerless area protection (challenger at {challenger_dist:.1f}m "
-                        f">= {_scannerless_min_dist_override:.1f}m, {floor_type})"
-                    )
+                    if capture_diagnostics:
+                        floor_type = "cross-floor" if cross_floor else "same-floor"
+                        tests.reason = (
+                            f"LOSS - scannerless area protection (challenger at {challenger_dist:.1f}m "
+                            f">= {_scannerless_min_dist_override:.1f}m, {floor_type})"
+                        )
+                    else:
+                        tests.reason = "LOSS - scannerless area protection"
                     if _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug(
                             "Weak scanner override blocked for %s: scannerless area protected, "
@@ -2660,6 +2789,8 @@ class AreaSelectionHandler:
                                         f"LOSS - absolute profile match "
                                         f"(z={avg_z:.2f}{offline_context}) "
                                         f"protects current area"
+                                        if capture_diagnostics
+                                        else "LOSS - absolute profile match protects current area"
                                     )
                                     if _superchatty:
                                         _LOGGER.debug(
@@ -2702,14 +2833,19 @@ class AreaSelectionHandler:
                         has_sufficient_history = len(challenger_hist) >= soft_inc_min_history
 
                         if not has_significant_distance_advantage and not has_sufficient_history:
-                            dist_adv_str = (
-                                f"{soft_inc_distance - challenger_dist:.2f}" if challenger_dist is not None else "N/A"
-                            )
-                            tests.reason = (
-                                f"LOSS - soft incumbent same-floor protection "
-                                f"(dist adv: {dist_adv_str}m < {soft_inc_min_distance_advantage}m, "
-                                f"hist: {len(challenger_hist)} < {soft_inc_min_history})"
-                            )
+                            if capture_diagnostics:
+                                dist_adv_str = (
+                                    f"{soft_inc_distance - challenger_dist:.2f}"
+                                    if challenger_dist is not None
+                                    else "N/A"
+                                )
+                                tests.reason = (
+                                    f"LOSS - soft incumbent same-floor protection "
+                                    f"(dist adv: {dist_adv_str}m < {soft_inc_min_distance_advantage}m, "
+                                    f"hist: {len(challenger_hist)} < {soft_inc_min_history})"
+                                )
+                            else:
+                                tests.reason = "LOSS - soft incumbent same-floor protection"
                             if _superchatty:
                                 _LOGGER.debug(
                                     "%s: Soft incumbent same-floor protection - %s rejected "
@@ -3126,8 +3262,9 @@ class AreaSelectionHandler:
             device.area_distance_stamp = nowstamp
             device.ukf_scannerless_area = True
             device.reset_pending_state()
-            tests.reason = f"WIN via virtual distance ({virtual_winner_distance:.2f}m) for scannerless room"
-            device.diag_area_switch = tests.sensortext()
+            if capture_diagnostics:
+                tests.reason = f"WIN via virtual distance ({virtual_winner_distance:.2f}m) for scannerless room"
+            self._record_area_decision(device, "MIN_DISTANCE:virtual", tests if capture_diagnostics else None)
             if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "Applied virtual distance winner for %s: area=%s distance=%.2fm",
@@ -3227,7 +3364,7 @@ class AreaSelectionHandler:
                 winner = None
 
         if device.area_advert != winner and tests.reason is not None:
-            device.diag_area_switch = tests.sensortext()
+            self._record_area_decision(device, "MIN_DISTANCE:switch", tests if capture_diagnostics else None)
 
         # Apply the newly-found closest scanner
         def _apply_selection(advert: BermudaAdvert | None) -> None:
@@ -3236,7 +3373,7 @@ class AreaSelectionHandler:
             if advert is not None and advert.area_id is not None:
                 visible_scanners = analyzer.get_visible_scanner_addresses()
                 known_scanners = analyzer.get_all_known_scanners_for_area(advert.area_id)
-                all_candidate_scanners = known_scanners | visible_scanners
+                all_candidate_scanners = visible_scanners | known_scanners
                 device.update_co_visibility(advert.area_id, visible_scanners, all_candidate_scanners)
 
                 if advert.rssi is not None:
@@ -3501,5 +3638,5 @@ class AreaSelectionHandler:
             device.reset_pending_state()
             _apply_selection(winner)
         else:
-            device.diag_area_switch = tests.sensortext()
+            self._record_area_decision(device, "MIN_DISTANCE:pending", tests if capture_diagnostics else None)
             _apply_selection(device.area_advert)
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Set as AbstractSet
 
     from .bermuda_advert import BermudaAdvert
     from .bermuda_device import BermudaDevice
@@ -88,7 +89,7 @@ class AdvertAnalyzerProtocol(Protocol):
         """Get addresses of all scanners currently seeing this device."""
         ...
 
-    def get_all_known_scanners_for_area(self, area_id: str) -> set[str]:
+    def get_all_known_scanners_for_area(self, area_id: str) -> AbstractSet[str]:
         """Get all scanner addresses that have ever seen this device in this area."""
         ...
 
@@ -380,11 +381,13 @@ class AdvertAnalyzer:
                 visible.add(adv.scanner_device.address)
         return visible
 
-    def get_all_known_scanners_for_area(self, area_id: str) -> set[str]:
+    def get_all_known_scanners_for_area(self, area_id: str) -> AbstractSet[str]:
         """
         Get all scanner addresses that have ever seen this device in this area.
 
         Uses the device's co_visibility_stats to find historically known scanners.
+        Returns a live read-only view rather than a copy; callers combine it
+        with other sets (which copies anyway) and must not mutate it.
 
         Args:
         ----
@@ -392,9 +395,10 @@ class AdvertAnalyzer:
 
         Returns:
         -------
-            Set of scanner addresses, empty if no stats available
+            Set-like view of scanner addresses, empty if no stats available
 
         """
-        if area_id not in self._device.co_visibility_stats:
-            return set()
-        return set(self._device.co_visibility_stats[area_id].keys())
+        area_stats = self._device.co_visibility_stats.get(area_id)
+        if area_stats is None:
+            return frozenset()
+        return area_stats.keys()
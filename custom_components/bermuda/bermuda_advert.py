@@ -48,7 +48,8 @@ from .const import (
     VELOCITY_NOISE_MULTIPLIER,
     VELOCITY_TELEPORT_THRESHOLD,
 )
-from .filters import KalmanFilter
+from .filters import BankedKalmanFilter, KalmanFilterBank
+from .interval_window import MaxIntervalWindow
 from .util import clean_charbuf, rssi_to_metres
 
 if TYPE_CHECKING:
@@ -145,6 +146,7 @@ class BermudaAdvert(dict[str, Any]):
         scanner_device: BermudaDevice,  # The scanner device that "saw" it.
         *,
         nowstamp: float | None = None,
+        rssi_filter_bank: KalmanFilterBank | None = None,  # The coordinator's bank; adverts without one get their own
     ) -> None:
         self.scanner_address: Final[str] = scanner_device.address
         self.device_address: Final[str] = parent_device.address
@@ -163,6 +165,7 @@ class BermudaAdvert(dict[str, Any]):
         self.stale_update_count = 0  # How many times we did an update but no new stamps were found.
         self.adaptive_timeout: float = AREA_MAX_AD_AGE_DEFAULT  # Calculated based on device's ad pattern
         self.hist_stamp: list[float] = []
+        self._interval_window = MaxIntervalWindow()  # Running max of recent hist_stamp intervals
         self.hist_rssi: list[int] = []
         self.hist_distance: list[float] = []
         self.hist_distance_by_interval: list[float] = []  # updated per-interval
@@ -186,11 +189,14 @@ class BermudaAdvert(dict[str, Any]):
         # Applied to RSSI before distance calculation because RSSI is linear while distance is logarithmic.
         # Parameters based on BLE research: process_noise=1.0, measurement_noise=10.0
         # See: "The Influence of Kalman Filtering on RSSI" (2024) - 27% error reduction
-        self.rssi_kalman: KalmanFilter = KalmanFilter(
+        # The filter is a view onto the coordinator's filter bank, which batches the per-packet updates.
+        self.rssi_kalman: BankedKalmanFilter = BankedKalmanFilter(
+            rssi_filter_bank if rssi_filter_bank is not None else KalmanFilterBank(),
             process_noise=1.0,  # Q: How much true RSSI can change between updates
             measurement_noise=10.0,  # R: RSSI variance (std dev ~3 dBm → variance ~10)
         )
         self.rssi_filtered: float | None = None  # Kalman-filtered RSSI value
+        self._rssi_filter_queued: bool = False  # rssi_filtered awaits the bank's batched update
 
         # Just pass the rest on to update...
         self.update_advertisement(advertisementdata, self.scanner_device, nowstamp=nowstamp)
@@ -297,6 +303,7 @@ class BermudaAdvert(dict[str, Any]):
                 del self.local_name[HIST_KEEP_COUNT:]
                 if self._device.name_bt_local_name is None or len(self._device.name_bt_local_name) < len(nametuplet[0]):
                     self._device.name_bt_local_name = nametuplet[0]
+                    self._device.identity_changed()
                     _want_name_update = True
 
         if len(self.manufacturer_data) == 0 or self.manufacturer_data[0] != advertisementdata.manufacturer_data:
@@ -351,7 +358,7 @@ class BermudaAdvert(dict[str, Any]):
                 # RSSI at 1m (always negative, e.g. -55 dBm).  Skip this
                 # value and fall through to the global default.
                 _LOGGER_SPAM_LESS.warning(
-                    f"invalid_beacon_power_{self._device.address}",
+                    ("invalid_beacon_power", self._device.address),
                     "Device %s has beacon_power %.1f dBm which is positive. "
                     "iBeacon beacon_power should be calibrated RSSI at 1m "
                     "(always negative). The tracker likely sends TX power "
@@ -404,7 +411,7 @@ class BermudaAdvert(dict[str, Any]):
         # device-specific ref_power).
         if ref_power > 0:
             _LOGGER_SPAM_LESS.warning(
-                f"invalid_ref_power_{self._device.address}",
+                ("invalid_ref_power", self._device.address),
                 "Device %s has invalid ref_power %.1f dBm (from %s). "
                 "ref_power should be negative (calibrated RSSI at 1m). "
                 "Falling back to default %.0f dBm",
@@ -415,7 +422,9 @@ class BermudaAdvert(dict[str, Any]):
             )
             ref_power = DEFAULT_REF_POWER
         if reading_is_new:
-            self.rssi_filtered = self.rssi_kalman.update_adaptive(adjusted_rssi, ref_power, timestamp=timestamp)
+            # Applied with the rest of this cycle's readings; calculate_data() picks up the result.
+            self.rssi_kalman.queue_adaptive(adjusted_rssi, ref_power, timestamp=timestamp)
+            self._rssi_filter_queued = True
         elif self.rssi_kalman.is_initialized:
             self.rssi_filtered = self.rssi_kalman.estimate
 
@@ -431,7 +440,7 @@ class BermudaAdvert(dict[str, Any]):
         rssi_headroom = adjusted_rssi - ref_power
         if rssi_headroom >= 30:
             _LOGGER_SPAM_LESS.warning(
-                f"calibration_warning_{self.device_address}",
+                ("calibration_warning", self.device_address),
                 "Device %s has RSSI %.0f dBm which is %.0f dB stronger than ref_power %.0f dBm (from %s). "
                 "This results in minimum distance (%.1fm). Consider calibrating ref_power for this device. "
                 "Suggested ref_power: %.0f dBm (set 1m from a scanner, or use this RSSI + ~25 dB headroom)",
@@ -571,6 +580,12 @@ class BermudaAdvert(dict[str, Any]):
         new_stamp = self.new_stamp
         self.new_stamp = None
 
+        if self._rssi_filter_queued:
+            # The first read flushes the bank, batching every advert's queued reading.
+            self._rssi_filter_queued = False
+            rssi_kalman = self.rssi_kalman
+            self.rssi_filtered = rssi_kalman.estimate if rssi_kalman.is_initialized else None
+
         if self.rssi_distance is None and new_stamp is not None:
             self.rssi_distance = self.rssi_distance_raw
             if self.rssi_distance_raw is not None:
@@ -587,18 +602,13 @@ class BermudaAdvert(dict[str, Any]):
         # Using MAX instead of AVG ensures we don't mark devices as stale during deep sleep cycles.
         # Smartphones can have intervals ranging from 1-10s (active) to 30-360s (deep sleep).
         elif new_stamp is None:
-            if len(self.hist_stamp) >= 2:
-                # Calculate intervals between consecutive timestamps
-                intervals = [
-                    self.hist_stamp[i] - self.hist_stamp[i + 1]
-                    for i in range(min(10, len(self.hist_stamp) - 1))
-                    if self.hist_stamp[i + 1] is not None
-                ]
-                if intervals:
-                    max_interval = max(intervals)
-                    # Use 2x maximum interval, clamped between DEFAULT (60s) and LIMIT (360s)
-                    # Using MAX (not AVG) ensures deep sleep intervals are respected
-                    self.adaptive_timeout = max(AREA_MAX_AD_AGE_DEFAULT, min(AREA_MAX_AD_AGE_LIMIT, max_interval * 2))
+            # Max of the intervals between the last 10 consecutive timestamps, maintained
+            # incrementally as stamps are added rather than rescanned on every check.
+            max_interval = self._interval_window.max_interval(self.hist_stamp)
+            if max_interval is not None:
+                # Use 2x maximum interval, clamped between DEFAULT (60s) and LIMIT (360s)
+                # Using MAX (not AVG) ensures deep sleep intervals are respected
+                self.adaptive_timeout = max(AREA_MAX_AD_AGE_DEFAULT, min(AREA_MAX_AD_AGE_LIMIT, max_interval * 2))
 
             if self.stamp is None or self.stamp < monotonic_time_coarse() - self.adaptive_timeout:
                 self._clear_stale_history()
@@ -754,6 +764,9 @@ class BermudaAdvert(dict[str, Any]):
                 # objects we might want to represent but not fully iterate etc.
                 out[var] = val.__repr__()
                 continue
+            if val is self._interval_window:
+                out[var] = val.to_dict()
+                continue
             if val is self.local_name:
                 out[var] = {}
                 for namestr, namebytes in self.local_name:
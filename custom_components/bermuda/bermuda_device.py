@@ -72,9 +72,12 @@ from .const import (
     MOVEMENT_STATE_SETTLING,
     MOVEMENT_STATE_STATIONARY,
 )
+from .correlation.eviction import EvictionIndex
 from .util import is_mac_address, mac_math_offset, normalize_address, normalize_mac
 
 if TYPE_CHECKING:
+    from collections.abc import MutableMapping
+
     from bleak.backends.scanner import AdvertisementData
 
     from .area_selection import AreaTests
@@ -102,6 +105,16 @@ def _is_better_entry(candidate: dr.DeviceEntry, current: dr.DeviceEntry) -> bool
     return candidate.name_by_user is not None and current.name_by_user is None
 
 
+def _co_visibility_scanner_priority(stats: dict[str, int]) -> int:
+    """Return eviction priority of one scanner's co-visibility counts."""
+    return stats["total"]
+
+
+def _co_visibility_area_priority(area_stats: dict[str, dict[str, int]]) -> int:
+    """Return eviction priority of an area's co-visibility stats (max sample count)."""
+    return max((s["total"] for s in area_stats.values()), default=0)
+
+
 class BermudaDevice:
     """
     This class is to represent a single bluetooth "device" tracked by Bermuda.
@@ -168,6 +181,11 @@ class BermudaDevice:
         # in Area A but typical co-scanners for Area A don't see it).
         # Structure: {area_id: {scanner_address: {"seen": count, "total": count}}}
         self.co_visibility_stats: dict[str, dict[str, dict[str, int]]] = {}
+        # Eviction heaps bounding co_visibility_stats (per-area scanners, and areas)
+        self._co_visibility_scanner_index: dict[str, EvictionIndex[str, dict[str, int]]] = {}
+        self._co_visibility_area_index: EvictionIndex[str, dict[str, dict[str, int]]] = EvictionIndex(
+            _co_visibility_area_priority
+        )
         # Minimum samples before co-visibility affects confidence
         self.co_visibility_min_samples: int = 50
 
@@ -186,8 +204,11 @@ class BermudaDevice:
         self.beacon_major: str | None = None
         self.beacon_minor: str | None = None
         self.beacon_power: float | None = None
+        # Bumped whenever a name, manufacturer or beacon field above changes, so
+        # metadevices only re-read those from a source when they changed.
+        self.identity_version: int = 0
 
-        self.entry_id: str | None = None  # used for scanner devices
+        self._entry_id: str | None = None  # used for scanner devices
         self.create_sensor: bool = False  # Create/update a sensor for this device
         self.create_sensor_done: bool = False  # Sensor should now exist
         self.create_tracker_done: bool = False  # device_tracker should now exist
@@ -201,9 +222,10 @@ class BermudaDevice:
         self.last_retained_log: float = 0.0
         self.diag_area_switch: str | None = None  # saves output of AreaTests
         self.area_tests: AreaTests | None = None  # Full diagnostic object for extra_state_attributes
-        self.adverts: dict[
-            tuple[str, str], BermudaAdvert
-        ] = {}  # str will be a scanner address OR a deviceaddress__scanneraddress
+        self.area_decision: str | None = None  # Last area selection outcome code, e.g. "UKF:switch"
+        # (device address, scanner address) -> advert. Metadevices replace this with a
+        # MetadeviceAdverts view over their sources' adverts (see metadevice_adverts.py).
+        self.adverts: MutableMapping[tuple[str, str], BermudaAdvert] = {}
         self._adverts_by_scanner: dict[str, BermudaAdvert] = {}  # scanner_address → most recent advert
         self.current_mac: str = _address  # Most recent source MAC (for metadevices with rotating addresses)
         self.pending_area_id: str | None = None
@@ -311,7 +333,7 @@ class BermudaDevice:
                 elif top_bits == 0b01:  # Addresses where the first char will be 4,5,6 or 7
                     _LOGGER.debug("Identified Resolvable Private (potential IRK source) Address on %s", self.address)
                     self.address_type = BDADDR_TYPE_RANDOM_RESOLVABLE
-                    self._coordinator.irk_manager.check_mac(self.address)
+                    self._coordinator.irk_manager.queue_mac(self.address)
                 elif top_bits == 0b10:
                     self.address_type = BDADDR_TYPE_RESERVED
                     _LOGGER.debug("Hey, got one of those reserved MACs, %s", self.address)
@@ -325,6 +347,17 @@ class BermudaDevice:
                 if name and (self.manufacturer is None or not generic):
                     self.manufacturer = name
 
+    @property
+    def entry_id(self) -> str | None:
+        """Device registry id of this (scanner) device."""
+        return self._entry_id
+
+    @entry_id.setter
+    def entry_id(self, value: str | None) -> None:
+        if value != self._entry_id:
+            self._coordinator.registry_index.set_device_entry(self.address, self._entry_id, value)
+            self._entry_id = value
+
     @property
     def is_scanner(self):
         return self._is_scanner
@@ -505,7 +538,7 @@ class BermudaDevice:
             # two bt's and shelly/esphome, the second bt being the alternate
             # MAC address.
             _LOGGER_SPAM_LESS.warning(
-                f"multimatch_devreg_{slugify(self._hascanner.source)}",
+                ("multimatch_devreg", self._hascanner.source),
                 "Unexpectedly got %d device registry matches for %s: %s\n",
                 devreg_count,
                 self._hascanner.name,
@@ -514,7 +547,7 @@ class BermudaDevice:
 
         if scanner_devreg_bt is None and scanner_devreg_mac is None:
             _LOGGER_SPAM_LESS.error(
-                f"scanner_not_in_devreg_{self.address:s}",
+                ("scanner_not_in_devreg", self.address),
                 "Failed to find scanner %s (%s) in Device Registry",
                 self._hascanner.name,
                 self._hascanner.source,
@@ -610,7 +643,7 @@ class BermudaDevice:
                 else:
                     # floor_id was invalid
                     _LOGGER_SPAM_LESS.warning(
-                        f"floor_id invalid for {self.__repr__()}",
+                        ("floor_id_invalid", self.address),
                         "Update of area for %s has invalid floor_id of %s",
                         self.__repr__(),
                         self.floor_id,
@@ -626,7 +659,7 @@ class BermudaDevice:
                 self.floor_icon = ICON_DEFAULT_FLOOR
         else:
             _LOGGER_SPAM_LESS.warning(
-                f"no_area_on_update{self.name}",
+                ("no_area_on_update", self.name),
                 "Setting area of %s with invalid area id of %s",
                 self.__repr__(),
                 area_id,
@@ -706,12 +739,12 @@ class BermudaDevice:
         if self.is_remote_scanner:
             if self.stamps is None:
                 _LOGGER_SPAM_LESS.debug(
-                    f"remote_no_stamps{self.address}", "Remote Scanner %s has no stamps dict", self.__repr__()
+                    ("remote_no_stamps", self.address), "Remote Scanner %s has no stamps dict", self
                 )
                 return None
             if len(self.stamps) == 0:
                 _LOGGER_SPAM_LESS.debug(
-                    f"remote_stamps_empty{self.address}", "Remote scanner %s has an empty stamps dict", self.__repr__()
+                    ("remote_stamps_empty", self.address), "Remote scanner %s has an empty stamps dict", self
                 )
                 return None
             try:
@@ -950,32 +983,31 @@ class BermudaDevice:
         """
         if area_id not in self.co_visibility_stats:
             self.co_visibility_stats[area_id] = {}
+            self._co_visibility_area_index.track(area_id, self.co_visibility_stats[area_id])
 
         area_stats = self.co_visibility_stats[area_id]
+        scanner_index = self._co_visibility_scanner_index.get(area_id)
+        if scanner_index is None:
+            scanner_index = EvictionIndex(_co_visibility_scanner_priority)
+            scanner_index.rebuild(area_stats)
+            self._co_visibility_scanner_index[area_id] = scanner_index
 
         # Update stats for all candidate scanners
         for scanner_addr in all_candidate_scanners:
             if scanner_addr not in area_stats:
                 area_stats[scanner_addr] = {"seen": 0, "total": 0}
+                scanner_index.track(scanner_addr, area_stats[scanner_addr])
 
             area_stats[scanner_addr]["total"] += 1
             if scanner_addr in visible_scanners:
                 area_stats[scanner_addr]["seen"] += 1
 
         # Limit memory: keep only top 20 scanners per area by total count
-        if len(area_stats) > 20:
-            sorted_scanners = sorted(area_stats.items(), key=lambda x: x[1]["total"], reverse=True)
-            self.co_visibility_stats[area_id] = dict(sorted_scanners[:20])
+        scanner_index.evict_excess(area_stats, 20)
 
         # Limit memory: keep only top 50 areas by max sample count
-        max_areas = 50
-        if len(self.co_visibility_stats) > max_areas:
-            sorted_areas = sorted(
-                self.co_visibility_stats.items(),
-                key=lambda x: max((s["total"] for s in x[1].values()), default=0),
-                reverse=True,
-            )
-            self.co_visibility_stats = dict(sorted_areas[:max_areas])
+        for evicted_area in self._co_visibility_area_index.evict_excess(self.co_visibility_stats, 50):
+            self._co_visibility_scanner_index.pop(evicted_area, None)
 
     def get_co_visibility_confidence(self, area_id: str, visible_scanners: set[str]) -> float:
         """
@@ -1398,9 +1430,9 @@ class BermudaDevice:
             allow_processing = not self.adverts or scanner_address in normalized_sources
             if not self._metadevice_warned:
                 _LOGGER_SPAM_LESS.debug(
-                    f"meta_{self.address}_{advert_tuple}",
+                    ("meta", self.address, advert_tuple),
                     "process_advertisement on a metadevice (%s); %s advert tuple %s",
-                    self.__repr__(),
+                    self,
                     "allowing" if allow_processing else "skipping",
                     advert_tuple,
                 )
@@ -1420,6 +1452,7 @@ class BermudaDevice:
                 self.options,
                 scanner_device,
                 nowstamp=stamp_now,
+                rssi_filter_bank=self._coordinator.rssi_filter_bank,
             )
 
         # Let's see if we should update our last_seen based on this...
@@ -1438,6 +1471,8 @@ class BermudaDevice:
 
     def process_manufacturer_data(self, advert: BermudaAdvert):
         """Parse manufacturer data for maker name and iBeacon etc."""
+        identity = (self.manufacturer, self.beacon_unique_id, self.beacon_power)
+
         # Only override existing manufacturer name if it's "better"
 
         # ==== Check service uuids (type 0x16)
@@ -1498,10 +1533,20 @@ class BermudaDevice:
                         self.make_name()
                         self._coordinator.register_ibeacon_source(self)
 
+        if identity != (self.manufacturer, self.beacon_unique_id, self.beacon_power):
+            self.identity_changed()
+
+    def identity_changed(self) -> None:
+        """Note that a name, manufacturer or beacon field changed (bumps identity_version)."""
+        self.identity_version += 1
+
     def to_dict(self) -> dict[str, object]:
         """Convert class to serialisable dict for dump_devices."""
         out: dict[str, object] = {}
         for var, val in vars(self).items():
+            if var == "_entry_id":
+                # Stored privately behind the registry-indexing property, dumped under its public name.
+                var = "entry_id"  # noqa: PLW2901
             if val is None:
                 # Catch the Nones first, as otherwise they might match some other objects below if
                 # they are None (like self._hascanner), which will prevent them showing at all.
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
 from math import floor
 from typing import TYPE_CHECKING, Any, NamedTuple
@@ -15,11 +16,61 @@ from homeassistant.const import MAJOR_VERSION, MINOR_VERSION
 from .const import _LOGGER, DOMAIN, PRUNE_TIME_KNOWN_IRK, IrkTypes
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from cryptography.hazmat.primitives.ciphers import Cipher
     from homeassistant.components.bluetooth import BluetoothCallback
 
 type Cancellable = Callable[[], None]
 
+# Plaintext for an RPA hash is the 24-bit prand, zero-padded to one AES block.
+_RPA_PADDING = b"\x00" * 13
+_UNRESOLVED = frozenset(IrkTypes.unresolved())
+# Leading hex digits _validate_mac_irk() treats as resolvable (int(address[0], 16) & 0x04).
+_RPA_LEADING_DIGITS = frozenset("4567cdefCDEF")
+
+
+def batch_resolve_private_addresses(ciphers: Mapping[bytes, Cipher], addresses: Iterable[str]) -> dict[str, bytes]:
+    """
+    Resolve many addresses against many IRKs in one pass.
+
+    Equivalent to calling resolve_private_address() for every (cipher, address)
+    pair, but the padded prand blocks of all RPAs are encrypted together as one
+    multi-block ECB message per IRK, so each IRK costs a single cipher context
+    instead of one per address. Non-RPA addresses are skipped.
+
+    Args:
+    ----
+        ciphers: IRK -> prepared cipher (from get_cipher_for_irk).
+        addresses: MAC addresses to resolve.
+
+    Returns:
+    -------
+        Address -> matching IRK, for the addresses that resolved.
+
+    """
+    rpas: list[tuple[str, bytes]] = []
+    for address in addresses:
+        try:
+            rpa = bytes.fromhex(address.replace(":", ""))
+        except ValueError:
+            continue
+        if len(rpa) == 6 and rpa[0] & 0xC0 == 0x40:
+            rpas.append((address, rpa))
+    if not rpas or not ciphers:
+        return {}
+
+    plaintext = b"".join(_RPA_PADDING + rpa[:3] for _, rpa in rpas)
+    matches: dict[str, bytes] = {}
+    for irk, cipher in ciphers.items():
+        encryptor = cipher.encryptor()
+        ciphertext = encryptor.update(plaintext) + encryptor.finalize()
+        for index, (address, rpa) in enumerate(rpas):
+            offset = index * 16
+            if ciphertext[offset + 13 : offset + 16] == rpa[3:] and address not in matches:
+                matches[address] = irk
+    return matches
+
 
 class ResolvableMAC(NamedTuple):
     """Stores a mac address along with its IRK and expiry time."""
@@ -35,15 +86,25 @@ class BermudaIrkManager:
 
     - add_irk() as each IRK is learned
     - check_mac() whenever (results are cached)
+    - queue_mac() from the advert loop, then resolve_pending() once per cycle
+      to resolve all new MACs against all IRKs in one batch.
     """
 
     def __init__(self) -> None:
         self._irks: dict[bytes, Cipher] = {}
         self._macs: dict[str, ResolvableMAC] = {}
         self._irk_callbacks: dict[bytes, list[BluetoothCallback]] = {}
+        # MACs seen this cycle that are not in _macs yet (dict as ordered set)
+        self._pending: dict[str, None] = {}
+        # Deferred add_irk() rescans: (irk, MACs still to check against it)
+        self._rescans: deque[tuple[bytes, list[str]]] = deque()
+        self._stats: dict[str, int] = {"batches": 0, "batched_macs": 0, "batch_matches": 0, "deferred_rescans": 0}
 
     # Expected length for a valid IRK (Identity Resolving Key)
     IRK_LENGTH_BYTES: int = 16
+    # MACs checked synchronously when a new IRK is added, and per cycle for
+    # the remainder of larger rescans.
+    RESCAN_CHUNK_SIZE: int = 256
 
     def add_irk(self, irk: bytes) -> list[str]:
         """
@@ -77,14 +138,16 @@ class BermudaIrkManager:
             # Save new irk and cipher
             self._irks[irk] = cipher = get_cipher_for_irk(irk)
             # Check any previously unknown MACs for matches and update them.
+            # Only the first chunk is checked now, the rest is left to
+            # resolve_pending() so a big cache can't stall the event loop.
+            unresolved = [macirk.mac for macirk in self._macs.values() if macirk.irk in _UNRESOLVED]
+            if len(unresolved) > self.RESCAN_CHUNK_SIZE:
+                self._rescans.append((irk, unresolved[self.RESCAN_CHUNK_SIZE :]))
+                self._stats["deferred_rescans"] += 1
+                unresolved = unresolved[: self.RESCAN_CHUNK_SIZE]
 
             macs.extend(
-                macirk.mac
-                for macirk in self._macs.values()
-                if (
-                    macirk.irk in IrkTypes.unresolved()
-                    and self._validate_mac_irk(macirk.mac, irk, cipher) not in IrkTypes.unresolved()
-                )
+                address for address in unresolved if self._validate_mac_irk(address, irk, cipher) not in _UNRESOLVED
             )
 
             _LOGGER.debug(
@@ -107,6 +170,11 @@ class BermudaIrkManager:
         # otherwise, all of 'em
         return self._macs.copy()
 
+    def is_resolved(self, address: str) -> bool:
+        """Return True if address is known to resolve to one of our IRKs (no resolution is attempted)."""
+        macirk = self._macs.get(address)
+        return macirk is not None and macirk.irk not in _UNRESOLVED
+
     def async_prune(self) -> None:
         """
         Check for expired MACs and expunge them.
@@ -133,6 +201,70 @@ class BermudaIrkManager:
         # Do the math
         return self._validate_mac(address)
 
+    def queue_mac(self, address: str) -> bytes:
+        """
+        Queue a MAC for the next resolve_pending() batch, unless already known.
+
+        Returns the cached IRK / IrkType, or ADRESS_NOT_EVALUATED if queued.
+        """
+        if macirk := self._macs.get(address):
+            return macirk.irk
+        self._pending[address] = None
+        return IrkTypes.ADRESS_NOT_EVALUATED.value
+
+    def resolve_pending(self) -> int:
+        """
+        Resolve all queued MACs against all IRKs, and continue deferred rescans.
+
+        Called once per update cycle, after the adverts have been gathered and
+        before metadevices are updated, so matches (and their callbacks) land
+        in the same cycle as with per-advert resolution.
+
+        Returns the number of MACs that matched an IRK.
+        """
+        matched = 0
+        if self._pending:
+            addresses = [address for address in self._pending if address not in self._macs]
+            self._pending.clear()
+            matched += self._resolve_batch(addresses, self._irks, save_misses=True)
+
+        budget = self.RESCAN_CHUNK_SIZE
+        while self._rescans and budget > 0:
+            irk, addresses = self._rescans[0]
+            chunk = addresses[:budget]
+            del addresses[:budget]
+            if not addresses:
+                self._rescans.popleft()
+            budget -= len(chunk)
+            if (cipher := self._irks.get(irk)) is None:
+                continue
+            # Skip anything resolved or pruned since the rescan was queued
+            chunk = [address for address in chunk if (macirk := self._macs.get(address)) and macirk.irk in _UNRESOLVED]
+            matched += self._resolve_batch(chunk, {irk: cipher}, save_misses=False)
+        return matched
+
+    def _resolve_batch(self, addresses: list[str], ciphers: Mapping[bytes, Cipher], *, save_misses: bool) -> int:
+        """Batch-resolve addresses, saving results and firing callbacks for matches."""
+        if not addresses:
+            return 0
+        matches = batch_resolve_private_addresses(ciphers, addresses)
+        self._stats["batches"] += 1
+        self._stats["batched_macs"] += len(addresses)
+        self._stats["batch_matches"] += len(matches)
+        for address in addresses:
+            if (irk := matches.get(address)) is not None:
+                _LOGGER.debug("Batch resolved MAC %s with irk %s. Sending callbacks", address, irk.hex()[:4])
+                self._update_saved_mac(address, irk)
+                self.fire_callbacks(irk, address)
+            elif save_misses:
+                # Same outcomes as _validate_mac_irk(): an RPA no IRK resolves is
+                # NO_KNOWN_IRK_MATCH, anything else is NOT_RESOLVABLE_ADDRESS.
+                if address[:1] in _RPA_LEADING_DIGITS:
+                    self._update_saved_mac(address, IrkTypes.NO_KNOWN_IRK_MATCH.value)
+                else:
+                    self._update_saved_mac(address, IrkTypes.NOT_RESOLVABLE_ADDRESS.value)
+        return len(matches)
+
     def scan_device(self, address: str) -> tuple[bool, bytes]:
         """
         Scan a device address for IRK resolution and return results.
@@ -333,4 +465,9 @@ class BermudaIrkManager:
         return {
             "irks": [irk.hex() for irk in self._irks],
             "macs": macs,
+            "resolver": {
+                **self._stats,
+                "pending_macs": len(self._pending),
+                "rescan_macs_remaining": sum(len(addresses) for _, addresses in self._rescans),
+            },
         }
@@ -14,7 +14,14 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import _LOGGER, DOMAIN, SIGNAL_DEVICE_NEW
+from .const import (
+    _LOGGER,
+    DOMAIN,
+    SIGNAL_DEVICE_NEW,
+    TRAINING_ADVERT_WAIT_TIMEOUT,
+    TRAINING_MAX_TIME_SECONDS,
+    TRAINING_SAMPLE_COUNT,
+)
 from .entity import BermudaEntity
 
 if TYPE_CHECKING:
@@ -23,24 +30,11 @@ if TYPE_CHECKING:
     from . import BermudaConfigEntry
     from .coordinator import BermudaDataUpdateCoordinator
 
-# Number of unique training samples to collect
-# 60 samples with 82% efficiency (5s interval) = ~49 effective samples
-# This exceeds the n>=30 threshold for Central Limit Theorem reliability
-TRAINING_SAMPLE_COUNT = 60
-
-# Maximum time to wait for training to complete (seconds)
-# 60 samples x 5s interval = 300s, plus buffer for missed packets
-TRAINING_MAX_TIME_SECONDS = 300.0
-
 # Minimum time between training samples (seconds)
 # 5s interval reduces autocorrelation (rho=0.10) for 82% statistical efficiency
 # Shorter intervals cause highly correlated samples that add little information
 TRAINING_MIN_SAMPLE_INTERVAL = 5.0
 
-# How often to poll for new advertisement data (seconds)
-# Short interval to catch new data quickly, actual sample timing controlled by MIN_SAMPLE_INTERVAL
-TRAINING_POLL_INTERVAL = 0.3
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -318,8 +312,13 @@ class BermudaTrainingButton(BermudaEntity, ButtonEntity):
                     # (in case device is offline, stamps stay empty and we keep waiting)
                     last_stamps = current_stamps
 
-                # Short poll interval - we're waiting for new BLE advertisements
-                await asyncio.sleep(TRAINING_POLL_INTERVAL)
+                # Sleep until the coordinator ingests a genuinely new advert for this device
+                # (or one of its sources) instead of polling for one
+                await self.coordinator.async_wait_for_advert(
+                    self.address,
+                    last_stamps,
+                    min(TRAINING_ADVERT_WAIT_TIMEOUT, max(0.0, TRAINING_MAX_TIME_SECONDS - elapsed)),
+                )
 
             # Calculate training duration
             training_duration = time.monotonic() - start_time
@@ -26,28 +26,40 @@ from .const import (
     ADDR_TYPE_PRIVATE_BLE_DEVICE,
     BDADDR_TYPE_RANDOM_RESOLVABLE,
     CONF_ATTENUATION,
+    CONF_CALIBRATION_INTERVAL,
+    CONF_CONSOLIDATED_SCANNER_DISTANCES,
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
+    CONF_DISTANCE_DEADBAND,
     CONF_MAX_RADIUS,
     CONF_MAX_VELOCITY,
+    CONF_PUBLISH_MAX_SILENCE,
     CONF_RECORDER_FRIENDLY,
     CONF_REF_POWER,
     CONF_REFERENCE_TRACKERS,
+    CONF_RSSI_DEADBAND,
     CONF_RSSI_OFFSETS,
     CONF_SAVE_AND_CLOSE,
     CONF_SCANNER_INFO,
     CONF_SCANNERS,
     CONF_SMOOTHING_SAMPLES,
+    CONF_STATIONARY_BACKOFF,
     CONF_UPDATE_INTERVAL,
     CONF_USE_UKF_AREA_SELECTION,
     DEFAULT_ATTENUATION,
+    DEFAULT_CALIBRATION_INTERVAL,
+    DEFAULT_CONSOLIDATED_SCANNER_DISTANCES,
     DEFAULT_DEVTRACK_TIMEOUT,
+    DEFAULT_DISTANCE_DEADBAND,
     DEFAULT_FMDN_MODE,
     DEFAULT_MAX_RADIUS,
     DEFAULT_MAX_VELOCITY,
+    DEFAULT_PUBLISH_MAX_SILENCE,
     DEFAULT_RECORDER_FRIENDLY,
     DEFAULT_REF_POWER,
+    DEFAULT_RSSI_DEADBAND,
     DEFAULT_SMOOTHING_SAMPLES,
+    DEFAULT_STATIONARY_BACKOFF,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_USE_UKF_AREA_SELECTION,
     DISTANCE_INFINITE,
@@ -237,6 +249,26 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 CONF_UPDATE_INTERVAL,
                 default=self.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
             ): vol.Coerce(float),
+            vol.Required(
+                CONF_CALIBRATION_INTERVAL,
+                default=self.options.get(CONF_CALIBRATION_INTERVAL, DEFAULT_CALIBRATION_INTERVAL),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_DISTANCE_DEADBAND,
+                default=self.options.get(CONF_DISTANCE_DEADBAND, DEFAULT_DISTANCE_DEADBAND),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_RSSI_DEADBAND,
+                default=self.options.get(CONF_RSSI_DEADBAND, DEFAULT_RSSI_DEADBAND),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_PUBLISH_MAX_SILENCE,
+                default=self.options.get(CONF_PUBLISH_MAX_SILENCE, DEFAULT_PUBLISH_MAX_SILENCE),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_STATIONARY_BACKOFF,
+                default=self.options.get(CONF_STATIONARY_BACKOFF, DEFAULT_STATIONARY_BACKOFF),
+            ): vol.Coerce(float),
             vol.Required(
                 CONF_SMOOTHING_SAMPLES,
                 default=self.options.get(CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES),
@@ -257,6 +289,10 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 CONF_RECORDER_FRIENDLY,
                 default=self.options.get(CONF_RECORDER_FRIENDLY, DEFAULT_RECORDER_FRIENDLY),
             ): bool,
+            vol.Optional(
+                CONF_CONSOLIDATED_SCANNER_DISTANCES,
+                default=self.options.get(CONF_CONSOLIDATED_SCANNER_DISTANCES, DEFAULT_CONSOLIDATED_SCANNER_DISTANCES),
+            ): bool,
         }
 
         return self.async_show_form(step_id="globalopts", data_schema=vol.Schema(data_schema))
@@ -383,6 +419,17 @@ class BermudaOptionsFlowHandler(OptionsFlowWithConfigEntry):
                 )
             )
 
+        # Untracked private addresses only have a shadow record (they get a full
+        # device once configured), and are all recent since shadows expire quickly.
+        options_randoms.extend(
+            SelectOptionDict(
+                value=address,
+                label=f"[{address.upper()}] (Random MAC)",
+            )
+            for address in coordinator.shadow_devices
+            if address not in self.devices
+        )
+
         # build the final list with "preferred" devices first.
         # Auto-configured devices appear first (so users can see what's being auto-tracked)
         options_auto_configured.sort(key=lambda item: item["label"])
@@ -54,6 +54,8 @@ DOMAIN_PRIVATE_BLE_DEVICE = "private_ble_device"
 # Signal names we are using:
 SIGNAL_DEVICE_NEW = f"{DOMAIN}-device-new"
 SIGNAL_SCANNERS_CHANGED = f"{DOMAIN}-scanners-changed"
+# Per-device update signal, format with the device address
+SIGNAL_DEVICE_UPDATED = f"{DOMAIN}-device-updated-{{}}"
 
 UPDATE_INTERVAL = 1.05  # Seconds between bluetooth data processing cycles
 # Note: this is separate from the CONF_UPDATE_INTERVAL which allows the
@@ -178,6 +180,11 @@ RSSI_CONSECUTIVE_WINS: Final = 2  # Consecutive cycles required before switching
 CONF_RECORDER_FRIENDLY = "recorder_friendly"
 DEFAULT_RECORDER_FRIENDLY: Final = True  # Enabled by default; reduces DB writes significantly
 
+# Consolidated scanner distances - one diagnostic sensor per device with a per-scanner
+# attribute map, instead of a distance and raw-distance sensor for every device/scanner pair.
+CONF_CONSOLIDATED_SCANNER_DISTANCES = "consolidated_scanner_distances"
+DEFAULT_CONSOLIDATED_SCANNER_DISTANCES: Final = False  # Opt-in; per-scanner entities by default
+
 # UKF (Unscented Kalman Filter) Area Selection - experimental multi-scanner fusion
 CONF_USE_UKF_AREA_SELECTION = "use_ukf_area_selection"
 DEFAULT_USE_UKF_AREA_SELECTION: Final = True  # Enabled by default; uses fingerprints when available
@@ -302,6 +309,28 @@ CONF_REFERENCE_TRACKERS: Final = "reference_trackers"
 REFERENCE_TRACKER_CONFIDENCE: Final = 0.80  # Above gate (0.50), below button (~0.95)
 REFERENCE_TRACKER_DEVICE_PREFIX: Final = "ref:"  # Virtual device key prefix
 
+# Fingerprint training (training button and train_fleet service)
+# Number of unique training samples to collect
+# 60 samples with 82% efficiency (5s interval) = ~49 effective samples
+# This exceeds the n>=30 threshold for Central Limit Theorem reliability
+TRAINING_SAMPLE_COUNT: Final = 60
+
+# Maximum time to wait for training to complete (seconds)
+# 60 samples x 5s interval = 300s, plus buffer for missed packets
+TRAINING_MAX_TIME_SECONDS: Final = 300.0
+
+# Longest wait for a new advertisement before re-checking timeout and device (seconds)
+# Samples are taken as soon as the coordinator ingests a new advert; this only bounds
+# how long a silent device can hold the loop, and re-reads rotating metadevice sources
+TRAINING_ADVERT_WAIT_TIMEOUT: Final = 2.0
+
+# How long area selection keeps capturing full AreaTests diagnostics for every
+# device after a dump_devices call (seconds). Otherwise they are only built for
+# devices whose area switch reason sensor is enabled, or when debug logging is on.
+AREA_DIAGNOSTICS_HOLD_SECONDS: Final = 300.0
+# How long dump_devices waits for an update cycle that captured them (seconds).
+AREA_DIAGNOSTICS_WAIT_SECONDS: Final = 3 * UPDATE_INTERVAL
+
 # Sentinel values for distance/RSSI
 DISTANCE_INFINITE_SENTINEL: Final = 999.0  # Sentinel value for unknown/infinite distance
 RSSI_INVALID_SENTINEL: Final = -999.0  # Sentinel value for invalid/missing RSSI
@@ -403,6 +432,8 @@ class IrkTypes(Enum):
 # expires adverts at 195 seconds to avoid churning.
 #
 PRUNE_MAX_COUNT = 1000  # How many device entries to allow at maximum
+PRUNE_MAX_SHADOWS: Final[int] = 4096  # Shadow records kept for untracked private addresses (see shadow_devices.py)
+ADDRESS_REGISTRY_MAX_SIZE: Final[int] = 16384  # Raw address spellings kept by the interning registry (see util.py)
 PRUNE_TIME_INTERVAL = 180  # Every 3m, prune stale devices
 # ### Note about timeouts: Bluez and HABT cache for 180 or 195 seconds. Setting
 # timeouts below that may result in prune/create/prune churn, but as long as
@@ -412,9 +443,28 @@ PRUNE_TIME_UNKNOWN_IRK = 240  # Resolvable Private addresses change often, prune
 # see Bluetooth Core Spec, Vol3, Part C, Appendix A, Table A.1: Defined GAP timers
 PRUNE_TIME_KNOWN_IRK: Final[int] = 16 * 60  # spec "recommends" 15 min max address age. Round up to 16 :-)
 PRUNE_TIME_FMDN: Final[int] = 20 * 60  # Aggressive pruning for rotating FMDN source MACs
+# FMDN EIDs rotate every 1024 s, so a resolved payload can't be valid for longer.
+FMDN_EID_ROTATION_WINDOW: Final[int] = 1024
+# Payloads the resolver didn't recognise are re-checked after this many seconds.
+FMDN_NEGATIVE_CACHE_TIME: Final[int] = 60
+# Resolver time (seconds) unseen payloads may use on the advert path per cycle;
+# beyond that they are queued and drained after the advert loop (see fmdn/resolver_queue.py).
+FMDN_INLINE_RESOLVE_BUDGET: Final[float] = 0.005
+FMDN_QUEUE_DRAIN_BUDGET: Final[float] = 0.005  # Resolver time (seconds) spent draining the queue per cycle
+FMDN_RESOLVE_BATCH_SIZE: Final[int] = 32  # Queued payloads resolved per cycle at most
+FMDN_RESOLVE_QUEUE_MAX: Final[int] = 256  # Unseen payloads waiting beyond this are dropped
+# Caps for FMDN seen-EID diagnostics tracking; least recently seen entries are evicted first.
+FMDN_MAX_SEEN_EIDS: Final[int] = 2048
+FMDN_MAX_SOURCE_MACS: Final[int] = 1024
 
 PRUNE_TIME_REDACTIONS: Final[int] = 10 * 60  # when to discard redaction data
 
+# Learned correlation profiles are compacted periodically: profiles for deleted
+# areas are dropped, and auto-learned data for devices/scanners that have
+# vanished is dropped once it has not been updated for PROFILE_MAX_AGE.
+PROFILE_COMPACTION_INTERVAL: Final[int] = 60 * 60  # Every hour
+PROFILE_MAX_AGE: Final[int] = 30 * 86400  # 30 days without new samples
+
 SAVEOUT_COOLDOWN = 10  # seconds to delay before re-trying config entry save.
 
 DOCS: dict[str, str | tuple[str, ...]] = {}
@@ -555,6 +605,38 @@ DOCS[CONF_UPDATE_INTERVAL] = (
     "means more data, bigger database.",
 )
 
+CONF_CALIBRATION_INTERVAL, DEFAULT_CALIBRATION_INTERVAL = "calibration_interval", 10
+DOCS[CONF_CALIBRATION_INTERVAL] = (
+    "Seconds between recalculations of the suggested scanner RSSI offsets.",
+    "Cross-visibility samples are still collected every update.",
+)
+
+CONF_DISTANCE_DEADBAND, DEFAULT_DISTANCE_DEADBAND = "distance_deadband", 0.1
+DOCS[CONF_DISTANCE_DEADBAND] = (
+    "Minimum change in metres before a distance sensor publishes a new value",
+    "(or 5% of the current distance, whichever is larger).",
+)
+
+CONF_RSSI_DEADBAND, DEFAULT_RSSI_DEADBAND = "rssi_deadband", 2.0
+DOCS[CONF_RSSI_DEADBAND] = "Minimum change in dB before an RSSI sensor publishes a new value."
+
+CONF_PUBLISH_MAX_SILENCE, DEFAULT_PUBLISH_MAX_SILENCE = "publish_max_silence", 300
+DOCS[CONF_PUBLISH_MAX_SILENCE] = (
+    "Seconds after which distance/RSSI sensors publish their current value",
+    "even if it stayed inside the deadband.",
+)
+
+CONF_STATIONARY_BACKOFF, DEFAULT_STATIONARY_BACKOFF = "stationary_backoff", 8
+DOCS[CONF_STATIONARY_BACKOFF] = (
+    "Maximum multiplier of the update interval for devices that are stationary.",
+    "The interval doubles with each update while stationary. 1 disables back-off.",
+)
+
+# Fixed parts of the sensor publishing policy (see publish_policy.py)
+DISTANCE_RELATIVE_DEADBAND: Final = 0.05  # 5% of the published distance
+INTERVAL_ABSOLUTE_DEADBAND: Final = 0.1  # seconds, estimated broadcast interval
+INTERVAL_RELATIVE_DEADBAND: Final = 0.1  # 10% of the published interval
+
 CONF_SMOOTHING_SAMPLES, DEFAULT_SMOOTHING_SAMPLES = "smoothing_samples", 20
 DOCS[CONF_SMOOTHING_SAMPLES] = (
     "How many samples to average distance smoothing. Bigger numbers"
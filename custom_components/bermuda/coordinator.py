@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Container, Mapping
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 import aiofiles
 import voluptuous as vol
@@ -51,40 +51,54 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util.dt import get_age, now
 
+from .advert_waiters import AdvertWaiters
 from .area_selection import AreaSelectionHandler, AreaTests
 from .bermuda_device import BermudaDevice
 from .bermuda_irk import BermudaIrkManager
 from .const import (
     _LOGGER,
     _LOGGER_SPAM_LESS,
-    BDADDR_TYPE_NOT_MAC48,
-    BDADDR_TYPE_RANDOM_RESOLVABLE,
     CONF_ATTENUATION,
+    CONF_CALIBRATION_INTERVAL,
+    CONF_CONSOLIDATED_SCANNER_DISTANCES,
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
+    CONF_DISTANCE_DEADBAND,
     CONF_FMDN_EID_FORMAT,
     CONF_FMDN_MODE,
     CONF_MAX_RADIUS,
     CONF_MAX_VELOCITY,
+    CONF_PUBLISH_MAX_SILENCE,
     CONF_RECORDER_FRIENDLY,
     CONF_REF_POWER,
+    CONF_RSSI_DEADBAND,
     CONF_RSSI_OFFSETS,
     CONF_SMOOTHING_SAMPLES,
+    CONF_STATIONARY_BACKOFF,
     CONF_UPDATE_INTERVAL,
     CONF_USE_UKF_AREA_SELECTION,
     DEFAULT_ATTENUATION,
+    DEFAULT_CALIBRATION_INTERVAL,
+    DEFAULT_CONSOLIDATED_SCANNER_DISTANCES,
     DEFAULT_DEVTRACK_TIMEOUT,
+    DEFAULT_DISTANCE_DEADBAND,
     DEFAULT_MAX_RADIUS,
     DEFAULT_MAX_VELOCITY,
+    DEFAULT_PUBLISH_MAX_SILENCE,
     DEFAULT_RECORDER_FRIENDLY,
     DEFAULT_REF_POWER,
+    DEFAULT_RSSI_DEADBAND,
     DEFAULT_SMOOTHING_SAMPLES,
+    DEFAULT_STATIONARY_BACKOFF,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_USE_UKF_AREA_SELECTION,
     DOMAIN,
     DOMAIN_GOOGLEFINDMY,
     EVIDENCE_WINDOW_SECONDS,
+    PROFILE_COMPACTION_INTERVAL,
+    PROFILE_MAX_AGE,
     PRUNE_MAX_COUNT,
+    PRUNE_MAX_SHADOWS,
     PRUNE_TIME_DEFAULT,
     PRUNE_TIME_FMDN,
     PRUNE_TIME_INTERVAL,
@@ -92,21 +106,39 @@ from .const import (
     REPAIR_SCANNER_WITHOUT_AREA,
     SAVEOUT_COOLDOWN,
     SIGNAL_DEVICE_NEW,
+    SIGNAL_DEVICE_UPDATED,
     SIGNAL_SCANNERS_CHANGED,
+    TRAINING_SAMPLE_COUNT,
     UPDATE_INTERVAL,
 )
-from .correlation import AreaProfile, CorrelationStore, RoomProfile
+from .correlation import AreaProfile, CorrelationStore, ProfileCompactor, RoomProfile
+from .device_updates import DeviceUpdateDispatcher
+from .filters import KalmanFilterBank
 from .fmdn import FmdnIntegration
+from .freshness import FreshnessIndex
+from .metadevice_adverts import MetadeviceAdverts
 from .metadevice_manager import MetadeviceManager
+from .prune_index import BUCKET_RPA, BUCKET_STATIC, PruneIndex
+from .registry_index import RegistryIndex
 from .scanner_calibration import ScannerCalibrationManager, update_scanner_calibration
 from .services import BermudaServiceHandler
-from .util import is_mac_address, normalize_address, normalize_mac
+from .shadow_devices import ShadowDeviceTable, carries_identity_payload, is_shadow_candidate
+from .util import ADDRESS_REGISTRY, is_mac_address, normalize_address, normalize_mac
 
 Cancellable = Callable[[], None]
 CORRELATION_SAVE_INTERVAL = 300  # Save learned correlations every 5 minutes
 
 
+class TrainingSample(NamedTuple):
+    """One multi-scanner fingerprint training sample."""
+
+    rssi_readings: dict[str, float]  # scanner address -> RSSI
+    primary_scanner_addr: str  # strongest scanner
+    primary_rssi: float
+
+
 if TYPE_CHECKING:
+    from bleak.backends.scanner import AdvertisementData
     from habluetooth import BaseHaScanner, BluetoothServiceInfoBleak
     from homeassistant.components.bluetooth import (
         BluetoothChange,
@@ -195,6 +227,19 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         self.irk_manager = BermudaIrkManager()
         self.fmdn = FmdnIntegration(self)
         self.scanner_calibration = ScannerCalibrationManager()
+        # Wakes per-device entities only when their device changed (see device_updates.py)
+        self.device_updates = DeviceUpdateDispatcher()
+        self.prune_index = PruneIndex()
+        # Advert stamp high-water marks per scanner and recently heard devices (see freshness.py)
+        self.freshness = FreshnessIndex()
+        # Untracked transient addresses that don't get a full device (see shadow_devices.py)
+        self.shadow_devices = ShadowDeviceTable(PRUNE_MAX_SHADOWS)
+        # entry_id -> device and unique_id prefix -> entities (see registry_index.py)
+        self.registry_index = RegistryIndex()
+        # Coroutines (fingerprint training) waiting for a device's next new advert (see advert_waiters.py)
+        self.advert_waiters = AdvertWaiters()
+        # State of every advert's RSSI Kalman filter, updated in one batched step per cycle (see kalman_bank.py)
+        self.rssi_filter_bank = KalmanFilterBank()
 
         # Scanner correlation learning for improved area localization
         self.correlation_store = CorrelationStore(hass)
@@ -202,6 +247,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         self.room_profiles: dict[str, RoomProfile] = {}  # Device-independent room fingerprints
         self._correlations_loaded = False
         self._last_correlation_save: float = 0
+        self.profile_compactor = ProfileCompactor(max_age=PROFILE_MAX_AGE)
+        # When we last compacted correlation profiles. Starts "now" so the first run waits
+        # a full interval for scanners and devices to be rediscovered after startup.
+        self.stamp_last_compaction: float = monotonic_time_coarse()
 
         # UKF (Unscented Kalman Filter) instances per device for multi-scanner fusion
         # Key: device address, Value: UKF instance tracking RSSI from all visible scanners
@@ -255,19 +304,36 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         self.config_entry.async_on_unload(
             self.hass.bus.async_listen(EVENT_DEVICE_REGISTRY_UPDATED, self.handle_devreg_changes)
         )
+        # Keep the entity unique_id index current.
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self.handle_entreg_changes)
+        )
+        # Area/floor changes only need the area selection topology index refreshed.
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self.handle_topology_changes)
+        )
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(fr.EVENT_FLOOR_REGISTRY_UPDATED, self.handle_topology_changes)
+        )
 
         self.options: dict[str, Any] = {}
 
         # TODO: This is only here because we haven't set up migration of config
         # entries yet, so some users might not have this defined after an update.
         self.options[CONF_ATTENUATION] = DEFAULT_ATTENUATION
+        self.options[CONF_CALIBRATION_INTERVAL] = DEFAULT_CALIBRATION_INTERVAL
         self.options[CONF_DEVTRACK_TIMEOUT] = DEFAULT_DEVTRACK_TIMEOUT
+        self.options[CONF_DISTANCE_DEADBAND] = DEFAULT_DISTANCE_DEADBAND
         self.options[CONF_MAX_RADIUS] = DEFAULT_MAX_RADIUS
         self.options[CONF_MAX_VELOCITY] = DEFAULT_MAX_VELOCITY
+        self.options[CONF_PUBLISH_MAX_SILENCE] = DEFAULT_PUBLISH_MAX_SILENCE
         self.options[CONF_REF_POWER] = DEFAULT_REF_POWER
+        self.options[CONF_RSSI_DEADBAND] = DEFAULT_RSSI_DEADBAND
         self.options[CONF_SMOOTHING_SAMPLES] = DEFAULT_SMOOTHING_SAMPLES
+        self.options[CONF_STATIONARY_BACKOFF] = DEFAULT_STATIONARY_BACKOFF
         self.options[CONF_UPDATE_INTERVAL] = DEFAULT_UPDATE_INTERVAL
         self.options[CONF_RECORDER_FRIENDLY] = DEFAULT_RECORDER_FRIENDLY
+        self.options[CONF_CONSOLIDATED_SCANNER_DISTANCES] = DEFAULT_CONSOLIDATED_SCANNER_DISTANCES
         self.options[CONF_RSSI_OFFSETS] = {}
         self.options[CONF_USE_UKF_AREA_SELECTION] = DEFAULT_USE_UKF_AREA_SELECTION
 
@@ -279,15 +345,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             for key, val in entry.options.items():
                 if key in (
                     CONF_ATTENUATION,
+                    CONF_CALIBRATION_INTERVAL,
+                    CONF_CONSOLIDATED_SCANNER_DISTANCES,
                     CONF_DEVICES,
                     CONF_DEVTRACK_TIMEOUT,
+                    CONF_DISTANCE_DEADBAND,
                     CONF_FMDN_EID_FORMAT,
                     CONF_FMDN_MODE,
                     CONF_MAX_RADIUS,
                     CONF_MAX_VELOCITY,
+                    CONF_PUBLISH_MAX_SILENCE,
                     CONF_RECORDER_FRIENDLY,
                     CONF_REF_POWER,
                     CONF_SMOOTHING_SAMPLES,
+                    CONF_STATIONARY_BACKOFF,
+                    CONF_RSSI_DEADBAND,
                     CONF_RSSI_OFFSETS,
                     CONF_USE_UKF_AREA_SELECTION,
                 ):
@@ -311,6 +383,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             SupportsResponse.ONLY,
         )
 
+        # Register the train_fleet service
+        hass.services.async_register(
+            DOMAIN,
+            "train_fleet",
+            self.service_train_fleet,
+            vol.Schema(
+                {
+                    vol.Required("addresses"): vol.All(cv.ensure_list, [cv.string], vol.Length(min=1)),
+                    vol.Required("area_id"): cv.string,
+                    vol.Optional("samples"): vol.All(vol.Coerce(int), vol.Range(min=1, max=TRAINING_SAMPLE_COUNT)),
+                }
+            ),
+            SupportsResponse.OPTIONAL,
+        )
+
         # Register for newly discovered / changed BLE devices
         if self.config_entry is not None:
             self.config_entry.async_on_unload(
@@ -343,6 +430,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
     def scanner_list_add(self, scanner_device: BermudaDevice) -> None:
         self._scanner_list.add(scanner_device.address)
         self._scanners.add(scanner_device)
+        self.area_selection.topology.invalidate()
         async_dispatcher_send(self.hass, SIGNAL_SCANNERS_CHANGED)
 
     def scanner_list_del(self, scanner_device: BermudaDevice) -> None:
@@ -350,6 +438,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         # was never added to the list (e.g., during purge of removed scanners)
         self._scanner_list.discard(scanner_device.address)
         self._scanners.discard(scanner_device)
+        self.area_selection.topology.invalidate()
         async_dispatcher_send(self.hass, SIGNAL_SCANNERS_CHANGED)
 
     def reload_options(self) -> None:
@@ -364,20 +453,27 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             return
 
         _LOGGER.debug("Reloading options without full restart")
+        old_consolidated = self.options.get(CONF_CONSOLIDATED_SCANNER_DISTANCES)
 
         # Update options dict from config entry
         for key, val in entry.options.items():
             if key in (
                 CONF_ATTENUATION,
+                CONF_CALIBRATION_INTERVAL,
+                CONF_CONSOLIDATED_SCANNER_DISTANCES,
                 CONF_DEVICES,
                 CONF_DEVTRACK_TIMEOUT,
+                CONF_DISTANCE_DEADBAND,
                 CONF_FMDN_EID_FORMAT,
                 CONF_FMDN_MODE,
                 CONF_MAX_RADIUS,
                 CONF_MAX_VELOCITY,
+                CONF_PUBLISH_MAX_SILENCE,
                 CONF_RECORDER_FRIENDLY,
                 CONF_REF_POWER,
                 CONF_SMOOTHING_SAMPLES,
+                CONF_STATIONARY_BACKOFF,
+                CONF_RSSI_DEADBAND,
                 CONF_RSSI_OFFSETS,
                 CONF_USE_UKF_AREA_SELECTION,
             ):
@@ -389,6 +485,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             self.sensor_interval = new_interval
             _LOGGER.info("Sensor update interval changed to %s seconds", new_interval)
 
+        # Scanner distance entities depend on the consolidated mode, let the
+        # sensor platform create whichever kind is now missing.
+        if self.options.get(CONF_CONSOLIDATED_SCANNER_DISTANCES) != old_consolidated:
+            async_dispatcher_send(self.hass, SIGNAL_SCANNERS_CHANGED)
+
         # Propagate options to existing devices
         for device in self.devices.values():
             device.options = self.options
@@ -468,6 +569,14 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             # Ensure that an issue reading these files (which are optional, really) doesn't stop the whole show.
             self._waitingfor_load_manufacturer_ids = False
 
+    @callback
+    def handle_topology_changes(
+        self, ev: Event[ar.EventAreaRegistryUpdatedData] | Event[fr.EventFloorRegistryUpdatedData]
+    ) -> None:
+        """Invalidate the scanner topology index on area or floor registry changes."""
+        _LOGGER.debug("Area/floor registry has changed, invalidating topology. ev: %s", ev)
+        self.area_selection.topology.invalidate()
+
     @callback
     def handle_devreg_changes(self, ev: Event[EventDeviceRegistryUpdatedData]) -> None:
         """
@@ -476,6 +585,8 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         This catches area changes (on scanners) and any new/changed
         Private BLE Devices.
         """
+        # Scanner area assignments live in the device registry
+        self.area_selection.topology.invalidate()
         if ev.data["action"] == "update":
             _LOGGER.debug("Device registry UPDATE. ev: %s changes: %s", ev, ev.data["changes"])
         else:
@@ -489,12 +600,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 return
 
             # First look for any of our devices that have a stored id on them, it'll be quicker.
-            for device in self.devices.values():
-                if device.entry_id == device_id:
-                    # We matched, most likely a scanner.
-                    if device.is_scanner:
-                        self._refresh_scanners(force=True)
-                        return
+            device = self.registry_index.device_for_entry(device_id, self.devices)
+            if device is not None and device.is_scanner:
+                # We matched, most likely a scanner.
+                self._refresh_scanners(force=True)
+                return
             # Didn't match an existing, work through the connections etc.
 
             # Pull up the device registry entry for the device_id
@@ -565,6 +675,35 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         # will skip an update cycle if it detects one already in progress.
         # FIXME: self._async_update_data_internal()
 
+    @callback
+    def handle_entreg_changes(self, ev: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Keep the entity unique_id index in step with the entity registry."""
+        index = self.registry_index
+        if not index.entities_built:
+            # Nothing to maintain until the index is first needed.
+            return
+        data = ev.data
+        if data["action"] == "remove":
+            index.discard_entity(data["entity_id"])
+            return
+        if data["action"] == "update":
+            index.discard_entity(data.get("old_entity_id", data["entity_id"]))
+        entry = self.er.async_get(data["entity_id"])
+        if (
+            entry is not None
+            and entry.unique_id
+            and self.config_entry is not None
+            and entry.config_entry_id == self.config_entry.entry_id
+        ):
+            index.add_entity(entry.unique_id, entry.entity_id)
+
+    def _entity_index(self) -> RegistryIndex:
+        """Return the registry index, loading its entity part from the entity registry on first use."""
+        index = self.registry_index
+        if not index.entities_built and self.config_entry is not None:
+            index.rebuild_entities(er.async_entries_for_config_entry(self.er, self.config_entry.entry_id))
+        return index
+
     async def async_cleanup_device_registry_connections(self) -> None:
         """Canonicalise and deduplicate device registry connections for Bermuda devices."""
         mac_connection_types = {dr.CONNECTION_BLUETOOTH, dr.CONNECTION_NETWORK_MAC, "mac"}
@@ -619,11 +758,23 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 scanned,
             )
 
-    def _check_address_exists(self, base_address: str) -> bool:
+    def _fmdn_ids(self) -> set[str]:
+        """Return the FMDN canonical and device ids of all devices."""
+        ids: set[str] = set()
+        for device in self.devices.values():
+            if canonical_id := getattr(device, "fmdn_canonical_id", None):
+                ids.add(canonical_id)
+            if fmdn_device_id := getattr(device, "fmdn_device_id", None):
+                ids.add(fmdn_device_id)
+        return ids
+
+    def _check_address_exists(self, base_address: str, fmdn_ids: Container[str] | None = None) -> bool:
         """
         Check if a device address exists in coordinator.devices.
 
         For FMDN devices, also checks canonical_id and device_id matches.
+        Callers checking many addresses can pass fmdn_ids (from _fmdn_ids())
+        to avoid a pass over all devices per address.
         """
         if base_address in self.devices:
             return True
@@ -632,13 +783,27 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         if base_address.startswith("fmdn:"):
             # Try finding by canonical_id or device_id
             canonical_id = base_address[5:]  # Remove "fmdn:" prefix
-            for device in self.devices.values():
-                if (
-                    getattr(device, "fmdn_canonical_id", None) == canonical_id
-                    or getattr(device, "fmdn_device_id", None) == canonical_id
-                ):
-                    return True
+            if fmdn_ids is None:
+                fmdn_ids = self._fmdn_ids()
+            return canonical_id in fmdn_ids
+
+        return False
+
+    def _unique_id_has_device(self, unique_id: str) -> bool:
+        """
+        Return True if unique_id starts with the address of a known device.
 
+        Addresses end where the unique_id does or at an underscore, so only
+        those prefixes are looked up instead of comparing against every device.
+        """
+        devices = self.devices
+        if unique_id in devices:
+            return True
+        cut = unique_id.find("_")
+        while cut != -1:
+            if unique_id[:cut] in devices:
+                return True
+            cut = unique_id.find("_", cut + 1)
         return False
 
     # Known suffixes used in unique_id generation for entity type detection
@@ -705,9 +870,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 type_entities,
                 key=lambda e: (
                     e.disabled_by is None,
-                    any(e.unique_id and e.unique_id.startswith(addr) for addr in self.devices)
-                    if e.unique_id
-                    else False,
+                    self._unique_id_has_device(e.unique_id) if e.unique_id else False,
                 ),
                 reverse=True,
             )
@@ -741,6 +904,8 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             return
 
         bermuda_entities = er.async_entries_for_config_entry(registry, self.config_entry.entry_id)
+        # Reuse this pass to (re)load the entity index.
+        self.registry_index.rebuild_entities(bermuda_entities)
         if not bermuda_entities:
             return
 
@@ -760,11 +925,12 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
         # Find orphaned entities (address no longer exists)
         entities_to_remove: list[str] = []
+        fmdn_ids = self._fmdn_ids()
         for base_address, entities in entities_by_base_address.items():
             if base_address.startswith("BERMUDA_GLOBAL"):
                 continue
 
-            if not self._check_address_exists(base_address):
+            if not self._check_address_exists(base_address, fmdn_ids):
                 for entity in entities:
                     entities_to_remove.append(entity.entity_id)
                     _LOGGER.debug(
@@ -789,6 +955,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 removed_count += 1
             except KeyError:
                 pass
+            self.registry_index.discard_entity(entity_id)
 
         if removed_count > 0:
             _LOGGER.info(
@@ -863,9 +1030,6 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         if self.config_entry is None:
             return None
 
-        # Get all Bermuda entities
-        bermuda_entities = er.async_entries_for_config_entry(self.er, self.config_entry.entry_id)
-
         # For FMDN devices, check if there are entities with the old address format
         if device.fmdn_device_id or device.fmdn_canonical_id:
             # Possible old address formats to check
@@ -879,22 +1043,19 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             # Remove the current address from the list
             old_addresses = [addr for addr in old_addresses if addr != address]
 
-            for entity in bermuda_entities:
-                if entity.unique_id is None:
-                    continue
-
-                for old_addr in old_addresses:
-                    if entity.unique_id.startswith(old_addr):
-                        # Found an entity with an old address format
-                        # Return the old address so caller can decide what to do
-                        _LOGGER.debug(
-                            "Found existing entity %s with old FMDN address format %s "
-                            "(current: %s). Will clean up old entities.",
-                            entity.entity_id,
-                            old_addr,
-                            address,
-                        )
-                        return old_addr
+            index = self._entity_index()
+            for old_addr in old_addresses:
+                if matches := index.entities_with_prefix(old_addr):
+                    # Found an entity with an old address format
+                    # Return the old address so caller can decide what to do
+                    _LOGGER.debug(
+                        "Found existing entity %s with old FMDN address format %s "
+                        "(current: %s). Will clean up old entities.",
+                        matches[0][1],
+                        old_addr,
+                        address,
+                    )
+                    return old_addr
 
         # Note: We intentionally do NOT use device name matching for non-FMDN devices
         # because different devices can have the same name, causing false positives.
@@ -922,24 +1083,21 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             return 0
 
         removed_count = 0
-        bermuda_entities = er.async_entries_for_config_entry(self.er, self.config_entry.entry_id)
-
-        for entity in bermuda_entities:
-            if entity.unique_id is None:
-                continue
+        index = self._entity_index()
 
-            if entity.unique_id.startswith(old_address):
-                try:
-                    self.er.async_remove(entity.entity_id)
-                    removed_count += 1
-                    _LOGGER.debug(
-                        "Removed old entity %s (old address: %s, new: %s)",
-                        entity.entity_id,
-                        old_address,
-                        new_address,
-                    )
-                except KeyError:
-                    pass
+        for _unique_id, entity_id in index.entities_with_prefix(old_address):
+            try:
+                self.er.async_remove(entity_id)
+                removed_count += 1
+                _LOGGER.debug(
+                    "Removed old entity %s (old address: %s, new: %s)",
+                    entity_id,
+                    old_address,
+                    new_address,
+                )
+            except KeyError:
+                pass
+            index.discard_entity(entity_id)
 
         if removed_count > 0:
             _LOGGER.info(
@@ -1086,18 +1244,52 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         #
         # This enables true averaging across multiple positions in a large room.
         if not last_stamps:  # First call of new training session
-            normalized_address = device.address
-            if normalized_address in self.correlations and target_area_id in self.correlations[normalized_address]:
-                existing_profile = self.correlations[normalized_address][target_area_id]
-                existing_profile.reset_variance_only()
-                _LOGGER.info(
-                    "Reset variance for %s in area %s (multi-position training enabled)",
-                    device.name,
-                    target_area_id,
-                )
+            self._reset_training_variance(device, target_area_id)
 
-        # Collect current RSSI readings AND timestamps from all visible scanners
         nowstamp = monotonic_time_coarse()
+        sample, current_stamps = self._collect_training_sample(device, last_stamps, nowstamp)
+        if sample is None:
+            return (False, current_stamps)
+        self._apply_training_sample(device, target_area_id, sample)
+        self._log_button_training(device, target_area_id, len(sample.rssi_readings))
+
+        # Save correlations immediately after manual training
+        await self.correlation_store.async_save(self.correlations, self.room_profiles)
+        self._last_correlation_save = nowstamp
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Saved correlations for %s after training. Total devices: %d",
+                device.name,
+                len(self.correlations),
+            )
+
+        return (True, current_stamps)
+
+    def _reset_training_variance(self, device: BermudaDevice, target_area_id: str) -> None:
+        """Reset the button filter variance of an existing profile at the start of a training session."""
+        normalized_address = device.address
+        if normalized_address in self.correlations and target_area_id in self.correlations[normalized_address]:
+            existing_profile = self.correlations[normalized_address][target_area_id]
+            existing_profile.reset_variance_only()
+            _LOGGER.info(
+                "Reset variance for %s in area %s (multi-position training enabled)",
+                device.name,
+                target_area_id,
+            )
+
+    def _collect_training_sample(
+        self,
+        device: BermudaDevice,
+        last_stamps: dict[str, float] | None,
+        nowstamp: float,
+    ) -> tuple[TrainingSample | None, dict[str, float]]:
+        """
+        Read a training sample from the device's current adverts.
+
+        Returns the sample (None if there are no recent readings, or no scanner
+        has a stamp newer than last_stamps) and the current stamps per scanner.
+        """
+        # Collect current RSSI readings AND timestamps from all visible scanners
         rssi_readings: dict[str, float] = {}
         current_stamps: dict[str, float] = {}
         primary_scanner_addr: str | None = None
@@ -1123,7 +1315,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                     "Training for %s: no recent RSSI readings, waiting...",
                     device.name,
                 )
-            return (False, current_stamps)
+            return None, current_stamps
 
         if primary_rssi is None or primary_scanner_addr is None:
             if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -1131,7 +1323,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                     "Training for %s: no primary scanner identified, waiting...",
                     device.name,
                 )
-            return (False, current_stamps)
+            return None, current_stamps
 
         # BUG 19 FIX: Only train if we have NEW advertisement data
         # Without this check, we'd re-read the same cached RSSI values multiple times,
@@ -1148,7 +1340,13 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
             if not has_new_data:
                 # No new data yet - return current stamps so caller can retry
-                return (False, current_stamps)
+                return None, current_stamps
+
+        return TrainingSample(rssi_readings, primary_scanner_addr, primary_rssi), current_stamps
+
+    def _apply_training_sample(self, device: BermudaDevice, target_area_id: str, sample: TrainingSample) -> None:
+        """Feed a training sample into the device's AreaProfile and the RoomProfile with button weight."""
+        rssi_readings, primary_scanner_addr, primary_rssi = sample
 
         # BUG 17 FIX: Use device.address (normalized) instead of device_address (raw parameter)
         # This ensures the correlations key matches the lookup key used elsewhere in the code.
@@ -1181,8 +1379,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             self.room_profiles[target_area_id] = RoomProfile(area_id=target_area_id)
         self.room_profiles[target_area_id].update_button(rssi_readings)
 
+    def _log_button_training(self, device: BermudaDevice, target_area_id: str, scanner_count: int) -> None:
+        """Log the button sample counts of a trained profile."""
         # BUG 17 DEBUG: Log button sample counts after training
-        trained_profile = self.correlations[normalized_address][target_area_id]
+        trained_profile = self.correlations[device.address][target_area_id]
         btn_counts = []
         for scanner_addr, abs_prof in trained_profile._absolute_profiles.items():
             btn_counts.append(f"{scanner_addr[-8:]}:{abs_prof.button_sample_count}")
@@ -1191,22 +1391,128 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             "Button counts: [%s], has_button_training=%s",
             device.name,
             target_area_id,
-            len(rssi_readings),
+            scanner_count,
             ", ".join(btn_counts),
             trained_profile.has_button_training,
         )
 
-        # Save correlations immediately after manual training
-        await self.correlation_store.async_save(self.correlations, self.room_profiles)
-        self._last_correlation_save = nowstamp
-        if _LOGGER.isEnabledFor(logging.DEBUG):
-            _LOGGER.debug(
-                "Saved correlations for %s after training. Total devices: %d",
-                device.name,
-                len(self.correlations),
+    async def async_wait_for_advert(
+        self,
+        device_address: str,
+        last_stamps: dict[str, float] | None,
+        wait_seconds: float,
+    ) -> bool:
+        """
+        Wait until a device has advert data newer than last_stamps.
+
+        Returns at once if a scanner already has a newer stamp (data that
+        arrived while the caller was busy), otherwise waits for the next new
+        advert from the device or any of its metadevice sources. Sources are
+        re-read on every call, so rotating addresses are picked up.
+
+        Args:
+        ----
+            device_address: Address of the device to wait for
+            last_stamps: Dict of scanner_addr -> stamp, as returned by async_train_fingerprint
+            wait_seconds: Seconds to wait at most
+
+        Returns:
+        -------
+            True if new advert data is available, False on timeout or unknown device.
+
+        """
+        device = self._get_device(device_address)
+        if device is None:
+            return False
+        if last_stamps:
+            # Scanners missing from last_stamps were outside the evidence window
+            # at the last sample, so only count them once they pass the newest stamp.
+            newest = max(last_stamps.values())
+            for advert in device.adverts.values():
+                if advert.stamp is not None and advert.stamp > last_stamps.get(advert.scanner_address, newest):
+                    return True
+        return await self.advert_waiters.wait([device.address, *device.metadevice_sources], wait_seconds)
+
+    async def async_train_fleet(
+        self,
+        device_addresses: list[str],
+        target_area_id: str,
+        sample_count: int,
+        max_time: float,
+        wait_timeout: float,
+    ) -> dict[str, int]:
+        """
+        Train fingerprints for several devices in one area in a single pass.
+
+        Samples for all devices are taken from the same advert stream: one
+        wait covers every device still short of sample_count, and each wake
+        reads a new sample from every device that has new data. Samples are
+        buffered and only fed into the profiles once collection ends, after
+        which the correlations are saved once.
+
+        Args:
+        ----
+            device_addresses: Addresses of the devices to train
+            target_area_id: Home Assistant area ID all devices are in
+            sample_count: Samples to collect per device
+            max_time: Seconds after which collection stops regardless
+            wait_timeout: Longest single wait for a new advert
+
+        Returns:
+        -------
+            Number of samples trained per device address (unknown devices are omitted).
+
+        """
+        devices: dict[str, BermudaDevice] = {}
+        for device_address in device_addresses:
+            device = self._get_device(device_address)
+            if device is None:
+                _LOGGER.warning("Cannot train fingerprint: device %s not found", device_address)
+                continue
+            devices[device.address] = device
+            # Velocity Reset, as in async_train_fingerprint: the device is HERE NOW
+            device.reset_velocity_history()
+
+        samples: dict[str, list[TrainingSample]] = {address: [] for address in devices}
+        last_stamps: dict[str, dict[str, float]] = {address: {} for address in devices}
+        pending = set(devices)
+        deadline = monotonic_time_coarse() + max_time
+
+        while pending:
+            nowstamp = monotonic_time_coarse()
+            for address in list(pending):
+                sample, current_stamps = self._collect_training_sample(devices[address], last_stamps[address], nowstamp)
+                if current_stamps:
+                    last_stamps[address] = current_stamps
+                if sample is not None:
+                    samples[address].append(sample)
+                    if len(samples[address]) >= sample_count:
+                        pending.discard(address)
+
+            remaining = deadline - monotonic_time_coarse()
+            if not pending or remaining <= 0:
+                break
+            await self.advert_waiters.wait(
+                [source for address in pending for source in (address, *devices[address].metadevice_sources)],
+                min(wait_timeout, remaining),
             )
 
-        return (True, current_stamps)
+        # Batch the profile updates, then persist once
+        for address, device_samples in samples.items():
+            if not device_samples:
+                continue
+            device = devices[address]
+            self._reset_training_variance(device, target_area_id)
+            for sample in device_samples:
+                self._apply_training_sample(device, target_area_id, sample)
+            self._log_button_training(device, target_area_id, len(device_samples[-1].rssi_readings))
+            device.update_area_and_floor(target_area_id)
+
+        if any(samples.values()):
+            await self.correlation_store.async_save(self.correlations, self.room_profiles)
+            self._last_correlation_save = monotonic_time_coarse()
+
+        return {address: len(device_samples) for address, device_samples in samples.items()}
 
     async def async_reset_device_training(self, device_address: str) -> bool:
         """
@@ -1300,26 +1606,29 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         Useful as a general indicator of health
         """
         stamp = monotonic_time_coarse() - 10  # seconds
-        fresh_count = 0
-        for device in self.devices.values():
+        # Devices heard by scanners are recorded at ingest; only fresh ones are visited.
+        fresh_count = self.freshness.count_devices_seen_since(stamp, self.devices)
+        # Metadevices and scanners get their last_seen from aggregation and scanner updates.
+        for device in self.metadevices.values():
             if device.last_seen > stamp:
                 fresh_count += 1
-        return fresh_count
+        for scanner in self._scanners:
+            if scanner.last_seen > stamp and not self.freshness.device_seen_since(scanner.address, stamp):
+                fresh_count += 1
+        return fresh_count + self.shadow_devices.count_seen_since(stamp)
 
     def count_active_scanners(self, max_age: float = 10) -> int:
-        """Returns count of scanners that have recently sent updates."""
-        stamp = monotonic_time_coarse() - max_age  # seconds
-        fresh_count = 0
-        for scanner in self.get_active_scanner_summary():
-            last_stamp = scanner.get("last_stamp", 0)
-            if isinstance(last_stamp, str):
-                try:
-                    last_stamp = float(last_stamp)
-                except ValueError:
-                    last_stamp = 0.0
-            if float(last_stamp) > stamp:
-                fresh_count += 1
-        return fresh_count
+        """
+        Returns count of scanners that have recently sent updates.
+
+        Counted once per update cycle (calculate_data asks for every stale device).
+        """
+
+        def _count() -> int:
+            stamp = monotonic_time_coarse() - max_age  # seconds
+            return sum(1 for scanner in self._scanners if scanner.last_seen > stamp)
+
+        return self.freshness.active_scanner_count(max_age, _count)
 
     def get_active_scanner_summary(self) -> list[dict[str, float | str]]:
         """
@@ -1383,15 +1692,33 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                         )
 
         result = self._async_update_data_internal()
+        self._dispatch_device_updates()
 
-        # Periodically save correlations
+        # Periodically drop dead profiles, and persist straight away if that freed anything
         nowstamp = monotonic_time_coarse()
+        if self.compact_profiles() > 0:
+            self._last_correlation_save = 0
+
+        # Periodically save correlations
         if nowstamp - self._last_correlation_save > CORRELATION_SAVE_INTERVAL:
             await self.correlation_store.async_save(self.correlations, self.room_profiles)
             self._last_correlation_save = nowstamp
 
         return result
 
+    def _dispatch_device_updates(self) -> None:
+        """
+        Signal the entities of devices whose tracking state changed this cycle.
+
+        Per-device entities listen on SIGNAL_DEVICE_UPDATED rather than the
+        coordinator, so unchanged devices stay idle. Unchanged devices are
+        still signalled every sensor update interval.
+        """
+        for address in self.device_updates.changed_devices(
+            self.devices.values(), monotonic_time_coarse(), self.sensor_interval
+        ):
+            async_dispatcher_send(self.hass, SIGNAL_DEVICE_UPDATED.format(address))
+
     def _async_update_data_internal(self) -> bool:
         """
         The primary update loop that processes almost all data in Bermuda.
@@ -1424,6 +1751,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
 
             self.update_metadevices()
 
+            # Apply this cycle's queued RSSI readings to every advert's Kalman
+            # filter in one batched step before the smoothed distances are read.
+            self.rssi_filter_bank.flush()
+
             # Calculate per-device data
             #
             # Scanner entries have been loaded up with latest data, now we can
@@ -1433,10 +1764,12 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 device.calculate_data()
 
             # Update scanner auto-calibration based on cross-visibility
+            # (offsets are only recomputed every CONF_CALIBRATION_INTERVAL seconds)
             update_scanner_calibration(
                 self.scanner_calibration,
                 self._scanner_list,
                 self.devices,
+                offset_interval=self.options.get(CONF_CALIBRATION_INTERVAL, DEFAULT_CALIBRATION_INTERVAL),
             )
 
             self._refresh_areas_by_min_distance()
@@ -1503,6 +1836,17 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         if self._scanner_init_pending:
             self._refresh_scanners(force=True)
 
+        # Refill the FMDN inline resolver budget for this cycle's adverts.
+        if self.fmdn:
+            self.fmdn.begin_cycle()
+
+        nowstamp = monotonic_time_coarse()
+        self.freshness.begin_cycle(nowstamp)
+        # Adverts from shadowed addresses this cycle, replayed if they get promoted.
+        shadowed: list[tuple[str, BermudaDevice, AdvertisementData]] = []
+        # Counted here rather than in the registry to keep its cached path a bare dict.get.
+        address_lookups = 0
+
         for ha_scanner in self._hascanners:
             # Create / Get the BermudaDevice for this scanner
             scanner_device = self._get_device(ha_scanner.source)
@@ -1518,7 +1862,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                 # perhaps it's an unexpected type that we don't know how to
                 # find.
                 _LOGGER_SPAM_LESS.error(
-                    f"missing_scanner_entry_{ha_scanner.source}",
+                    ("missing_scanner_entry", ha_scanner.source),
                     "Failed to find config for scanner %s, this is probably a bug.",
                     ha_scanner.source,
                 )
@@ -1537,31 +1881,50 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                     continue
 
                 # ============================================================
-                # RESOLUTION FIRST: Identity resolvers run BEFORE any filtering
+                # IDENTITY RESOLUTION: hooks run per advert, IRK matching is batched
                 # ============================================================
-                # CRITICAL: The identity resolution hooks MUST run BEFORE
-                # process_advertisement() so that rotating MAC addresses can be
-                # linked to their metadevices before any state updates happen.
+                # Rotating MAC addresses (Apple IRK, Google FMDN) must be linked to
+                # their metadevices in the same cycle their adverts arrive, or their
+                # data would be treated as "unknown noise".
                 #
-                # Without this order, devices with rotating MACs (Apple IRK,
-                # Google FMDN) would be treated as "unknown noise" and their
-                # advertisement data would be lost.
-
-                # 1. Create/get the device object (OHNE Filter!)
-                # We need the object so resolvers can store their state.
-                device = self._get_or_create_device(bledevice.address)
+                # FMDN payloads are handled below (payloads over the inline budget are
+                # resolved before the next cycle). New MACs are only queued
+                # for IRK matching here: resolve_pending() checks the whole queue
+                # against all known IRKs after this loop and fires the match
+                # callbacks then, before metadevices are updated. A MAC's first
+                # advert is therefore processed before it is known to belong to an
+                # IRK; the metadevice picks it up from the source device that cycle.
+
+                # 1. Create/get the device object.
+                # We need the object so resolvers can store their state. Unknown
+                # private addresses nothing claims only get a shadow record; they
+                # are still queued for IRK resolution, and promoted (with this
+                # advert replayed) below if that resolves them.
+                address = normalize_address(bledevice.address)
+                address_lookups += 1
+                device = self.devices.get(address)
+                if device is None:
+                    if not self._admit_device(address, advertisementdata):
+                        self.irk_manager.queue_mac(address)
+                        # Still proves the scanner is receiving
+                        self.freshness.record_scanner(scanner_device.address, adstamp or nowstamp)
+                        self.shadow_devices.record(address, advertisementdata.rssi, nowstamp, scanner_device.address)
+                        shadowed.append((address, scanner_device, advertisementdata))
+                        continue
+                    device = self._get_or_create_device(address)
 
-                # 2. Identity Resolution Hooks (MUST run before process_advertisement!)
+                # 2. Identity Resolution Hooks
 
                 # A. Apple IRK Resolution (iPhone, Watch, AirTag, etc.)
                 # Checks if the random MAC belongs to a known IRK.
                 # This is called on every advertisement to catch cases where:
                 # - The IRK was learned after the device was first seen
                 # - The MAC rotated to a new address that now matches a known IRK
-                # The check is cheap because irk_manager caches results.
-                # scan_device() returns (matched, result) and fires callbacks when matched.
+                # Known MACs are a cache hit. New ones are queued and resolved against
+                # all IRKs in one batch after this loop (resolve_pending), which still
+                # fires the callbacks before metadevices are updated.
                 if self.irk_manager:
-                    self.irk_manager.scan_device(bledevice.address)
+                    self.irk_manager.queue_mac(address)
 
                 # B. Google FMDN Resolution (Find My Device Network)
                 # Checks for Service UUID 0xFEAA and resolves EIDs to devices.
@@ -1576,17 +1939,113 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                     self.fmdn.handle_advertisement(device, service_data)
 
                 # 3. Standard Processing (RSSI, Scanner info, etc.)
-                # ONLY NOW do we process the physical advertisement data,
-                # after identity resolution has had a chance to "claim" the device.
-                device.process_advertisement(scanner_device, advertisementdata)
+                # The physical advertisement data is processed after the FMDN hook
+                # has had a chance to "claim" the device.
+                if address in self.advert_waiters:
+                    advert = device.adverts.get((device.address, scanner_device.address))
+                    prev_stamp = advert.stamp if advert is not None else None
+                    device.process_advertisement(scanner_device, advertisementdata)
+                    advert = device.adverts.get((device.address, scanner_device.address))
+                    if advert is not None and advert.stamp != prev_stamp:
+                        self.advert_waiters.notify(address)
+                else:
+                    device.process_advertisement(scanner_device, advertisementdata)
+                    advert = device.adverts.get((device.address, scanner_device.address))
+
+                if advert is not None:
+                    # 4. Freshness high-water marks (scanner online status, activity counts)
+                    self.freshness.record(
+                        device.address, device.last_seen, scanner_device.address, advert.stamp, nowstamp
+                    )
+
+                    # 5. Scanner auto-calibration: index scanner-to-scanner sightings
+                    # here so calibration never has to search every device's adverts.
+                    if device.address in self.scanner_calibration.mac_to_scanner:
+                        self.scanner_calibration.record_scanner_advert(
+                            device.address, advert.scanner_address, advert.rssi, advert.stamp
+                        )
 
                 # ============================================================
-                # END RESOLUTION FIRST
+                # END IDENTITY RESOLUTION
                 # ============================================================
 
         # end of for ha_scanner loop
+
+        ADDRESS_REGISTRY.lookups += address_lookups
+        # Resolve this cycle's new MACs against all known IRKs in one batch
+        # (and continue any large rescan left over from add_irk).
+        if self.irk_manager:
+            self.irk_manager.resolve_pending()
+        if shadowed:
+            self._promote_shadowed(shadowed)
+        # FMDN payloads that didn't fit in this cycle's inline budget are
+        # resolved now, within a separate per-cycle drain budget.
+        if self.fmdn:
+            self.fmdn.drain_pending()
         return True
 
+    def _admit_device(self, address: str, advertisementdata: AdvertisementData) -> bool:
+        """
+        Decide whether an address without a device gets a full BermudaDevice.
+
+        Only resolvable private addresses can be shadowed, and only while
+        nothing claims them: not a scanner, not resolved to a known IRK, and no
+        FMDN or iBeacon payload (which would make them a metadevice source).
+        Configured devices always exist already, so never reach this.
+        """
+        if not is_shadow_candidate(address):
+            return True
+        if address in self.scanner_calibration.mac_to_scanner or self.irk_manager.is_resolved(address):
+            return True
+        return carries_identity_payload(advertisementdata.service_data, advertisementdata.manufacturer_data)
+
+    def _promote_shadowed(self, shadowed: list[tuple[str, BermudaDevice, AdvertisementData]]) -> None:
+        """Promote this cycle's shadowed addresses that now resolve to an IRK, replaying their adverts."""
+        for address, scanner_device, advertisementdata in shadowed:
+            if address not in self.devices and not self.irk_manager.is_resolved(address):
+                continue
+            if self.shadow_devices.promote(address) is not None:
+                _LOGGER.debug("Promoting shadowed address %s to a full device", address)
+            self._get_or_create_device(address).process_advertisement(scanner_device, advertisementdata)
+
+    def compact_profiles(self, force_compaction: bool = False) -> int:  # noqa: FBT001
+        """
+        Drop learned correlation profiles that no longer match the live deployment.
+
+        Runs at most every PROFILE_COMPACTION_INTERVAL unless force_compaction
+        is set. Uses the area registry, current scanner list and known devices
+        to decide what is dead (see ProfileCompactor).
+
+        Returns the approximate number of bytes reclaimed from the store.
+        """
+        nowstamp = monotonic_time_coarse()
+        if not self._correlations_loaded:
+            return 0
+        if self.stamp_last_compaction > nowstamp - PROFILE_COMPACTION_INTERVAL and not force_compaction:
+            return 0
+        self.stamp_last_compaction = nowstamp
+
+        live_devices = set(self.devices) | set(self.metadevices)
+        configured_devices = self.options.get(CONF_DEVICES, [])
+        if isinstance(configured_devices, list):
+            live_devices.update(normalize_address(address) for address in configured_devices)
+
+        reclaimed = self.profile_compactor.compact(
+            self.correlations,
+            self.room_profiles,
+            nowstamp=nowstamp,
+            live_devices=live_devices,
+            live_area_ids={area.id for area in self.ar.async_list_areas()},
+            live_scanners=set(self._scanner_list),
+        )
+        if reclaimed > 0:
+            _LOGGER.debug(
+                "Compacted correlation profiles, reclaimed ~%d bytes: %s",
+                reclaimed,
+                self.profile_compactor.stats.to_dict(),
+            )
+        return reclaimed
+
     def prune_devices(self, force_pruning: bool = False) -> None:  # noqa: C901, FBT001
         """
         Scan through all collected devices, and remove those that meet Pruning criteria.
@@ -1615,9 +2074,14 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         # Prune any FMDN EIDs that have expired
         self.fmdn.manager.async_prune()
 
+        # Shadowed addresses expire like unknown IRK devices
+        self.shadow_devices.prune(stamp_unknown_irk)
+
         # Prune devices.
-        prune_list: list[str] = []  # list of addresses to be pruned
-        prunable_stamps: dict[str, float] = {}  # dict of potential prunees if we need to be more aggressive.
+        # Addresses to be pruned, as an ordered set (dict keys) for O(1) membership.
+        prune_list: dict[str, None] = {}
+        index = self.prune_index
+        index.sync(self.devices)
 
         # =======================================================================
         # FIX: Collect ALL addresses that serve as sources for ANY metadevice.
@@ -1643,95 +2107,88 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                         if self.fmdn.prune_source(_device, stamp_fmdn, sources_to_prune):
                             # Remove from keepers so it CAN be pruned
                             metadevice_source_keepers.discard(address)
-                            if address not in prune_list:
-                                prune_list.append(address)
+                            prune_list[address] = None
                         # Also check IRK sources that are extremely stale
                         elif _device.last_seen < stamp_unknown_irk:
                             # Only prune if it's not the ONLY source for this metadevice
                             if len(metadevice.metadevice_sources) > 1:
                                 metadevice_source_keepers.discard(address)
-                                if address not in prune_list:
-                                    prune_list.append(address)
+                                prune_list[address] = None
 
-        for device_address, device in self.devices.items():
-            if device_address in prune_list:
-                continue
-            # Prune any devices that haven't been heard from for too long, but only
-            # if we aren't actively tracking them and it's a traditional MAC address.
-            # We just collect the addresses first, and do the pruning after exiting this iterator
-            #
+        def _is_prunable(device_address: str) -> bool:
             # Devices are protected from pruning if they are:
+            # - already on the prune list
             # - a scanner (because we need those!)
             # - a metadevice source (linked to a metadevice for data delivery)
             # - a metadevice itself
             # - have create_sensor flag (user configured tracking)
-            # - not a MAC48 address type
-            if (
-                device_address not in metadevice_source_keepers
+            # - not a MAC48 address type (never indexed, see PruneIndex)
+            device = self.devices[device_address]
+            return (
+                device_address not in prune_list
+                and device_address not in metadevice_source_keepers
                 and device_address not in self.metadevices
                 and device_address not in self.scanner_list
                 and (not device.create_sensor)  # Not if we track the device
                 and (not device.is_scanner)  # redundant, but whatevs.
-                and device.address_type != BDADDR_TYPE_NOT_MAC48
-            ):
-                if device.address_type == BDADDR_TYPE_RANDOM_RESOLVABLE:
-                    # This is an *UNKNOWN* IRK source address, or a known one which is
-                    # well and truly stale (ie, not in keepers).
-                    # We prune unknown irk's aggressively because they pile up quickly
-                    # in high-density situations, and *we* don't need to hang on to new
-                    # enrollments because we'll seed them from PBLE.
-                    if device.last_seen < stamp_unknown_irk:
-                        _LOGGER.debug(
-                            "Marking stale (%ds) Unknown IRK address for pruning: [%s] %s",
-                            nowstamp - device.last_seen,
-                            device_address,
-                            device.name,
-                        )
-                        prune_list.append(device_address)
-                    elif device.last_seen < nowstamp - 200:  # BlueZ cache time
-                        # It's not stale, but we will prune it if we can't make our
-                        # quota of PRUNE_MAX_COUNT we'll shave these off too.
-
-                        # Note that because BlueZ doesn't give us timestamps, we guess them
-                        # based on whether the rssi has changed. If we delete our existing
-                        # device we have nothing to compare too and will forever churn them.
-                        # This can change if we drop support for BlueZ or we find a way to
-                        # make stamps (we could also just keep a separate list but meh)
-                        prunable_stamps[device_address] = device.last_seen
-
-                elif device.last_seen < nowstamp - PRUNE_TIME_DEFAULT:
-                    # It's a static address, and stale.
-                    _LOGGER.debug(
-                        "Marking old device entry for pruning: %s",
-                        device.name,
-                    )
-                    prune_list.append(device_address)
-                else:
-                    # Device is static, not tracked, not so old, but we might have to prune it anyway
-                    prunable_stamps[device_address] = device.last_seen
+            )
 
-            # Do nothing else at this level without excluding the keepers first.
+        # Prune any devices that haven't been heard from for too long, but only
+        # if we aren't actively tracking them. The index only hands us devices
+        # that are actually past their expiry, oldest first.
+        #
+        # This is an *UNKNOWN* IRK source address, or a known one which is
+        # well and truly stale (ie, not in keepers).
+        # We prune unknown irk's aggressively because they pile up quickly
+        # in high-density situations, and *we* don't need to hang on to new
+        # enrollments because we'll seed them from PBLE.
+        for device_address in index.expired(BUCKET_RPA, stamp_unknown_irk, self.devices):
+            if _is_prunable(device_address):
+                device = self.devices[device_address]
+                _LOGGER.debug(
+                    "Marking stale (%ds) Unknown IRK address for pruning: [%s] %s",
+                    nowstamp - device.last_seen,
+                    device_address,
+                    device.name,
+                )
+                prune_list[device_address] = None
+
+        # Static addresses, and stale.
+        for device_address in index.expired(BUCKET_STATIC, nowstamp - PRUNE_TIME_DEFAULT, self.devices):
+            if _is_prunable(device_address):
+                _LOGGER.debug(
+                    "Marking old device entry for pruning: %s",
+                    self.devices[device_address].name,
+                )
+                prune_list[device_address] = None
 
         prune_quota_shortfall = len(self.devices) - len(prune_list) - PRUNE_MAX_COUNT
         if prune_quota_shortfall > 0:
             # We need to find more addresses to prune. Perhaps we live
             # in a busy train station, or are under some sort of BLE-MAC
             # DOS-attack.
-            if len(prunable_stamps) > 0:
-                # Sort the prunables by timestamp ascending
-                sorted_addresses = sorted([(v, k) for k, v in prunable_stamps.items()])
-                cutoff_index = min(len(sorted_addresses), prune_quota_shortfall)
-
-                if cutoff_index > 0:
-                    _LOGGER.debug(
-                        "Prune quota short by %d. Pruning %d extra devices (down to age %0.2f seconds)",
-                        prune_quota_shortfall,
-                        cutoff_index,
-                        nowstamp - sorted_addresses[cutoff_index - 1][0],
-                    )
-                # pylint: disable-next=unused-variable
-                for _stamp, address in sorted_addresses[:cutoff_index]:
-                    prune_list.append(address)
+            #
+            # Take the least recently seen prunable devices from the index.
+            # IRK addresses only qualify once they are older than the BlueZ cache
+            # time: because BlueZ doesn't give us timestamps, we guess them
+            # based on whether the rssi has changed. If we delete our existing
+            # device we have nothing to compare too and will forever churn them.
+            # This can change if we drop support for BlueZ or we find a way to
+            # make stamps (we could also just keep a separate list but meh)
+            extra_prunes = index.oldest(
+                self.devices,
+                prune_quota_shortfall,
+                {BUCKET_RPA: nowstamp - 200},  # BlueZ cache time
+                _is_prunable,
+            )
+            if extra_prunes:
+                _LOGGER.debug(
+                    "Prune quota short by %d. Pruning %d extra devices (down to age %0.2f seconds)",
+                    prune_quota_shortfall,
+                    len(extra_prunes),
+                    nowstamp - self.devices[extra_prunes[-1]].last_seen,
+                )
+                prune_list.update(dict.fromkeys(extra_prunes))
             else:
                 _LOGGER.warning(
                     "Need to prune another %s devices to make quota, but no extra prunables available",
@@ -1745,19 +2202,25 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         # ###############################################
         # Prune_list is now ready to action. It contains no keepers, and is already
         # expanded if necessary to meet quota, as much as we can.
-
-        # FIX: Safety deduplication - devices may appear in multiple metadevices' sources
-        # which could cause the same address to be added multiple times
-        prune_list = list(dict.fromkeys(prune_list))  # Preserves order, removes duplicates
+        # Devices in multiple metadevices' sources only appear once (dict keys).
 
         # Prune the source devices
         for device_address in prune_list:
             _LOGGER.debug("Acting on prune list for %s", device_address)
             del self.devices[device_address]
+            index.removed(device_address)
             # FIX: BUG 7 - Also remove from device_ukfs to prevent memory leak
             # Without this, UKF states for pruned devices accumulate forever
             self.device_ukfs.pop(device_address, None)
 
+        # Release interned addresses nothing refers to any more, so the registry tracks live devices only.
+        ADDRESS_REGISTRY.retain(
+            lambda address: address in self.devices or address in self.metadevices or address in self.shadow_devices
+        )
+
+        if not prune_list:
+            return
+
         # Clean out the scanners dicts in metadevices and scanners
         # (scanners will have entries if they are also beacons, although
         # their addresses should never get stale, but one day someone will
@@ -1772,9 +2235,10 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             #     or METADEVICE_IBEACON_DEVICE in device.metadevice_type
             # ):
             # clean out the metadevice_sources field
-            for address in prune_list:
-                if address in device.metadevice_sources:
-                    device.metadevice_sources.remove(address)
+            if device.metadevice_sources and not prune_list.keys().isdisjoint(device.metadevice_sources):
+                device.metadevice_sources[:] = [
+                    address for address in device.metadevice_sources if address not in prune_list
+                ]
 
             # Clean out adverts that reference pruned devices.
             # Adverts store two device addresses:
@@ -1782,8 +2246,17 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             #   - scanner_address: The scanner (ESPHome proxy, BT adapter) that received it
             # We must prune adverts if EITHER address is in the prune_list, otherwise
             # code accessing devices[address] will raise KeyError.
-            for advert_tuple in list(device.adverts.keys()):
-                advert = device.adverts[advert_tuple]
+            adverts = device.adverts
+            if isinstance(adverts, MetadeviceAdverts):
+                # A metadevice's source adverts belong to (and are pruned with) the
+                # source devices, so only drop pruned sources from the view and clean
+                # its own adverts below.
+                adverts.discard_sources(prune_list)
+                if device.area_advert is not None and device.area_advert.scanner_address in prune_list:
+                    device.area_advert = None
+                adverts = adverts.own
+            for advert_tuple in list(adverts.keys()):
+                advert = adverts[advert_tuple]
                 # Case 1: The tracked device (tracker) is being pruned
                 # This happens when a tracker with rotating RPA goes stale
                 if advert.device_address in prune_list:
@@ -1794,7 +2267,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                         advert.scanner_address,
                         nowstamp - advert.stamp,
                     )
-                    del device.adverts[advert_tuple]
+                    del adverts[advert_tuple]
                 # Case 2: The scanner that received the advert is being pruned
                 # This is rare but can happen if a scanner is demoted and pruned
                 elif advert.scanner_address in prune_list:
@@ -1805,7 +2278,7 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
                         advert.scanner_address,
                         nowstamp - advert.stamp,
                     )
-                    del device.adverts[advert_tuple]
+                    del adverts[advert_tuple]
                     # Clear area_advert if it points to the pruned scanner,
                     # otherwise BermudaSensorScanner.native_value would fail
                     if device.area_advert is advert:
@@ -1904,6 +2377,8 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
             if bermuda_scanner.area_id is None:
                 _scanners_without_areas.append(f"{bermuda_scanner.name} [{bermuda_scanner.address}]")
         self._async_manage_repair_scanners_without_areas(_scanners_without_areas)
+        # Scanner areas may have changed during init
+        self.area_selection.topology.invalidate()
 
     def _async_purge_removed_scanners(self):
         """Demotes any devices that are no longer scanners based on new self.hascanners."""
@@ -1973,3 +2448,11 @@ class BermudaDataUpdateCoordinator(DataUpdateCoordinator[Any]):
         Delegates to the service handler for actual implementation.
         """
         return await self.service_handler.async_dump_devices(call)
+
+    async def service_train_fleet(self, call: ServiceCall) -> ServiceResponse:
+        """
+        Train fingerprints for several devices in one area.
+
+        Delegates to the service handler for actual implementation.
+        """
+        return await self.service_handler.async_train_fleet(call)
@@ -43,6 +43,7 @@ Architecture:
     - RoomProfile: Device-independent scanner-pair deltas for one room
     - confidence: Pure functions for z-score to confidence conversion
     - CorrelationStore: Home Assistant persistence
+    - ProfileCompactor: Periodic removal of profiles for vanished areas/devices/scanners
     - AutoLearningStats: Diagnostic statistics for auto-learning (debug tool)
 
 """
@@ -53,6 +54,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from .area_profile import AreaProfile
+from .compaction import CompactionStats, ProfileCompactor
 from .confidence import weighted_z_scores_to_confidence, z_scores_to_confidence
 from .room_profile import RoomProfile
 from .scanner_absolute import ScannerAbsoluteRssi
@@ -242,7 +244,9 @@ class AutoLearningStats:
 __all__ = [
     "AreaProfile",
     "AutoLearningStats",
+    "CompactionStats",
     "CorrelationStore",
+    "ProfileCompactor",
     "RoomProfile",
     "ScannerAbsoluteRssi",
     "ScannerPairCorrelation",
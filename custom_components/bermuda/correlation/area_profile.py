@@ -21,6 +21,7 @@ from typing import Any, Self
 
 from custom_components.bermuda.const import AUTO_LEARNING_MIN_CONFIDENCE, AUTO_LEARNING_MIN_INTERVAL
 
+from .eviction import EvictionIndex
 from .scanner_absolute import ScannerAbsoluteRssi
 from .scanner_pair import ScannerPairCorrelation
 
@@ -28,6 +29,15 @@ from .scanner_pair import ScannerPairCorrelation
 MAX_CORRELATIONS_PER_AREA: int = 15
 
 
+def _eviction_priority(entry: ScannerPairCorrelation | ScannerAbsoluteRssi) -> tuple[bool, int]:
+    """
+    Return eviction priority for a correlation or absolute profile.
+
+    Tuple sort: (True, 500) > (True, 100) > (False, 9999) - lowest is evicted first.
+    """
+    return (entry.has_button_training, entry.sample_count)
+
+
 @dataclass(slots=True)
 class AreaProfile:
     """
@@ -66,6 +76,17 @@ class AreaProfile:
     )
     # Timestamp of last auto-learning update (for minimum interval enforcement)
     _last_update_stamp: float = field(default=0.0, repr=False)
+    # Eviction heaps for _enforce_memory_limit (not serialized)
+    _correlation_index: EvictionIndex[str, ScannerPairCorrelation] = field(
+        default_factory=lambda: EvictionIndex(_eviction_priority),
+        repr=False,
+        compare=False,
+    )
+    _absolute_index: EvictionIndex[str, ScannerAbsoluteRssi] = field(
+        default_factory=lambda: EvictionIndex(_eviction_priority),
+        repr=False,
+        compare=False,
+    )
 
     def update(
         self,
@@ -136,6 +157,7 @@ class AreaProfile:
 
             if scanner_addr not in self._correlations:
                 self._correlations[scanner_addr] = ScannerPairCorrelation(scanner_address=scanner_addr)
+                self._correlation_index.track(scanner_addr, self._correlations[scanner_addr])
 
             self._correlations[scanner_addr].update(delta, timestamp=nowstamp)
 
@@ -148,6 +170,7 @@ class AreaProfile:
         for scanner_addr, rssi in all_readings.items():
             if scanner_addr not in self._absolute_profiles:
                 self._absolute_profiles[scanner_addr] = ScannerAbsoluteRssi(scanner_address=scanner_addr)
+                self._absolute_index.track(scanner_addr, self._absolute_profiles[scanner_addr])
             self._absolute_profiles[scanner_addr].update(rssi, timestamp=nowstamp)
 
         self._enforce_memory_limit()
@@ -182,6 +205,7 @@ class AreaProfile:
 
             if scanner_addr not in self._correlations:
                 self._correlations[scanner_addr] = ScannerPairCorrelation(scanner_address=scanner_addr)
+                self._correlation_index.track(scanner_addr, self._correlations[scanner_addr])
 
             self._correlations[scanner_addr].update_button(delta, timestamp=timestamp)
 
@@ -193,6 +217,7 @@ class AreaProfile:
         for scanner_addr, rssi in all_readings.items():
             if scanner_addr not in self._absolute_profiles:
                 self._absolute_profiles[scanner_addr] = ScannerAbsoluteRssi(scanner_address=scanner_addr)
+                self._absolute_index.track(scanner_addr, self._absolute_profiles[scanner_addr])
             self._absolute_profiles[scanner_addr].update_button(rssi, timestamp=timestamp)
 
         self._enforce_memory_limit()
@@ -215,6 +240,9 @@ class AreaProfile:
             corr.reset_training()
         for profile in self._absolute_profiles.values():
             profile.reset_training()
+        # Priorities dropped to zero - heap order is no longer valid
+        self._correlation_index.rebuild(self._correlations)
+        self._absolute_index.rebuild(self._absolute_profiles)
 
     def reset_variance_only(self) -> None:
         """
@@ -244,31 +272,53 @@ class AreaProfile:
         """
         Evict least-important correlations if over memory limit.
 
-        Sort priority (descending):
+        Eviction priority (lowest evicted first):
         1. has_button_training=True (NEVER evict user-trained profiles)
         2. sample_count (higher = more established)
 
         This ensures button-trained profiles for scannerless rooms are preserved
         even when auto-learned profiles accumulate more samples over time.
+
+        Uses EvictionIndex heaps so each eviction is O(log n) and the dicts are
+        trimmed in place rather than sorted and rebuilt.
         """
-        # Enforce limit for delta correlations
-        if len(self._correlations) > MAX_CORRELATIONS_PER_AREA:
-            sorted_corrs = sorted(
-                self._correlations.items(),
-                # Tuple sort: (True, 500) > (True, 100) > (False, 9999)
-                key=lambda x: (x[1].has_button_training, x[1].sample_count),
-                reverse=True,
-            )
-            self._correlations = dict(sorted_corrs[:MAX_CORRELATIONS_PER_AREA])
-
-        # Enforce limit for absolute profiles (same logic)
-        if len(self._absolute_profiles) > MAX_CORRELATIONS_PER_AREA:
-            sorted_profiles = sorted(
-                self._absolute_profiles.items(),
-                key=lambda x: (x[1].has_button_training, x[1].sample_count),
-                reverse=True,
-            )
-            self._absolute_profiles = dict(sorted_profiles[:MAX_CORRELATIONS_PER_AREA])
+        self._correlation_index.evict_excess(self._correlations, MAX_CORRELATIONS_PER_AREA)
+        self._absolute_index.evict_excess(self._absolute_profiles, MAX_CORRELATIONS_PER_AREA)
+
+    def drop_stale_scanners(self, live_scanners: set[str], cutoff: float) -> int:
+        """
+        Remove entries for scanners that are gone and have not learned since cutoff.
+
+        Used by profile compaction. Entries whose scanner is still in
+        live_scanners are always kept, as are entries with no timestamps
+        (age unknown).
+
+        Args:
+        ----
+            live_scanners: Addresses of scanners currently known to Bermuda.
+            cutoff: Entries last updated before this stamp are considered dead.
+
+        Returns:
+        -------
+            Number of correlations and absolute profiles removed.
+
+        """
+        removed = 0
+        for entries, index in (
+            (self._correlations, self._correlation_index),
+            (self._absolute_profiles, self._absolute_index),
+        ):
+            for scanner_addr in [
+                addr
+                for addr, entry in entries.items()
+                if addr not in live_scanners
+                and entry.last_sample_stamp is not None
+                and entry.last_sample_stamp < cutoff
+            ]:
+                del entries[scanner_addr]
+                index.discard(scanner_addr)
+                removed += 1
+        return removed
 
     def get_z_scores(
         self,
@@ -560,4 +610,6 @@ class AreaProfile:
             profile._absolute_profiles[abs_profile.scanner_address] = abs_profile
         # Restore last update timestamp (default 0.0 for backward compatibility)
         profile._last_update_stamp = data.get("last_update_stamp", 0.0)
+        profile._correlation_index.rebuild(profile._correlations)
+        profile._absolute_index.rebuild(profile._absolute_profiles)
         return profile
@@ -0,0 +1,174 @@
+"""
+Periodic compaction of learned correlation profiles.
+
+Correlations only ever accumulate during normal operation. Without
+housekeeping, profiles for devices that were pruned long ago, areas that
+were deleted from Home Assistant and scanners that were removed stay in
+memory and are re-serialised on every save.
+
+ProfileCompactor walks the correlation graph (run periodically by the
+coordinator) and:
+
+1. Drops area profiles (device and room) for areas no longer in the
+   area registry - regardless of training, the area itself is gone.
+2. Drops auto-learned device profiles for devices Bermuda no longer knows
+   about once their last sample is older than the maximum age. Button-trained
+   profiles are kept (explicit user intent).
+3. Drops per-scanner entries and room scanner-pairs for scanners that are
+   no longer known, once their last sample is older than the maximum age.
+4. Collapses room scanner-pairs that are stored twice under differently
+   formatted keys.
+
+Timestamps are monotonic stamps, so after a host reboot stored stamps can be
+"in the future" or look younger than they are. Both cases only make
+profiles look fresher, so compaction errs on the side of keeping data.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .area_profile import AreaProfile
+    from .room_profile import RoomProfile
+
+
+def _serialized_size(
+    device_profiles: dict[str, dict[str, AreaProfile]],
+    room_profiles: dict[str, RoomProfile],
+) -> int:
+    """Return approximate store size in bytes (compact JSON)."""
+    size = 0
+    for areas in device_profiles.values():
+        for area_profile in areas.values():
+            size += len(json.dumps(area_profile.to_dict(), separators=(",", ":")))
+    for room_profile in room_profiles.values():
+        size += len(json.dumps(room_profile.to_dict(), separators=(",", ":")))
+    return size
+
+
+@dataclass
+class CompactionStats:
+    """
+    Statistics for profile compaction diagnostics.
+
+    Totals accumulate across runs; bytes_before/bytes_after describe the
+    most recent run. Stats reset on HA restart (not persisted).
+    """
+
+    runs: int = 0
+    last_run_stamp: float = 0.0
+    device_profiles_dropped: int = 0
+    area_profiles_dropped: int = 0
+    room_profiles_dropped: int = 0
+    scanner_entries_dropped: int = 0
+    room_pairs_merged: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    bytes_reclaimed_total: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize statistics for diagnostics output."""
+        return {
+            "runs": self.runs,
+            "last_run_stamp": self.last_run_stamp,
+            "device_profiles_dropped": self.device_profiles_dropped,
+            "area_profiles_dropped": self.area_profiles_dropped,
+            "room_profiles_dropped": self.room_profiles_dropped,
+            "scanner_entries_dropped": self.scanner_entries_dropped,
+            "room_pairs_merged": self.room_pairs_merged,
+            "last_run_bytes_before": self.bytes_before,
+            "last_run_bytes_after": self.bytes_after,
+            "last_run_bytes_reclaimed": self.bytes_before - self.bytes_after,
+            "bytes_reclaimed_total": self.bytes_reclaimed_total,
+        }
+
+
+class ProfileCompactor:
+    """Drops dead profiles from the correlation graph and tracks what was reclaimed."""
+
+    def __init__(self, max_age: float) -> None:
+        """
+        Initialize the compactor.
+
+        Args:
+        ----
+            max_age: Seconds without new samples after which profiles for
+                     vanished devices and scanners are dropped.
+
+        """
+        self.max_age = max_age
+        self.stats = CompactionStats()
+
+    def compact(
+        self,
+        device_profiles: dict[str, dict[str, AreaProfile]],
+        room_profiles: dict[str, RoomProfile],
+        *,
+        nowstamp: float,
+        live_devices: set[str],
+        live_area_ids: set[str],
+        live_scanners: set[str],
+    ) -> int:
+        """
+        Compact profiles in place.
+
+        Empty live_area_ids / live_scanners sets disable the corresponding
+        checks, so a registry that is not populated yet never wipes data.
+
+        Args:
+        ----
+            device_profiles: Nested dict of device -> area -> profile (modified).
+            room_profiles: Dict of area_id -> RoomProfile (modified).
+            nowstamp: Current monotonic timestamp.
+            live_devices: Addresses of devices Bermuda currently knows about.
+            live_area_ids: Area IDs present in the area registry.
+            live_scanners: Addresses of currently known scanners.
+
+        Returns:
+        -------
+            Number of bytes reclaimed (approximate serialized size).
+
+        """
+        cutoff = nowstamp - self.max_age
+        stats = self.stats
+        stats.runs += 1
+        stats.last_run_stamp = nowstamp
+        stats.bytes_before = _serialized_size(device_profiles, room_profiles)
+
+        for device_addr in list(device_profiles):
+            areas = device_profiles[device_addr]
+            for area_id in list(areas):
+                profile = areas[area_id]
+                if live_area_ids and area_id not in live_area_ids:
+                    del areas[area_id]
+                    stats.area_profiles_dropped += 1
+                    continue
+                if device_addr not in live_devices and not profile.has_button_training:
+                    last_stamp = profile.last_sample_stamp
+                    if last_stamp is not None and last_stamp < cutoff:
+                        del areas[area_id]
+                        stats.area_profiles_dropped += 1
+                        continue
+                if live_scanners:
+                    stats.scanner_entries_dropped += profile.drop_stale_scanners(live_scanners, cutoff)
+            if not areas:
+                del device_profiles[device_addr]
+                stats.device_profiles_dropped += 1
+
+        for area_id in list(room_profiles):
+            room = room_profiles[area_id]
+            if live_area_ids and area_id not in live_area_ids:
+                del room_profiles[area_id]
+                stats.room_profiles_dropped += 1
+                continue
+            if live_scanners:
+                stats.scanner_entries_dropped += room.drop_stale_scanners(live_scanners, cutoff)
+            stats.room_pairs_merged += room.merge_duplicate_pairs()
+
+        stats.bytes_after = _serialized_size(device_profiles, room_profiles)
+        reclaimed = max(0, stats.bytes_before - stats.bytes_after)
+        stats.bytes_reclaimed_total += reclaimed
+        return reclaimed
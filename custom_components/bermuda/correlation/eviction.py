@@ -0,0 +1,125 @@
+"""
+Bounded eviction index for correlation dictionaries.
+
+Pure helper with no external dependencies. Profiles keep their learned
+entries in plain dicts (keyed by scanner address or pair key) and cap the
+number of entries to bound memory. Previously the cap was enforced by
+sorting the whole dict and rebuilding it on every overflow.
+
+EvictionIndex keeps a lazily-maintained min-heap next to the dict instead:
+
+- Entries are pushed once, when they are inserted into the dict.
+- Priorities are re-read from the live values only when an entry reaches
+  the top of the heap. If the value has grown since it was pushed, the
+  entry is re-pushed with its current priority and the next one is tried.
+- Eviction pops the true minimum in O(log n) and deletes it from the dict
+  in place - the dict is never rebuilt.
+
+This relies on priorities being non-decreasing between rebuilds (sample
+counts only grow, button training is only ever added). Anything that can
+lower a priority (e.g. reset_training) must call rebuild().
+
+The evicted set is the same as the previous sort-and-truncate approach
+whenever priorities differ. Among exact ties the most recently inserted
+entry is evicted first (the sort kept ties in dict order and dropped the tail).
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class EvictionIndex[K, V]:
+    """
+    Lazy min-heap over the values of a bounded dict.
+
+    Attributes
+    ----------
+        priority: Function returning a comparable priority for a value.
+                  Lower priorities are evicted first.
+
+    """
+
+    __slots__ = ("_heap", "_order", "_seq", "priority")
+
+    def __init__(self, priority: Callable[[V], Any]) -> None:
+        """Initialise an empty index using the given priority function."""
+        self.priority = priority
+        # Heap entries: (priority, -insertion_seq, key)
+        self._heap: list[tuple[Any, int, K]] = []
+        # Insertion sequence per tracked key (identifies the live heap entry)
+        self._order: dict[K, int] = {}
+        self._seq: int = 0
+
+    def __len__(self) -> int:
+        """Return number of tracked keys."""
+        return len(self._order)
+
+    def track(self, key: K, value: V) -> None:
+        """Register a newly inserted dict entry."""
+        self._seq += 1
+        self._order[key] = self._seq
+        heapq.heappush(self._heap, (self.priority(value), -self._seq, key))
+
+    def rebuild(self, entries: dict[K, V]) -> None:
+        """
+        Re-index all entries from scratch in dict iteration order.
+
+        Needed after bulk loads or anything that can lower a priority.
+        """
+        self._heap = []
+        self._order = {}
+        self._seq = 0
+        for key, value in entries.items():
+            self._seq += 1
+            self._order[key] = self._seq
+            self._heap.append((self.priority(value), -self._seq, key))
+        heapq.heapify(self._heap)
+
+    def evict_excess(self, entries: dict[K, V], limit: int) -> list[K]:
+        """
+        Delete lowest-priority entries from the dict until len <= limit.
+
+        Args:
+        ----
+            entries: The dict this index tracks (modified in place).
+            limit: Maximum number of entries to keep.
+
+        Returns:
+        -------
+            Evicted keys, lowest priority first.
+
+        """
+        if len(entries) <= limit:
+            return []
+
+        # Entries inserted without track() (e.g. restored or injected directly)
+        if len(self._order) != len(entries):
+            self.rebuild(entries)
+
+        evicted: list[K] = []
+        while len(entries) > limit:
+            if not self._heap:
+                # Index drifted from the dict (untracked keys) - resync once.
+                self.rebuild(entries)
+            prio, neg_seq, key = heapq.heappop(self._heap)
+            if self._order.get(key) != -neg_seq or key not in entries:
+                # Stale entry for a key that was removed or re-tracked.
+                continue
+            current = self.priority(entries[key])
+            if current != prio:
+                # Value grew since it was pushed - re-queue at its real priority.
+                heapq.heappush(self._heap, (current, neg_seq, key))
+                continue
+            del entries[key]
+            del self._order[key]
+            evicted.append(key)
+        return evicted
+
+    def discard(self, key: K) -> None:
+        """Forget a key removed from the dict by the caller (heap entry goes stale)."""
+        self._order.pop(key, None)
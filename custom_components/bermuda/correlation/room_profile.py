@@ -26,6 +26,7 @@ from typing import Any, Self
 
 from custom_components.bermuda.const import AUTO_LEARNING_MIN_INTERVAL
 
+from .eviction import EvictionIndex
 from .scanner_pair import ScannerPairCorrelation
 
 # Memory limit: keep only the most useful scanner pairs.
@@ -50,6 +51,15 @@ def _make_pair_key(scanner_a: str, scanner_b: str) -> str:
     return f"{scanner_b}|{scanner_a}"
 
 
+def _eviction_priority(pair: ScannerPairCorrelation) -> tuple[bool, int]:
+    """
+    Return eviction priority for a scanner pair.
+
+    Tuple sort: (True, 500) > (True, 100) > (False, 9999) - lowest is evicted first.
+    """
+    return (pair.has_button_training, pair.sample_count)
+
+
 @dataclass(slots=True)
 class RoomProfile:
     """
@@ -65,6 +75,12 @@ class RoomProfile:
     )
     # Timestamp of last auto-learning update (for minimum interval enforcement)
     _last_update_stamp: float = field(default=0.0, repr=False)
+    # Eviction heap for _enforce_memory_limit (not serialized)
+    _pair_index: EvictionIndex[str, ScannerPairCorrelation] = field(
+        default_factory=lambda: EvictionIndex(_eviction_priority),
+        repr=False,
+        compare=False,
+    )
 
     def update(
         self,
@@ -124,6 +140,7 @@ class RoomProfile:
                     self._scanner_pairs[pair_key] = ScannerPairCorrelation(
                         scanner_address=pair_key  # Store key as "address"
                     )
+                    self._pair_index.track(pair_key, self._scanner_pairs[pair_key])
 
                 # Delta: first alphabetically - second alphabetically
                 delta = readings[addr_a] - readings[addr_b]
@@ -162,6 +179,7 @@ class RoomProfile:
                     self._scanner_pairs[pair_key] = ScannerPairCorrelation(
                         scanner_address=pair_key  # Store key as "address"
                     )
+                    self._pair_index.track(pair_key, self._scanner_pairs[pair_key])
 
                 # Delta: first alphabetically - second alphabetically
                 delta = readings[addr_a] - readings[addr_b]
@@ -173,21 +191,15 @@ class RoomProfile:
         """
         Evict least-important scanner pairs if over memory limit.
 
-        Sort priority (descending):
+        Eviction priority (lowest evicted first):
         1. has_button_training=True (NEVER evict user-trained pairs)
         2. sample_count (higher = more established)
 
         This ensures button-trained pairs for scannerless rooms are preserved
         even when auto-learned pairs accumulate more samples over time.
+        The EvictionIndex heap trims the dict in place in O(log n) per eviction.
         """
-        if len(self._scanner_pairs) > MAX_SCANNER_PAIRS_PER_ROOM:
-            sorted_pairs = sorted(
-                self._scanner_pairs.items(),
-                # Tuple sort: (True, 500) > (True, 100) > (False, 9999)
-                key=lambda x: (x[1].has_button_training, x[1].sample_count),
-                reverse=True,
-            )
-            self._scanner_pairs = dict(sorted_pairs[:MAX_SCANNER_PAIRS_PER_ROOM])
+        self._pair_index.evict_excess(self._scanner_pairs, MAX_SCANNER_PAIRS_PER_ROOM)
 
     def reset_training(self) -> None:
         """
@@ -201,6 +213,84 @@ class RoomProfile:
         """
         for pair in self._scanner_pairs.values():
             pair.reset_training()
+        # Priorities dropped to zero - heap order is no longer valid
+        self._pair_index.rebuild(self._scanner_pairs)
+
+    def drop_stale_scanners(self, live_scanners: set[str], cutoff: float) -> int:
+        """
+        Remove pairs involving a gone scanner that have not learned since cutoff.
+
+        Used by profile compaction. Pairs with no timestamps (age unknown)
+        are kept.
+
+        Args:
+        ----
+            live_scanners: Addresses of scanners currently known to Bermuda.
+            cutoff: Pairs last updated before this stamp are considered dead.
+
+        Returns:
+        -------
+            Number of scanner pairs removed.
+
+        """
+        stale_keys = [
+            pair_key
+            for pair_key, pair in self._scanner_pairs.items()
+            if pair.last_sample_stamp is not None
+            and pair.last_sample_stamp < cutoff
+            and any(addr not in live_scanners for addr in pair_key.split("|"))
+        ]
+        for pair_key in stale_keys:
+            del self._scanner_pairs[pair_key]
+            self._pair_index.discard(pair_key)
+        return len(stale_keys)
+
+    def merge_duplicate_pairs(self) -> int:
+        """
+        Collapse scanner pairs whose keys differ only in address formatting.
+
+        Older stores (and addresses that were not normalised when first seen)
+        can hold the same physical pair under e.g. upper- and lower-case keys.
+        Lookups only ever hit the canonical lower-case key, so the duplicate
+        is dead weight. The most established entry (button training first,
+        then sample count) is kept under the canonical key.
+
+        Pairs whose canonical form would swap the scanner order are left
+        alone, since their delta sign would be inverted.
+
+        Returns
+        -------
+            Number of duplicate pairs removed.
+
+        """
+        groups: dict[str, list[str]] = {}
+        for pair_key in self._scanner_pairs:
+            parts = pair_key.split("|")
+            if len(parts) != 2:
+                continue
+            addr_a, addr_b = (part.strip().lower() for part in parts)
+            if addr_a > addr_b:
+                continue
+            groups.setdefault(f"{addr_a}|{addr_b}", []).append(pair_key)
+
+        duplicates: list[str] = []
+        for canon_key, pair_keys in groups.items():
+            if len(pair_keys) < 2:
+                continue
+            keeper = max(pair_keys, key=lambda k: _eviction_priority(self._scanner_pairs[k]))
+            keeper_pair = self._scanner_pairs[keeper]
+            for pair_key in pair_keys:
+                del self._scanner_pairs[pair_key]
+                if pair_key != keeper:
+                    duplicates.append(pair_key)
+            keeper_pair.scanner_address = canon_key
+            self._scanner_pairs[canon_key] = keeper_pair
+
+        if not duplicates:
+            return 0
+
+        self._pair_index.rebuild(self._scanner_pairs)
+        return len(duplicates)
 
     @property
     def has_button_training(self) -> bool:
@@ -309,4 +399,5 @@ class RoomProfile:
             profile._scanner_pairs[pair.scanner_address] = pair
         # Restore last update timestamp (default 0.0 for backward compatibility)
         profile._last_update_stamp = data.get("last_update_stamp", 0.0)
+        profile._pair_index.rebuild(profile._scanner_pairs)
         return profile
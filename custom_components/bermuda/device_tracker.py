@@ -73,6 +73,8 @@ class BermudaDeviceTracker(BermudaEntity, BaseTrackerEntity):
     """A trackable Bermuda Device."""
 
     _attr_should_poll = False
+    # Woken by the per-device update signal, not every coordinator refresh
+    _device_update_signal = True
     _attr_has_entity_name = True
     _attr_translation_key = "tracker"
     # Override BaseTrackerEntity's default DIAGNOSTIC category.
@@ -0,0 +1,135 @@
+"""
+Targeted per-device entity update dispatch.
+
+Every Bermuda entity used to be woken by the coordinator on every refresh,
+so entity callbacks scaled with the number of entities rather than with the
+number of devices that actually changed. Per-device tracking entities
+(sensors, device_tracker) now listen on a per-device dispatcher signal
+instead, and the coordinator signals a device only when:
+
+- its tracking state (area, floor, nearest scanner, distance, RSSI or zone)
+  changed since the last signal, or
+- it has not been signalled for refresh_interval seconds, so slower-moving
+  values (per-scanner distances, time-based attributes) still refresh at the
+  configured sensor update interval.
+
+Everything else stays idle. Entities that depend on more than per-device
+tracking data (scanner online, training controls, global counters) keep
+using the regular coordinator listener.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from .bermuda_device import BermudaDevice
+
+
+def device_tracking_key(device: BermudaDevice) -> tuple[Any, ...]:
+    """Return the tracking state whose change should wake the device's entities."""
+    area_advert = device.area_advert
+    return (
+        device.area_id,
+        device.floor_id,
+        area_advert.scanner_address if area_advert is not None else None,
+        device.area_distance,
+        device.area_rssi,
+        device.zone,
+    )
+
+
+class DeviceUpdateDispatcher:
+    """
+    Decides which devices' entities need waking after a coordinator cycle.
+
+    Attributes
+    ----------
+        cycles: Number of cycles evaluated (diagnostics).
+        signals_sent: Total per-device signals sent (diagnostics).
+        last_cycle_signalled: Devices signalled in the most recent cycle.
+        last_cycle_tracked: Devices with entities in the most recent cycle.
+
+    """
+
+    __slots__ = (
+        "_last_keys",
+        "_last_signalled",
+        "cycles",
+        "last_cycle_signalled",
+        "last_cycle_tracked",
+        "signals_sent",
+    )
+
+    def __init__(self) -> None:
+        """Initialise with no devices seen yet (first cycle signals everything)."""
+        self._last_keys: dict[str, tuple[Any, ...]] = {}
+        self._last_signalled: dict[str, float] = {}
+        self.cycles: int = 0
+        self.signals_sent: int = 0
+        self.last_cycle_signalled: int = 0
+        self.last_cycle_tracked: int = 0
+
+    def changed_devices(
+        self,
+        devices: Collection[BermudaDevice],
+        nowstamp: float,
+        refresh_interval: float,
+    ) -> list[str]:
+        """
+        Return addresses of devices whose entities should be updated this cycle.
+
+        Only devices that have entities (create_sensor) are considered.
+
+        Args:
+        ----
+            devices: All Bermuda devices.
+            nowstamp: Current monotonic timestamp.
+            refresh_interval: Seconds after which an unchanged device is
+                              signalled anyway.
+
+        Returns:
+        -------
+            Addresses to signal, in device iteration order.
+
+        """
+        last_keys = self._last_keys
+        last_signalled = self._last_signalled
+        refresh_before = nowstamp - refresh_interval
+        changed: list[str] = []
+        tracked = 0
+
+        for device in devices:
+            if not device.create_sensor:
+                continue
+            tracked += 1
+            address = device.address
+            key = device_tracking_key(device)
+            if last_keys.get(address) != key or last_signalled.get(address, 0.0) <= refresh_before:
+                last_keys[address] = key
+                last_signalled[address] = nowstamp
+                changed.append(address)
+
+        # Forget devices that were pruned or no longer have entities
+        if len(last_keys) > tracked:
+            live = {device.address for device in devices if device.create_sensor}
+            for address in [address for address in last_keys if address not in live]:
+                del last_keys[address]
+                last_signalled.pop(address, None)
+
+        self.cycles += 1
+        self.signals_sent += len(changed)
+        self.last_cycle_signalled = len(changed)
+        self.last_cycle_tracked = tracked
+        return changed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise dispatch activity for diagnostics."""
+        return {
+            "cycles": self.cycles,
+            "signals_sent": self.signals_sent,
+            "last_cycle_signalled": self.last_cycle_signalled,
+            "last_cycle_tracked": self.last_cycle_tracked,
+        }
@@ -6,7 +6,9 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant, ServiceCall
 
-from .const import DOMAIN
+from .const import _LOGGER_SPAM_LESS, DOMAIN
+from .fmdn import extraction as fmdn_extraction
+from .util import ADDRESS_REGISTRY
 
 if TYPE_CHECKING:
     from . import BermudaConfigEntry
@@ -36,6 +38,20 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: Bermuda
             coordinator.area_selection.get_auto_learning_diagnostics()
         ),
         "reference_trackers": coordinator.area_selection.get_reference_tracker_diagnostics(),
+        "profile_compaction": coordinator.profile_compactor.stats.to_dict(),
+        "scanner_topology": coordinator.area_selection.topology.to_dict(),
+        "device_updates": coordinator.device_updates.to_dict(),
+        "prune_index": coordinator.prune_index.to_dict(),
+        "shadow_devices": coordinator.shadow_devices.to_dict(),
+        "registry_index": coordinator.registry_index.to_dict(),
+        "advert_waiters": coordinator.advert_waiters.to_dict(),
+        "freshness": coordinator.freshness.to_dict(),
+        "address_registry": ADDRESS_REGISTRY.to_dict(),
+        "rssi_filter_bank": coordinator.rssi_filter_bank.to_dict(),
+        "log_spam_less": {
+            "bermuda": _LOGGER_SPAM_LESS.to_dict(),
+            "fmdn_extraction": fmdn_extraction.log_spam_stats(),
+        },
         "devices": await coordinator.service_dump_devices(call),
         "bt_manager": coordinator.service_handler.redact_data(bt_diags),
     }
@@ -9,7 +9,8 @@ from homeassistant.core import callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity, CoordinatorEntity
 
 from .const import (
     ADDR_TYPE_FMDN_DEVICE,
@@ -21,15 +22,67 @@ from .const import (
     DOMAIN,
     DOMAIN_GOOGLEFINDMY,
     DOMAIN_PRIVATE_BLE_DEVICE,
+    MOVEMENT_STATE_STATIONARY,
+    SIGNAL_DEVICE_UPDATED,
 )
+from .publish_policy import get_publish_policy
 from .util import is_mac_address, mac_math_offset, normalize_mac
 
 if TYPE_CHECKING:
+    from homeassistant.helpers.entity import Entity
+
     from . import BermudaConfigEntry
     from .coordinator import BermudaDataUpdateCoordinator
     # from . import BermudaDevice
 
 
+def _state_fingerprint(entity: Entity) -> tuple[Any, ...]:
+    """
+    Return the inputs that make up an entity's written state.
+
+    Covers everything async_write_ha_state would publish that Bermuda can
+    change between coordinator cycles: availability, state, attributes,
+    name, icon, picture and unit. Each property is read exactly once here.
+    Two equal fingerprints mean a state write would not change anything in
+    the state machine.
+    """
+    return (
+        entity.available,
+        entity.state,
+        entity.capability_attributes,
+        entity.state_attributes,
+        entity.extra_state_attributes,
+        entity.name,
+        entity.icon,
+        entity.entity_picture,
+        entity.unit_of_measurement,
+    )
+
+
+@callback
+def _async_write_ha_state_if_changed(entity: BermudaEntity | BermudaGlobalEntity) -> bool:
+    """
+    Write the entity state only if its fingerprint changed since the last write.
+
+    Entities not yet added to hass (no hass reference) are always written,
+    leaving it to HA to handle them as before.
+
+    Returns
+    -------
+        True if the state was written.
+
+    """
+    if entity.hass is None:
+        entity.async_write_ha_state()
+        return True
+    fingerprint = _state_fingerprint(entity)
+    if fingerprint == entity._last_state_fingerprint:
+        return False
+    entity.async_write_ha_state()
+    entity._last_state_fingerprint = fingerprint
+    return True
+
+
 class BermudaEntity(CoordinatorEntity):
     """
     Co-ordinator for Bermuda data.
@@ -46,6 +99,22 @@ class BermudaEntity(CoordinatorEntity):
     # belong on the Bermuda device instead.
     _scanner_entity: bool = False
 
+    # Fingerprint of the last state written by _handle_coordinator_update,
+    # used to skip state writes when nothing changed. None forces a write.
+    _last_state_fingerprint: tuple[Any, ...] | None = None
+
+    # Entities that only reflect per-device tracking data (area, distance,
+    # RSSI, zone) set this to True. They are woken by the per-device
+    # SIGNAL_DEVICE_UPDATED dispatcher instead of on every coordinator refresh.
+    _device_update_signal: bool = False
+
+    # Publishing policy (deadband/heartbeat/back-off) applied by _cached_ratelimit,
+    # one of the publish_policy.POLICY_* sensor classes. None keeps the plain
+    # time-based cache.
+    _publish_policy: str | None = None
+    # Current stationary back-off multiplier of the update interval
+    bermuda_publish_backoff: float = 1.0
+
     def __init__(
         self,
         coordinator: BermudaDataUpdateCoordinator,
@@ -80,11 +149,16 @@ class BermudaEntity(CoordinatorEntity):
         Mostly suitable for MEASUREMENTS, but should work with strings, too.
         If interval is specified the cache will use that (in seconds), otherwise the deafult is
         the CONF_UPPDATE_INTERVAL (typically suitable for fast-close slow-far sensors)
+
+        Entities that set _publish_policy additionally apply that sensor class's
+        deadband, max-silence heartbeat and stationary back-off (see publish_policy.py).
         """
         if interval is not None:
             self.bermuda_update_interval = interval
 
         nowstamp = monotonic_time_coarse()
+        if self._publish_policy is not None:
+            return self._policy_ratelimit(statevalue, nowstamp, fast_falling=fast_falling, fast_rising=fast_rising)
         if (
             (self.bermuda_last_stamp < nowstamp - self.bermuda_update_interval)  # Cache is stale
             or (self._device.ref_power_changed > nowstamp - 2)  # ref power changed in last 2sec
@@ -101,12 +175,58 @@ class BermudaEntity(CoordinatorEntity):
             # Send the cached value, don't update cache
             return self.bermuda_last_state
 
+    def _policy_ratelimit(
+        self,
+        statevalue: Any,
+        nowstamp: float,
+        *,
+        fast_falling: bool,
+        fast_rising: bool,
+    ) -> Any:
+        """Rate-limit statevalue using this entity's publishing policy."""
+        policy = get_publish_policy(self._publish_policy, self.coordinator.options)  # type: ignore[arg-type]
+        last_state = self.bermuda_last_state
+        if (
+            last_state is None
+            or statevalue is None
+            or self._device.ref_power_changed > nowstamp - 2  # ref power changed in last 2sec
+        ):
+            publish = True
+            self.bermuda_publish_backoff = 1.0
+        else:
+            backoff = self.bermuda_publish_backoff
+            stationary: bool | None = None
+            if backoff > 1.0:
+                # A device that stops being stationary ends the back-off at once,
+                # rather than holding its first movement back for the long interval.
+                stationary = self._device.get_movement_state(stamp_now=nowstamp) == MOVEMENT_STATE_STATIONARY
+                if not stationary:
+                    backoff = self.bermuda_publish_backoff = 1.0
+            publish = policy.should_publish(
+                statevalue,
+                last_state,
+                nowstamp - self.bermuda_last_stamp,
+                self.bermuda_update_interval * backoff,
+                fast_falling=fast_falling,
+                fast_rising=fast_rising,
+            )
+            if publish:
+                if stationary is None:
+                    stationary = self._device.get_movement_state(stamp_now=nowstamp) == MOVEMENT_STATE_STATIONARY
+                self.bermuda_publish_backoff = policy.next_backoff(backoff, stationary=stationary)
+        if publish:
+            self.bermuda_last_stamp = nowstamp
+            self.bermuda_last_state = statevalue
+            return statevalue
+        return last_state
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """
         Handle updated data from the co-ordinator.
 
-        Any specific things we want to do during an update cycle
+        Any specific things we want to do during an update cycle.
+        The state is only written if it changed since the last write.
         """
         if not self.devreg_init_done and self.device_entry:
             self._device.name_by_user = self.device_entry.name_by_user
@@ -116,7 +236,37 @@ class BermudaEntity(CoordinatorEntity):
             if self.device_entry:
                 # We have a new name locally, so let's update the device registry.
                 self.dr.async_update_device(self.device_entry.id, name=self._device.name)
-        self.async_write_ha_state()
+            self._last_state_fingerprint = None
+        _async_write_ha_state_if_changed(self)
+
+    async def async_added_to_hass(self) -> None:
+        """
+        Subscribe to updates when added to hass.
+
+        Per-device entities skip the coordinator listener (registered by
+        BaseCoordinatorEntity) and listen for their device's update signal.
+        """
+        if not self._device_update_signal:
+            await super().async_added_to_hass()
+            return
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_DEVICE_UPDATED.format(self.address), self._handle_coordinator_update
+            )
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """
+        Write the state to the state machine.
+
+        Direct writes (e.g. from user actions on select/number/button entities)
+        bypass the fingerprint check, so forget the last fingerprint to make
+        the next coordinator update compare against fresh state.
+        """
+        self._last_state_fingerprint = None
+        super().async_write_ha_state()
 
     @property
     def unique_id(self) -> str | None:
@@ -344,6 +494,8 @@ class BermudaEntity(CoordinatorEntity):
 class BermudaGlobalEntity(CoordinatorEntity):
     """Holds all Bermuda global data under one entity type/device."""
 
+    _last_state_fingerprint: tuple[Any, ...] | None = None
+
     def __init__(
         self,
         coordinator: BermudaDataUpdateCoordinator,
@@ -361,9 +513,20 @@ class BermudaGlobalEntity(CoordinatorEntity):
         """
         Handle updated data from the co-ordinator.
 
-        (we don't need to implement this, but if we want to do anything special we can)
+        Only writes the state if it changed since the last write.
+        """
+        _async_write_ha_state_if_changed(self)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """
+        Write the state to the state machine.
+
+        Writes outside the fingerprint check forget the last fingerprint, so
+        the next coordinator update compares against fresh state.
         """
-        self.async_write_ha_state()
+        self._last_state_fingerprint = None
+        super().async_write_ha_state()
 
     def _cached_ratelimit(self, statevalue: Any, interval: int | None = None) -> Any:
         """A simple way to rate-limit sensor updates."""
@@ -8,6 +8,7 @@ Architecture:
 ------------
     SignalFilter (ABC)              # Abstract base class
         ├── KalmanFilter            # Classic linear Kalman filter
+        ├── BankedKalmanFilter      # KalmanFilter view onto a KalmanFilterBank slot
         ├── AdaptiveRobustFilter    # EMA + CUSUM changepoint detection
         └── UnscentedKalmanFilter   # Multi-scanner fusion (experimental)
 
@@ -50,6 +51,8 @@ Usage:
 Available Filters:
 -----------------
 - KalmanFilter: Classic Kalman filter, optimal for Gaussian noise
+- BankedKalmanFilter: KalmanFilter view onto a KalmanFilterBank, which batches
+  the updates of many filters (per-advert RSSI smoothing)
 - AdaptiveRobustFilter: EMA-based with CUSUM changepoint detection
 - UnscentedKalmanFilter: Multi-scanner fusion with fingerprint matching
 - AdaptiveStatistics: Low-level stats class (used internally)
@@ -92,6 +95,7 @@ from .const import (
     MIN_UPDATE_DT,
 )
 from .kalman import KalmanFilter
+from .kalman_bank import BankedKalmanFilter, KalmanFilterBank
 from .ukf import UnscentedKalmanFilter
 
 __all__ = [
@@ -121,8 +125,10 @@ __all__ = [
     # Classes
     "AdaptiveRobustFilter",
     "AdaptiveStatistics",
+    "BankedKalmanFilter",
     "FilterConfig",
     "KalmanFilter",
+    "KalmanFilterBank",
     "SignalFilter",
     "UnscentedKalmanFilter",
     # Factory function
@@ -35,6 +35,61 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def adaptive_noise_multiplier(measurement: float, ref_power: float) -> float:
+    """
+    Return the measurement noise multiplier for an RSSI reading.
+
+    See KalmanFilter.update_adaptive() for the model. Shared with
+    KalmanFilterBank so both paths scale noise identically.
+
+    Args:
+    ----
+        measurement: RSSI measurement in dBm
+        ref_power: Device's calibrated RSSI at 1m
+
+    Returns:
+    -------
+        Factor to apply to the filter's base measurement noise.
+
+    """
+    # Validate ref_power (calibrated RSSI at 1m, NOT TX power!)
+    # Valid range: -100 to 0 dBm (always negative for RSSI measurements)
+    # Note: BLE TX power (transmit strength) can be positive (+3 dBm for ESP32),
+    # but ref_power represents the received signal strength at 1 meter, which is
+    # always negative. If you see positive values here, the device is likely
+    # reporting TX power instead of calibrated RSSI - check beacon_power or
+    # device configuration.
+    # Invalid values cause incorrect adaptive noise scaling.
+    if not (-100 <= ref_power <= 0):
+        _LOGGER.warning(
+            "Invalid ref_power %.1f dBm (expected -100 to 0). "
+            "ref_power should be calibrated RSSI at 1m (always negative), not TX power. "
+            "Check device's beacon_power or ref_power configuration. Using default -55",
+            ref_power,
+        )
+        ref_power = -55.0  # Safe default for most BLE devices
+
+    # Calculate device-relative threshold
+    # Signals within OFFSET dB of ref_power are considered "strong"
+    threshold = ref_power - ADAPTIVE_RSSI_OFFSET_FROM_REF
+
+    # Calculate adaptive measurement noise based on signal strength
+    db_below_threshold = threshold - measurement
+
+    # float ** float is typed as Any, so pin the result type here
+    noise_multiplier: float
+    if db_below_threshold > 0:
+        # Weaker signal = higher noise (less trust)
+        noise_multiplier = ADAPTIVE_NOISE_SCALE_PER_10DB ** (db_below_threshold / 10.0)
+    else:
+        # Stronger signal = lower noise, but cap at minimum
+        noise_multiplier = max(
+            ADAPTIVE_MIN_NOISE_MULTIPLIER,
+            ADAPTIVE_NOISE_SCALE_PER_10DB ** (db_below_threshold / 10.0),
+        )
+    return noise_multiplier
+
+
 @dataclass
 class KalmanFilter(SignalFilter):
     """
@@ -199,39 +254,7 @@ class KalmanFilter(SignalFilter):
             - PMC5461075: "An Improved BLE Indoor Localization with Kalman-Based Fusion"
 
         """
-        # Validate ref_power (calibrated RSSI at 1m, NOT TX power!)
-        # Valid range: -100 to 0 dBm (always negative for RSSI measurements)
-        # Note: BLE TX power (transmit strength) can be positive (+3 dBm for ESP32),
-        # but ref_power represents the received signal strength at 1 meter, which is
-        # always negative. If you see positive values here, the device is likely
-        # reporting TX power instead of calibrated RSSI - check beacon_power or
-        # device configuration.
-        # Invalid values cause incorrect adaptive noise scaling.
-        if not (-100 <= ref_power <= 0):
-            _LOGGER.warning(
-                "Invalid ref_power %.1f dBm (expected -100 to 0). "
-                "ref_power should be calibrated RSSI at 1m (always negative), not TX power. "
-                "Check device's beacon_power or ref_power configuration. Using default -55",
-                ref_power,
-            )
-            ref_power = -55.0  # Safe default for most BLE devices
-
-        # Calculate device-relative threshold
-        # Signals within OFFSET dB of ref_power are considered "strong"
-        threshold = ref_power - ADAPTIVE_RSSI_OFFSET_FROM_REF
-
-        # Calculate adaptive measurement noise based on signal strength
-        db_below_threshold = threshold - measurement
-
-        if db_below_threshold > 0:
-            # Weaker signal = higher noise (less trust)
-            noise_multiplier = ADAPTIVE_NOISE_SCALE_PER_10DB ** (db_below_threshold / 10.0)
-        else:
-            # Stronger signal = lower noise, but cap at minimum
-            noise_multiplier = max(
-                ADAPTIVE_MIN_NOISE_MULTIPLIER,
-                ADAPTIVE_NOISE_SCALE_PER_10DB ** (db_below_threshold / 10.0),
-            )
+        noise_multiplier = adaptive_noise_multiplier(measurement, ref_power)
 
         # Temporarily apply adaptive noise
         original_noise = self.measurement_noise
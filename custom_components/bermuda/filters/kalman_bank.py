@@ -0,0 +1,453 @@
+"""
+Bank of 1D Kalman filters stored in contiguous arrays.
+
+Every BermudaAdvert smooths its RSSI with its own Kalman filter, and each
+new packet used to run KalmanFilter.update_adaptive() on that object: a
+handful of attribute reads and writes plus the adaptive noise power, one
+advert at a time. This is the innermost loop of the integration.
+
+KalmanFilterBank keeps the state of all advert filters in column arrays
+(estimate, variance, last timestamp, sample count, ...), and the filters
+handed out to adverts (BankedKalmanFilter) are views onto one slot of the
+bank. New readings are queued with queue_adaptive() during the advert
+gather and applied to all filters in one vectorised step, either when the
+coordinator flushes the bank or lazily on the first read of any queued
+filter. NumPy is used for the step when available (as for the UKF, see
+ukf_numpy.py), otherwise readings are applied as they arrive, with the same
+equations as KalmanFilter.
+
+Direct update()/update_adaptive() calls on a view still apply immediately,
+so a view behaves exactly like a KalmanFilter to its callers.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from array import array
+from collections import deque
+from typing import Any
+
+from .base import SignalFilter
+from .const import (
+    ADAPTIVE_MIN_NOISE_MULTIPLIER,
+    ADAPTIVE_NOISE_SCALE_PER_10DB,
+    ADAPTIVE_RSSI_OFFSET_FROM_REF,
+    DEFAULT_UPDATE_DT,
+    KALMAN_MEASUREMENT_NOISE,
+    KALMAN_PROCESS_NOISE,
+    MAX_UPDATE_DT,
+    MIN_UPDATE_DT,
+)
+from .kalman import adaptive_noise_multiplier
+from .ukf_numpy import is_numpy_available
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timestamps are stored as floats; NaN stands for "no timestamp" (None).
+_NO_STAMP = math.nan
+
+# Set to False to force the pure Python path (e.g., for debugging)
+USE_NUMPY_IF_AVAILABLE: bool = True
+
+
+class KalmanFilterBank:
+    """
+    Column storage and batched updates for many 1D Kalman filters.
+
+    Attributes
+    ----------
+        batches: Vectorised update steps run (diagnostics).
+        batched_updates: Readings applied through those steps (diagnostics).
+
+    """
+
+    __slots__ = (
+        "_first_stamp",
+        "_free",
+        "_initialized",
+        "_last_stamp",
+        "_last_timestamp",
+        "_measurement_noise",
+        "_pending_measurements",
+        "_pending_ref_powers",
+        "_pending_set",
+        "_pending_slots",
+        "_pending_timestamps",
+        "_process_noise",
+        "_released",
+        "_vectorised",
+        "batched_updates",
+        "batches",
+        "estimate",
+        "sample_count",
+        "variance",
+    )
+
+    def __init__(self) -> None:
+        """Initialise an empty bank."""
+        self.estimate: array[float] = array("d")
+        self.variance: array[float] = array("d")
+        self.sample_count: array[int] = array("q")
+        self._initialized: array[int] = array("b")
+        self._process_noise: array[float] = array("d")
+        self._measurement_noise: array[float] = array("d")
+        # Time-aware filtering stamp and the profile-age stamps of the first
+        # and last sample.
+        self._last_timestamp: array[float] = array("d")
+        self._first_stamp: array[float] = array("d")
+        self._last_stamp: array[float] = array("d")
+        self._free: list[int] = []
+        # Slots whose views were garbage collected. A finaliser may append at
+        # any point (even from another thread); allocate() reclaims them with
+        # popleft, which never loses a concurrent append.
+        self._released: deque[int] = deque()
+        # Readings queued for the next batched step, in arrival order.
+        self._pending_slots: list[int] = []
+        self._pending_measurements: list[float] = []
+        self._pending_ref_powers: list[float] = []
+        self._pending_timestamps: list[float] = []
+        self._pending_set: set[int] = set()
+        # Batch readings only if there is a vectorised step to batch them for.
+        self._vectorised: bool = USE_NUMPY_IF_AVAILABLE and is_numpy_available()
+        self.batches: int = 0
+        self.batched_updates: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of filters in use."""
+        return len(self.estimate) - len(self._free) - len(self._released)
+
+    def allocate(
+        self,
+        process_noise: float = KALMAN_PROCESS_NOISE,
+        measurement_noise: float = KALMAN_MEASUREMENT_NOISE,
+    ) -> int:
+        """Reserve a slot for a new filter and return its index."""
+        if self._released:
+            # Queued readings may still target released slots; apply them
+            # before the slots are handed out again.
+            self.flush()
+            released = self._released
+            while released:
+                self._free.append(released.popleft())
+        if self._free:
+            slot = self._free.pop()
+            self._process_noise[slot] = process_noise
+            self._measurement_noise[slot] = measurement_noise
+            self.reset(slot)
+            return slot
+        self.estimate.append(0.0)
+        self.variance.append(measurement_noise)
+        self.sample_count.append(0)
+        self._initialized.append(0)
+        self._process_noise.append(process_noise)
+        self._measurement_noise.append(measurement_noise)
+        self._last_timestamp.append(_NO_STAMP)
+        self._first_stamp.append(_NO_STAMP)
+        self._last_stamp.append(_NO_STAMP)
+        return len(self.estimate) - 1
+
+    def release(self, slot: int) -> None:
+        """Return a slot to the bank once its filter is no longer used."""
+        self._released.append(slot)
+
+    def reset(self, slot: int) -> None:
+        """Reset one filter to its initial state."""
+        if slot in self._pending_set:
+            self.flush()
+        self.estimate[slot] = 0.0
+        self.variance[slot] = self._measurement_noise[slot]
+        self.sample_count[slot] = 0
+        self._initialized[slot] = 0
+        self._last_timestamp[slot] = _NO_STAMP
+        self._first_stamp[slot] = _NO_STAMP
+        self._last_stamp[slot] = _NO_STAMP
+
+    @property
+    def pending(self) -> int:
+        """Number of readings waiting for the next batched step."""
+        return len(self._pending_slots)
+
+    def queue_adaptive(self, slot: int, measurement: float, ref_power: float, timestamp: float | None) -> None:
+        """
+        Queue an RSSI reading for the next batched update_adaptive step.
+
+        A filter takes at most one queued reading per step; a second one for
+        the same slot flushes the queue first, so readings are always applied
+        in arrival order. Without NumPy there is nothing to gain from
+        batching, so the reading is applied immediately.
+        """
+        if not self._vectorised:
+            self.update_adaptive(slot, measurement, ref_power, timestamp)
+            return
+        pending_set = self._pending_set
+        if slot in pending_set:
+            self.flush()
+            pending_set = self._pending_set
+        pending_set.add(slot)
+        self._pending_slots.append(slot)
+        self._pending_measurements.append(measurement)
+        self._pending_ref_powers.append(ref_power)
+        self._pending_timestamps.append(_NO_STAMP if timestamp is None else timestamp)
+
+    def flush(self) -> None:
+        """Apply all queued readings in one step."""
+        if not self._pending_slots:
+            return
+        slots = self._pending_slots
+        measurements = self._pending_measurements
+        ref_powers = self._pending_ref_powers
+        timestamps = self._pending_timestamps
+        self._pending_slots = []
+        self._pending_measurements = []
+        self._pending_ref_powers = []
+        self._pending_timestamps = []
+        self._pending_set = set()
+        self.batches += 1
+        self.batched_updates += len(slots)
+
+        if len(slots) > 1 and self._vectorised:
+            self._flush_numpy(slots, measurements, ref_powers, timestamps)
+            return
+        for slot, measurement, ref_power, timestamp in zip(slots, measurements, ref_powers, timestamps, strict=True):
+            self.update_adaptive(slot, measurement, ref_power, None if math.isnan(timestamp) else timestamp)
+
+    def _flush_numpy(
+        self,
+        slots: list[int],
+        measurements: list[float],
+        ref_powers: list[float],
+        timestamps: list[float],
+    ) -> None:
+        """Vectorised update_adaptive over the queued slots (no slot appears twice)."""
+        import numpy as np  # noqa: PLC0415
+
+        idx = np.asarray(slots, dtype=np.intp)
+        meas = np.asarray(measurements, dtype=np.float64)
+        ref = np.asarray(ref_powers, dtype=np.float64)
+        stamp = np.asarray(timestamps, dtype=np.float64)
+
+        invalid = ~((ref >= -100) & (ref <= 0))
+        if invalid.any():
+            # Rare: let the scalar helper log its warning, then use its default.
+            for i in np.flatnonzero(invalid):
+                adaptive_noise_multiplier(float(meas[i]), float(ref[i]))
+            ref = np.where(invalid, -55.0, ref)
+
+        # Zero-copy views onto the column arrays. While any view exists the
+        # arrays can't be resized (append raises BufferError), so they are
+        # dropped in the finally block even if the update fails.
+        estimate = np.frombuffer(self.estimate, dtype=np.float64)
+        variance = np.frombuffer(self.variance, dtype=np.float64)
+        sample_count = np.frombuffer(self.sample_count, dtype=np.int64)
+        initialized = np.frombuffer(self._initialized, dtype=np.int8)
+        process_noise = np.frombuffer(self._process_noise, dtype=np.float64)
+        measurement_noise = np.frombuffer(self._measurement_noise, dtype=np.float64)
+        last_timestamp = np.frombuffer(self._last_timestamp, dtype=np.float64)
+        first_stamp = np.frombuffer(self._first_stamp, dtype=np.float64)
+        last_stamp = np.frombuffer(self._last_stamp, dtype=np.float64)
+        try:
+            sample_count[idx] += 1
+
+            has_stamp = ~np.isnan(stamp)
+            first_stamp[idx] = np.where(has_stamp & np.isnan(first_stamp[idx]), stamp, first_stamp[idx])
+            last_stamp[idx] = np.where(has_stamp, stamp, last_stamp[idx])
+
+            previous = last_timestamp[idx]
+            dt = np.full(len(idx), DEFAULT_UPDATE_DT)
+            timed = has_stamp & ~np.isnan(previous)
+            dt[timed] = np.clip(stamp[timed] - previous[timed], MIN_UPDATE_DT, MAX_UPDATE_DT)
+            last_timestamp[idx] = np.where(has_stamp, stamp, previous)
+
+            db_below_threshold = (ref - ADAPTIVE_RSSI_OFFSET_FROM_REF) - meas
+            multiplier = ADAPTIVE_NOISE_SCALE_PER_10DB ** (db_below_threshold / 10.0)
+            multiplier = np.where(
+                db_below_threshold > 0, multiplier, np.maximum(ADAPTIVE_MIN_NOISE_MULTIPLIER, multiplier)
+            )
+            noise = measurement_noise[idx] * multiplier
+
+            est = estimate[idx]
+            predicted_variance = variance[idx] + process_noise[idx] * dt
+            kalman_gain = predicted_variance / (predicted_variance + noise)
+            new_estimate = est + kalman_gain * (meas - est)
+            new_variance = (1 - kalman_gain) * predicted_variance
+
+            # First reading of a filter initialises it instead.
+            fresh = initialized[idx] == 0
+            estimate[idx] = np.where(fresh, meas, new_estimate)
+            variance[idx] = np.where(fresh, noise, new_variance)
+            initialized[idx] = 1
+        finally:
+            del estimate, variance, sample_count, initialized, process_noise, measurement_noise
+            del last_timestamp, first_stamp, last_stamp
+
+    def update(
+        self, slot: int, measurement: float, timestamp: float | None = None, measurement_noise: float | None = None
+    ) -> float:
+        """Apply one reading to one filter now (KalmanFilter.update equations)."""
+        if self._pending_set and slot in self._pending_set:
+            self.flush()
+        noise = self._measurement_noise[slot] if measurement_noise is None else measurement_noise
+        self.sample_count[slot] += 1
+
+        dt = DEFAULT_UPDATE_DT
+        if timestamp is not None:
+            if math.isnan(self._first_stamp[slot]):
+                self._first_stamp[slot] = timestamp
+            self._last_stamp[slot] = timestamp
+            previous = self._last_timestamp[slot]
+            if not math.isnan(previous):
+                dt = max(MIN_UPDATE_DT, min(timestamp - previous, MAX_UPDATE_DT))
+            self._last_timestamp[slot] = timestamp
+
+        if not self._initialized[slot]:
+            self.estimate[slot] = measurement
+            self.variance[slot] = noise
+            self._initialized[slot] = 1
+            return measurement
+
+        predicted_variance = self.variance[slot] + self._process_noise[slot] * dt
+        kalman_gain = predicted_variance / (predicted_variance + noise)
+        estimate = self.estimate[slot]
+        estimate = estimate + kalman_gain * (measurement - estimate)
+        self.estimate[slot] = estimate
+        self.variance[slot] = (1 - kalman_gain) * predicted_variance
+        return estimate
+
+    def update_adaptive(self, slot: int, measurement: float, ref_power: float, timestamp: float | None = None) -> float:
+        """Apply one reading with RSSI-adaptive measurement noise to one filter now."""
+        noise = self._measurement_noise[slot] * adaptive_noise_multiplier(measurement, ref_power)
+        return self.update(slot, measurement, timestamp, measurement_noise=noise)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the bank for diagnostics."""
+        return {
+            "filters": len(self),
+            "capacity": len(self.estimate),
+            "pending": self.pending,
+            "batches": self.batches,
+            "batched_updates": self.batched_updates,
+            "numpy": self._vectorised,
+        }
+
+
+class BankedKalmanFilter(SignalFilter):
+    """
+    KalmanFilter-compatible view onto one slot of a KalmanFilterBank.
+
+    Reads flush any queued readings first, so a view always reports the
+    same state a KalmanFilter fed the same readings would.
+    """
+
+    __slots__ = ("_bank", "_slot")
+
+    def __init__(
+        self,
+        bank: KalmanFilterBank,
+        process_noise: float = KALMAN_PROCESS_NOISE,
+        measurement_noise: float = KALMAN_MEASUREMENT_NOISE,
+    ) -> None:
+        """Allocate a slot in bank for this filter."""
+        self._bank = bank
+        self._slot = bank.allocate(process_noise, measurement_noise)
+
+    def __del__(self) -> None:
+        """Hand the slot back to the bank."""
+        self._bank.release(self._slot)
+
+    def _synced(self) -> KalmanFilterBank:
+        bank = self._bank
+        if bank._pending_slots:
+            bank.flush()
+        return bank
+
+    @property
+    def estimate(self) -> float:
+        """Current filtered RSSI."""
+        return self._synced().estimate[self._slot]
+
+    @property
+    def variance(self) -> float:
+        """Current error covariance."""
+        return self._synced().variance[self._slot]
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples processed."""
+        return self._synced().sample_count[self._slot]
+
+    @property
+    def process_noise(self) -> float:
+        """Process noise of this filter."""
+        return self._bank._process_noise[self._slot]
+
+    @property
+    def measurement_noise(self) -> float:
+        """Base measurement noise of this filter."""
+        return self._bank._measurement_noise[self._slot]
+
+    @property
+    def is_initialized(self) -> bool:
+        """Whether the filter has received at least one measurement."""
+        return bool(self._synced()._initialized[self._slot])
+
+    @property
+    def last_update_time(self) -> float | None:
+        """Timestamp of the last measurement update, if one was given."""
+        stamp = self._synced()._last_timestamp[self._slot]
+        return None if math.isnan(stamp) else stamp
+
+    @property
+    def first_sample_stamp(self) -> float | None:
+        """Timestamp of the first sample."""
+        stamp = self._synced()._first_stamp[self._slot]
+        return None if math.isnan(stamp) else stamp
+
+    @property
+    def last_sample_stamp(self) -> float | None:
+        """Timestamp of the latest sample."""
+        stamp = self._synced()._last_stamp[self._slot]
+        return None if math.isnan(stamp) else stamp
+
+    def update(self, measurement: float, timestamp: float | None = None) -> float:
+        """Process a new RSSI measurement now."""
+        return self._bank.update(self._slot, measurement, timestamp)
+
+    def update_adaptive(self, measurement: float, ref_power: float, timestamp: float | None = None) -> float:
+        """Process a measurement with RSSI-adaptive noise now."""
+        return self._bank.update_adaptive(self._slot, measurement, ref_power, timestamp)
+
+    def queue_adaptive(self, measurement: float, ref_power: float, timestamp: float | None = None) -> None:
+        """Queue a measurement for the bank's next batched update_adaptive step."""
+        self._bank.queue_adaptive(self._slot, measurement, ref_power, timestamp)
+
+    def get_estimate(self) -> float:
+        """Return current filtered RSSI estimate."""
+        return self.estimate
+
+    def get_variance(self) -> float:
+        """Return current error covariance."""
+        return self.variance
+
+    def reset(self) -> None:
+        """Reset filter to initial state."""
+        self._bank.reset(self._slot)
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostic information including Kalman-specific state."""
+        initialized = self.is_initialized
+        variance = self.variance
+        return {
+            "estimate": round(self.estimate, 2),
+            "variance": round(variance, 4),
+            "std_dev": round(variance**0.5, 2),
+            "sample_count": self.sample_count,
+            "kalman_gain": round(variance / (variance + self.measurement_noise), 4) if initialized else 0.0,
+            "initialized": initialized,
+            "first_sample_stamp": self.first_sample_stamp,
+            "last_sample_stamp": self.last_sample_stamp,
+        }
+
+    def __repr__(self) -> str:
+        """Return the slot and current state of the filter."""
+        return f"BankedKalmanFilter(slot={self._slot}, estimate={self.estimate}, variance={self.variance})"
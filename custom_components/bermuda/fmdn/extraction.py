@@ -47,6 +47,11 @@ def is_fmdn_service_uuid(service_uuid: str | int) -> bool:
     return normalized in {SERVICE_UUID_FMDN, "feaa", "0xfeaa", "0000feaa"}
 
 
+def log_spam_stats() -> dict[str, Any]:
+    """Return the rate-limited extraction logger's counters for diagnostics."""
+    return _LOG_SPAM_LESS.to_dict()
+
+
 def _log_mode(mode: str) -> None:
     """Log mode transitions to avoid repeated noisy debug output."""
     if mode != _LAST_MODE_LOGGED[0]:
@@ -57,7 +62,7 @@ def _log_mode(mode: str) -> None:
 def _log_malformed(mode: str, frame_type: int, payload_len: int, reason: str) -> None:
     """Log malformed payloads without spamming the logs."""
     _LOG_SPAM_LESS.debug(
-        f"fmdn_malformed_{mode}_{frame_type:02x}_{payload_len}_{reason}",
+        ("fmdn_malformed", mode, frame_type, payload_len, reason),
         "Ignoring FMDN payload (mode=%s, frame=0x%02x, len=%d, reason=%s)",
         mode,
         frame_type,
@@ -69,7 +74,7 @@ def _log_malformed(mode: str, frame_type: int, payload_len: int, reason: str) ->
 def _log_candidates(mode: str, frame_type: int, payload_len: int, count: int) -> None:
     """Log candidate extraction summaries without spamming."""
     _LOG_SPAM_LESS.debug(
-        f"fmdn_candidates_{mode}_{frame_type:02x}_{payload_len}_{count}",
+        ("fmdn_candidates", mode, frame_type, payload_len, count),
         "FMDN candidate extraction (mode=%s, frame=0x%02x, len=%d) yielded %d candidates",
         mode,
         frame_type,
@@ -5,8 +5,10 @@
 from __future__ import annotations
 
 import threading
+from time import perf_counter
 from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, cast
 
+from bluetooth_data_tools import monotonic_time_coarse
 from homeassistant.const import Platform
 
 from custom_components.bermuda.const import (
@@ -15,6 +17,8 @@ from custom_components.bermuda.const import (
     DATA_EID_RESOLVER,
     DEFAULT_FMDN_EID_FORMAT,
     DOMAIN_GOOGLEFINDMY,
+    FMDN_QUEUE_DRAIN_BUDGET,
+    FMDN_RESOLVE_BATCH_SIZE,
     METADEVICE_FMDN_DEVICE,
     METADEVICE_TYPE_FMDN_SOURCE,
 )
@@ -24,7 +28,7 @@ from .extraction import extract_fmdn_eids, extract_raw_fmdn_payloads
 from .manager import BermudaFmdnManager, EidResolutionStatus
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping, Sequence
 
     from custom_components.bermuda.bermuda_device import BermudaDevice
     from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
@@ -87,6 +91,23 @@ def _convert_to_eid_match(raw_match: Any) -> EIDMatch | None:
         return None
 
 
+class ResolutionOutcome(NamedTuple):
+    """
+    Result of trying an advertisement's payloads against the resolver.
+
+    Fields:
+        eid: The payload that resolved, or the first payload if none did.
+        matches: Matches with a device_id for eid; empty if unresolved.
+        failures: (payload, status) for every payload that didn't resolve.
+        definitive: False if the resolver failed, so a miss must not be cached.
+    """
+
+    eid: bytes
+    matches: tuple[EIDMatch, ...]
+    failures: tuple[tuple[bytes, EidResolutionStatus], ...]
+    definitive: bool
+
+
 class EidResolver(Protocol):
     """Protocol for the googlefindmy EID resolver."""
 
@@ -326,7 +347,7 @@ class FmdnIntegration:
         # Match found - will be recorded by caller with device_id
         return match, EidResolutionStatus.NOT_EVALUATED
 
-    def process_resolution_all_with_status(  # noqa: PLR0911  # pylint: disable=too-many-return-statements
+    def process_resolution_all_with_status(
         self, eid_bytes: bytes, source_mac: str
     ) -> tuple[list[EIDMatch], EidResolutionStatus]:
         """
@@ -348,9 +369,21 @@ class FmdnIntegration:
             self.manager.record_resolution_failure(eid_bytes, source_mac, EidResolutionStatus.RESOLVER_UNAVAILABLE)
             return [], EidResolutionStatus.RESOLVER_UNAVAILABLE
 
+        matches, status = self._query_resolver(resolver, eid_bytes)
+        if not matches:
+            self.manager.record_resolution_failure(eid_bytes, source_mac, status)
+        return matches, status
+
+    def _query_resolver(  # pylint: disable=too-many-return-statements
+        self, resolver: EidResolver, eid_bytes: bytes
+    ) -> tuple[list[EIDMatch], EidResolutionStatus]:
+        """
+        Ask the resolver for all matches of one EID payload.
+
+        Doesn't touch any Bermuda state. Failures are only returned, not recorded.
+        """
         normalized_eid = self.normalize_eid_bytes(eid_bytes)
         if normalized_eid is None:
-            self.manager.record_resolution_failure(eid_bytes, source_mac, EidResolutionStatus.NO_KNOWN_EID_MATCH)
             return [], EidResolutionStatus.NO_KNOWN_EID_MATCH
 
         # Try resolve_eid_all first (returns all matches for shared trackers)
@@ -405,7 +438,6 @@ class FmdnIntegration:
                 type(ex).__name__,
                 ex,
             )
-            self.manager.record_resolution_failure(eid_bytes, source_mac, EidResolutionStatus.RESOLVER_ERROR)
             return [], EidResolutionStatus.RESOLVER_ERROR
         except Exception as ex:  # noqa: BLE001  # pylint: disable=broad-exception-caught
             # Catch-all for unexpected errors from external resolver
@@ -415,13 +447,11 @@ class FmdnIntegration:
                 ex,
                 exc_info=True,
             )
-            self.manager.record_resolution_failure(eid_bytes, source_mac, EidResolutionStatus.RESOLVER_ERROR)
             return [], EidResolutionStatus.RESOLVER_ERROR
 
         # Convert to typed EIDMatch
         single_match = _convert_to_eid_match(raw_single_match)
         if single_match is None:
-            self.manager.record_resolution_failure(eid_bytes, source_mac, EidResolutionStatus.NO_KNOWN_EID_MATCH)
             return [], EidResolutionStatus.NO_KNOWN_EID_MATCH
 
         # Diagnostic logging
@@ -511,12 +541,38 @@ class FmdnIntegration:
         Resolution order: raw payloads are tried first because they include the
         optional hashed flags byte (battery status, unwanted-tracking mode).
         Parsed candidates serve as fallback when raw payloads don't resolve.
+
+        The outcome is memoised per raw payload (see EidResolutionCache), so the
+        same EID heard by many scanners is only extracted and resolved once.
+        Unseen payloads are resolved inline while the cycle's resolver budget
+        lasts, and queued for drain_pending after that (see EidResolverQueue).
         """
         if not service_data:
             return
 
         # Extract raw FMDN payloads (full bytes including frame_type and hashed flags)
         raw_payloads = extract_raw_fmdn_payloads(service_data)
+
+        # Same payloads as a recent advert: reuse that outcome instead of
+        # extracting and resolving again.
+        cache = self.manager.resolution_cache
+        queue = self.manager.resolver_queue
+        cache_key = tuple(raw_payloads)
+        nowstamp = monotonic_time_coarse()
+        cached = cache.get(cache_key, nowstamp) if cache_key else None
+        if cached is not None:
+            device.metadevice_type.add(METADEVICE_TYPE_FMDN_SOURCE)
+            if cached.matches:
+                self._apply_matches(device, cached.eid, cached.matches)
+            else:
+                # Keep the unresolved EID's diagnostics fresh for this source MAC
+                self.manager.record_eid_seen(cached.eid, device.address)
+            return
+        if cache_key and queue.add_source(cache_key, device.address):
+            # Already waiting for the resolver; this source is applied with the result
+            device.metadevice_type.add(METADEVICE_TYPE_FMDN_SOURCE)
+            return
+
         # Also extract parsed candidates (bare EIDs) as fallback
         candidates = self.extract_eids(service_data)
 
@@ -536,52 +592,145 @@ class FmdnIntegration:
                 resolution_payloads.append(candidate)
                 seen.add(candidate)
 
-        # Track whether we found any match for this advertisement
-        any_resolved = False
+        resolver = self.get_resolver()
+        if resolver is None:
+            self._apply_outcome(cache_key, self._resolve_payloads(None, resolution_payloads), [device], nowstamp)
+            return
+        if cache_key and queue.budget_left <= 0:
+            # This cycle's inline resolver time is spent, resolve after the advert loop
+            queue.enqueue(cache_key, tuple(resolution_payloads), device.address)
+            return
+
+        started = perf_counter()
+        outcome = self._resolve_payloads(resolver, resolution_payloads)
+        queue.spend_inline(perf_counter() - started)
+        self._apply_outcome(cache_key, outcome, [device], nowstamp)
 
-        for eid_bytes in resolution_payloads:
+    def _resolve_payloads(self, resolver: EidResolver | None, payloads: Sequence[bytes]) -> ResolutionOutcome:
+        """
+        Try payloads in order until one resolves to matches with a device_id.
+
+        Doesn't touch any Bermuda state; failures are collected in the outcome
+        and recorded by _apply_outcome.
+        """
+        if resolver is None:
+            failures = tuple((eid_bytes, EidResolutionStatus.RESOLVER_UNAVAILABLE) for eid_bytes in payloads)
+            return ResolutionOutcome(payloads[0], (), failures, definitive=False)
+
+        collected: list[tuple[bytes, EidResolutionStatus]] = []
+        # Only a definitive "no match" from every payload may be cached negatively;
+        # a failing resolver must be retried on the next advert.
+        definitive = True
+        for eid_bytes in payloads:
             # Use resolve_eid_all to get ALL matches (important for shared trackers)
-            matches, _resolution_status = self.process_resolution_all_with_status(eid_bytes, device.address)
+            matches, resolution_status = self._query_resolver(resolver, eid_bytes)
 
             if not matches:
-                # EID was seen but not resolved - already tracked in process_resolution_all_with_status
+                collected.append((eid_bytes, resolution_status))
+                if resolution_status == EidResolutionStatus.RESOLVER_ERROR:
+                    definitive = False
                 continue
 
-            # Process ALL matches to support shared trackers between multiple accounts
-            # Note: When resolve_eid_all returns multiple matches, it means the same
-            # physical tracker is registered in multiple Google accounts.
-            for match in matches:
-                # With typed EIDMatch, we can access fields directly
-                if not match.device_id:
-                    _LOGGER.debug("Resolver returned match without device_id for candidate length %d", len(eid_bytes))
-                    continue
-
-                # Successfully resolved - record in FMDN manager with diagnostic fields
-                self.manager.record_resolution_success(
-                    eid_bytes,
-                    device.address,
-                    match.device_id,
-                    match.canonical_id or None,
-                    time_offset=match.time_offset,
-                    is_reversed=match.is_reversed,
-                )
-                any_resolved = True
+            # With typed EIDMatch, we can access fields directly
+            usable = tuple(match for match in matches if match.device_id)
+            if len(usable) != len(matches):
+                _LOGGER.debug("Resolver returned match without device_id for candidate length %d", len(eid_bytes))
+            if usable:
+                # Found matches for this EID candidate, no need to try other candidates
+                return ResolutionOutcome(eid_bytes, usable, tuple(collected), definitive)
+
+        return ResolutionOutcome(payloads[0], (), tuple(collected), definitive)
+
+    def _apply_outcome(
+        self,
+        cache_key: tuple[bytes, ...],
+        outcome: ResolutionOutcome,
+        devices: Sequence[BermudaDevice],
+        nowstamp: float,
+    ) -> None:
+        """Record a resolution outcome, memoise it and attach every source device that sent the payload."""
+        source_mac = devices[0].address
+        for eid_bytes, status in outcome.failures:
+            self.manager.record_resolution_failure(eid_bytes, source_mac, status)
+
+        cache = self.manager.resolution_cache
+        if outcome.matches:
+            if cache_key:
+                cache.store_resolved(cache_key, outcome.eid, outcome.matches, nowstamp)
+            for device in devices:
+                self._apply_matches(device, outcome.eid, outcome.matches)
+            return
+
+        # No payloads resolved, record the first one as unresolved for diagnostics
+        # (only if not already tracked via the failures above)
+        if self.manager.get_resolution_status(outcome.eid) is None:
+            self.manager.record_resolution_failure(outcome.eid, source_mac, EidResolutionStatus.NO_KNOWN_EID_MATCH)
+        for device in devices[1:]:
+            self.manager.record_eid_seen(outcome.eid, device.address)
+        if outcome.definitive and cache_key:
+            cache.store_unresolved(cache_key, outcome.eid, nowstamp)
+
+    def begin_cycle(self) -> None:
+        """Refill the inline resolver budget at the start of a coordinator cycle."""
+        self.manager.resolver_queue.begin_cycle()
 
-                metadevice_address = self.format_metadevice_address(match.device_id, match.canonical_id)
-                self.register_source(device, metadevice_address, match)
+    def drain_pending(self) -> int:
+        """
+        Resolve queued payloads on the event loop and apply the results.
 
-            # Found matches for this EID candidate, no need to try other candidates
-            if any_resolved:
+        Called after the advert loop, so sources resolved here join their
+        metadevices this cycle. Works oldest first and stops after
+        FMDN_RESOLVE_BATCH_SIZE payloads or once FMDN_QUEUE_DRAIN_BUDGET of
+        resolver time is spent (at least one payload per call, so the queue
+        always makes progress). Returns the number of payloads resolved.
+        """
+        queue = self.manager.resolver_queue
+        if not queue.depth:
+            return 0
+        resolver = self.get_resolver()
+        if resolver is None:
+            # Keep them queued until the resolver is back
+            return 0
+        queue.batches += 1
+        nowstamp = monotonic_time_coarse()
+        known_devices = self.coordinator.devices
+        budget = FMDN_QUEUE_DRAIN_BUDGET
+        resolved = 0
+        while resolved < FMDN_RESOLVE_BATCH_SIZE and (budget > 0 or not resolved):
+            if (item := queue.pop_oldest()) is None:
                 break
+            cache_key, entry = item
+            started = perf_counter()
+            outcome = self._resolve_payloads(resolver, entry.payloads)
+            elapsed = perf_counter() - started
+            budget -= elapsed
+            queue.complete(elapsed)
+            resolved += 1
+            sources = [device for address in entry.sources if (device := known_devices.get(address))]
+            if sources:
+                self._apply_outcome(cache_key, outcome, sources, nowstamp)
+        return resolved
+
+    def _apply_matches(self, device: BermudaDevice, eid_bytes: bytes, matches: Iterable[EIDMatch]) -> None:
+        """
+        Record a resolved EID and attach the source device to each matching metadevice.
 
-        # If no payloads resolved, record the first one as unresolved for diagnostics
-        if not any_resolved and resolution_payloads:
-            first_eid = resolution_payloads[0]
-            # Only record if not already tracked by process_resolution_all_with_status
-            if self.manager.get_resolution_status(first_eid) is None:
-                self.manager.record_resolution_failure(
-                    first_eid, device.address, EidResolutionStatus.NO_KNOWN_EID_MATCH
-                )
+        Process ALL matches to support shared trackers between multiple accounts.
+        When resolve_eid_all returns multiple matches, it means the same physical
+        tracker is registered in multiple Google accounts.
+        """
+        for match in matches:
+            # Successfully resolved - record in FMDN manager with diagnostic fields
+            self.manager.record_resolution_success(
+                eid_bytes,
+                device.address,
+                match.device_id,
+                match.canonical_id or None,
+                time_offset=match.time_offset,
+                is_reversed=match.is_reversed,
+            )
+            metadevice_address = self.format_metadevice_address(match.device_id, match.canonical_id)
+            self.register_source(device, metadevice_address, match)
 
     def prune_source(self, device: BermudaDevice, stamp_fmdn: float, prune_list: list[str]) -> bool:
         """Prune stale FMDN rotating MACs and return True if pruned."""
@@ -703,6 +852,9 @@ class FmdnIntegration:
         self.coordinator._do_fmdn_device_init = False
         # pylint: enable=protected-access
 
+        # The set of known trackers may have changed, so cached "no match" results are stale
+        self.manager.resolution_cache.clear()
+
         _LOGGER.debug("Refreshing FMDN Device list from googlefindmy integration")
 
         fmdn_entries = self.coordinator.hass.config_entries.async_entries(DOMAIN_GOOGLEFINDMY, include_disabled=False)
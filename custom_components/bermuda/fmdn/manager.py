@@ -9,9 +9,12 @@ from typing import Any
 
 from bluetooth_data_tools import monotonic_time_coarse
 
-from custom_components.bermuda.const import _LOGGER, PRUNE_TIME_FMDN
+from custom_components.bermuda.const import _LOGGER, FMDN_MAX_SEEN_EIDS, FMDN_MAX_SOURCE_MACS, PRUNE_TIME_FMDN
 from custom_components.bermuda.util import is_mac_address
 
+from .resolution_cache import EidResolutionCache
+from .resolver_queue import EidResolverQueue
+
 
 class EidResolutionStatus(Enum):
     """
@@ -52,6 +55,10 @@ class EidResolutionStats:
     total_eids_unresolved: int = 0
     resolver_errors: int = 0
     resolver_unavailable_count: int = 0
+    eids_expired: int = 0
+    eids_evicted: int = 0
+    macs_expired: int = 0
+    macs_evicted: int = 0
 
 
 class BermudaFmdnManager:
@@ -65,18 +72,26 @@ class BermudaFmdnManager:
     - Resolution failures (NO_KNOWN_EID_MATCH equivalent)
 
     This provides diagnostic visibility into the FMDN resolution process.
+    Tracking is bounded (FMDN_MAX_SEEN_EIDS / FMDN_MAX_SOURCE_MACS, least
+    recently seen evicted first) so passing visitors can't grow it without limit.
     """
 
     def __init__(self) -> None:
         """Initialize the FMDN manager."""
-        # Map of EID hex string -> SeenEid data
+        # Map of EID hex string -> SeenEid data, least recently seen first (LRU order)
         self._seen_eids: dict[str, SeenEid] = {}
-        # Map of source MAC -> list of EID hex strings (for tracking which MACs sent which EIDs)
-        self._mac_to_eids: dict[str, list[str]] = {}
+        # Map of source MAC -> EID hex strings (for tracking which MACs sent which EIDs)
+        self._mac_to_eids: dict[str, set[str]] = {}
+        # Map of source MAC -> last time it sent an EID, least recently seen first (LRU order)
+        self._mac_last_seen: dict[str, float] = {}
         # Resolution statistics
         self._stats = EidResolutionStats()
         # Prune interval tracking
         self._last_prune: float = 0.0
+        # Memoised resolution outcomes per advertisement payload
+        self.resolution_cache = EidResolutionCache()
+        # Unseen payloads waiting to be resolved after the advert loop
+        self.resolver_queue = EidResolverQueue()
 
     def record_eid_seen(
         self,
@@ -111,9 +126,9 @@ class BermudaFmdnManager:
         nowstamp = monotonic_time_coarse()
         eid_hex = eid.hex()
 
-        if eid_hex in self._seen_eids:
-            # Update existing entry
-            seen = self._seen_eids[eid_hex]
+        if (seen := self._seen_eids.pop(eid_hex, None)) is not None:
+            # Update existing entry, moving it to the most recently seen end
+            self._seen_eids[eid_hex] = seen
             seen.last_seen = nowstamp
             seen.check_count += 1
             # Update resolution status if we got a better result
@@ -144,12 +159,32 @@ class BermudaFmdnManager:
             self._stats.total_eids_seen += 1
             # Update resolution statistics only for NEW EIDs to avoid double-counting
             self._update_stats(resolution_status)
+            while len(self._seen_eids) > FMDN_MAX_SEEN_EIDS:
+                self._drop_eid(next(iter(self._seen_eids)))
+                self._stats.eids_evicted += 1
 
         # Track MAC -> EID mapping
-        if source_mac not in self._mac_to_eids:
-            self._mac_to_eids[source_mac] = []
-        if eid_hex not in self._mac_to_eids[source_mac]:
-            self._mac_to_eids[source_mac].append(eid_hex)
+        if (eids := self._mac_to_eids.get(source_mac)) is None:
+            eids = self._mac_to_eids[source_mac] = set()
+        eids.add(eid_hex)
+        self._mac_last_seen.pop(source_mac, None)
+        self._mac_last_seen[source_mac] = nowstamp
+        while len(self._mac_last_seen) > FMDN_MAX_SOURCE_MACS:
+            self._drop_mac(next(iter(self._mac_last_seen)))
+            self._stats.macs_evicted += 1
+
+    def _drop_eid(self, eid_hex: str) -> None:
+        """Forget an EID and remove it from its source MAC's set."""
+        seen = self._seen_eids.pop(eid_hex)
+        if (eids := self._mac_to_eids.get(seen.source_mac)) is not None:
+            eids.discard(eid_hex)
+            if not eids:
+                self._drop_mac(seen.source_mac)
+
+    def _drop_mac(self, source_mac: str) -> None:
+        """Forget a source MAC and the EIDs it was seen with."""
+        self._mac_to_eids.pop(source_mac, None)
+        self._mac_last_seen.pop(source_mac, None)
 
     def _update_stats(self, resolution_status: EidResolutionStatus | str) -> None:
         """Update resolution statistics based on status."""
@@ -206,25 +241,34 @@ class BermudaFmdnManager:
             return
 
         self._last_prune = nowstamp
+        self.resolution_cache.prune(nowstamp)
         expiry_threshold = nowstamp - PRUNE_TIME_FMDN
 
-        # Find and remove expired EIDs
-        expired_eids = [eid_hex for eid_hex, seen in self._seen_eids.items() if seen.last_seen < expiry_threshold]
-
-        for eid_hex in expired_eids:
-            seen = self._seen_eids.pop(eid_hex)
-            # Also clean up MAC -> EID mapping
-            if seen.source_mac in self._mac_to_eids:
-                if eid_hex in self._mac_to_eids[seen.source_mac]:
-                    self._mac_to_eids[seen.source_mac].remove(eid_hex)
-                if not self._mac_to_eids[seen.source_mac]:
-                    del self._mac_to_eids[seen.source_mac]
-
+        # Both maps are kept in least-recently-seen order, so expired entries
+        # are at the front and pruning stops at the first live one.
+        expired_eids = 0
+        while self._seen_eids:
+            eid_hex, seen = next(iter(self._seen_eids.items()))
+            if seen.last_seen >= expiry_threshold:
+                break
+            self._drop_eid(eid_hex)
+            expired_eids += 1
+
+        expired_macs = 0
+        while self._mac_last_seen:
+            source_mac, last_seen = next(iter(self._mac_last_seen.items()))
+            if last_seen >= expiry_threshold:
+                break
+            self._drop_mac(source_mac)
+            expired_macs += 1
+
+        self._stats.eids_expired += expired_eids
+        self._stats.macs_expired += expired_macs
         if expired_eids:
             _LOGGER.debug(
                 "BermudaFmdn pruned %d of %d EIDs from cache",
-                len(expired_eids),
-                len(expired_eids) + len(self._seen_eids),
+                expired_eids,
+                expired_eids + len(self._seen_eids),
             )
 
     def get_resolution_status(self, eid: bytes) -> EidResolutionStatus | str | None:
@@ -287,10 +331,19 @@ class BermudaFmdnManager:
                 "resolver_errors": self._stats.resolver_errors,
                 "resolver_unavailable_count": self._stats.resolver_unavailable_count,
                 "current_cache_size": len(self._seen_eids),
+                "current_source_macs": len(self._mac_last_seen),
+                "max_cache_size": FMDN_MAX_SEEN_EIDS,
+                "max_source_macs": FMDN_MAX_SOURCE_MACS,
+                "eids_expired": self._stats.eids_expired,
+                "eids_evicted": self._stats.eids_evicted,
+                "macs_expired": self._stats.macs_expired,
+                "macs_evicted": self._stats.macs_evicted,
             },
+            "resolution_cache": self.resolution_cache.to_dict(),
+            "resolver_pipeline": self.resolver_queue.to_dict(),
             "resolved_eids": resolved_eids,
             "unresolved_eids": unresolved_eids,
             "source_macs": {
-                mac: {"eid_count": len(eid_list), "eids": eid_list} for mac, eid_list in self._mac_to_eids.items()
+                mac: {"eid_count": len(eid_set), "eids": sorted(eid_set)} for mac, eid_set in self._mac_to_eids.items()
             },
         }
@@ -0,0 +1,119 @@
+"""
+Payload-keyed memoisation of FMDN EID resolution.
+
+A tracker broadcasts the same FMDN service data payload until its EID
+rotates (every 1024 seconds), and every scanner that hears it hands the same
+bytes to FmdnIntegration.handle_advertisement. Without a cache each of those
+calls re-ran candidate extraction (sliding windows over the payload) and
+asked the GoogleFindMy resolver again, so the work scaled with
+scanners x adverts rather than with distinct EIDs.
+
+EidResolutionCache remembers the outcome per raw payload tuple:
+
+- Positive entries (the payload resolved) keep the resolving EID and its
+  matches for the EID rotation window. Once the EID rotates, the payload
+  changes and the entry simply ages out.
+- Negative entries (the resolver answered "no known EID") are kept for a
+  shorter window, so a tracker added to GoogleFindMy is picked up quickly.
+- Resolver errors and an unavailable resolver are never cached; those are
+  transient and must be retried.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from custom_components.bermuda.const import FMDN_EID_ROTATION_WINDOW, FMDN_NEGATIVE_CACHE_TIME
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class CachedResolution(NamedTuple):
+    """
+    Memoised resolution outcome for one advertisement payload.
+
+    Fields:
+        expires: Monotonic timestamp after which the entry is stale.
+        eid: The payload that resolved, or the first payload tried if none did.
+        matches: Resolver matches (with device_id) for eid; empty if unresolved.
+    """
+
+    expires: float
+    eid: bytes
+    matches: tuple[Any, ...]
+
+
+class EidResolutionCache:
+    """
+    Resolution outcomes keyed by the raw FMDN payloads of an advertisement.
+
+    Attributes
+    ----------
+        hits: Lookups answered from a live positive entry.
+        negative_hits: Lookups answered from a live negative entry.
+        misses: Lookups with no live entry (extraction and resolution ran).
+        expired: Entries dropped because they outlived their window.
+
+    """
+
+    __slots__ = ("_entries", "expired", "hits", "misses", "negative_hits")
+
+    def __init__(self) -> None:
+        """Initialise an empty cache."""
+        self._entries: dict[tuple[bytes, ...], CachedResolution] = {}
+        self.hits: int = 0
+        self.negative_hits: int = 0
+        self.misses: int = 0
+        self.expired: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached payloads."""
+        return len(self._entries)
+
+    def get(self, key: tuple[bytes, ...], nowstamp: float) -> CachedResolution | None:
+        """Return the live entry for key, counting the lookup as a hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires < nowstamp:
+            del self._entries[key]
+            self.expired += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+        elif entry.matches:
+            self.hits += 1
+        else:
+            self.negative_hits += 1
+        return entry
+
+    def store_resolved(self, key: tuple[bytes, ...], eid: bytes, matches: Sequence[Any], nowstamp: float) -> None:
+        """Remember that eid resolved to matches for the EID rotation window."""
+        self._entries[key] = CachedResolution(nowstamp + FMDN_EID_ROTATION_WINDOW, eid, tuple(matches))
+
+    def store_unresolved(self, key: tuple[bytes, ...], eid: bytes, nowstamp: float) -> None:
+        """Remember that none of the payloads matched a known EID."""
+        self._entries[key] = CachedResolution(nowstamp + FMDN_NEGATIVE_CACHE_TIME, eid, ())
+
+    def prune(self, nowstamp: float) -> int:
+        """Drop stale entries and return how many were removed."""
+        stale = [key for key, entry in self._entries.items() if entry.expires < nowstamp]
+        for key in stale:
+            del self._entries[key]
+        self.expired += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Forget all outcomes (e.g. when the resolver's device set changes)."""
+        self._entries.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise cache activity for diagnostics."""
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 3) if lookups else None,
+        }
@@ -0,0 +1,157 @@
+"""
+Queued resolution stage for FMDN EIDs.
+
+The GoogleFindMy resolver is another integration's code. If it does
+expensive work (key derivation, table rebuilds) calling it from
+handle_advertisement stalls the whole Bermuda update cycle, once per
+unseen payload.
+
+Resolution therefore runs in two tiers, both on the event loop (the
+resolver has only ever been called there and makes no thread-safety
+promises):
+
+- Inline: while this cycle's resolver time stays within
+  FMDN_INLINE_RESOLVE_BUDGET, unseen payloads are resolved on the spot, so
+  with a fast resolver nothing changes (no added latency).
+- Queued: once the budget is spent, unseen payloads are queued (deduplicated
+  by payload, remembering every source MAC that sent them). After the advert
+  loop the queue is drained oldest first, up to FMDN_RESOLVE_BATCH_SIZE
+  payloads or FMDN_QUEUE_DRAIN_BUDGET of resolver time, and the results are
+  applied (register_source etc.) before metadevices are updated. The rest
+  waits for the next cycle.
+
+Backpressure: the queue holds at most FMDN_RESOLVE_QUEUE_MAX payloads.
+Payloads arriving while it is full are dropped (and counted) - the tracker
+will advertise them again.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from custom_components.bermuda.const import FMDN_INLINE_RESOLVE_BUDGET, FMDN_RESOLVE_QUEUE_MAX
+
+
+@dataclass
+class PendingResolution:
+    """An unseen advertisement payload waiting for the resolver."""
+
+    payloads: tuple[bytes, ...]  # Resolution order: raw payloads, then parsed candidates
+    sources: list[str] = field(default_factory=list)  # Source MACs that sent it, first one first
+
+
+class EidResolverQueue:
+    """
+    Pending payloads and the per-cycle inline budget.
+
+    Attributes
+    ----------
+        budget_left: Seconds of inline resolver time left in this cycle.
+        enqueued: Payloads queued since startup.
+        dropped: Payloads rejected because the queue was full.
+        batches: Cycles that drained queued payloads.
+        inline_resolutions: Payloads resolved inline on the advert path.
+        queued_resolutions: Payloads resolved from the queue.
+
+    """
+
+    __slots__ = (
+        "_latency_count",
+        "_latency_last",
+        "_latency_max",
+        "_latency_total",
+        "_pending",
+        "batches",
+        "budget_left",
+        "dropped",
+        "enqueued",
+        "inline_resolutions",
+        "queued_resolutions",
+    )
+
+    def __init__(self) -> None:
+        """Initialise an empty queue with a full inline budget."""
+        self._pending: dict[tuple[bytes, ...], PendingResolution] = {}
+        self.budget_left: float = FMDN_INLINE_RESOLVE_BUDGET
+        self.enqueued: int = 0
+        self.dropped: int = 0
+        self.batches: int = 0
+        self.inline_resolutions: int = 0
+        self.queued_resolutions: int = 0
+        self._latency_last: float = 0.0
+        self._latency_max: float = 0.0
+        self._latency_total: float = 0.0
+        self._latency_count: int = 0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of payloads waiting for the resolver."""
+        return len(self._pending)
+
+    def begin_cycle(self) -> None:
+        """Refill the inline budget for a new update cycle."""
+        self.budget_left = FMDN_INLINE_RESOLVE_BUDGET
+
+    def spend_inline(self, elapsed: float) -> None:
+        """Account for an inline resolution that took elapsed seconds."""
+        self.budget_left -= elapsed
+        self.inline_resolutions += 1
+        self.record_latency(elapsed)
+
+    def add_source(self, key: tuple[bytes, ...], source: str) -> bool:
+        """
+        Attach another source MAC to a payload that is already queued.
+
+        Returns False if the payload is not waiting for the resolver.
+        """
+        entry = self._pending.get(key)
+        if entry is None:
+            return False
+        if source not in entry.sources:
+            entry.sources.append(source)
+        return True
+
+    def enqueue(self, key: tuple[bytes, ...], payloads: tuple[bytes, ...], source: str) -> bool:
+        """Queue an unseen payload; return False if it was dropped because the queue is full."""
+        if len(self._pending) >= FMDN_RESOLVE_QUEUE_MAX:
+            self.dropped += 1
+            return False
+        self._pending[key] = PendingResolution(payloads, [source])
+        self.enqueued += 1
+        return True
+
+    def pop_oldest(self) -> tuple[tuple[bytes, ...], PendingResolution] | None:
+        """Remove and return the longest-waiting payload, or None if the queue is empty."""
+        if not self._pending:
+            return None
+        key = next(iter(self._pending))
+        return key, self._pending.pop(key)
+
+    def complete(self, elapsed: float) -> None:
+        """Account for a queued payload that took elapsed seconds to resolve."""
+        self.queued_resolutions += 1
+        self.record_latency(elapsed)
+
+    def record_latency(self, elapsed: float) -> None:
+        """Record how long one payload took to resolve."""
+        self._latency_last = elapsed
+        self._latency_max = max(self._latency_max, elapsed)
+        self._latency_total += elapsed
+        self._latency_count += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise queue and resolver latency for diagnostics."""
+        return {
+            "queue_depth": len(self._pending),
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "inline_resolutions": self.inline_resolutions,
+            "queued_resolutions": self.queued_resolutions,
+            "resolver_latency_ms": {
+                "last": round(self._latency_last * 1000, 3),
+                "avg": round(self._latency_total * 1000 / self._latency_count, 3) if self._latency_count else None,
+                "max": round(self._latency_max * 1000, 3),
+            },
+        }
@@ -0,0 +1,121 @@
+"""
+Freshness high-water marks recorded at advert ingest.
+
+Several places needed "when did we last hear X" and answered it by sweeping
+everything each time:
+
+- Scanner online status walked every advert of every device per cycle to
+  find the newest stamp per scanner.
+- count_active_scanners() built a summary list of dicts, and was called by
+  calculate_data for every stale device.
+- count_active_devices() swept all devices.
+
+FreshnessIndex is fed once per advert by the coordinator's gather loop and
+keeps:
+
+- a per-scanner and a global high-water mark of advert stamps,
+- the devices heard recently, in the order they were heard, so counting the
+  active ones only visits fresh entries, and
+- a per-cycle cache of active scanner counts.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Container
+
+# Devices heard longer ago than this are dropped from the recency order.
+# Activity counts only look back a few seconds.
+DEVICE_RECENCY_HORIZON = 60.0
+
+
+class FreshnessIndex:
+    """
+    High-water marks of advert stamps, maintained at ingest.
+
+    Attributes
+    ----------
+        scanner_stamps: Newest advert stamp received by each scanner.
+        newest_stamp: Newest advert stamp received by any scanner.
+
+    """
+
+    __slots__ = ("_recent", "_scanner_counts", "newest_stamp", "scanner_stamps")
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self.scanner_stamps: dict[str, float] = {}
+        self.newest_stamp: float = 0.0
+        # device address -> (ingest stamp, device last_seen), oldest ingest first
+        self._recent: dict[str, tuple[float, float]] = {}
+        # max_age -> active scanner count, valid for the current cycle
+        self._scanner_counts: dict[float, int] = {}
+
+    def begin_cycle(self, nowstamp: float) -> None:
+        """Start an update cycle: drop cached counts and devices not heard within the horizon."""
+        self._scanner_counts.clear()
+        cutoff = nowstamp - DEVICE_RECENCY_HORIZON
+        stale: list[str] = []
+        for address, (ingested, _last_seen) in self._recent.items():
+            if ingested >= cutoff:
+                break
+            stale.append(address)
+        for address in stale:
+            del self._recent[address]
+
+    def record_scanner(self, scanner_address: str, stamp: float) -> None:
+        """Raise the high-water marks for an advert a scanner received at stamp."""
+        if stamp > self.scanner_stamps.get(scanner_address, 0.0):
+            self.scanner_stamps[scanner_address] = stamp
+            self.newest_stamp = max(self.newest_stamp, stamp)
+
+    def record(
+        self, device_address: str, last_seen: float, scanner_address: str, stamp: float, nowstamp: float
+    ) -> None:
+        """Record an advert for a device (with its last_seen after processing) received by a scanner."""
+        self.record_scanner(scanner_address, stamp)
+        recent = self._recent
+        recent.pop(device_address, None)
+        recent[device_address] = (nowstamp, last_seen)
+
+    def scanner_stamp(self, scanner_address: str) -> float:
+        """Return the newest advert stamp received by a scanner (0 if none)."""
+        return self.scanner_stamps.get(scanner_address, 0.0)
+
+    def device_seen_since(self, device_address: str, stamp: float) -> bool:
+        """Return True if a device was recorded with a last_seen after stamp."""
+        entry = self._recent.get(device_address)
+        return entry is not None and entry[1] > stamp
+
+    def count_devices_seen_since(self, stamp: float, devices: Container[str]) -> int:
+        """
+        Count devices (still in devices) recorded with a last_seen after stamp.
+
+        Walks from the most recently heard device and stops at the first one
+        ingested at or before stamp, since a device's last_seen is never later
+        than the cycle it was ingested in.
+        """
+        count = 0
+        for address, (ingested, last_seen) in reversed(self._recent.items()):
+            if ingested <= stamp:
+                break
+            if last_seen > stamp and address in devices:
+                count += 1
+        return count
+
+    def active_scanner_count(self, max_age: float, count: Callable[[], int]) -> int:
+        """Return this cycle's active scanner count for max_age, calling count() once per cycle."""
+        cached = self._scanner_counts.get(max_age)
+        if cached is None:
+            cached = self._scanner_counts[max_age] = count()
+        return cached
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the index for diagnostics."""
+        return {
+            "scanners": len(self.scanner_stamps),
+            "recent_devices": len(self._recent),
+            "newest_stamp": round(self.newest_stamp, 3),
+        }
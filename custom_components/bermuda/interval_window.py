@@ -0,0 +1,127 @@
+"""
+Running maximum of an advert's recent advertisement intervals.
+
+The adaptive timeout of a BermudaAdvert is twice the largest gap between the
+last few stamps in hist_stamp. It used to be recomputed from scratch on every
+stale check, although the history only ever changes by a new stamp at the
+front and a trim at the back.
+
+MaxIntervalWindow follows the history list instead: on each query it works
+out how many stamps were inserted since the previous one, pushes only those
+intervals into a monotonic deque and expires the ones that fell out of the
+window, so a query is amortised O(1). Any other change to the list (a clear,
+a replacement list, a history that no longer contains the last known head)
+falls back to a full rebuild with the original semantics.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Number of most recent intervals the adaptive timeout looks at.
+INTERVAL_WINDOW_SPAN = 10
+
+
+class MaxIntervalWindow:
+    """
+    Largest interval between consecutive stamps of a newest-first history.
+
+    Attributes
+    ----------
+        span: Number of most recent intervals considered.
+        pushes: Intervals added incrementally (diagnostics).
+        rebuilds: Full recomputations after the history was replaced or cleared (diagnostics).
+
+    """
+
+    __slots__ = ("_head", "_length", "_newest", "_stamps", "_window", "pushes", "rebuilds", "span")
+
+    def __init__(self, span: int = INTERVAL_WINDOW_SPAN) -> None:
+        """Initialise without any history observed yet."""
+        self.span = span
+        # The history list seen on the last query, with its length and first stamp.
+        self._stamps: list[float] | None = None
+        self._length: int = 0
+        self._head: float | None = None
+        # (sequence number, interval) pairs with strictly decreasing intervals, so the
+        # front is the maximum. Sequence numbers count intervals pushed, oldest first.
+        self._window: deque[tuple[int, float]] = deque()
+        self._newest: int = -1
+        self.pushes: int = 0
+        self.rebuilds: int = 0
+
+    def max_interval(self, stamps: list[float]) -> float | None:
+        """
+        Return the largest of the newest `span` intervals in stamps.
+
+        Args:
+        ----
+            stamps: Advert stamps, newest first (BermudaAdvert.hist_stamp).
+
+        Returns:
+        -------
+            The largest interval, or None if there is none (fewer than two stamps).
+
+        """
+        inserted = self._inserted_since_last(stamps)
+        if inserted is None:
+            self._rebuild(stamps)
+        else:
+            for index in range(inserted - 1, -1, -1):
+                self._push(stamps, index)
+            self.pushes += inserted
+
+        length = len(stamps)
+        self._stamps = stamps
+        self._length = length
+        self._head = stamps[0] if length else None
+
+        window = self._window
+        oldest = self._newest - min(self.span, length - 1)
+        while window and window[0][0] <= oldest:
+            window.popleft()
+        return window[0][1] if window else None
+
+    def _inserted_since_last(self, stamps: list[float]) -> int | None:
+        """Return how many stamps were inserted at the front since the last query, or None to rebuild."""
+        head = self._head
+        if stamps is not self._stamps or head is None or not stamps:
+            return None
+        if stamps[0] == head:
+            return 0 if len(stamps) == self._length else None
+        # Stamps grow strictly at the front, so the old head moved back by the number of
+        # inserts. Trimming only shortens the tail, so the list cannot have grown by more.
+        for inserted in range(1, len(stamps)):
+            if stamps[inserted] == head:
+                return inserted if len(stamps) <= self._length + inserted else None
+        return None
+
+    def _push(self, stamps: list[float], index: int) -> None:
+        """Add the interval ending at stamps[index] as the newest in the window."""
+        self._newest += 1
+        older = stamps[index + 1] if index + 1 < len(stamps) else None
+        if older is None:
+            return
+        interval = stamps[index] - older
+        window = self._window
+        while window and window[-1][1] <= interval:
+            window.pop()
+        window.append((self._newest, interval))
+
+    def _rebuild(self, stamps: list[float]) -> None:
+        """Refill the window from the whole history."""
+        self._window.clear()
+        self._newest = -1
+        self.rebuilds += 1
+        for index in range(min(self.span, len(stamps) - 1) - 1, -1, -1):
+            self._push(stamps, index)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the window for diagnostics."""
+        return {
+            "span": self.span,
+            "max_interval": self._window[0][1] if self._window else None,
+            "pushes": self.pushes,
+            "rebuilds": self.rebuilds,
+        }
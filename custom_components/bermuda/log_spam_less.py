@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, TypedDict
+import logging
+from typing import TYPE_CHECKING, Any
 
 from bluetooth_data_tools import monotonic_time_coarse
 
 if TYPE_CHECKING:
-    import logging
+    from collections.abc import Hashable
 
+# Keys kept per instance at most. Keys often embed device addresses, so
+# rotating MACs would otherwise grow the cache forever.
+DEFAULT_MAX_KEYS = 1024
 
-class _CacheEntry(TypedDict):
-    stamp: float
-    count: int
+
+class _CacheEntry:
+    """Rate-limit state for one key."""
+
+    __slots__ = ("count", "stamp", "touched")
+
+    def __init__(self, stamp: float) -> None:
+        self.stamp = stamp  # last time the message was emitted
+        self.touched = stamp  # last time the key was used at all
+        self.count = 0  # uses suppressed since the last emission
 
 
 class BermudaLogSpamLess:
@@ -21,17 +32,37 @@ class BermudaLogSpamLess:
 
     Log via this class, adding a "key" to each call, and we will rate-limit any later log
     messages that use the same key by the spam_interval defined in the constructor.
+
+    Keys can be any hashable; pass a tuple such as ("invalid_ref_power", address)
+    rather than formatting a string on every call. Messages for a disabled log
+    level return before the key is looked at.
+
+    Each instance keeps its own keys, least recently used first. Keys unused for
+    longer than the key TTL (by default the spam interval) are forgotten, and at
+    most max_keys are kept. Forgetting a key only loses its "previous messages
+    suppressed" count, the next message with that key is emitted anyway.
     """
 
-    _logger: logging.Logger
-    _interval: float
-    _keycache: dict[str, _CacheEntry] = {}
+    __slots__ = ("_interval", "_keycache", "_logger", "_ttl", "emitted", "evicted", "expired", "max_keys", "suppressed")
 
-    def __init__(self, logger: logging.Logger, spam_interval: float) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        spam_interval: float,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        key_ttl: float | None = None,
+    ) -> None:
         self._logger = logger
         self._interval = spam_interval
-
-    def _check_key(self, key: str) -> int:
+        self._ttl = max(spam_interval, key_ttl or 0.0)
+        self._keycache: dict[Hashable, _CacheEntry] = {}
+        self.max_keys = max_keys
+        self.emitted: int = 0
+        self.suppressed: int = 0
+        self.expired: int = 0
+        self.evicted: int = 0
+
+    def _check_key(self, key: Hashable) -> int:
         """
         Check if the given key has been used recently.
 
@@ -39,27 +70,46 @@ class BermudaLogSpamLess:
         but if the message should be logged it returns the number of attempted uses
         since last time it was sent - which might be zero.
         """
-        if key in self._keycache:
-            # key exists, check timestamps
-            cache = self._keycache[key]
-            if cache["stamp"] < monotonic_time_coarse() - self._interval:
-                # It's time to emit the message
-                count = cache["count"]
-                cache["count"] = 0
-                cache["stamp"] = monotonic_time_coarse()
-                return count
-            # We sent this message recently, don't spam
-            cache["count"] += 1
-            return -1
-        else:
-            # Key is completely new, store the new stamp and let it through
-            self._keycache[key] = {
-                "stamp": monotonic_time_coarse(),
-                "count": 0,
-            }
+        nowstamp = monotonic_time_coarse()
+        cache = self._keycache.pop(key, None)
+        if cache is None:
+            # Key is completely new (or forgotten), store the new stamp and let it through
+            self._expire(nowstamp)
+            self._keycache[key] = _CacheEntry(nowstamp)
+            self.emitted += 1
             return 0
-
-    def _prep_message(self, key: str, msg: str) -> str | None:
+        # Re-insert to keep the cache in least-recently-used order
+        self._keycache[key] = cache
+        cache.touched = nowstamp
+        if cache.stamp < nowstamp - self._interval:
+            # It's time to emit the message
+            count = cache.count
+            cache.count = 0
+            cache.stamp = nowstamp
+            self.emitted += 1
+            return count
+        # We sent this message recently, don't spam
+        cache.count += 1
+        self.suppressed += 1
+        return -1
+
+    def _expire(self, nowstamp: float) -> None:
+        """Forget keys unused for longer than the TTL, and make room for one more key."""
+        keycache = self._keycache
+        cutoff = nowstamp - self._ttl
+        stale: list[Hashable] = []
+        for key, cache in keycache.items():
+            if cache.touched >= cutoff:
+                break
+            stale.append(key)
+        for key in stale:
+            del keycache[key]
+        self.expired += len(stale)
+        while len(keycache) >= self.max_keys:
+            del keycache[next(iter(keycache))]
+            self.evicted += 1
+
+    def _prep_message(self, key: Hashable, msg: str) -> str | None:
         """
         Checks if message should be logged and returns the message reformatted
         to indicate how many previous messages were supressed.
@@ -72,26 +122,36 @@ class BermudaLogSpamLess:
             return f"{msg} ({count} previous messages suppressed)"
         return None
 
-    def debug(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
-        """Send log message, if no log was issued with the same key recently."""
+    def _log(self, level: int, key: Hashable, msg: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
         newmsg = self._prep_message(key, msg)
         if newmsg is not None:
-            self._logger.debug(newmsg, *args, **kwargs)
+            self._logger.log(level, newmsg, *args, **kwargs)
 
-    def info(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+    def debug(self, key: Hashable, msg: str, *args: Any, **kwargs: Any) -> None:
         """Send log message, if no log was issued with the same key recently."""
-        newmsg = self._prep_message(key, msg)
-        if newmsg is not None:
-            self._logger.info(newmsg, *args, **kwargs)
+        self._log(logging.DEBUG, key, msg, args, kwargs)
 
-    def warning(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+    def info(self, key: Hashable, msg: str, *args: Any, **kwargs: Any) -> None:
         """Send log message, if no log was issued with the same key recently."""
-        newmsg = self._prep_message(key, msg)
-        if newmsg is not None:
-            self._logger.warning(newmsg, *args, **kwargs)
+        self._log(logging.INFO, key, msg, args, kwargs)
 
-    def error(self, key: str, msg: str, *args: Any, **kwargs: Any) -> None:
+    def warning(self, key: Hashable, msg: str, *args: Any, **kwargs: Any) -> None:
         """Send log message, if no log was issued with the same key recently."""
-        newmsg = self._prep_message(key, msg)
-        if newmsg is not None:
-            self._logger.error(newmsg, *args, **kwargs)
+        self._log(logging.WARNING, key, msg, args, kwargs)
+
+    def error(self, key: Hashable, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Send log message, if no log was issued with the same key recently."""
+        self._log(logging.ERROR, key, msg, args, kwargs)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the rate limiter for diagnostics."""
+        return {
+            "keys": len(self._keycache),
+            "max_keys": self.max_keys,
+            "emitted": self.emitted,
+            "suppressed": self.suppressed,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
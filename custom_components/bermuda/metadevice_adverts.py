@@ -0,0 +1,135 @@
+"""
+Merged advert view for metadevices.
+
+A metadevice (iBeacon, Private BLE Device, FMDN) has no adverts of its own,
+it reports the adverts of its source devices. update_metadevices() used to
+copy every (address, scanner) entry of every source into the metadevice's
+adverts dict on each cycle, so the copy was re-done even when nothing
+changed and kept entries of sources that had since been dropped.
+
+MetadeviceAdverts instead presents the sources' own advert dicts, plus any
+adverts the metadevice received directly, as one mapping. Nothing is copied:
+the view is re-pointed at the current sources once per cycle, and lookups by
+advert key go straight to the owning source, since the first element of an
+advert key is always the source device address.
+
+Source entries are read-only through the view; they belong to (and are
+pruned with) the source devices. Writes and deletes apply to the
+metadevice's own adverts.
+"""
+
+from __future__ import annotations
+
+from collections.abc import ItemsView, Iterator, Mapping, MutableMapping, ValuesView
+from itertools import chain
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Container
+
+    from .bermuda_advert import BermudaAdvert
+
+AdvertKey = tuple[str, str]
+
+
+class _AdvertValues(ValuesView["BermudaAdvert"]):
+    """Values view that walks the underlying dicts directly."""
+
+    _mapping: MetadeviceAdverts
+
+    def __iter__(self) -> Iterator[BermudaAdvert]:
+        """Iterate over all adverts."""
+        return self._mapping.iter_values()
+
+
+class _AdvertItems(ItemsView[AdvertKey, "BermudaAdvert"]):
+    """Items view that walks the underlying dicts directly."""
+
+    _mapping: MetadeviceAdverts
+
+    def __iter__(self) -> Iterator[tuple[AdvertKey, BermudaAdvert]]:
+        """Iterate over all (key, advert) pairs."""
+        return self._mapping.iter_items()
+
+
+class MetadeviceAdverts(MutableMapping[AdvertKey, "BermudaAdvert"]):
+    """
+    Adverts of a metadevice: its own plus those of its current sources.
+
+    Attributes
+    ----------
+        own: Adverts received by the metadevice address itself.
+
+    """
+
+    __slots__ = ("_sources", "own")
+
+    def __init__(self, own: MutableMapping[AdvertKey, BermudaAdvert] | None = None) -> None:
+        """Wrap the metadevice's own adverts mapping (kept, not copied)."""
+        self.own: MutableMapping[AdvertKey, BermudaAdvert] = own if own is not None else {}
+        # source address -> that source device's adverts dict
+        self._sources: dict[str, Mapping[AdvertKey, BermudaAdvert]] = {}
+
+    def set_sources(self, sources: dict[str, Mapping[AdvertKey, BermudaAdvert]]) -> None:
+        """Point the view at the advert dicts of the current source devices."""
+        self._sources = sources
+
+    def discard_sources(self, addresses: Container[str]) -> None:
+        """Stop presenting adverts from the given source addresses, including any own copies."""
+        sources = self._sources
+        for address in [address for address in sources if address in addresses]:
+            del sources[address]
+        own = self.own
+        for key in [key for key in own if key[0] in addresses]:
+            del own[key]
+
+    def __getitem__(self, key: AdvertKey) -> BermudaAdvert:
+        """Return an advert, looking in its source device first."""
+        source = self._sources.get(key[0])
+        if source is not None and key in source:
+            return source[key]
+        return self.own[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if a source or the metadevice itself holds the advert."""
+        if isinstance(key, tuple) and key:
+            source = self._sources.get(key[0])
+            if source is not None and key in source:
+                return True
+        return key in self.own
+
+    def __setitem__(self, key: AdvertKey, value: BermudaAdvert) -> None:
+        """Store an advert received by the metadevice itself."""
+        self.own[key] = value
+
+    def __delitem__(self, key: AdvertKey) -> None:
+        """Delete one of the metadevice's own adverts."""
+        del self.own[key]
+
+    def __iter__(self) -> Iterator[AdvertKey]:
+        """Iterate over own advert keys, then those of each source."""
+        return chain(self.own, *self._sources.values())
+
+    def __len__(self) -> int:
+        """Return the number of adverts across own and source adverts."""
+        return len(self.own) + sum(len(source) for source in self._sources.values())
+
+    def iter_values(self) -> Iterator[BermudaAdvert]:
+        """Iterate over all adverts without building a list."""
+        return chain(self.own.values(), *(source.values() for source in self._sources.values()))
+
+    def iter_items(self) -> Iterator[tuple[AdvertKey, BermudaAdvert]]:
+        """Iterate over all (key, advert) pairs without building a list."""
+        return chain(self.own.items(), *(source.items() for source in self._sources.values()))
+
+    def values(self) -> _AdvertValues:
+        """Return a view of all adverts."""
+        return _AdvertValues(self)
+
+    def items(self) -> _AdvertItems:
+        """Return a view of all (key, advert) pairs."""
+        return _AdvertItems(self)
+
+    def __repr__(self) -> str:
+        """Return a summary without expanding the adverts."""
+        return f"MetadeviceAdverts(own={len(self.own)}, sources={list(self._sources)})"
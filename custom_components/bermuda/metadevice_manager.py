@@ -30,19 +30,28 @@ from .const import (
     METADEVICE_TYPE_IBEACON_SOURCE,
     METADEVICE_TYPE_PRIVATE_BLE_SOURCE,
 )
+from .metadevice_adverts import MetadeviceAdverts
 from .util import normalize_address, normalize_mac
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.device_registry import DeviceRegistry
     from homeassistant.helpers.entity_registry import EntityRegistry
 
+    from .bermuda_advert import BermudaAdvert
     from .bermuda_device import BermudaDevice
     from .coordinator import BermudaDataUpdateCoordinator
     from .fmdn import FmdnIntegration
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source fields copied to a metadevice that doesn't have them yet.
+_SOURCE_NAME_FIELDS = ("name_bt_local_name", "name_bt_serviceinfo", "manufacturer")
+# Source fields that always overwrite the metadevice's.
+_SOURCE_BEACON_FIELDS = ("beacon_major", "beacon_minor", "beacon_power", "beacon_unique_id", "beacon_uuid")
+
 
 class MetadeviceManager:
     """
@@ -69,6 +78,8 @@ class MetadeviceManager:
 
         """
         self.coordinator = coordinator
+        # Metadevice address -> {source address: source identity_version last propagated}
+        self._identity_seen: dict[str, dict[str, int]] = {}
 
     # =========================================================================
     # Property accessors for coordinator state
@@ -355,7 +366,14 @@ class MetadeviceManager:
         ref_power_set_this_cycle: set[str] = set()
 
         for metadevice in self.metadevices.values():
-            # Find every known source device and copy their adverts in.
+            # Present every known source device's adverts through the metadevice.
+            # The view references the sources' own dicts, so nothing is copied.
+            adverts = metadevice.adverts
+            if not isinstance(adverts, MetadeviceAdverts):
+                adverts = metadevice.adverts = MetadeviceAdverts(adverts)
+            sources: dict[str, Mapping[tuple[str, str], BermudaAdvert]] = {}
+            # Source address -> identity_version we last propagated from it.
+            identity_seen = self._identity_seen.setdefault(metadevice.address, {})
 
             # Keep track of whether we want to recalculate the name fields at the end.
             _want_name_update = False
@@ -380,8 +398,8 @@ class MetadeviceManager:
                     # Some iBeacons (specifically Bluecharms) change uuid on movement.
                     #
                     # This source device has changed its uuid, so we won't track it against
-                    # this metadevice any more / for now, and we will also remove
-                    # the existing scanner entries on the metadevice, to ensure it goes
+                    # this metadevice any more / for now. Leaving it out of the view also
+                    # drops its scanner entries from the metadevice, to ensure it goes
                     # `unknown` immediately (assuming no other source devices show up)
                     #
                     # Note that this won't quick-away devices that change their MAC at the
@@ -394,17 +412,13 @@ class MetadeviceManager:
                         source_device,
                         metadevice,
                     )
-                    for key_address, key_scanner in list(metadevice.adverts):
-                        if key_address == source_device.address:
-                            del metadevice.adverts[(key_address, key_scanner)]
+                    adverts.discard_sources((source_device.address,))
                     if source_device.address in metadevice.metadevice_sources:
                         # Remove this source from the list once we're done iterating on it
                         _sources_to_remove.append(source_device.address)
                     continue  # to next metadevice_source
 
-                # Copy every ADVERT_TUPLE into our metadevice
-                for advert_tuple in source_device.adverts:
-                    metadevice.adverts[advert_tuple] = source_device.adverts[advert_tuple]
+                sources[source_device.address] = source_device.adverts
 
                 # Update last_seen if the source is newer.
                 metadevice.last_seen = max(metadevice.last_seen, source_device.last_seen)
@@ -441,40 +455,35 @@ class MetadeviceManager:
                 if should_set_ref_power:
                     source_device.set_ref_power(metadevice.ref_power)
 
-                # anything that isn't already set to something interesting, overwrite
-                # it with the new device's data.
-                for key, val in vars(source_device).items():
-                    if val is any(
-                        [
-                            source_device.name_bt_local_name,
-                            source_device.name_bt_serviceinfo,
-                            source_device.manufacturer,
-                        ]
-                    ) and getattr(metadevice, key, None) in [None, False]:
-                        setattr(metadevice, key, val)
-                        _want_name_update = True
-
-                if _want_name_update:
-                    metadevice.make_name()
-
-                # Anything that's VERY interesting, overwrite it regardless of what's already there:
-                # INTERESTING:
-                for key, val in vars(source_device).items():
-                    if val is any(
-                        [
-                            source_device.beacon_major,
-                            source_device.beacon_minor,
-                            source_device.beacon_power,
-                            source_device.beacon_unique_id,
-                            source_device.beacon_uuid,
-                        ]
-                    ):
-                        setattr(metadevice, key, val)
-                        # _want_name_update = True
+                # Names, manufacturer and beacon fields only need re-reading when the
+                # source has changed them since we last looked.
+                identity_version = source_device.identity_version
+                if identity_seen.get(source_device.address) != identity_version:
+                    identity_seen[source_device.address] = identity_version
+
+                    # anything that isn't already set to something interesting, overwrite
+                    # it with the new device's data.
+                    for key in _SOURCE_NAME_FIELDS:
+                        val = getattr(source_device, key)
+                        if val and getattr(metadevice, key, None) in [None, False]:
+                            setattr(metadevice, key, val)
+                            _want_name_update = True
+
+                    # Anything that's VERY interesting, overwrite it regardless of what's already there:
+                    for key in _SOURCE_BEACON_FIELDS:
+                        val = getattr(source_device, key)
+                        if val is not None:
+                            setattr(metadevice, key, val)
+
+            adverts.set_sources(sources)
 
             # Done iterating sources, remove any to be dropped
             for source in _sources_to_remove:
                 metadevice.metadevice_sources.remove(source)
+            if len(identity_seen) > len(sources):
+                # Forget sources that have rotated away or been pruned.
+                for source in [source for source in identity_seen if source not in sources]:
+                    del identity_seen[source]
             if _want_name_update:
                 metadevice.make_name()
 
@@ -0,0 +1,224 @@
+"""
+Time-ordered index of devices for prune_devices.
+
+prune_devices used to walk every device on every run, collect stale ones in
+a list with linear membership checks, and sort every remaining candidate
+when the device count exceeded PRUNE_MAX_COUNT. In busy places (stations,
+offices) that is tens of thousands of rotating MACs per run.
+
+PruneIndex keeps one min-heap of (last_seen, address) per bucket:
+
+- BUCKET_RPA: random resolvable (IRK) addresses, pruned after
+  PRUNE_TIME_UNKNOWN_IRK.
+- BUCKET_STATIC: every other MAC48 address, pruned after PRUNE_TIME_DEFAULT.
+
+Non-MAC48 addresses (metadevices, iBeacons) are never pruned by age and are
+not indexed. FMDN and IRK rotating sources are reached through their
+metadevice's source list, as before.
+
+The heaps are lazy: last_seen changes on every advert, and updating a heap
+entry there would cost more than it saves. Instead, an entry popped from
+the front is compared with the device's current last_seen. If the device
+has been seen since, the entry is re-pushed with the newer stamp. So a run
+only touches entries that looked expired when they were last pushed.
+
+New devices are picked up without hooking device creation: devices are
+only ever removed by prune_devices, so the coordinator's devices dict keeps
+insertion order and anything added since the last sync sits at its tail.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Any
+
+from .const import BDADDR_TYPE_NOT_MAC48, BDADDR_TYPE_RANDOM_RESOLVABLE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .bermuda_device import BermudaDevice
+
+BUCKET_RPA = "rpa"
+BUCKET_STATIC = "static"
+
+
+def prune_bucket(address_type: str) -> str | None:
+    """Return the prune bucket for an address type, or None if it is never pruned by age."""
+    if address_type == BDADDR_TYPE_NOT_MAC48:
+        return None
+    if address_type == BDADDR_TYPE_RANDOM_RESOLVABLE:
+        return BUCKET_RPA
+    return BUCKET_STATIC
+
+
+class PruneIndex:
+    """
+    Per-bucket min-heaps of device last_seen stamps.
+
+    Attributes
+    ----------
+        rebuilds: Full rebuilds (stale entry compaction, or devices removed
+                  outside prune_devices).
+        refreshed: Heap entries re-pushed because the device was seen since.
+
+    """
+
+    __slots__ = ("_heaps", "_stamps", "_synced", "rebuilds", "refreshed")
+
+    def __init__(self) -> None:
+        """Initialise an empty index."""
+        self._heaps: dict[str, list[tuple[float, str]]] = {BUCKET_RPA: [], BUCKET_STATIC: []}
+        # address -> stamp of its live heap entry (older entries for it are stale)
+        self._stamps: dict[str, float] = {}
+        # Number of devices (from the front of the devices dict) already indexed
+        self._synced: int = 0
+        self.rebuilds: int = 0
+        self.refreshed: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed devices."""
+        return len(self._stamps)
+
+    def _push(self, bucket: str, stamp: float, address: str) -> None:
+        self._stamps[address] = stamp
+        heapq.heappush(self._heaps[bucket], (stamp, address))
+
+    def _add(self, address: str, device: BermudaDevice) -> None:
+        if (bucket := prune_bucket(device.address_type)) is not None:
+            self._push(bucket, device.last_seen, address)
+
+    def sync(self, devices: dict[str, BermudaDevice]) -> None:
+        """Index devices added since the last sync (only the tail of devices is visited)."""
+        new_count = len(devices) - self._synced
+        if new_count < 0 or sum(len(heap) for heap in self._heaps.values()) > 2 * len(self._stamps) + 64:
+            # Something removed devices behind our back, or too many stale
+            # heap entries piled up: start over.
+            self.rebuild(devices)
+            return
+        if new_count:
+            tail: list[tuple[str, BermudaDevice]] = []
+            for item in reversed(devices.items()):
+                if len(tail) == new_count:
+                    break
+                tail.append(item)
+            for address, device in tail:
+                self._add(address, device)
+        self._synced = len(devices)
+
+    def rebuild(self, devices: Mapping[str, BermudaDevice]) -> None:
+        """Index all devices from scratch."""
+        for heap in self._heaps.values():
+            heap.clear()
+        self._stamps.clear()
+        for address, device in devices.items():
+            self._add(address, device)
+        self._synced = len(devices)
+        self.rebuilds += 1
+
+    def removed(self, address: str) -> None:
+        """Forget a device that prune_devices deleted (its heap entry goes stale)."""
+        self._stamps.pop(address, None)
+        self._synced -= 1
+
+    def _pop_valid(self, bucket: str, devices: Mapping[str, BermudaDevice]) -> tuple[float, str] | None:
+        """
+        Pop the front entry of a bucket that is still accurate.
+
+        Stale entries are discarded, and entries for devices seen since they
+        were pushed are re-pushed with the current stamp.
+        """
+        heap = self._heaps[bucket]
+        while heap:
+            stamp, address = heapq.heappop(heap)
+            if self._stamps.get(address) != stamp:
+                continue  # superseded or removed
+            device = devices.get(address)
+            if device is None:
+                del self._stamps[address]
+                continue
+            if device.last_seen > stamp:
+                self._push(bucket, device.last_seen, address)
+                self.refreshed += 1
+                continue
+            return stamp, address
+        return None
+
+    def _peek_stamp(self, bucket: str) -> float | None:
+        heap = self._heaps[bucket]
+        return heap[0][0] if heap else None
+
+    def expired(self, bucket: str, cutoff: float, devices: Mapping[str, BermudaDevice]) -> list[str]:
+        """
+        Return addresses in bucket whose device was last seen before cutoff, oldest first.
+
+        Only entries older than cutoff are visited. The returned devices stay
+        indexed; call removed() for the ones that actually get pruned.
+        """
+        found: list[tuple[float, str]] = []
+        while (front := self._peek_stamp(bucket)) is not None and front < cutoff:
+            entry = self._pop_valid(bucket, devices)
+            if entry is None:
+                break
+            if entry[0] >= cutoff:
+                self._push(bucket, *entry)
+                break
+            found.append(entry)
+        for stamp, address in found:
+            self._push(bucket, stamp, address)
+        return [address for _stamp, address in found]
+
+    def oldest(
+        self,
+        devices: Mapping[str, BermudaDevice],
+        count: int,
+        cutoffs: Mapping[str, float],
+        accept: Callable[[str], bool],
+    ) -> list[str]:
+        """
+        Return up to count accepted addresses across buckets, least recently seen first.
+
+        Args:
+        ----
+            devices: The coordinator's devices.
+            count: How many addresses are wanted.
+            cutoffs: Per bucket, only devices last seen before this stamp qualify.
+            accept: Predicate for whether an address may be pruned.
+
+        Returns:
+        -------
+            Addresses in ascending last_seen order. They stay indexed; call
+            removed() for the ones that actually get pruned.
+
+        """
+        popped: list[tuple[str, float, str]] = []
+        chosen: list[str] = []
+        fronts: dict[str, tuple[float, str]] = {}
+        for bucket in self._heaps:
+            if (entry := self._pop_valid(bucket, devices)) is not None:
+                fronts[bucket] = entry
+        while fronts and len(chosen) < count:
+            bucket = min(fronts, key=lambda name: fronts[name][0])
+            stamp, address = fronts.pop(bucket)
+            popped.append((bucket, stamp, address))
+            if stamp >= cutoffs.get(bucket, float("inf")):
+                # Everything else in this bucket is newer still
+                continue
+            if accept(address):
+                chosen.append(address)
+            if (entry := self._pop_valid(bucket, devices)) is not None:
+                fronts[bucket] = entry
+        for bucket, (stamp, address) in fronts.items():
+            self._push(bucket, stamp, address)
+        for bucket, stamp, address in popped:
+            self._push(bucket, stamp, address)
+        return chosen
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the index for diagnostics."""
+        return {
+            "indexed": len(self._stamps),
+            "heap_entries": {bucket: len(heap) for bucket, heap in self._heaps.items()},
+            "rebuilds": self.rebuilds,
+            "refreshed": self.refreshed,
+        }
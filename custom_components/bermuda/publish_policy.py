@@ -0,0 +1,172 @@
+"""
+Publishing policy for measurement sensors (distance, RSSI, intervals).
+
+The original rate limiter (BermudaEntity._cached_ratelimit) only knew about
+time: once CONF_UPDATE_INTERVAL expired, any wobble in the value was
+published. For noisy measurements like BLE distances that means a new
+recorder row every interval even when nothing meaningful changed.
+
+A PublishPolicy adds three things on top of the time-based cache:
+
+- Deadband: a new value is only published if it differs from the last
+  published value by at least max(abs_deadband, rel_deadband * |last|).
+  Changes inside the deadband are held back.
+- Max-silence heartbeat: even inside the deadband, the current value is
+  published once max_silence seconds have passed, so the state never goes
+  stale indefinitely.
+- Stationary back-off: while a device is stationary (see
+  BermudaDevice.get_movement_state), the minimum interval between
+  publications doubles with every publication, up to max_backoff times the
+  update interval. Leaving the stationary state resets it straight away.
+
+Per-scanner distance sensors get their own, lighter policy: the absolute
+distance deadband only, without the relative deadband or stationary
+back-off, since the movement state describes the device's area rather than
+its range to any one scanner. The unfiltered per-scanner ranges keep the
+plain time-based cache.
+
+Fast-falling/fast-rising bypasses still skip the interval (e.g. approaching
+a scanner shows up immediately) but must clear the deadband.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .const import (
+    CONF_DISTANCE_DEADBAND,
+    CONF_PUBLISH_MAX_SILENCE,
+    CONF_RSSI_DEADBAND,
+    CONF_STATIONARY_BACKOFF,
+    DEFAULT_DISTANCE_DEADBAND,
+    DEFAULT_PUBLISH_MAX_SILENCE,
+    DEFAULT_RSSI_DEADBAND,
+    DEFAULT_STATIONARY_BACKOFF,
+    DISTANCE_RELATIVE_DEADBAND,
+    INTERVAL_ABSOLUTE_DEADBAND,
+    INTERVAL_RELATIVE_DEADBAND,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Sensor classes with their own deadband settings
+POLICY_DISTANCE = "distance"
+POLICY_SCANNER_DISTANCE = "scanner_distance"
+POLICY_RSSI = "rssi"
+POLICY_INTERVAL = "interval"
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """
+    Deadband, heartbeat and back-off settings for one sensor class.
+
+    Attributes
+    ----------
+        abs_deadband: Minimum absolute change worth publishing.
+        rel_deadband: Minimum change as a fraction of the last published value.
+        max_silence: Seconds after which the current value is published anyway.
+        max_backoff: Upper bound of the stationary interval multiplier
+                     (1.0 disables back-off).
+
+    """
+
+    abs_deadband: float
+    rel_deadband: float
+    max_silence: float
+    max_backoff: float
+
+    def exceeds_deadband(self, value: float, last_value: float) -> bool:
+        """Return True if value moved far enough from last_value to publish."""
+        threshold = max(self.abs_deadband, self.rel_deadband * abs(last_value))
+        return abs(value - last_value) >= threshold
+
+    def next_backoff(self, backoff: float, *, stationary: bool) -> float:
+        """Return the interval multiplier to use after a publication."""
+        if not stationary:
+            return 1.0
+        return min(backoff * 2.0, self.max_backoff)
+
+    def should_publish(
+        self,
+        value: float,
+        last_value: float,
+        since_last: float,
+        interval: float,
+        *,
+        fast_falling: bool,
+        fast_rising: bool,
+    ) -> bool:
+        """
+        Decide whether a new measurement should replace the published one.
+
+        Args:
+        ----
+            value: New measurement.
+            last_value: Currently published value.
+            since_last: Seconds since the last publication.
+            interval: Minimum seconds between publications (after back-off).
+            fast_falling: Publish decreases without waiting for the interval.
+            fast_rising: Publish increases without waiting for the interval.
+
+        Returns:
+        -------
+            True if value should be published.
+
+        """
+        if not self.exceeds_deadband(value, last_value):
+            # Heartbeat: don't hold a (slightly) different value forever
+            return since_last >= self.max_silence
+        if (fast_falling and value < last_value) or (fast_rising and value > last_value):
+            return True
+        return since_last > interval
+
+
+@lru_cache(maxsize=32)
+def _build_policy(kind: str, abs_deadband: float, max_silence: float, max_backoff: float) -> PublishPolicy:
+    """Build (and share) a policy for the given settings."""
+    if kind == POLICY_DISTANCE:
+        rel_deadband = DISTANCE_RELATIVE_DEADBAND
+    elif kind == POLICY_INTERVAL:
+        rel_deadband = INTERVAL_RELATIVE_DEADBAND
+    else:
+        rel_deadband = 0.0
+    if kind == POLICY_SCANNER_DISTANCE:
+        max_backoff = 1.0
+    return PublishPolicy(
+        abs_deadband=abs_deadband,
+        rel_deadband=rel_deadband,
+        max_silence=max_silence,
+        max_backoff=max(1.0, max_backoff),
+    )
+
+
+def get_publish_policy(kind: str, options: Mapping[str, Any]) -> PublishPolicy:
+    """
+    Return the publishing policy for a sensor class from the current options.
+
+    Args:
+    ----
+        kind: One of POLICY_DISTANCE, POLICY_SCANNER_DISTANCE, POLICY_RSSI or POLICY_INTERVAL.
+        options: Coordinator options.
+
+    Returns:
+    -------
+        A shared, immutable PublishPolicy.
+
+    """
+    if kind in (POLICY_DISTANCE, POLICY_SCANNER_DISTANCE):
+        abs_deadband = float(options.get(CONF_DISTANCE_DEADBAND, DEFAULT_DISTANCE_DEADBAND))
+    elif kind == POLICY_RSSI:
+        abs_deadband = float(options.get(CONF_RSSI_DEADBAND, DEFAULT_RSSI_DEADBAND))
+    else:
+        abs_deadband = INTERVAL_ABSOLUTE_DEADBAND
+    return _build_policy(
+        kind,
+        abs_deadband,
+        float(options.get(CONF_PUBLISH_MAX_SILENCE, DEFAULT_PUBLISH_MAX_SILENCE)),
+        float(options.get(CONF_STATIONARY_BACKOFF, DEFAULT_STATIONARY_BACKOFF)),
+    )
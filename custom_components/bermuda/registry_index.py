@@ -0,0 +1,118 @@
+"""
+Reverse indexes over the device and entity registries.
+
+Registry handlers used to answer their questions with full passes:
+
+- handle_devreg_changes() scanned every device for a matching entry_id on
+  each device registry event, most of which are for devices we don't track.
+- check_for_duplicate_entities() fetched every Bermuda entity and
+  prefix-matched their unique_ids for each device a platform added, and
+  cleanup_old_entities_for_device() did the same again.
+
+RegistryIndex keeps an entry_id -> device address map, maintained by
+BermudaDevice when its entry_id is assigned, and the unique_ids of this
+config entry's entities in sorted order, so all entities whose unique_id
+starts with an address are a bisect away. The entity index is built from
+the entity registry on first use and then kept current from entity registry
+events.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from homeassistant.helpers import entity_registry as er
+
+    from .bermuda_device import BermudaDevice
+
+
+class RegistryIndex:
+    """
+    Reverse indexes for registry event handlers.
+
+    Attributes
+    ----------
+        entities_built: True once the entity index has been loaded from the registry.
+        rebuilds: Number of times the entity index was loaded.
+
+    """
+
+    __slots__ = ("_entity_unique_ids", "_entry_addresses", "_unique_ids", "entities_built", "rebuilds")
+
+    def __init__(self) -> None:
+        """Initialise empty indexes."""
+        # device registry entry_id -> device address
+        self._entry_addresses: dict[str, str] = {}
+        # entity_id -> unique_id, and sorted (unique_id, entity_id) pairs. unique_ids
+        # are only unique per platform, so the sensor and device_tracker of a device
+        # can share one.
+        self._entity_unique_ids: dict[str, str] = {}
+        self._unique_ids: list[tuple[str, str]] = []
+        self.entities_built: bool = False
+        self.rebuilds: int = 0
+
+    # Device registry entry_ids
+
+    def set_device_entry(self, address: str, old_entry_id: str | None, entry_id: str | None) -> None:
+        """Record that the device at address changed its device registry entry_id."""
+        if old_entry_id is not None and self._entry_addresses.get(old_entry_id) == address:
+            del self._entry_addresses[old_entry_id]
+        if entry_id is not None:
+            self._entry_addresses[entry_id] = address
+
+    def device_for_entry(self, entry_id: str, devices: Mapping[str, BermudaDevice]) -> BermudaDevice | None:
+        """Return the device whose entry_id is entry_id, if it still exists."""
+        address = self._entry_addresses.get(entry_id)
+        if address is None:
+            return None
+        device = devices.get(address)
+        if device is None or device.entry_id != entry_id:
+            # Device was pruned or has moved on to another entry.
+            del self._entry_addresses[entry_id]
+            return None
+        return device
+
+    # Entity unique_ids
+
+    def rebuild_entities(self, entries: Iterable[er.RegistryEntry]) -> None:
+        """Load the entity index from this config entry's registry entries."""
+        self._entity_unique_ids = {entry.entity_id: entry.unique_id for entry in entries if entry.unique_id}
+        self._unique_ids = sorted((unique_id, entity_id) for entity_id, unique_id in self._entity_unique_ids.items())
+        self.entities_built = True
+        self.rebuilds += 1
+
+    def add_entity(self, unique_id: str, entity_id: str) -> None:
+        """Add an entity, replacing any earlier unique_id it had."""
+        self.discard_entity(entity_id)
+        self._entity_unique_ids[entity_id] = unique_id
+        insort(self._unique_ids, (unique_id, entity_id))
+
+    def discard_entity(self, entity_id: str) -> None:
+        """Forget an entity, if it is indexed."""
+        unique_id = self._entity_unique_ids.pop(entity_id, None)
+        if unique_id is not None:
+            unique_ids = self._unique_ids
+            del unique_ids[bisect_left(unique_ids, (unique_id, entity_id))]
+
+    def entities_with_prefix(self, prefix: str) -> list[tuple[str, str]]:
+        """Return (unique_id, entity_id) for every entity whose unique_id starts with prefix."""
+        unique_ids = self._unique_ids
+        matches: list[tuple[str, str]] = []
+        for i in range(bisect_left(unique_ids, (prefix,)), len(unique_ids)):
+            if not unique_ids[i][0].startswith(prefix):
+                break
+            matches.append(unique_ids[i])
+        return matches
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the indexes for diagnostics."""
+        return {
+            "device_entries": len(self._entry_addresses),
+            "entities": len(self._unique_ids),
+            "entities_built": self.entities_built,
+            "rebuilds": self.rebuilds,
+        }
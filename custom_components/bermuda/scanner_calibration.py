@@ -204,6 +204,32 @@ class ScannerCalibrationManager:
     # Updated via set_scanner_tx_power() from coordinator
     scanner_tx_powers: dict[str, float] = field(default_factory=dict)
 
+    # Reverse lookup: any scanner MAC (canonical, BLE, WiFi, metadevice source)
+    # -> canonical scanner address. Rebuilt by refresh_scanner_macs() only when
+    # the scanner list or a scanner's MACs / metadevice sources change.
+    mac_to_scanner: dict[str, str] = field(default_factory=dict)
+    _mac_map_signature: tuple[tuple[str, str | None, str | None, tuple[str, ...]], ...] = field(default=(), repr=False)
+
+    # Cross-visibility index, fed at advert ingest via record_scanner_advert():
+    # {(receiver_addr, sender_addr): (rssi_raw, stamp)} for sightings that have
+    # not been folded into scanner_pairs yet.
+    pending_visibility: dict[tuple[str, str], tuple[float, float]] = field(default_factory=dict, repr=False)
+    # Newest advert stamp already indexed per (receiver, sender), so re-delivered
+    # adverts without new data are not counted twice.
+    _visibility_stamps: dict[tuple[str, str], float] = field(default_factory=dict, repr=False)
+
+    # Incremental offset recomputation: scanners whose pairs received new
+    # samples (or TX power / online state changes) since the last
+    # calculate_suggested_offsets(). Only these are recomputed.
+    _dirty_scanners: set[str] = field(default_factory=set, repr=False)
+    # Pair keys per scanner, so a dirty scanner only walks its own pairs
+    _pairs_by_scanner: dict[str, set[tuple[str, str]]] = field(default_factory=dict, repr=False)
+    _indexed_pair_count: int = field(default=0, repr=False)
+    # Scanners considered online at the last recomputation
+    _online_scanners: set[str] = field(default_factory=set, repr=False)
+    # Stamp of the last offset recomputation via update_scanner_calibration()
+    last_offsets_stamp: float | None = None
+
     def _get_pair_key(self, addr_a: str, addr_b: str) -> tuple[str, str]:
         """Get canonical key for scanner pair (always sorted)."""
         return (min(addr_a, addr_b), max(addr_a, addr_b))
@@ -213,8 +239,28 @@ class ScannerCalibrationManager:
         key = self._get_pair_key(addr_a, addr_b)
         if key not in self.scanner_pairs:
             self.scanner_pairs[key] = ScannerPairData(scanner_a=key[0], scanner_b=key[1])
+            self._pairs_by_scanner.setdefault(key[0], set()).add(key)
+            self._pairs_by_scanner.setdefault(key[1], set()).add(key)
+            self._indexed_pair_count += 1
         return self.scanner_pairs[key]
 
+    def _mark_dirty(self, scanner_addr: str) -> None:
+        """Flag a scanner and all its pair partners for offset recomputation."""
+        self._dirty_scanners.add(scanner_addr)
+        for key in self._pairs_by_scanner.get(scanner_addr, ()):
+            self._dirty_scanners.update(key)
+
+    def _sync_pair_index(self) -> None:
+        """Rebuild the per-scanner pair index if pairs were added without it."""
+        if self._indexed_pair_count == len(self.scanner_pairs):
+            return
+        self._pairs_by_scanner = {}
+        self._indexed_pair_count = len(self.scanner_pairs)
+        for key in self.scanner_pairs:
+            self._pairs_by_scanner.setdefault(key[0], set()).add(key)
+            self._pairs_by_scanner.setdefault(key[1], set()).add(key)
+            self._dirty_scanners.update(key)
+
     def _is_scanner_online(self, scanner_addr: str, nowstamp: float) -> bool:
         """
         Check if a scanner is considered online (has provided data recently).
@@ -252,14 +298,20 @@ class ScannerCalibrationManager:
             tx_power: Transmit power in dBm (typically -12 to 0 dBm).
 
         """
+        if self.scanner_tx_powers.get(scanner_addr) == tx_power:
+            # Unchanged - pairs already carry this value (update_cross_visibility
+            # also applies the cache to newly created pairs).
+            return
         self.scanner_tx_powers[scanner_addr] = tx_power
 
         # Update TX power in all pairs containing this scanner
-        for pair in self.scanner_pairs.values():
+        for key in self._pairs_by_scanner.get(scanner_addr, ()):
+            pair = self.scanner_pairs[key]
             if pair.scanner_a == scanner_addr:
                 pair.tx_power_a = tx_power
-            elif pair.scanner_b == scanner_addr:
+            else:
                 pair.tx_power_b = tx_power
+        self._mark_dirty(scanner_addr)
 
     def _calculate_confidence(
         self,
@@ -327,6 +379,137 @@ class ScannerCalibrationManager:
 
         return confidence, factors
 
+    def refresh_scanner_macs(self, scanner_list: set[str], devices: dict[str, BermudaDevice]) -> bool:
+        """
+        Rebuild the MAC -> scanner lookup if the scanner topology changed.
+
+        Scanners may have multiple MAC addresses (WiFi, BLE, Ethernet) and the
+        iBeacon broadcasts come from the BLE MAC, which may differ from the
+        canonical scanner address in scanner_list. Checking the signature is
+        O(scanners); the map itself is only rebuilt when it differs.
+
+        Args:
+        ----
+            scanner_list: Set of canonical scanner addresses.
+            devices: Dictionary of all BermudaDevice instances.
+
+        Returns:
+        -------
+            True if the lookup was rebuilt.
+
+        """
+        signature_parts: list[tuple[str, str | None, str | None, tuple[str, ...]]] = []
+        for scanner_addr in sorted(scanner_list):
+            scanner_device = devices.get(scanner_addr)
+            if scanner_device is None:
+                # Scanner not in devices dict yet, just use canonical address
+                signature_parts.append((scanner_addr, None, None, ()))
+                continue
+            signature_parts.append(
+                (
+                    scanner_addr,
+                    getattr(scanner_device, "address_ble_mac", None),
+                    getattr(scanner_device, "address_wifi_mac", None),
+                    tuple(getattr(scanner_device, "metadevice_sources", None) or ()),
+                )
+            )
+        signature = tuple(signature_parts)
+        if signature == self._mac_map_signature:
+            return False
+
+        mac_to_scanner: dict[str, str] = {}
+        for scanner_addr, ble_mac, wifi_mac, metadevice_sources in signature:
+            # The canonical address
+            mac_to_scanner[scanner_addr] = scanner_addr
+            # BLE MAC (may differ from canonical address for ESPHome/Shelly)
+            if ble_mac:
+                mac_to_scanner[ble_mac] = scanner_addr
+            # WiFi MAC
+            if wifi_mac:
+                mac_to_scanner[wifi_mac] = scanner_addr
+            # Scanner's own metadevice_sources (potential BLE MACs it broadcasts from)
+            for source_mac in metadevice_sources:
+                mac_to_scanner[source_mac] = scanner_addr
+
+        self.mac_to_scanner = mac_to_scanner
+        self._mac_map_signature = signature
+        # Drop index entries for scanners that are gone
+        for key in [k for k in self._visibility_stamps if k[0] not in scanner_list or k[1] not in scanner_list]:
+            del self._visibility_stamps[key]
+            self.pending_visibility.pop(key, None)
+        _LOGGER.debug(
+            "Auto-cal: Rebuilt scanner MAC lookup: %d MACs for %d scanners",
+            len(mac_to_scanner),
+            len(scanner_list),
+        )
+        return True
+
+    def record_scanner_advert(
+        self,
+        sender_mac: str,
+        receiver_addr: str,
+        rssi_raw: float | None,
+        stamp: float | None,
+    ) -> bool:
+        """
+        Index an advert if it is one scanner hearing another.
+
+        Called at advert ingest for every processed advertisement, so the
+        common case (sender is not a scanner) is a single dict lookup.
+        Adverts are stored on the SENDING device, so sender_mac is the device
+        address and receiver_addr is the scanner that heard it.
+
+        Args:
+        ----
+            sender_mac: Address the advert was sent from.
+            receiver_addr: Canonical address of the receiving scanner.
+            rssi_raw: RAW RSSI of the advert (NOT adjusted by rssi_offset).
+            stamp: Monotonic stamp of the advert, used to skip re-deliveries.
+
+        Returns:
+        -------
+            True if the advert was new cross-visibility data.
+
+        """
+        sender_addr = self.mac_to_scanner.get(sender_mac)
+        if sender_addr is None or sender_addr == receiver_addr or rssi_raw is None:
+            return False
+        if self.mac_to_scanner.get(receiver_addr) != receiver_addr:
+            # Receiver is not a known (canonical) scanner
+            return False
+        if stamp is None:
+            stamp = monotonic_time_coarse()
+        key = (receiver_addr, sender_addr)
+        if stamp <= self._visibility_stamps.get(key, float("-inf")):
+            return False
+        self._visibility_stamps[key] = stamp
+        self.pending_visibility[key] = (rssi_raw, stamp)
+        return True
+
+    def apply_pending_visibility(self) -> int:
+        """
+        Fold indexed sightings into the scanner pairs.
+
+        Only pairs that received new data since the last call are touched.
+
+        Returns
+        -------
+            Number of directed scanner pairs updated.
+
+        """
+        pending = self.pending_visibility
+        if not pending:
+            return 0
+        self.pending_visibility = {}
+        for (receiver_addr, sender_addr), (rssi_raw, stamp) in pending.items():
+            self.update_cross_visibility(
+                receiver_addr=receiver_addr,
+                sender_addr=sender_addr,
+                rssi_raw=rssi_raw,
+                timestamp=stamp,
+            )
+        return len(pending)
+
     def update_cross_visibility(
         self,
         receiver_addr: str,
@@ -380,18 +563,24 @@ class ScannerCalibrationManager:
         self.scanner_last_seen[sender_addr] = ts
         self.active_scanners.add(receiver_addr)
         self.active_scanners.add(sender_addr)
+        self._dirty_scanners.add(receiver_addr)
+        self._dirty_scanners.add(sender_addr)
 
     def calculate_suggested_offsets(self, nowstamp: float | None = None) -> dict[str, float]:
         """
         Calculate suggested RSSI offsets from scanner cross-visibility.
 
-        Algorithm:
-        1. For each scanner pair with bidirectional data, calculate the RSSI difference
+        Algorithm (per scanner):
+        1. For each of its pairs with bidirectional data, take the RSSI difference
         2. Skip pairs where either scanner is offline (no data for > 5 minutes)
         3. The difference / 2 gives the relative offset for each scanner
-        4. Average all pair-based offsets for each scanner
+        4. Take the median of all pair-based offsets for the scanner
         5. Round to integer dB values
 
+        A scanner's offset only depends on its own pairs, so only scanners
+        whose pairs got new samples, TX power changes or whose partners went
+        online/offline since the last call are recomputed.
+
         Args:
         ----
             nowstamp: Current timestamp for online checking. If None, uses
@@ -405,168 +594,119 @@ class ScannerCalibrationManager:
         if nowstamp is None:
             nowstamp = monotonic_time_coarse()
 
-        # Collect offset contributions for each scanner
-        offset_contributions: dict[str, list[float]] = {addr: [] for addr in self.active_scanners}
-        # Track sample counts per scanner for confidence calculation
-        sample_counts: dict[str, list[int]] = {addr: [] for addr in self.active_scanners}
+        self._sync_pair_index()
+
+        # Online/offline transitions change which pairs count, for the scanner
+        # itself and for everything paired with it.
+        online = {addr for addr in self.active_scanners if self._is_scanner_online(addr, nowstamp)}
+        for addr in online ^ self._online_scanners:
+            self._mark_dirty(addr)
+        self._online_scanners = online
+
+        dirty = self._dirty_scanners & self.active_scanners
+        self._dirty_scanners = set()
+        if not dirty:
+            return self.suggested_offsets
+
+        for addr in dirty:
+            contributions: list[float] = []
+            sample_counts: list[int] = []
+            for key in self._pairs_by_scanner.get(addr, ()):
+                pair = self.scanner_pairs[key]
+                # Skip pairs where either scanner is offline
+                if pair.scanner_a not in online or pair.scanner_b not in online:
+                    continue
+                # Get TX-power-corrected difference
+                diff = pair.rssi_difference
+                if diff is None or pair.rssi_difference_raw is None:
+                    continue
+                # Positive diff means A receives stronger → A needs negative offset
+                # to bring its readings down to match B's perspective
+                contributions.append(-diff / 2 if addr == pair.scanner_a else diff / 2)
+                # Track minimum sample count from this pair
+                sample_counts.append(min(pair.sample_count_ab, pair.sample_count_ba))
 
-        bidirectional_pairs = 0
-        offline_pairs_skipped = 0
+            _LOGGER.debug(
+                "Auto-cal: Recomputing %s from %d usable pairs (%s)",
+                addr,
+                len(contributions),
+                "online" if addr in online else "offline",
+            )
+            if len(contributions) >= CALIBRATION_MIN_PAIRS:
+                self._update_offset(addr, contributions, sample_counts)
 
-        for pair in self.scanner_pairs.values():
-            # Skip pairs where either scanner is offline
-            if not self._is_scanner_online(pair.scanner_a, nowstamp):
-                _LOGGER.debug(
-                    "Auto-cal pair %s <-> %s: skipped - scanner %s offline",
-                    pair.scanner_a,
-                    pair.scanner_b,
-                    pair.scanner_a,
-                )
-                offline_pairs_skipped += 1
-                continue
-            if not self._is_scanner_online(pair.scanner_b, nowstamp):
-                _LOGGER.debug(
-                    "Auto-cal pair %s <-> %s: skipped - scanner %s offline",
-                    pair.scanner_a,
-                    pair.scanner_b,
-                    pair.scanner_b,
-                )
-                offline_pairs_skipped += 1
-                continue
+        # Log which scanners got offsets and which didn't
+        scanners_without_offsets = self.active_scanners - set(self.suggested_offsets)
+        if scanners_without_offsets:
+            _LOGGER.debug(
+                "Auto-cal: %d scanners without suggested offsets: %s",
+                len(scanners_without_offsets),
+                list(scanners_without_offsets),
+            )
 
-            # Get TX-power-corrected difference
-            diff = pair.rssi_difference  # This is now TX-corrected
-            raw_diff = pair.rssi_difference_raw
-            if diff is None or raw_diff is None:
-                _LOGGER.debug(
-                    "Auto-cal pair %s <-> %s: not bidirectional yet (A sees B: %s/%d, B sees A: %s/%d)",
-                    pair.scanner_a,
-                    pair.scanner_b,
-                    pair.rssi_a_sees_b,
-                    pair.sample_count_ab,
-                    pair.rssi_b_sees_a,
-                    pair.sample_count_ba,
-                )
-                continue
+        return self.suggested_offsets
+
+    def _update_offset(self, addr: str, contributions: list[float], sample_counts: list[int]) -> None:
+        """Apply confidence filtering, median and hysteresis to a scanner's pair contributions."""
+        # Calculate average sample count for confidence
+        avg_samples = statistics.mean(sample_counts) if sample_counts else 0.0
 
-            bidirectional_pairs += 1
-            tx_diff = pair.tx_power_difference
+        # Calculate confidence score
+        confidence, factors = self._calculate_confidence(addr, contributions, len(contributions), avg_samples)
+        self.offset_confidence[addr] = confidence
+        self.confidence_factors[addr] = factors
+
+        # Only suggest offset if confidence meets threshold
+        if confidence < CALIBRATION_MIN_CONFIDENCE:
             _LOGGER.debug(
-                "Auto-cal pair %s <-> %s: bidirectional! raw_diff=%.1f dB, tx_diff=%.1f dB, corrected_diff=%.1f dB",
-                pair.scanner_a,
-                pair.scanner_b,
-                raw_diff,
-                tx_diff,
-                diff,
+                "Auto-cal: Offset for %s skipped - confidence %.1f%% < %.1f%% threshold",
+                addr,
+                confidence * 100,
+                CALIBRATION_MIN_CONFIDENCE * 100,
             )
-            # Positive diff means A receives stronger → A needs negative offset
-            # to bring its readings down to match B's perspective
-            offset_contributions[pair.scanner_a].append(-diff / 2)
-            offset_contributions[pair.scanner_b].append(diff / 2)
-            # Track minimum sample count from this pair for each scanner
-            min_samples = min(pair.sample_count_ab, pair.sample_count_ba)
-            sample_counts[pair.scanner_a].append(min_samples)
-            sample_counts[pair.scanner_b].append(min_samples)
-
-        if offline_pairs_skipped > 0:
+            # Remove any previous suggestion that no longer meets confidence
+            self.suggested_offsets.pop(addr, None)
+            return
+
+        # Use median for robustness against outliers
+        median_offset = statistics.median(contributions)
+        # Round to nearest integer dB
+        new_offset = round(median_offset)
+
+        # Apply hysteresis: only update if change exceeds threshold
+        current_offset = self.suggested_offsets.get(addr)
+        if current_offset is None:
+            # First time seeing this scanner - accept initial value
+            self.suggested_offsets[addr] = new_offset
             _LOGGER.debug(
-                "Auto-cal: Skipped %d pairs due to offline scanners",
-                offline_pairs_skipped,
+                "Auto-cal: Initial offset for %s: %d dB (confidence: %.1f%%, from %d pairs)",
+                addr,
+                new_offset,
+                confidence * 100,
+                len(contributions),
             )
-        if bidirectional_pairs > 0:
-            _LOGGER.debug("Auto-cal: Found %d bidirectional pairs", bidirectional_pairs)
-
-        # Calculate median offset for each scanner with confidence filtering
-        for addr, contributions in offset_contributions.items():
-            if len(contributions) >= CALIBRATION_MIN_PAIRS:
-                # Calculate average sample count for confidence
-                avg_samples = statistics.mean(sample_counts[addr]) if sample_counts[addr] else 0.0
-
-                # Calculate confidence score
-                confidence, factors = self._calculate_confidence(addr, contributions, len(contributions), avg_samples)
-                self.offset_confidence[addr] = confidence
-                self.confidence_factors[addr] = factors
-
-                # Only suggest offset if confidence meets threshold
-                if confidence < CALIBRATION_MIN_CONFIDENCE:
-                    _LOGGER.debug(
-                        "Auto-cal: Offset for %s skipped - confidence %.1f%% < %.1f%% threshold",
-                        addr,
-                        confidence * 100,
-                        CALIBRATION_MIN_CONFIDENCE * 100,
-                    )
-                    # Remove any previous suggestion that no longer meets confidence
-                    self.suggested_offsets.pop(addr, None)
-                    continue
-
-                # Use median for robustness against outliers
-                median_offset = statistics.median(contributions)
-                # Round to nearest integer dB
-                new_offset = round(median_offset)
-
-                # Apply hysteresis: only update if change exceeds threshold
-                current_offset = self.suggested_offsets.get(addr)
-                if current_offset is None:
-                    # First time seeing this scanner - accept initial value
-                    self.suggested_offsets[addr] = new_offset
-                    _LOGGER.debug(
-                        "Auto-cal: Initial offset for %s: %d dB (confidence: %.1f%%, from %d pairs)",
-                        addr,
-                        new_offset,
-                        confidence * 100,
-                        len(contributions),
-                    )
-                elif abs(new_offset - current_offset) >= CALIBRATION_HYSTERESIS_DB:
-                    # Significant change - update offset
-                    _LOGGER.info(
-                        "Auto-cal: Offset for %s changed: %d → %d dB (confidence: %.1f%%, from %d pairs)",
-                        addr,
-                        current_offset,
-                        new_offset,
-                        confidence * 100,
-                        len(contributions),
-                    )
-                    self.suggested_offsets[addr] = new_offset
-                else:
-                    # Change within hysteresis band - keep current value
-                    _LOGGER.debug(
-                        "Auto-cal: Offset for %s stable at %d dB "
-                        "(candidate: %d, hysteresis: %d dB, confidence: %.1f%%)",
-                        addr,
-                        current_offset,
-                        new_offset,
-                        CALIBRATION_HYSTERESIS_DB,
-                        confidence * 100,
-                    )
-
-        # Log summary of scanner pair status for diagnostics
-        if self.scanner_pairs:
-            pairs_summary = []
-            for pair in self.scanner_pairs.values():
-                status = "✓" if pair.has_bidirectional_data else "✗"
-                pairs_summary.append(
-                    f"{pair.scanner_a[:8]}↔{pair.scanner_b[:8]}: "
-                    f"AB={pair.sample_count_ab} BA={pair.sample_count_ba} [{status}]"
-                )
+        elif abs(new_offset - current_offset) >= CALIBRATION_HYSTERESIS_DB:
+            # Significant change - update offset
+            _LOGGER.info(
+                "Auto-cal: Offset for %s changed: %d → %d dB (confidence: %.1f%%, from %d pairs)",
+                addr,
+                current_offset,
+                new_offset,
+                confidence * 100,
+                len(contributions),
+            )
+            self.suggested_offsets[addr] = new_offset
+        else:
+            # Change within hysteresis band - keep current value
             _LOGGER.debug(
-                "Auto-cal: Scanner pair summary (%d pairs): %s",
-                len(self.scanner_pairs),
-                "; ".join(pairs_summary[:10]),  # Show first 10
+                "Auto-cal: Offset for %s stable at %d dB (candidate: %d, hysteresis: %d dB, confidence: %.1f%%)",
+                addr,
+                current_offset,
+                new_offset,
+                CALIBRATION_HYSTERESIS_DB,
+                confidence * 100,
             )
 
-        # Log which scanners got offsets and which didn't
-        if self.active_scanners:
-            scanners_with_offsets = set(self.suggested_offsets.keys())
-            scanners_without_offsets = self.active_scanners - scanners_with_offsets
-            if scanners_without_offsets:
-                _LOGGER.debug(
-                    "Auto-cal: %d scanners without suggested offsets: %s",
-                    len(scanners_without_offsets),
-                    list(scanners_without_offsets),
-                )
-
-        return self.suggested_offsets
-
     def get_scanner_pair_info(self, nowstamp: float | None = None) -> list[dict[str, Any]]:
         """
         Get human-readable info about scanner pairs for diagnostics.
@@ -650,61 +790,51 @@ class ScannerCalibrationManager:
         self.active_scanners.clear()
         self.scanner_last_seen.clear()
         self.scanner_tx_powers.clear()
-
-
-def update_scanner_calibration(  # noqa: C901
+        self.mac_to_scanner.clear()
+        self._mac_map_signature = ()
+        self.pending_visibility.clear()
+        self._visibility_stamps.clear()
+        self._dirty_scanners.clear()
+        self._pairs_by_scanner.clear()
+        self._indexed_pair_count = 0
+        self._online_scanners.clear()
+        self.last_offsets_stamp = None
+
+
+def update_scanner_calibration(
     calibration_manager: ScannerCalibrationManager,
     scanner_list: set[str],
     devices: dict[str, BermudaDevice],
+    offset_interval: float = 0.0,
 ) -> dict[str, float]:
     """
-    Update scanner calibration based on current device data.
+    Update scanner calibration from the cross-visibility index.
+
+    This function should be called periodically (e.g., each update cycle).
+    Scanner-to-scanner sightings are indexed at advert ingest via
+    ScannerCalibrationManager.record_scanner_advert(), so this only folds in
+    pairs with new data instead of searching every device's adverts for
+    every ordered scanner pair.
 
-    This function should be called periodically (e.g., each update cycle)
-    to refresh cross-visibility data and recalculate suggested offsets.
+    Folding in samples is cheap and happens on every call so no sightings
+    are lost. Offsets change far more slowly, so they are only recomputed
+    once offset_interval seconds have passed since the last recomputation.
 
     Args:
     ----
         calibration_manager: The calibration manager instance
         scanner_list: Set of scanner addresses
         devices: Dictionary of all BermudaDevice instances
+        offset_interval: Minimum seconds between offset recomputations.
+                         0 recomputes on every call.
 
     Returns:
     -------
         Dictionary of suggested RSSI offsets per scanner
 
     """
-    # Get timestamp once for consistent staleness tracking
-    nowstamp = monotonic_time_coarse()
-
-    # Build a reverse lookup: any_scanner_mac -> canonical_scanner_address
-    # Scanners may have multiple MAC addresses (WiFi, BLE, Ethernet) and the
-    # iBeacon broadcasts come from the BLE MAC, which may differ from the
-    # canonical scanner address in scanner_list.
-    mac_to_scanner: dict[str, str] = {}
-    for scanner_addr in scanner_list:
-        scanner_device = devices.get(scanner_addr)
-        if scanner_device is None:
-            # Scanner not in devices dict yet, just use canonical address
-            mac_to_scanner[scanner_addr] = scanner_addr
-            continue
-
-        # Add all possible MAC addresses that could identify this scanner
-        # The canonical address
-        mac_to_scanner[scanner_addr] = scanner_addr
-
-        # BLE MAC (may differ from canonical address for ESPHome/Shelly)
-        if hasattr(scanner_device, "address_ble_mac") and scanner_device.address_ble_mac:
-            mac_to_scanner[scanner_device.address_ble_mac] = scanner_addr
-
-        # WiFi MAC
-        if hasattr(scanner_device, "address_wifi_mac") and scanner_device.address_wifi_mac:
-            mac_to_scanner[scanner_device.address_wifi_mac] = scanner_addr
-
-        # Scanner's own metadevice_sources (potential BLE MACs it broadcasts from)
-        if hasattr(scanner_device, "metadevice_sources") and scanner_device.metadevice_sources:
-            for source_mac in scanner_device.metadevice_sources:
-                mac_to_scanner[source_mac] = scanner_addr
+    # Keep the ingest-side MAC lookup in sync with the scanner topology
+    calibration_manager.refresh_scanner_macs(scanner_list, devices)
 
     # Extract TX power (ref_power) from scanner devices for hardware normalization
     for scanner_addr in scanner_list:
@@ -714,136 +844,16 @@ def update_scanner_calibration(  # noqa: C901
             tx_power = getattr(scanner_device, "ref_power", None)
             if tx_power is not None:
                 calibration_manager.set_scanner_tx_power(scanner_addr, tx_power)
-                _LOGGER.debug(
-                    "Auto-cal: Set TX power for %s: %.1f dBm",
-                    scanner_addr,
-                    tx_power,
-                )
 
-    # Build lookup: canonical_scanner_address -> list of iBeacon addresses
-    scanner_to_ibeacon: dict[str, list[str]] = {addr: [] for addr in scanner_list}
-    for device_addr, device in devices.items():
-        if hasattr(device, "metadevice_sources") and device.metadevice_sources:
-            for source_mac in device.metadevice_sources:
-                # Look up which scanner this MAC belongs to
-                canonical_scanner = mac_to_scanner.get(source_mac)
-                if canonical_scanner is not None:
-                    scanner_to_ibeacon[canonical_scanner].append(device_addr)
-
-    # Log which scanners have iBeacon broadcasts
-    scanners_with_ibeacons = {k: v for k, v in scanner_to_ibeacon.items() if v}
-    scanners_without_ibeacons = [k for k in scanner_list if k not in scanners_with_ibeacons]
-
-    if scanners_with_ibeacons:
-        _LOGGER.debug(
-            "Auto-cal: Found %d scanners with iBeacon broadcasts: %s",
-            len(scanners_with_ibeacons),
-            scanners_with_ibeacons,
-        )
-    if scanners_without_ibeacons:
-        _LOGGER.debug(
-            "Auto-cal: %d scanners WITHOUT iBeacon broadcasts: %s",
-            len(scanners_without_ibeacons),
-            scanners_without_ibeacons,
-        )
-
-    visibility_found = 0
-    visibility_not_found = 0
+    updated = calibration_manager.apply_pending_visibility()
+    if updated:
+        _LOGGER.debug("Auto-cal: Updated %d directed scanner pairs with new data", updated)
 
-    for scanner_addr in scanner_list:
-        # Check if this scanner sees any other scanners
-        for other_addr in scanner_list:
-            if other_addr == scanner_addr:
-                continue
-
-            # Check if scanner_addr has received an advert from other_addr
-            # IMPORTANT: adverts are stored on the SENDING device, not the receiver!
-            # The key is (source_mac, receiver_scanner_addr)
-            advert = None
-
-            # Method 1: Direct MAC match - check if other_addr device was seen by scanner_addr
-            other_device = devices.get(other_addr)
-            if other_device is not None:
-                # Look for advert where other_device was seen by scanner_addr
-                for advert_key, adv in other_device.adverts.items():
-                    if advert_key[1] == scanner_addr:
-                        advert = adv
-                        _LOGGER.debug(
-                            "Auto-cal: Scanner %s sees scanner %s directly (key: %s)",
-                            scanner_addr,
-                            other_addr,
-                            advert_key,
-                        )
-                        break
-
-            # Method 2: Check if any iBeacon/metadevice sourced from other_addr
-            # was seen by scanner_addr (ESPHome iBeacons use UUID as address)
-            if advert is None:
-                ibeacon_addrs = scanner_to_ibeacon.get(other_addr, [])
-                if not ibeacon_addrs:
-                    _LOGGER.debug(
-                        "Auto-cal: Scanner %s has no iBeacon devices mapped",
-                        other_addr,
-                    )
-                for ibeacon_addr in ibeacon_addrs:
-                    ibeacon_device = devices.get(ibeacon_addr)
-                    if ibeacon_device is None:
-                        _LOGGER.debug(
-                            "Auto-cal: iBeacon device %s not found in devices dict",
-                            ibeacon_addr,
-                        )
-                        continue
-                    # Look for advert where iBeacon was seen by scanner_addr
-                    advert_keys = list(ibeacon_device.adverts.keys())
-                    matching_keys = [k for k in advert_keys if k[1] == scanner_addr]
-                    if not matching_keys and advert_keys:
-                        _LOGGER.debug(
-                            "Auto-cal: iBeacon %s has %d adverts, none from scanner %s. Advert scanner addresses: %s",
-                            ibeacon_addr,
-                            len(advert_keys),
-                            scanner_addr,
-                            [k[1] for k in advert_keys[:5]],  # Show first 5
-                        )
-                    for advert_key, adv in ibeacon_device.adverts.items():
-                        if advert_key[1] == scanner_addr:
-                            advert = adv
-                            _LOGGER.debug(
-                                "Auto-cal: Scanner %s sees scanner %s via iBeacon %s",
-                                scanner_addr,
-                                other_addr,
-                                ibeacon_addr,
-                            )
-                            break
-                    if advert is not None:
-                        break
-
-            if advert is None:
-                visibility_not_found += 1
-                continue
-
-            visibility_found += 1
-
-            # IMPORTANT: Use RAW RSSI for calibration, NOT rssi_filtered!
-            # rssi_filtered includes conf_rssi_offset which would create a
-            # circular dependency (calibration based on already-calibrated values).
-            rssi_raw = advert.rssi
-
-            if rssi_raw is None:
-                continue
-
-            calibration_manager.update_cross_visibility(
-                receiver_addr=scanner_addr,
-                sender_addr=other_addr,
-                rssi_raw=rssi_raw,
-                timestamp=nowstamp,
-            )
-
-    if visibility_found > 0 or visibility_not_found > 0:
-        _LOGGER.debug(
-            "Auto-cal: Visibility check complete - found: %d, not found: %d",
-            visibility_found,
-            visibility_not_found,
-        )
+    nowstamp = monotonic_time_coarse()
+    last_stamp = calibration_manager.last_offsets_stamp
+    if last_stamp is not None and nowstamp - last_stamp < offset_interval:
+        return calibration_manager.suggested_offsets
+    calibration_manager.last_offsets_stamp = nowstamp
 
-    # Recalculate suggested offsets
-    return calibration_manager.calculate_suggested_offsets()
+    # Recalculate suggested offsets (only scanners with changed pairs)
+    return calibration_manager.calculate_suggested_offsets(nowstamp)
@@ -0,0 +1,155 @@
+"""
+Precomputed scanner/area/floor lookups for area selection.
+
+Area selection asks the same questions many times per cycle - for every
+advert and every UKF candidate: "does this area have a scanner?", "which
+floor is this area on?", "what is this area called?". Answering them by
+walking the scanner set or querying the area registry each time adds up
+with many devices.
+
+ScannerTopology answers them from dicts that are rebuilt only when the
+topology actually changes:
+
+- area/floor registry update events
+- device registry updates (scanner area assignments)
+- changes to the scanner list (_rebuild_scanner_list, scanner add/remove)
+
+As a safety net the index also rebuilds itself when the number of scanners
+differs from the last build, so a scanner added without an explicit
+invalidation is never missed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.helpers.area_registry import AreaRegistry
+
+    from .bermuda_device import BermudaDevice
+
+
+class ScannerTopology:
+    """
+    Index of area -> scanners, area -> floor and area names.
+
+    Attributes
+    ----------
+        area_scanners: Scanner devices per area_id (only areas with scanners).
+        area_floor: floor_id per area_id, from the area registry.
+        area_names: Area name per area_id, from the area registry.
+                    Areas missing from the registry are cached as None.
+        scannerless_areas: Registry areas without any scanner.
+        rebuilds: Number of rebuilds so far (diagnostics).
+
+    """
+
+    __slots__ = (
+        "_dirty",
+        "_scanner_count",
+        "area_floor",
+        "area_names",
+        "area_scanners",
+        "rebuilds",
+        "scannerless_areas",
+    )
+
+    def __init__(self) -> None:
+        """Initialise an empty index; the first query triggers a build."""
+        self.area_scanners: dict[str, tuple[BermudaDevice, ...]] = {}
+        self.area_floor: dict[str, str | None] = {}
+        self.area_names: dict[str, str | None] = {}
+        self.scannerless_areas: frozenset[str] = frozenset()
+        self.rebuilds: int = 0
+        self._scanner_count: int = -1
+        self._dirty: bool = True
+
+    def invalidate(self) -> None:
+        """Mark the index stale; it is rebuilt on the next ensure()."""
+        self._dirty = True
+
+    def ensure(self, scanners: set[BermudaDevice], area_registry: AreaRegistry | None) -> ScannerTopology:
+        """Rebuild if invalidated or the scanner set changed size, then return self."""
+        if self._dirty or len(scanners) != self._scanner_count:
+            self.rebuild(scanners, area_registry)
+        return self
+
+    def rebuild(self, scanners: Iterable[BermudaDevice], area_registry: AreaRegistry | None) -> None:
+        """
+        Rebuild all lookups from the current scanners and area registry.
+
+        Args:
+        ----
+            scanners: Current scanner devices.
+            area_registry: Home Assistant area registry (None in some tests).
+
+        """
+        area_scanners: dict[str, list[BermudaDevice]] = {}
+        scanner_count = 0
+        for scanner in scanners:
+            scanner_count += 1
+            area_id = getattr(scanner, "area_id", None)
+            if area_id is not None:
+                area_scanners.setdefault(area_id, []).append(scanner)
+
+        area_floor: dict[str, str | None] = {}
+        area_names: dict[str, str | None] = {}
+        if area_registry is not None and (list_areas := getattr(area_registry, "async_list_areas", None)):
+            for area in list_areas():
+                area_floor[area.id] = getattr(area, "floor_id", None)
+                area_names[area.id] = area.name
+
+        self.area_scanners = {area_id: tuple(members) for area_id, members in area_scanners.items()}
+        self.area_floor = area_floor
+        self.area_names = area_names
+        self.scannerless_areas = frozenset(area_floor.keys() - area_scanners.keys())
+        self._scanner_count = scanner_count
+        self._dirty = False
+        self.rebuilds += 1
+
+    def area_has_scanner(self, area_id: str) -> bool:
+        """Return True if at least one scanner is assigned to the area."""
+        return area_id in self.area_scanners
+
+    def scanners_in_area(self, area_id: str) -> tuple[BermudaDevice, ...]:
+        """Return the scanners assigned to the area."""
+        return self.area_scanners.get(area_id, ())
+
+    def floor_id_for_area(self, area_id: str, area_registry: AreaRegistry | None) -> str | None:
+        """Return the floor_id of an area, looking it up once if not indexed yet."""
+        if area_id in self.area_floor:
+            return self.area_floor[area_id]
+        if area_registry is None:
+            return None
+        self._cache_area(area_id, area_registry)
+        return self.area_floor[area_id]
+
+    def area_name(self, area_id: str, area_registry: AreaRegistry | None) -> str | None:
+        """Return the name of an area, looking it up once if not indexed yet."""
+        if area_id in self.area_names:
+            return self.area_names[area_id]
+        if area_registry is None:
+            return None
+        self._cache_area(area_id, area_registry)
+        return self.area_names[area_id]
+
+    def _cache_area(self, area_id: str, area_registry: AreaRegistry) -> None:
+        """Cache registry data for an area created since the last rebuild (or unknown)."""
+        area = area_registry.async_get_area(area_id)
+        if area is None:
+            self.area_floor[area_id] = None
+            self.area_names[area_id] = None
+            return
+        self.area_floor[area_id] = getattr(area, "floor_id", None)
+        self.area_names[area_id] = getattr(area, "name", None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the index for diagnostics."""
+        return {
+            "rebuilds": self.rebuilds,
+            "areas_with_scanners": len(self.area_scanners),
+            "scannerless_areas": sorted(self.scannerless_areas),
+            "known_areas": len(self.area_names),
+        }
@@ -19,12 +19,15 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from .const import (
     _LOGGER,
     ADDR_TYPE_FMDN_DEVICE,
+    CONF_CONSOLIDATED_SCANNER_DISTANCES,
     CONF_RECORDER_FRIENDLY,
+    DEFAULT_CONSOLIDATED_SCANNER_DISTANCES,
     DEFAULT_RECORDER_FRIENDLY,
     SIGNAL_DEVICE_NEW,
     SIGNAL_SCANNERS_CHANGED,
 )
 from .entity import BermudaEntity, BermudaGlobalEntity
+from .publish_policy import POLICY_DISTANCE, POLICY_INTERVAL, POLICY_RSSI, POLICY_SCANNER_DISTANCE
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -46,6 +49,7 @@ async def async_setup_entry(
 
     created_devices: list[str] = []  # list of already-created devices
     created_scanners: dict[str, list[str]] = {}  # list of scanner:address for created entities
+    created_distance_maps: set[str] = set()  # devices with a consolidated scanner distances sensor
 
     @callback
     def device_new(address: str) -> None:
@@ -114,6 +118,10 @@ async def async_setup_entry(
         # go over time. So we need to maintain our matrix of which ones we have already
         # spun-up so we don't duplicate any.
 
+        if entry.options.get(CONF_CONSOLIDATED_SCANNER_DISTANCES, DEFAULT_CONSOLIDATED_SCANNER_DISTANCES):
+            create_distance_map_entities()
+            return
+
         for scanner in coordinator.get_scanners:
             if (
                 scanner.is_remote_scanner is None  # usb/HCI scanner's are fine.
@@ -141,6 +149,20 @@ async def async_setup_entry(
         # call(back(ed)) from the update, so causing it to call another would be... bad.
         async_add_entities(entities, False)
 
+    def create_distance_map_entities() -> None:
+        # One sensor per device instead of two per device/scanner pair. Created
+        # once there are scanners to report on, the scanner roster itself only
+        # changes the sensor's attributes.
+        if not coordinator.scanner_list:
+            return
+        entities = []
+        for address in created_devices:
+            if address not in created_distance_maps:
+                entities.append(BermudaSensorScannerDistances(coordinator, entry, address))
+                created_distance_maps.add(address)
+        if entities:
+            async_add_entities(entities, False)
+
     @callback
     def scanners_changed() -> None:
         """Callback for event from coordinator advising that the roster of scanners has changed."""
@@ -167,6 +189,8 @@ class BermudaSensor(BermudaEntity, SensorEntity):
 
     _attr_has_entity_name = True
     _attr_translation_key = "area"
+    # Woken by the per-device update signal, not every coordinator refresh
+    _device_update_signal = True
 
     # Exclude volatile metadata from HA recorder database.
     # These attributes change frequently (every coordinator cycle or on
@@ -309,6 +333,7 @@ class BermudaSensorRssi(BermudaSensor):
     """Sensor for RSSI of closest scanner."""
 
     _attr_translation_key = "nearest_rssi"
+    _publish_policy = POLICY_RSSI
 
     @property
     def unique_id(self) -> str:
@@ -341,6 +366,7 @@ class BermudaSensorRange(BermudaSensor):
     """Extra sensor for range-to-closest-area."""
 
     _attr_translation_key = "distance"
+    _publish_policy: str | None = POLICY_DISTANCE
 
     @property
     def unique_id(self) -> str:
@@ -381,6 +407,7 @@ class BermudaSensorScannerRange(BermudaSensorRange):
     """Create sensors for range to each scanner. Extends closest-range class."""
 
     _attr_translation_key = "scanner_distance"
+    _publish_policy: str | None = POLICY_SCANNER_DISTANCE
 
     def __init__(
         self,
@@ -466,6 +493,8 @@ class BermudaSensorScannerRangeRaw(BermudaSensorScannerRange):
     """Provides un-filtered latest distances per-scanner."""
 
     _attr_translation_key = "scanner_distance_raw"
+    # Unfiltered values: only the plain time-based cache (recorder-friendly mode)
+    _publish_policy: str | None = None
 
     @property
     def unique_id(self) -> str:
@@ -492,6 +521,62 @@ class BermudaSensorScannerRangeRaw(BermudaSensorScannerRange):
         return None
 
 
+class BermudaSensorScannerDistances(BermudaSensor):
+    """
+    Distances to all scanners in a single diagnostic sensor.
+
+    Used instead of BermudaSensorScannerRange/Raw when consolidated scanner
+    distances are enabled. The state is the number of scanners currently
+    reporting a distance, the per-scanner values are in the "scanners"
+    attribute, keyed by scanner address.
+    """
+
+    _attr_translation_key = "scanner_distances"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    # The distance map changes every cycle and is only useful live (dashboards,
+    # debugging), so keep all of it out of the recorder. Unlike the per-scanner
+    # sensors this doesn't depend on recorder-friendly mode, so nothing needs
+    # re-syncing on update.
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    @property
+    def unique_id(self) -> str:
+        return f"{self._device.unique_id}_scanner_distances"
+
+    @property
+    def entity_registry_enabled_default(self) -> bool:
+        """Enabled, since the user opted in to this sensor."""
+        return True
+
+    def _scanner_distances(self) -> dict[str, dict[str, Any]]:
+        """Return distance info for every scanner that currently has a distance to the device."""
+        distances: dict[str, dict[str, Any]] = {}
+        for scanner_address in self.coordinator.scanner_list:
+            advert = self._device.get_scanner(scanner_address)
+            if advert is None or advert.rssi_distance is None:
+                continue
+            distance_raw = advert.rssi_distance_raw
+            distances[scanner_address] = {
+                "name": advert.name,
+                "area_id": advert.area_id,
+                "area_name": advert.area_name,
+                "distance": round(advert.rssi_distance, 3),
+                "distance_raw": round(distance_raw, 3) if distance_raw is not None else None,
+            }
+        return distances
+
+    @property
+    def native_value(self) -> int:
+        """Number of scanners with a current distance to the device."""
+        return len(self._scanner_distances())
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Per-scanner distances, keyed by scanner address."""
+        return {"scanners": self._scanner_distances()}
+
+
 class BermudaSensorAreaSwitchReason(BermudaSensor):
     """Sensor for area switch reason."""
 
@@ -510,6 +595,16 @@ class BermudaSensorAreaSwitchReason(BermudaSensor):
     def unique_id(self) -> str:
         return f"{self._device.unique_id}_area_switch_reason"
 
+    async def async_added_to_hass(self) -> None:
+        """Ask area selection to capture full diagnostics for this device."""
+        await super().async_added_to_hass()
+        self.coordinator.area_selection.enable_diagnostics(self._device.address)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop capturing full diagnostics once nobody displays them."""
+        self.coordinator.area_selection.disable_diagnostics(self._device.address)
+        await super().async_will_remove_from_hass()
+
     @property
     def native_value(self) -> str | None:
         if self._device.diag_area_switch is not None:
@@ -540,6 +635,7 @@ class BermudaSensorEstimatedBroadcastInterval(BermudaSensor):
     _attr_entity_registry_enabled_default = False
     _attr_native_unit_of_measurement = UnitOfTime.SECONDS
     _attr_suggested_display_precision = 1
+    _publish_policy = POLICY_INTERVAL
 
     @property
     def unique_id(self) -> str:
@@ -553,7 +649,8 @@ class BermudaSensorEstimatedBroadcastInterval(BermudaSensor):
 
         Calculates the median interval from Bermuda's observed advertisement
         intervals across all scanners. Uses median to be robust against
-        occasional missed packets or outliers.
+        occasional missed packets or outliers. Rate-limited by the interval
+        publishing policy, since the median shifts a little with every advert.
         """
         # Collect all valid intervals from all adverts (scanner observations)
         all_intervals: list[float] = []
@@ -572,8 +669,10 @@ class BermudaSensorEstimatedBroadcastInterval(BermudaSensor):
         all_intervals.sort()
         mid = len(all_intervals) // 2
         if len(all_intervals) % 2 == 0:
-            return (all_intervals[mid - 1] + all_intervals[mid]) / 2
-        return all_intervals[mid]
+            median = (all_intervals[mid - 1] + all_intervals[mid]) / 2
+        else:
+            median = all_intervals[mid]
+        return self._cached_ratelimit(median, fast_falling=False)  # type: ignore[no-any-return]
 
 
 class BermudaSensorAreaLastSeen(BermudaSensor, RestoreSensor):
@@ -665,8 +764,11 @@ class BermudaTotalDeviceCount(BermudaGlobalSensor):
 
     @property
     def native_value(self) -> int:
-        """Gets the amount of devices we have seen."""
-        return self._cached_ratelimit(len(self.coordinator.devices)) or 0  # type: ignore[attr-defined]
+        """Gets the amount of devices we have seen (including shadowed private addresses)."""
+        return (
+            self._cached_ratelimit(len(self.coordinator.devices) + len(self.coordinator.shadow_devices))  # type: ignore[attr-defined]
+            or 0
+        )
 
 
 class BermudaVisibleDeviceCount(BermudaGlobalSensor):
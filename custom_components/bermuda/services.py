@@ -12,12 +12,17 @@ import re
 from typing import TYPE_CHECKING, Any, cast
 
 from bluetooth_data_tools import monotonic_time_coarse
+from homeassistant.exceptions import ServiceValidationError
 
 from .const import (
     _LOGGER,
     ADDR_TYPE_PRIVATE_BLE_DEVICE,
+    AREA_DIAGNOSTICS_WAIT_SECONDS,
     CONF_DEVICES,
     PRUNE_TIME_REDACTIONS,
+    TRAINING_ADVERT_WAIT_TIMEOUT,
+    TRAINING_MAX_TIME_SECONDS,
+    TRAINING_SAMPLE_COUNT,
 )
 from .util import mac_explode_formats
 
@@ -84,6 +89,11 @@ class BermudaServiceHandler:
         summary: dict[str, Any] | None = None
 
         coord = self.coordinator
+        # Area switch reasons are only captured on demand. Turn capture on for
+        # every device (for a while, so follow-up dumps are immediate) and wait
+        # for the next update cycle to fill them in.
+        if not await coord.area_selection.async_capture_diagnostics(AREA_DIAGNOSTICS_WAIT_SECONDS):
+            _LOGGER.debug("No update cycle captured area switch reasons in time, dumping without them")
 
         # Choose filter for device/address selection
         addresses: list[str] = []
@@ -142,6 +152,58 @@ class BermudaServiceHandler:
 
         return cast("ServiceResponse", out)
 
+    async def async_train_fleet(self, call: ServiceCall) -> ServiceResponse:
+        """
+        Train fingerprints for several devices placed in the same area at once.
+
+        Args:
+        ----
+            call: The service call with parameters:
+                - addresses: List of device addresses to train
+                - area_id: The area all the devices are in
+                - samples: Optional number of samples per device
+
+        Returns:
+        -------
+            A dictionary with the samples trained per device and the duration.
+
+        """
+        coord = self.coordinator
+        area_id = call.data["area_id"]
+        if coord.ar.async_get_area(area_id) is None:
+            msg = f"Area '{area_id}' does not exist"
+            raise ServiceValidationError(msg)
+        addresses = call.data["addresses"]
+        sample_count = call.data.get("samples", TRAINING_SAMPLE_COUNT)
+
+        _LOGGER.info(
+            "Fleet training %d devices in area %s (%d samples each, max %.0fs)",
+            len(addresses),
+            area_id,
+            sample_count,
+            TRAINING_MAX_TIME_SECONDS,
+        )
+        started = monotonic_time_coarse()
+        trained = await coord.async_train_fleet(
+            addresses,
+            area_id,
+            sample_count,
+            TRAINING_MAX_TIME_SECONDS,
+            TRAINING_ADVERT_WAIT_TIMEOUT,
+        )
+        duration = monotonic_time_coarse() - started
+        _LOGGER.info(
+            "Fleet training in area %s complete after %.0fs: %d/%d devices trained",
+            area_id,
+            duration,
+            sum(1 for count in trained.values() if count),
+            len(addresses),
+        )
+        return cast(
+            "ServiceResponse",
+            {"area_id": area_id, "duration": round(duration, 1), "samples": trained},
+        )
+
     def redaction_list_update(self) -> None:
         """
         Freshen or create the list of match/replace pairs for MAC redaction.
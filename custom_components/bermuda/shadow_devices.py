@@ -0,0 +1,161 @@
+"""
+Admission tier for transient, untracked addresses.
+
+Every phone walking past a scanner advertises from a resolvable private
+address (RPA) that rotates every few minutes. Creating a full BermudaDevice
+for each of them (adverts, Kalman filters, history lists) and running it
+through calculate_data until pruning removes it makes memory and CPU scale
+with foot traffic rather than with the devices we actually track.
+
+Unknown RPAs that nothing claims are therefore kept in a ShadowDeviceTable
+holding only the last RSSI, stamp and scanner. An address is promoted to a
+full device as soon as it becomes interesting:
+
+- it resolves to a known IRK (Private BLE / our own IRK manager),
+- it carries an FMDN or iBeacon payload (metadevice sources),
+- it is a scanner's own address, or
+- it is configured for tracking (configured devices are always created).
+
+Public and static addresses are never shadowed, so stable devices still
+appear in the config flow as before.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .fmdn import is_fmdn_service_uuid
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+# Apple's company id, and the iBeacon type/length prefix in its manufacturer data
+_APPLE_COMPANY_ID = 0x004C
+_IBEACON_PREFIX = b"\x02"
+
+
+def is_shadow_candidate(address: str) -> bool:
+    """Return True if a normalised address is a resolvable private address (first nibble 4-7)."""
+    return len(address) == 17 and address[0] in "4567"
+
+
+def carries_identity_payload(service_data: Mapping[Any, Any], manufacturer_data: Mapping[int, bytes]) -> bool:
+    """Return True if an advert carries data that may make its sender a metadevice source."""
+    if service_data and any(is_fmdn_service_uuid(uuid) for uuid in service_data):
+        return True
+    apple = manufacturer_data.get(_APPLE_COMPANY_ID) if manufacturer_data else None
+    return apple is not None and apple[:1] == _IBEACON_PREFIX
+
+
+class ShadowRecord:
+    """Last sighting of a shadowed address."""
+
+    __slots__ = ("rssi", "scanner", "stamp")
+
+    def __init__(self, rssi: float, stamp: float, scanner: str) -> None:
+        """Record a sighting."""
+        self.rssi = rssi
+        self.stamp = stamp
+        self.scanner = scanner
+
+
+class ShadowDeviceTable:
+    """
+    Compact records of untracked transient addresses, least recently seen first.
+
+    Attributes
+    ----------
+        max_size: Records kept at most; the least recently seen are evicted.
+        admitted: Addresses that got a shadow record.
+        promoted: Shadowed addresses promoted to full devices.
+        expired: Records dropped by prune().
+        evicted: Records dropped to stay within max_size.
+
+    """
+
+    __slots__ = ("_records", "admitted", "evicted", "expired", "max_size", "promoted")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialise an empty table."""
+        self._records: dict[str, ShadowRecord] = {}
+        self.max_size = max_size
+        self.admitted: int = 0
+        self.promoted: int = 0
+        self.expired: int = 0
+        self.evicted: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of shadowed addresses."""
+        return len(self._records)
+
+    def __contains__(self, address: object) -> bool:
+        """Return True if address is shadowed."""
+        return address in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate shadowed addresses, least recently seen first."""
+        return iter(self._records)
+
+    def get(self, address: str) -> ShadowRecord | None:
+        """Return the record for address, if shadowed."""
+        return self._records.get(address)
+
+    def items(self) -> Iterator[tuple[str, ShadowRecord]]:
+        """Iterate (address, record) pairs, least recently seen first."""
+        return iter(self._records.items())
+
+    def record(self, address: str, rssi: float, stamp: float, scanner: str) -> None:
+        """Store a sighting, moving the address to the most recently seen end."""
+        records = self._records
+        record = records.pop(address, None)
+        if record is None:
+            self.admitted += 1
+            if len(records) >= self.max_size:
+                del records[next(iter(records))]
+                self.evicted += 1
+            records[address] = ShadowRecord(rssi, stamp, scanner)
+            return
+        record.rssi = rssi
+        record.stamp = stamp
+        record.scanner = scanner
+        records[address] = record
+
+    def promote(self, address: str) -> ShadowRecord | None:
+        """Forget address because it became a full device; return its last record."""
+        record = self._records.pop(address, None)
+        if record is not None:
+            self.promoted += 1
+        return record
+
+    def prune(self, cutoff: float) -> int:
+        """Drop records last seen before cutoff and return how many were removed."""
+        # Records are in last-seen order, so stop at the first live one.
+        stale: list[str] = []
+        for address, record in self._records.items():
+            if record.stamp >= cutoff:
+                break
+            stale.append(address)
+        for address in stale:
+            del self._records[address]
+        self.expired += len(stale)
+        return len(stale)
+
+    def count_seen_since(self, stamp: float) -> int:
+        """Return how many shadowed addresses were seen after stamp."""
+        count = 0
+        for record in reversed(self._records.values()):
+            if record.stamp <= stamp:
+                break
+            count += 1
+        return count
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise the table for diagnostics."""
+        return {
+            "size": len(self._records),
+            "max_size": self.max_size,
+            "admitted": self.admitted,
+            "promoted": self.promoted,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 import math
 import re
+import sys
 from functools import lru_cache
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
-from homeassistant.helpers.device_registry import format_mac
+from .const import ADDRESS_REGISTRY_MAX_SIZE, MIN_DISTANCE, PATH_LOSS_EXPONENT_NEAR, TWO_SLOPE_BREAKPOINT_METRES
 
-from .const import MIN_DISTANCE, PATH_LOSS_EXPONENT_NEAR, TWO_SLOPE_BREAKPOINT_METRES
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 MAC_PAIR_PATTERN: Final = re.compile(r"^[0-9A-Fa-f]{2}([:\-_][0-9A-Fa-f]{2}){5}$")
 MAC_DOTTED_PATTERN: Final = re.compile(r"^[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}$")
@@ -47,7 +49,6 @@ def mac_math_offset(mac: str | None, offset: int = 0) -> str | None:
     return None
 
 
-@lru_cache(1024)
 def _mac_hex(mac: str) -> str | None:
     """Return hex-only mac string when the input matches a MAC format."""
     to_test = mac.strip()
@@ -60,28 +61,6 @@ def _mac_hex(mac: str) -> str | None:
     return None
 
 
-@lru_cache(512)
-def is_mac_address(mac: str) -> bool:
-    """Return True when the provided string is a MAC-48 address."""
-    return _mac_hex(mac) is not None
-
-
-@lru_cache(512)
-def normalize_mac(mac: str) -> str:
-    """
-    Format the mac address string using Home Assistant's canonical rules.
-
-    Always returns lower-case, colon-delimited MACs or raises ValueError for
-    non-MAC inputs.
-    """
-    formatted = format_mac(mac.strip())
-    hex_only = _mac_hex(formatted)
-    if hex_only is None:
-        msg = f"'{mac}' is not a valid MAC address"
-        raise ValueError(msg)
-    return ":".join(hex_only[i : i + 2] for i in range(0, 12, 2))
-
-
 @lru_cache(1024)
 def normalize_identifier(identifier: str) -> str:
     """
@@ -99,7 +78,156 @@ def normalize_identifier(identifier: str) -> str:
     return to_test.lower()
 
 
-@lru_cache(1024)
+class InternedAddress(NamedTuple):
+    """
+    Canonical form of a raw address string.
+
+    Fields:
+        canonical: Interned canonical address (lower-case colon MAC, or identifier).
+        is_mac: True if the address is a MAC-48 address.
+    """
+
+    canonical: str
+    is_mac: bool
+
+
+class AddressRegistry:
+    """
+    Interning registry mapping raw address strings to canonical addresses.
+
+    Every spelling of an address (upper-case from the backend, dashes from a
+    config entry, the canonical form itself) is parsed once and then answered
+    from a dict. Canonical strings are interned, so the coordinator's device
+    map, advert keys and device addresses all share one string object per
+    address.
+
+    Unlike the lru_caches this replaces, entries are not thrown out by churn:
+    the coordinator drops addresses it no longer knows via retain(), and
+    max_size only guards against unbounded use elsewhere (oldest spellings go
+    first).
+
+    Attributes
+    ----------
+        get: The spelling map's dict.get, so a cached lookup is one C call.
+        max_size: Raw spellings kept at most.
+        misses: Lookups that had to parse the address.
+        lookups: Lookups reported by callers (the coordinator's advert ingest),
+            counted there so cached hits stay a single dict.get.
+        evicted: Spellings dropped to stay within max_size.
+        released: Canonical addresses dropped by retain().
+
+    """
+
+    __slots__ = ("_canonicals", "_entries", "evicted", "get", "lookups", "max_size", "misses", "released")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialise an empty registry."""
+        self._entries: dict[str, InternedAddress] = {}
+        self._canonicals: set[str] = set()
+        # Bound once; _entries is only ever mutated in place so this stays valid.
+        self.get: Callable[[str], InternedAddress | None] = self._entries.get
+        self.max_size = max_size
+        self.misses: int = 0
+        self.lookups: int = 0
+        self.evicted: int = 0
+        self.released: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of canonical addresses."""
+        return len(self._canonicals)
+
+    def lookup(self, address: str) -> InternedAddress:
+        """Return the interned form of a raw address, parsing it only the first time."""
+        return self.get(address) or self.add(address)
+
+    def add(self, address: str) -> InternedAddress:
+        """Parse a raw address not in the registry yet and store its spelling."""
+        self.misses += 1
+        hex_only = _mac_hex(address)
+        if hex_only is not None:
+            canonical = ":".join(hex_only[i : i + 2] for i in range(0, 12, 2))
+        else:
+            canonical = normalize_identifier(address)
+        entry = self._entries.get(canonical)
+        if entry is None:
+            canonical = sys.intern(canonical)
+            self._canonicals.add(canonical)
+            entry = InternedAddress(canonical, hex_only is not None)
+            self._store(canonical, entry)
+        if address != canonical:
+            self._store(address, entry)
+        return entry
+
+    def _store(self, address: str, entry: InternedAddress) -> None:
+        if len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
+            self.evicted += 1
+        self._entries[address] = entry
+
+    def retain(self, keep: Callable[[str], bool]) -> int:
+        """
+        Drop canonical addresses for which keep() is False, with all their spellings.
+
+        Returns the number of canonical addresses released.
+        """
+        released = {canonical for canonical in self._canonicals if not keep(canonical)}
+        if not released:
+            return 0
+        self._canonicals -= released
+        for raw in [raw for raw, entry in self._entries.items() if entry.canonical in released]:
+            del self._entries[raw]
+        self.released += len(released)
+        return len(released)
+
+    def hit_rate(self) -> float | None:
+        """
+        Return the share of reported lookups answered without parsing, if any were reported.
+
+        Misses from lookups outside the advert ingest are not in the count, so
+        this slightly understates the true rate.
+        """
+        if not self.lookups:
+            return None
+        return max(0.0, 1.0 - self.misses / self.lookups)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarise registry size and churn for diagnostics."""
+        hit_rate = self.hit_rate()
+        return {
+            "addresses": len(self._canonicals),
+            "spellings": len(self._entries),
+            "lookups": self.lookups,
+            "misses": self.misses,
+            "hit_rate": None if hit_rate is None else round(hit_rate, 4),
+            "evicted": self.evicted,
+            "released": self.released,
+        }
+
+
+ADDRESS_REGISTRY: Final = AddressRegistry(ADDRESS_REGISTRY_MAX_SIZE)
+_address_get: Final = ADDRESS_REGISTRY.get
+_address_add: Final = ADDRESS_REGISTRY.add
+
+
+def is_mac_address(mac: str) -> bool:
+    """Return True when the provided string is a MAC-48 address."""
+    return (_address_get(mac) or _address_add(mac)).is_mac
+
+
+def normalize_mac(mac: str) -> str:
+    """
+    Format the mac address string using Home Assistant's canonical rules.
+
+    Always returns lower-case, colon-delimited MACs or raises ValueError for
+    non-MAC inputs.
+    """
+    entry = _address_get(mac) or _address_add(mac)
+    if not entry.is_mac:
+        msg = f"'{mac}' is not a valid MAC address"
+        raise ValueError(msg)
+    return entry.canonical
+
+
 def mac_norm(mac: str) -> str:
     """
     Backwards-compatible address canonicaliser.
@@ -107,17 +235,12 @@ def mac_norm(mac: str) -> str:
     Dispatches to normalize_mac for true MAC addresses, otherwise falls back to
     normalize_identifier for UUID-like and other pseudo identifiers.
     """
-    if is_mac_address(mac):
-        return normalize_mac(mac)
-    return normalize_identifier(mac)
+    return (_address_get(mac) or _address_add(mac)).canonical
 
 
-@lru_cache(1024)
 def normalize_address(address: str) -> str:
     """Canonicalise addresses that may be MACs or pseudo identifiers."""
-    if is_mac_address(address):
-        return normalize_mac(address)
-    return normalize_identifier(address)
+    return (_address_get(address) or _address_add(address)).canonical
 
 
 @lru_cache(2048)
@@ -0,0 +1,55 @@
+"""Tests for the per-device new-advert notification."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.bermuda.advert_waiters import AdvertWaiters
+
+
+@pytest.mark.asyncio
+async def test_notify_wakes_waiter_on_any_address() -> None:
+    """A wait on several addresses resumes on the first notified one and unregisters from all."""
+    waiters = AdvertWaiters()
+    task = asyncio.create_task(waiters.wait(["meta", "source"], wait_seconds=5))
+    await asyncio.sleep(0)
+    assert "meta" in waiters
+    assert "source" in waiters
+
+    waiters.notify("other")
+    waiters.notify("source")
+
+    assert await task is True
+    assert "meta" not in waiters
+    assert waiters.to_dict() == {"addresses": 0, "notified": 1, "timed_out": 0}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out() -> None:
+    """Without a new advert the wait returns False and leaves nothing registered."""
+    waiters = AdvertWaiters()
+
+    assert await waiters.wait(["aa:bb"], wait_seconds=0.01) is False
+    assert "aa:bb" not in waiters
+    assert waiters.timed_out == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waits_share_notification() -> None:
+    """Several waiters on one address (and on different ones) are served by the same notifications."""
+    waiters = AdvertWaiters()
+    first = asyncio.create_task(waiters.wait(["aa"], wait_seconds=5))
+    second = asyncio.create_task(waiters.wait(["aa"], wait_seconds=5))
+    third = asyncio.create_task(waiters.wait(["bb"], wait_seconds=5))
+    await asyncio.sleep(0)
+
+    waiters.notify("aa")
+    assert await first is True
+    assert await second is True
+    assert not third.done()
+
+    waiters.notify("bb")
+    assert await third is True
+    assert waiters.notified == 3
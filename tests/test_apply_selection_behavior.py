@@ -26,6 +26,7 @@ from custom_components.bermuda.const import (
     DEFAULT_REF_POWER,
 )
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
+from custom_components.bermuda.filters import KalmanFilterBank
 from custom_components.bermuda.area_selection import AreaSelectionHandler
 
 
@@ -52,6 +53,7 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator.fr = fr.async_get(hass)
     coordinator.irk_manager = BermudaIrkManager()
     coordinator.fmdn = FmdnIntegration(coordinator)
+    coordinator.rssi_filter_bank = KalmanFilterBank()
     coordinator.hass_version_min_2025_4 = False
     coordinator.area_selection = AreaSelectionHandler(coordinator)
     return coordinator
@@ -30,6 +30,7 @@ from custom_components.bermuda.const import (
 from custom_components.bermuda.area_selection import AreaSelectionHandler
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
 from custom_components.bermuda.fmdn import BermudaFmdnManager, FmdnIntegration
+from custom_components.bermuda.freshness import FreshnessIndex
 from custom_components.bermuda.bermuda_irk import BermudaIrkManager
 
 
@@ -55,6 +56,7 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator.fr = fr.async_get(hass)
     coordinator.irk_manager = BermudaIrkManager()
     coordinator.fmdn = FmdnIntegration(coordinator)
+    coordinator.freshness = FreshnessIndex()
     coordinator.area_selection = AreaSelectionHandler(coordinator)
     return coordinator
 
@@ -1180,7 +1180,8 @@ class TestCoVisibilityLearning:
 
     def test_co_visibility_stats_update(self) -> None:
         """Test that co-visibility statistics are properly updated."""
-        from custom_components.bermuda.bermuda_device import BermudaDevice
+        from custom_components.bermuda.bermuda_device import BermudaDevice, _co_visibility_area_priority
+        from custom_components.bermuda.correlation.eviction import EvictionIndex
         from unittest.mock import MagicMock
 
         # Create a mock device
@@ -1200,6 +1201,8 @@ class TestCoVisibilityLearning:
             # Create device directly and set required attributes
             device = BermudaDevice.__new__(BermudaDevice)
             device.co_visibility_stats = {}
+            device._co_visibility_scanner_index = {}
+            device._co_visibility_area_index = EvictionIndex(_co_visibility_area_priority)
             device.co_visibility_min_samples = 50
 
             # Test updating co-visibility
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from custom_components.bermuda.area_selection import AreaTests
+from custom_components.bermuda.area_selection import AreaSelectionHandler, AreaTests
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -863,3 +864,82 @@ class TestSensorExtraStateAttributes:
         # Verify sanity checks
         assert result["sanity_proximity_passed"] is True
         assert result["sanity_topological_passed"] is True
+
+
+class TestAreaDiagnosticsCapture:
+    """Tests for on-demand AreaTests capture in AreaSelectionHandler."""
+
+    @staticmethod
+    def _handler() -> AreaSelectionHandler:
+        return AreaSelectionHandler(MagicMock())
+
+    def test_capture_only_when_requested(self) -> None:
+        """AreaTests are built for opted-in devices, during a dump window, or with debug logging."""
+        handler = self._handler()
+        device = MagicMock()
+        device.address = "aa:bb:cc:dd:ee:ff"
+
+        with patch("custom_components.bermuda.area_selection._LOGGER.isEnabledFor", return_value=False):
+            assert not handler._wants_diagnostics(device, 100.0)
+
+            handler.enable_diagnostics(device.address)
+            assert handler._wants_diagnostics(device, 100.0)
+            handler.disable_diagnostics(device.address)
+            assert not handler._wants_diagnostics(device, 100.0)
+
+            with patch("custom_components.bermuda.area_selection.monotonic_time_coarse", return_value=100.0):
+                handler.request_diagnostics(60.0)
+            assert handler._wants_diagnostics(device, 159.0)
+            assert not handler._wants_diagnostics(device, 160.0)
+
+        with patch("custom_components.bermuda.area_selection._LOGGER.isEnabledFor", return_value=True):
+            assert handler._wants_diagnostics(device, 160.0)
+
+    @pytest.mark.asyncio
+    async def test_capture_waits_for_a_full_refresh(self) -> None:
+        """A dump waits for the refresh that captured every device, or gives up after the timeout."""
+        handler = self._handler()
+        handler.coordinator.devices = {}
+
+        with patch("custom_components.bermuda.area_selection._LOGGER.isEnabledFor", return_value=False):
+            assert await handler.async_capture_diagnostics(0) is False
+            assert handler._diagnostics_waiters == []
+
+            waiting = asyncio.ensure_future(handler.async_capture_diagnostics(5.0))
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            with (
+                patch.object(handler, "_update_scanner_online_status"),
+                patch.object(handler, "_update_reference_tracker_learning"),
+                patch.object(handler, "_get_topology"),
+                patch.object(handler, "_get_offline_scanner_addrs", return_value=frozenset()),
+            ):
+                handler.refresh_areas_by_min_distance()
+            assert await waiting is True
+
+            # The capture window is still open, so the next dump is served at once.
+            assert await handler.async_capture_diagnostics(0) is True
+
+    def test_record_decision_without_capture(self) -> None:
+        """Without captured tests only the decision code is recorded and stale text is cleared."""
+        device = MagicMock()
+        device.diag_area_switch = "old"
+        device.area_tests = AreaTests()
+
+        AreaSelectionHandler._record_area_decision(device, "UKF:pending", None, keep_tests=True)
+
+        assert device.area_decision == "UKF:pending"
+        assert device.diag_area_switch is None
+        assert device.area_tests is None
+
+    def test_record_decision_with_capture(self) -> None:
+        """Captured tests are rendered, and kept on the device only when asked to."""
+        tests = AreaTests(decision_path="MIN_DISTANCE", reason="WIN by not losing!")
+        device = MagicMock()
+        device.area_tests = None
+
+        AreaSelectionHandler._record_area_decision(device, "MIN_DISTANCE:switch", tests)
+
+        assert device.area_decision == "MIN_DISTANCE:switch"
+        assert device.diag_area_switch == tests.sensortext()
+        assert device.area_tests is None
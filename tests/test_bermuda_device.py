@@ -141,6 +141,8 @@ def test_to_dict(bermuda_device: BermudaDevice) -> None:
     device_dict = bermuda_device.to_dict()
     assert isinstance(device_dict, dict)
     assert device_dict["address"] == normalize_mac("aa:bb:cc:dd:ee:ff")
+    assert "entry_id" in device_dict
+    assert "_entry_id" not in device_dict
 
 
 def test_repr(bermuda_device: BermudaDevice) -> None:
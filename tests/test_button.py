@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -9,8 +10,8 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 
 from custom_components.bermuda.button import (
+    TRAINING_ADVERT_WAIT_TIMEOUT,
     TRAINING_MAX_TIME_SECONDS,
-    TRAINING_POLL_INTERVAL,
     TRAINING_SAMPLE_COUNT,
     BermudaResetTrainingButton,
     BermudaTrainingButton,
@@ -269,10 +270,11 @@ class TestTrainingConstants:
         # 300 seconds (5 minutes) should be enough for 60 samples
         assert TRAINING_MAX_TIME_SECONDS == 300.0
 
-    def test_training_poll_interval(self) -> None:
-        """Test that poll interval is reasonable."""
-        # 0.3 seconds for responsive polling
-        assert TRAINING_POLL_INTERVAL == 0.3
+    def test_training_advert_wait_timeout(self) -> None:
+        """Test that the advert wait is bounded well below the training time."""
+        # Samples arrive as soon as a new advert is ingested; the timeout only re-checks the loop
+        assert TRAINING_ADVERT_WAIT_TIMEOUT == 2.0
+        assert TRAINING_ADVERT_WAIT_TIMEOUT < TRAINING_MAX_TIME_SECONDS
 
 
 class TestDeviceNewCallback:
@@ -443,6 +445,13 @@ class TestTrainingButtonAsyncPress:
         mock_coordinator.last_update_success = True
         mock_coordinator.async_request_refresh = AsyncMock()
 
+        async def mock_wait_for_advert(device_address, last_stamps, wait_seconds):
+            # A new advert is always ready
+            await asyncio.sleep(0)
+            return True
+
+        mock_coordinator.async_wait_for_advert = AsyncMock(side_effect=mock_wait_for_advert)
+
         mock_device = MagicMock()
         mock_device.name = "Test Device"
         mock_device.unique_id = "test_unique_id"
@@ -520,7 +529,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create") as mock_notify,
             patch("custom_components.bermuda.button.async_dismiss") as mock_dismiss,
             patch("custom_components.bermuda.button.TRAINING_SAMPLE_COUNT", 3),  # Reduce samples for test
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.01),  # Speed up
         ):
             await button.async_press()
 
@@ -531,6 +539,8 @@ class TestTrainingButtonAsyncPress:
         button._device.update_area_and_floor.assert_called_once_with("area1")
         # Verify notifications were created
         assert mock_notify.call_count >= 1  # At least start notification
+        # Samples were paced by new-advert notifications, not by sleeping
+        assert button.coordinator.async_wait_for_advert.await_count >= 2
 
     @pytest.mark.asyncio
     async def test_async_press_handles_timeout(self) -> None:
@@ -549,7 +559,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create"),
             patch("custom_components.bermuda.button.async_dismiss"),
             patch("custom_components.bermuda.button.TRAINING_MAX_TIME_SECONDS", 0.1),  # Very short timeout
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.05),
         ):
             await button.async_press()
 
@@ -583,7 +592,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create"),
             patch("custom_components.bermuda.button.async_dismiss"),
             patch("custom_components.bermuda.button.TRAINING_SAMPLE_COUNT", 3),
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.01),
         ):
             await button.async_press()
 
@@ -642,7 +650,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create"),
             patch("custom_components.bermuda.button.async_dismiss"),
             patch("custom_components.bermuda.button.TRAINING_SAMPLE_COUNT", 2),
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.01),
         ):
             await button.async_press()
 
@@ -670,7 +677,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create") as mock_notify,
             patch("custom_components.bermuda.button.async_dismiss"),
             patch("custom_components.bermuda.button.TRAINING_MAX_TIME_SECONDS", 0.1),
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.05),
         ):
             await button.async_press()
 
@@ -705,7 +711,6 @@ class TestTrainingButtonAsyncPress:
             patch("custom_components.bermuda.button.async_create", side_effect=capture_notification),
             patch("custom_components.bermuda.button.async_dismiss"),
             patch("custom_components.bermuda.button.TRAINING_SAMPLE_COUNT", 60),  # Full count
-            patch("custom_components.bermuda.button.TRAINING_POLL_INTERVAL", 0.001),
         ):
             await button.async_press()
 
@@ -15,6 +15,7 @@ from custom_components.bermuda.bermuda_advert import BermudaAdvert
 from custom_components.bermuda.fmdn import BermudaFmdnManager, FmdnIntegration
 from custom_components.bermuda.bermuda_irk import BermudaIrkManager
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
+from custom_components.bermuda.filters import KalmanFilterBank
 from custom_components.bermuda.area_selection import AreaSelectionHandler
 from custom_components.bermuda.const import (
     CONF_ATTENUATION,
@@ -50,6 +51,7 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator.fr = fr.async_get(hass)
     coordinator.irk_manager = BermudaIrkManager()
     coordinator.fmdn = FmdnIntegration(coordinator)
+    coordinator.rssi_filter_bank = KalmanFilterBank()
     coordinator.area_selection = AreaSelectionHandler(coordinator)
     return coordinator
 
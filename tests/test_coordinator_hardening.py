@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from types import SimpleNamespace
 from typing import Any
@@ -26,9 +27,19 @@ from custom_components.bermuda.const import (
     DEFAULT_MAX_VELOCITY,
     DEFAULT_REF_POWER,
     DEFAULT_SMOOTHING_SAMPLES,
+    DEFAULT_UPDATE_INTERVAL,
+    PROFILE_MAX_AGE,
+    PRUNE_MAX_SHADOWS,
 )
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
+from custom_components.bermuda.correlation import ProfileCompactor
 from custom_components.bermuda.area_selection import AreaSelectionHandler
+from custom_components.bermuda.prune_index import PruneIndex
+from custom_components.bermuda.advert_waiters import AdvertWaiters
+from custom_components.bermuda.device_updates import DeviceUpdateDispatcher
+from custom_components.bermuda.filters import KalmanFilter
+from custom_components.bermuda.registry_index import RegistryIndex
+from custom_components.bermuda.shadow_devices import ShadowDeviceTable
 from custom_components.bermuda.services import BermudaServiceHandler
 
 
@@ -53,6 +64,8 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator._correlations_loaded = True  # Prevent async loading in tests
     coordinator._last_correlation_save = 0.0  # Last time correlations were saved
     coordinator.correlation_store = MagicMock(async_save=AsyncMock())  # Mock store
+    coordinator.profile_compactor = ProfileCompactor(max_age=PROFILE_MAX_AGE)
+    coordinator.stamp_last_compaction = 0.0
     coordinator._seed_configured_devices_done = False
     coordinator._scanner_init_pending = False
     coordinator._hascanners = set()
@@ -66,6 +79,12 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator.service_handler = BermudaServiceHandler(coordinator)
     coordinator.pb_state_sources = {}
     coordinator.stamp_last_prune = 0
+    coordinator.prune_index = PruneIndex()
+    coordinator.shadow_devices = ShadowDeviceTable(PRUNE_MAX_SHADOWS)
+    coordinator.registry_index = RegistryIndex()
+    coordinator.advert_waiters = AdvertWaiters()
+    coordinator.device_updates = DeviceUpdateDispatcher()
+    coordinator.sensor_interval = DEFAULT_UPDATE_INTERVAL
     coordinator.update_in_progress = False
     coordinator.last_update_success = False
     coordinator._waitingfor_load_manufacturer_ids = False
@@ -181,6 +200,7 @@ async def test_async_update_data_returns_internal_result(hass: HomeAssistant) ->
 async def test_dump_devices_limits_when_over_soft_cap(monkeypatch: pytest.MonkeyPatch, hass: HomeAssistant) -> None:
     """Dump service should fall back when device graph is oversized."""
     monkeypatch.setattr(services_mod, "DUMP_DEVICE_SOFT_LIMIT", 2)
+    monkeypatch.setattr(services_mod, "AREA_DIAGNOSTICS_WAIT_SECONDS", 0)
     coordinator = _make_coordinator(hass)
     coordinator.options[CONF_DEVICES] = ["AA:BB:CC:DD:EE:01"]
     coordinator._scanner_list = {"aa:bb:cc:dd:ee:ff"}
@@ -209,3 +229,67 @@ async def test_dump_devices_limits_when_over_soft_cap(monkeypatch: pytest.Monkey
     devices = response["devices"]
     assert isinstance(devices, dict)
     assert len(devices) < len(coordinator.devices)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_advert_uses_stamps_and_sources(hass: HomeAssistant) -> None:
+    """Training waits return at once for already-newer data, otherwise on a source's next advert."""
+    coordinator = _make_coordinator(hass)
+    device = _configure_device(coordinator, "AA:BB:CC:00:00:10")
+    device.metadevice_sources = ["aa:bb:cc:00:00:11"]
+    device.adverts = {  # type: ignore[assignment]
+        ("aa:bb:cc:00:00:11", "scanner1"): SimpleNamespace(stamp=100.0, scanner_address="scanner1"),
+        ("aa:bb:cc:00:00:11", "scanner2"): SimpleNamespace(stamp=20.0, scanner_address="scanner2"),
+    }
+
+    # scanner1 has moved on since the last sample; scanner2 is stale, not new
+    assert await coordinator.async_wait_for_advert(device.address, {"scanner1": 90.0}, 0.01) is True
+    assert await coordinator.async_wait_for_advert(device.address, {"scanner1": 100.0}, 0.01) is False
+
+    waiter = asyncio.create_task(coordinator.async_wait_for_advert(device.address, {"scanner1": 100.0}, 5))
+    await asyncio.sleep(0)
+    coordinator.advert_waiters.notify("aa:bb:cc:00:00:11")
+    assert await waiter is True
+
+
+@pytest.mark.asyncio
+def _training_advert(rssi: float, scanner_address: str) -> SimpleNamespace:
+    """Return an advert stand-in with the history that reset_velocity_history() clears."""
+    return SimpleNamespace(
+        rssi=rssi,
+        scanner_address=scanner_address,
+        stamp=999.0,
+        hist_velocity=[1.0],
+        hist_distance=[2.0],
+        hist_distance_by_interval=[2.0],
+        hist_stamp=[998.0],
+        rssi_kalman=KalmanFilter(),
+        rssi_filtered=rssi,
+    )
+
+
+async def test_train_fleet_batches_and_saves_once(monkeypatch: pytest.MonkeyPatch, hass: HomeAssistant) -> None:
+    """Fleet training samples every device from one stream, then updates profiles and saves once."""
+    monkeypatch.setattr(coordinator_mod, "monotonic_time_coarse", lambda: 1000.0)
+    coordinator = _make_coordinator(hass)
+    trained = []
+    for index, rssi in enumerate((-60.0, -70.0)):
+        device = _configure_device(coordinator, f"AA:BB:CC:00:00:2{index}")
+        device.adverts = {  # type: ignore[assignment]
+            (device.address, "scanner1"): _training_advert(rssi, "scanner1"),
+            (device.address, "scanner2"): _training_advert(rssi - 10, "scanner2"),
+        }
+        device.update_area_and_floor = MagicMock()  # type: ignore[method-assign]
+        trained.append(device)
+
+    result = await coordinator.async_train_fleet(
+        [device.address for device in trained] + ["aa:bb:cc:00:00:99"], "kitchen", 1, 5.0, 0.01
+    )
+
+    assert result == {trained[0].address: 1, trained[1].address: 1}
+    for device in trained:
+        assert coordinator.correlations[device.address]["kitchen"].has_button_training
+        device.update_area_and_floor.assert_called_once_with("kitchen")
+    assert "kitchen" in coordinator.room_profiles
+    assert all(not advert.hist_velocity for device in trained for advert in device.adverts.values())
+    coordinator.correlation_store.async_save.assert_awaited_once()
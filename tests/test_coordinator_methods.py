@@ -18,6 +18,7 @@ from custom_components.bermuda.fmdn import BermudaFmdnManager, FmdnIntegration
 from custom_components.bermuda.bermuda_irk import BermudaIrkManager
 from custom_components.bermuda.const import (
     CONF_ATTENUATION,
+    CONF_CONSOLIDATED_SCANNER_DISTANCES,
     CONF_DEVICES,
     CONF_DEVTRACK_TIMEOUT,
     CONF_MAX_RADIUS,
@@ -35,9 +36,15 @@ from custom_components.bermuda.const import (
     DEFAULT_SMOOTHING_SAMPLES,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    PRUNE_MAX_SHADOWS,
+    SIGNAL_SCANNERS_CHANGED,
 )
 from custom_components.bermuda.coordinator import BermudaDataUpdateCoordinator
 from custom_components.bermuda.area_selection import AreaSelectionHandler
+from custom_components.bermuda.prune_index import PruneIndex
+from custom_components.bermuda.advert_waiters import AdvertWaiters
+from custom_components.bermuda.registry_index import RegistryIndex
+from custom_components.bermuda.shadow_devices import ShadowDeviceTable
 from custom_components.bermuda.services import BermudaServiceHandler
 
 
@@ -77,6 +84,10 @@ def _make_coordinator(hass: HomeAssistant) -> BermudaDataUpdateCoordinator:
     coordinator.service_handler = BermudaServiceHandler(coordinator)
     coordinator.pb_state_sources = {}
     coordinator.stamp_last_prune = 0
+    coordinator.prune_index = PruneIndex()
+    coordinator.shadow_devices = ShadowDeviceTable(PRUNE_MAX_SHADOWS)
+    coordinator.registry_index = RegistryIndex()
+    coordinator.advert_waiters = AdvertWaiters()
     coordinator.update_in_progress = False
     coordinator.last_update_success = False
     coordinator._waitingfor_load_manufacturer_ids = False
@@ -179,6 +190,19 @@ class TestReloadOptions:
 
         assert device.options[CONF_MAX_RADIUS] == 20.0
 
+    def test_reload_options_signals_scanner_entities_on_distance_mode_change(self, hass: HomeAssistant) -> None:
+        """Switching consolidated scanner distances asks the sensor platform to create entities."""
+        coordinator = _make_coordinator(hass)
+
+        with patch("custom_components.bermuda.coordinator.async_dispatcher_send") as mock_dispatch:
+            coordinator.config_entry.options = {CONF_MAX_RADIUS: 20.0}
+            coordinator.reload_options()
+            mock_dispatch.assert_not_called()
+
+            coordinator.config_entry.options = {CONF_CONSOLIDATED_SCANNER_DISTANCES: True}
+            coordinator.reload_options()
+            mock_dispatch.assert_called_once_with(hass, SIGNAL_SCANNERS_CHANGED)
+
     def test_reload_options_handles_none_config_entry(self, hass: HomeAssistant) -> None:
         """Test that reload_options handles None config entry gracefully."""
         coordinator = _make_coordinator(hass)
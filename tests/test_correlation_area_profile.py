@@ -239,6 +239,54 @@ class TestAreaProfileMemoryLimit:
                 f"most-sampled (most reliable) correlations."
             )
 
+    def test_eviction_order_matches_sorted_truncation(self) -> None:
+        """Heap-based eviction keeps exactly the set the old sort-and-truncate kept."""
+        profile = AreaProfile(area_id="area.office")
+        # Reference model of the previous implementation: (has_button, samples)
+        reference: dict[str, tuple[bool, int]] = {}
+
+        def apply(addr: str, *, button: bool) -> None:
+            if button:
+                profile.update_button(primary_rssi=-50.0, other_readings={addr: -70.0})
+            else:
+                profile.update(primary_rssi=-50.0, other_readings={addr: -70.0})
+            has_button, samples = reference.get(addr, (False, 0))
+            reference[addr] = (has_button or button, samples + 1)
+            if len(reference) > MAX_CORRELATIONS_PER_AREA:
+                ranked = sorted(reference.items(), key=lambda x: x[1], reverse=True)
+                reference.clear()
+                reference.update(ranked[:MAX_CORRELATIONS_PER_AREA])
+
+        # Scanners earn distinct totals; late scanners overtake early ones and
+        # one late scanner is button-trained with very few samples.
+        for round_number in range(3):
+            for k in range(MAX_CORRELATIONS_PER_AREA + 5):
+                for _ in range(k + 1):
+                    apply(f"scanner_{k:02d}", button=False)
+                if round_number == 2 and k == MAX_CORRELATIONS_PER_AREA + 4:
+                    apply("scanner_button", button=True)
+                assert set(profile._correlations) == set(reference)
+
+        assert "scanner_button" in profile._correlations
+        assert len(profile._correlations) == MAX_CORRELATIONS_PER_AREA
+
+    def test_eviction_after_reset_training(self) -> None:
+        """Reset lowers priorities; the index must not keep evicting by stale counts."""
+        profile = AreaProfile(area_id="area.office")
+        for k in range(MAX_CORRELATIONS_PER_AREA):
+            for _ in range(k + 1):
+                profile.update(primary_rssi=-50.0, other_readings={f"scanner_{k:02d}": -70.0})
+
+        profile.reset_training()
+        for _ in range(5):
+            profile.update(primary_rssi=-50.0, other_readings={"scanner_00": -70.0})
+        profile.update(primary_rssi=-50.0, other_readings={"scanner_new": -70.0})
+
+        # All reset scanners now have 0 samples except scanner_00 (5) and the new one (1)
+        assert "scanner_00" in profile._correlations
+        assert "scanner_new" in profile._correlations
+        assert len(profile._correlations) == MAX_CORRELATIONS_PER_AREA
+
 
 class TestAreaProfilePersistence:
     """Tests for serialization."""
@@ -0,0 +1,165 @@
+"""
+Tests for ProfileCompactor.
+
+These tests verify that periodic compaction drops profiles for vanished
+areas, devices and scanners while never touching live or user-trained data.
+"""
+
+from __future__ import annotations
+
+from custom_components.bermuda.correlation import AreaProfile, ProfileCompactor, RoomProfile
+
+MAX_AGE = 1000.0
+NOW = 10_000.0
+OLD = NOW - MAX_AGE - 1
+RECENT = NOW - 10
+
+
+def _area_profile(area_id: str, stamp: float, scanners: tuple[str, ...] = ("scanner_a",)) -> AreaProfile:
+    profile = AreaProfile(area_id=area_id)
+    profile.update(
+        primary_rssi=-50.0,
+        other_readings={addr: -70.0 for addr in scanners},
+        primary_scanner_addr="scanner_primary",
+        nowstamp=stamp,
+    )
+    return profile
+
+
+def _room_profile(area_id: str, stamp: float, scanners: tuple[str, ...] = ("scanner_a", "scanner_b")) -> RoomProfile:
+    room = RoomProfile(area_id=area_id)
+    room.update(dict.fromkeys(scanners, -60.0), nowstamp=stamp)
+    return room
+
+
+def _compact(
+    device_profiles: dict[str, dict[str, AreaProfile]],
+    room_profiles: dict[str, RoomProfile],
+    *,
+    live_devices: set[str] | None = None,
+    live_area_ids: set[str] | None = None,
+    live_scanners: set[str] | None = None,
+) -> tuple[ProfileCompactor, int]:
+    compactor = ProfileCompactor(max_age=MAX_AGE)
+    reclaimed = compactor.compact(
+        device_profiles,
+        room_profiles,
+        nowstamp=NOW,
+        live_devices=live_devices or set(),
+        live_area_ids=live_area_ids if live_area_ids is not None else {"area.office", "area.kitchen"},
+        live_scanners=live_scanners if live_scanners is not None else {"scanner_primary", "scanner_a", "scanner_b"},
+    )
+    return compactor, reclaimed
+
+
+class TestDeletedAreas:
+    """Profiles for areas missing from the area registry are dropped."""
+
+    def test_drops_device_and_room_profiles_for_deleted_area(self) -> None:
+        """Both device and room profiles for a deleted area go, even if recent."""
+        devices = {"dev1": {"area.gone": _area_profile("area.gone", RECENT)}}
+        rooms = {"area.gone": _room_profile("area.gone", RECENT), "area.office": _room_profile("area.office", RECENT)}
+
+        compactor, reclaimed = _compact(devices, rooms, live_devices={"dev1"})
+
+        assert devices == {}
+        assert set(rooms) == {"area.office"}
+        assert compactor.stats.area_profiles_dropped == 1
+        assert compactor.stats.device_profiles_dropped == 1
+        assert compactor.stats.room_profiles_dropped == 1
+        assert reclaimed > 0
+        assert compactor.stats.to_dict()["last_run_bytes_reclaimed"] == reclaimed
+
+    def test_empty_area_registry_disables_area_check(self) -> None:
+        """An unpopulated registry must never wipe data."""
+        devices = {"dev1": {"area.office": _area_profile("area.office", RECENT)}}
+        rooms = {"area.office": _room_profile("area.office", RECENT)}
+
+        _, reclaimed = _compact(devices, rooms, live_devices={"dev1"}, live_area_ids=set())
+
+        assert "area.office" in devices["dev1"]
+        assert "area.office" in rooms
+        assert reclaimed == 0
+
+
+class TestVanishedDevices:
+    """Auto-learned profiles for unknown devices age out."""
+
+    def test_drops_old_auto_profile_for_unknown_device(self) -> None:
+        """Unknown device, no new samples for longer than max age: dropped."""
+        devices = {"gone": {"area.office": _area_profile("area.office", OLD)}}
+
+        _compact(devices, {})
+
+        assert devices == {}
+
+    def test_keeps_recent_profile_for_unknown_device(self) -> None:
+        """Unknown but recently learned: kept."""
+        devices = {"gone": {"area.office": _area_profile("area.office", RECENT)}}
+
+        _compact(devices, {})
+
+        assert "gone" in devices
+
+    def test_keeps_old_profile_for_live_device(self) -> None:
+        """Known device: age does not matter."""
+        devices = {"dev1": {"area.office": _area_profile("area.office", OLD)}}
+
+        _compact(devices, {}, live_devices={"dev1"})
+
+        assert "dev1" in devices
+
+    def test_keeps_button_trained_profile_for_unknown_device(self) -> None:
+        """Button training is explicit user intent and is never aged out."""
+        profile = AreaProfile(area_id="area.office")
+        profile.update_button(-50.0, {"scanner_a": -70.0}, "scanner_primary", timestamp=OLD)
+        devices = {"gone": {"area.office": profile}}
+
+        _compact(devices, {})
+
+        assert "gone" in devices
+
+
+class TestVanishedScanners:
+    """Entries for removed scanners age out inside live profiles."""
+
+    def test_drops_old_entries_for_unknown_scanner(self) -> None:
+        """Old entries for a scanner that is no longer known are removed."""
+        profile = _area_profile("area.office", OLD, scanners=("scanner_a", "scanner_removed"))
+        devices = {"dev1": {"area.office": profile}}
+        rooms = {"area.office": _room_profile("area.office", OLD, scanners=("scanner_a", "scanner_removed"))}
+
+        compactor, _ = _compact(devices, rooms, live_devices={"dev1"})
+
+        assert profile.get_absolute_rssi("scanner_removed") is None
+        assert profile.get_absolute_rssi("scanner_a") is not None
+        assert profile.correlation_count == 1
+        assert rooms["area.office"].total_samples == 0
+        # Area profile: 1 correlation + 1 absolute; room: 1 pair
+        assert compactor.stats.scanner_entries_dropped == 3
+
+    def test_keeps_recent_entries_for_unknown_scanner(self) -> None:
+        """A scanner that is briefly missing keeps its learned data."""
+        profile = _area_profile("area.office", RECENT, scanners=("scanner_removed",))
+        devices = {"dev1": {"area.office": profile}}
+
+        _compact(devices, {}, live_devices={"dev1"})
+
+        assert profile.get_absolute_rssi("scanner_removed") is not None
+
+
+class TestDuplicatePairs:
+    """Room pairs stored under differently formatted keys are collapsed."""
+
+    def test_merges_case_duplicates_keeping_most_established(self) -> None:
+        """The entry with more samples survives under the canonical key."""
+        room = RoomProfile(area_id="area.office")
+        for _ in range(5):
+            room.update({"AA:AA:AA:AA:AA:01": -60.0, "AA:AA:AA:AA:AA:02": -70.0})
+        room.update({"aa:aa:aa:aa:aa:01": -60.0, "aa:aa:aa:aa:aa:02": -70.0})
+
+        compactor, _ = _compact({}, {"area.office": room}, live_scanners=set())
+
+        assert list(room._scanner_pairs) == ["aa:aa:aa:aa:aa:01|aa:aa:aa:aa:aa:02"]
+        assert room.total_samples == 5
+        assert compactor.stats.room_pairs_merged == 1
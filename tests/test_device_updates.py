@@ -0,0 +1,126 @@
+"""Tests for targeted per-device entity update dispatch."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.bermuda.const import SIGNAL_DEVICE_UPDATED
+from custom_components.bermuda.device_updates import DeviceUpdateDispatcher, device_tracking_key
+
+
+class FakeAdvert:
+    """Minimal advert with a scanner address."""
+
+    def __init__(self, scanner_address: str) -> None:
+        self.scanner_address = scanner_address
+
+
+class FakeDevice:
+    """Minimal device carrying the tracking fields the dispatcher reads."""
+
+    def __init__(self, address: str, *, create_sensor: bool = True) -> None:
+        self.address = address
+        self.create_sensor = create_sensor
+        self.area_id: str | None = "kitchen"
+        self.floor_id: str | None = "ground"
+        self.area_advert: Any = FakeAdvert("scanner1")
+        self.area_distance: float | None = 2.0
+        self.area_rssi: float | None = -60.0
+        self.zone = "home"
+
+
+REFRESH = 10.0
+
+
+class TestDeviceTrackingKey:
+    """Tests for device_tracking_key."""
+
+    def test_key_without_area_advert(self) -> None:
+        """A device without an area advert has no nearest scanner in its key."""
+        device = FakeDevice("aa:bb")
+        device.area_advert = None
+
+        assert device_tracking_key(device) == ("kitchen", "ground", None, 2.0, -60.0, "home")  # type: ignore[arg-type]
+
+
+class TestDeviceUpdateDispatcher:
+    """Tests for DeviceUpdateDispatcher."""
+
+    def test_first_cycle_signals_all_tracked_devices(self) -> None:
+        """Every device with entities is signalled the first time it is seen."""
+        dispatcher = DeviceUpdateDispatcher()
+        devices: list[Any] = [FakeDevice("a"), FakeDevice("b"), FakeDevice("c", create_sensor=False)]
+
+        assert dispatcher.changed_devices(devices, 100.0, REFRESH) == ["a", "b"]
+        assert dispatcher.last_cycle_tracked == 2
+
+    def test_unchanged_devices_stay_idle(self) -> None:
+        """Devices with unchanged tracking state are not signalled again."""
+        dispatcher = DeviceUpdateDispatcher()
+        devices: list[Any] = [FakeDevice("a"), FakeDevice("b")]
+        dispatcher.changed_devices(devices, 100.0, REFRESH)
+
+        assert dispatcher.changed_devices(devices, 101.0, REFRESH) == []
+        assert dispatcher.last_cycle_signalled == 0
+
+    def test_only_changed_devices_signalled(self) -> None:
+        """A change in area, distance, RSSI, zone or nearest scanner signals that device only."""
+        dispatcher = DeviceUpdateDispatcher()
+        device_a, device_b = FakeDevice("a"), FakeDevice("b")
+        devices: list[Any] = [device_a, device_b]
+        dispatcher.changed_devices(devices, 100.0, REFRESH)
+
+        device_b.area_distance = 2.5
+        assert dispatcher.changed_devices(devices, 101.0, REFRESH) == ["b"]
+
+        device_a.zone = "not_home"
+        assert dispatcher.changed_devices(devices, 102.0, REFRESH) == ["a"]
+
+        device_a.area_advert = FakeAdvert("scanner2")
+        device_b.area_rssi = -70.0
+        assert dispatcher.changed_devices(devices, 103.0, REFRESH) == ["a", "b"]
+
+    def test_unchanged_device_refreshed_after_interval(self) -> None:
+        """Idle devices are still signalled once per refresh interval."""
+        dispatcher = DeviceUpdateDispatcher()
+        device_a, device_b = FakeDevice("a"), FakeDevice("b")
+        devices: list[Any] = [device_a, device_b]
+        dispatcher.changed_devices(devices, 100.0, REFRESH)
+
+        device_b.area_distance = 3.0
+        dispatcher.changed_devices(devices, 105.0, REFRESH)
+
+        # a was last signalled at 100, b at 105
+        assert dispatcher.changed_devices(devices, 110.0, REFRESH) == ["a"]
+        assert dispatcher.changed_devices(devices, 115.0, REFRESH) == ["b"]
+
+    def test_pruned_devices_are_forgotten(self) -> None:
+        """State for devices that disappear is dropped, and they re-signal when back."""
+        dispatcher = DeviceUpdateDispatcher()
+        device_a, device_b = FakeDevice("a"), FakeDevice("b")
+        dispatcher.changed_devices([device_a, device_b], 100.0, REFRESH)
+
+        dispatcher.changed_devices([device_a], 101.0, REFRESH)
+        assert "b" not in dispatcher._last_keys
+
+        assert dispatcher.changed_devices([device_a, device_b], 102.0, REFRESH) == ["b"]
+
+    def test_diagnostics(self) -> None:
+        """Diagnostics summarise dispatch counts."""
+        dispatcher = DeviceUpdateDispatcher()
+        devices: list[Any] = [FakeDevice("a"), FakeDevice("b")]
+        dispatcher.changed_devices(devices, 100.0, REFRESH)
+        dispatcher.changed_devices(devices, 101.0, REFRESH)
+
+        assert dispatcher.to_dict() == {
+            "cycles": 2,
+            "signals_sent": 2,
+            "last_cycle_signalled": 0,
+            "last_cycle_tracked": 2,
+        }
+
+
+def test_signal_is_per_device() -> None:
+    """Each device gets its own signal name."""
+    assert SIGNAL_DEVICE_UPDATED.format("aa:bb") != SIGNAL_DEVICE_UPDATED.format("cc:dd")
+    assert SIGNAL_DEVICE_UPDATED.format("aa:bb").endswith("aa:bb")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,8 +16,9 @@ from custom_components.bermuda.const import (
     DOMAIN,
     DOMAIN_GOOGLEFINDMY,
     DOMAIN_PRIVATE_BLE_DEVICE,
+    SIGNAL_DEVICE_UPDATED,
 )
-from custom_components.bermuda.entity import BermudaEntity, BermudaGlobalEntity
+from custom_components.bermuda.entity import BermudaEntity, BermudaGlobalEntity, _state_fingerprint
 
 
 class TestBermudaEntityInit:
@@ -990,6 +991,95 @@ class TestBermudaEntityCachedRatelimit:
         assert entity.bermuda_update_interval == 5.0
 
 
+class TestBermudaEntityPublishPolicy:
+    """Tests for _cached_ratelimit with a publishing policy."""
+
+    def _create_entity(self, movement_state: str = "moving", **options: float) -> BermudaEntity:
+        """Create a distance-policy entity with a published value of 5.0 at t=100."""
+        mock_device = MagicMock()
+        mock_device.ref_power_changed = 0
+        mock_device.get_movement_state = MagicMock(return_value=movement_state)
+
+        entity = object.__new__(BermudaEntity)
+        entity._device = mock_device
+        entity._publish_policy = "distance"
+        entity.coordinator = MagicMock()
+        entity.coordinator.options = {
+            "distance_deadband": 0.1,
+            "publish_max_silence": 300,
+            "stationary_backoff": 8,
+            **options,
+        }
+        entity.bermuda_update_interval = 10.0
+        entity.bermuda_last_state = 5.0
+        entity.bermuda_last_stamp = 100.0
+        return entity
+
+    def _ratelimit(self, entity: BermudaEntity, value: float, now: float, **kwargs: bool) -> float:
+        with patch("custom_components.bermuda.entity.monotonic_time_coarse", return_value=now):
+            return entity._cached_ratelimit(value, **kwargs)  # type: ignore[no-any-return]
+
+    def test_change_inside_deadband_is_held(self) -> None:
+        """Wobbles inside the deadband are not published even after the interval."""
+        entity = self._create_entity()
+
+        # 5% of 5.0m = 0.25m relative deadband
+        assert self._ratelimit(entity, 5.2, now=120.0) == 5.0
+
+    def test_change_outside_deadband_published_after_interval(self) -> None:
+        """Significant changes are published once the interval has passed."""
+        entity = self._create_entity()
+
+        assert self._ratelimit(entity, 6.0, now=105.0) == 5.0
+        assert self._ratelimit(entity, 6.0, now=111.0) == 6.0
+
+    def test_fast_falling_still_needs_deadband(self) -> None:
+        """Fast-falling bypasses the interval but not the deadband."""
+        entity = self._create_entity()
+
+        assert self._ratelimit(entity, 4.9, now=101.0) == 5.0
+        assert self._ratelimit(entity, 4.0, now=101.0) == 4.0
+
+    def test_heartbeat_publishes_after_max_silence(self) -> None:
+        """Values inside the deadband are published after max silence."""
+        entity = self._create_entity(publish_max_silence=60)
+
+        assert self._ratelimit(entity, 5.1, now=159.0) == 5.0
+        assert self._ratelimit(entity, 5.1, now=160.0) == 5.1
+
+    def test_stationary_device_backs_off(self) -> None:
+        """Each publication while stationary doubles the interval."""
+        entity = self._create_entity(movement_state="stationary")
+
+        assert self._ratelimit(entity, 6.0, now=111.0) == 6.0
+        assert entity.bermuda_publish_backoff == 2.0
+        # Next interval is 20s
+        assert self._ratelimit(entity, 7.0, now=125.0) == 6.0
+        assert self._ratelimit(entity, 7.0, now=132.0) == 7.0
+        assert entity.bermuda_publish_backoff == 4.0
+
+    def test_moving_device_resets_backoff(self) -> None:
+        """Back-off is reset once the device is no longer stationary."""
+        entity = self._create_entity()
+        entity.bermuda_publish_backoff = 8.0
+
+        assert self._ratelimit(entity, 6.0, now=181.0) == 6.0
+        assert entity.bermuda_publish_backoff == 1.0
+
+    def test_leaving_stationary_ends_backoff_at_once(self) -> None:
+        """The first movement after a backed-off stretch only waits the normal interval."""
+        entity = self._create_entity(movement_state="stationary")
+        entity.bermuda_publish_backoff = 8.0
+
+        # Still stationary: the 80s backed-off interval applies
+        assert self._ratelimit(entity, 6.0, now=111.0) == 5.0
+        assert entity.bermuda_publish_backoff == 8.0
+
+        entity._device.get_movement_state.return_value = "moving"
+        assert self._ratelimit(entity, 6.0, now=111.0) == 6.0
+        assert entity.bermuda_publish_backoff == 1.0
+
+
 class TestBermudaEntityHandleCoordinatorUpdate:
     """Tests for BermudaEntity _handle_coordinator_update method."""
 
@@ -1031,6 +1121,121 @@ class TestBermudaEntityHandleCoordinatorUpdate:
         entity.dr.async_update_device.assert_called_once()
         assert entity._lastname == "New Name"
 
+    def test_handle_coordinator_update_skips_unchanged_state(self) -> None:
+        """Test that an unchanged state fingerprint skips the state write."""
+        entity = self._create_entity()
+        entity.hass = MagicMock()
+
+        with patch("custom_components.bermuda.entity._state_fingerprint", return_value=("home", 1.5)):
+            entity._handle_coordinator_update()
+            entity._handle_coordinator_update()
+
+        entity.async_write_ha_state.assert_called_once()
+
+    def test_handle_coordinator_update_writes_changed_state(self) -> None:
+        """Test that a changed state fingerprint is written."""
+        entity = self._create_entity()
+        entity.hass = MagicMock()
+
+        with patch(
+            "custom_components.bermuda.entity._state_fingerprint",
+            side_effect=[("home", 1.5), ("home", 2.0)],
+        ):
+            entity._handle_coordinator_update()
+            entity._handle_coordinator_update()
+
+        assert entity.async_write_ha_state.call_count == 2
+
+    def test_handle_coordinator_update_name_change_forces_write(self) -> None:
+        """Test that a device rename writes state even if the fingerprint is unchanged."""
+        entity = self._create_entity()
+        entity.hass = MagicMock()
+
+        with patch("custom_components.bermuda.entity._state_fingerprint", return_value=("home", 1.5)):
+            entity._handle_coordinator_update()
+            entity._device.name = "Renamed Device"
+            entity._handle_coordinator_update()
+
+        assert entity.async_write_ha_state.call_count == 2
+
+    def test_state_fingerprint_covers_name_icon_and_picture(self) -> None:
+        """Test that a new name, icon or entity picture changes the fingerprint."""
+        entity = MagicMock()
+        baseline = _state_fingerprint(entity)
+
+        for field in ("name", "icon", "entity_picture"):
+            setattr(entity, field, f"new {field}")
+            fingerprint = _state_fingerprint(entity)
+            assert fingerprint != baseline
+            baseline = fingerprint
+
+    def test_state_fingerprint_reads_state_and_attributes_once(self) -> None:
+        """Test that the fingerprint evaluates state and extra attributes once each."""
+        calls: list[str] = []
+
+        class CountingEntity(BermudaEntity):
+            @property
+            def state(self) -> str:
+                calls.append("state")
+                return "home"
+
+            @property
+            def extra_state_attributes(self) -> dict[str, str]:
+                calls.append("attributes")
+                return {"area_id": "kitchen"}
+
+        entity = object.__new__(CountingEntity)
+        entity._device = MagicMock()
+        entity.coordinator = MagicMock()
+
+        fingerprint = _state_fingerprint(entity)
+
+        assert "home" in fingerprint
+        assert {"area_id": "kitchen"} in fingerprint
+        assert calls == ["state", "attributes"]
+
+
+class TestBermudaEntityDeviceUpdateSignal:
+    """Tests for per-device update subscription in async_added_to_hass."""
+
+    def _create_entity(self, device_update_signal: bool) -> BermudaEntity:  # noqa: FBT001
+        entity = object.__new__(BermudaEntity)
+        entity._device_update_signal = device_update_signal
+        entity.address = "aa:bb:cc:dd:ee:ff"
+        entity.hass = MagicMock()
+        entity.coordinator = MagicMock()
+        entity.async_on_remove = MagicMock()
+        return entity
+
+    @pytest.mark.asyncio
+    async def test_per_device_entity_listens_on_device_signal(self) -> None:
+        """Per-device entities subscribe to their device signal, not the coordinator."""
+        entity = self._create_entity(device_update_signal=True)
+
+        with patch("custom_components.bermuda.entity.async_dispatcher_connect") as mock_connect:
+            await entity.async_added_to_hass()
+
+        mock_connect.assert_called_once_with(
+            entity.hass,
+            SIGNAL_DEVICE_UPDATED.format("aa:bb:cc:dd:ee:ff"),
+            entity._handle_coordinator_update,
+        )
+        entity.coordinator.async_add_listener.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_other_entities_use_coordinator_listener(self) -> None:
+        """Entities without the flag keep the regular coordinator subscription."""
+        entity = self._create_entity(device_update_signal=False)
+
+        with (
+            patch("custom_components.bermuda.entity.async_dispatcher_connect") as mock_connect,
+            patch.object(BermudaEntity.__bases__[0], "async_added_to_hass", new_callable=AsyncMock) as mock_parent,
+        ):
+            await entity.async_added_to_hass()
+
+        mock_parent.assert_awaited_once()
+        mock_connect.assert_not_called()
+
 
 class TestBermudaGlobalEntity:
     """Tests for BermudaGlobalEntity class."""
@@ -1068,6 +1273,28 @@ class TestBermudaGlobalEntity:
 
         entity.async_write_ha_state.assert_called_once()
 
+    def test_global_entity_handle_coordinator_update_skips_unchanged_state(self) -> None:
+        """Test that global entity skips the state write when nothing changed."""
+        entity = self._create_global_entity()
+        entity.hass = MagicMock()
+
+        with patch("custom_components.bermuda.entity._state_fingerprint", return_value=(True, 12)):
+            entity._handle_coordinator_update()
+            entity._handle_coordinator_update()
+
+        entity.async_write_ha_state.assert_called_once()
+
+    def test_global_entity_direct_write_forgets_fingerprint(self) -> None:
+        """Test that a write outside the fingerprint check makes the next update write again."""
+        entity = object.__new__(BermudaGlobalEntity)
+        entity._last_state_fingerprint = (True, 12)
+
+        with patch.object(BermudaGlobalEntity.__bases__[0], "async_write_ha_state") as mock_parent:
+            entity.async_write_ha_state()
+
+        mock_parent.assert_called_once()
+        assert entity._last_state_fingerprint is None
+
     def test_global_entity_cached_ratelimit_returns_new_value_first_time(self) -> None:
         """Test that global entity _cached_ratelimit returns new value first time."""
         entity = self._create_global_entity()
@@ -248,6 +248,8 @@ def test_fmdn_deduplication_by_device_id_prevents_duplicates(
     # canonical_id format from the device registry identifiers
     match2 = SimpleNamespace(device_id="shared-device-registry-id", canonical_id="different_canonical_id")
     resolver.resolve_eid_all.return_value = [match2]
+    # Same payload, different resolver answer: drop the memoised outcome
+    coordinator.fmdn.manager.resolution_cache.clear()
 
     source_device2 = coordinator._get_or_create_device("77:88:99:aa:bb:cc")
     coordinator.fmdn.handle_advertisement(source_device2, service_data)
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from custom_components.bermuda.const import PRUNE_TIME_FMDN
 from custom_components.bermuda.fmdn.integration import (
     EIDMatch,
     _convert_to_eid_match,
@@ -243,6 +244,56 @@ class TestBermudaFmdnManagerDiagnostics:
         assert seen.is_reversed is None
 
 
+MANAGER_MODULE = "custom_components.bermuda.fmdn.manager"
+
+
+class TestBermudaFmdnManagerBounds:
+    """Tests for the bounded, least-recently-seen EID/MAC tracking."""
+
+    def test_least_recently_seen_eid_evicted(self) -> None:
+        """Past the cap the EID seen longest ago is evicted, not the oldest inserted."""
+        manager = BermudaFmdnManager()
+        with patch(f"{MANAGER_MODULE}.FMDN_MAX_SEEN_EIDS", 2):
+            manager.record_eid_seen(b"\x01", "AA:BB:CC:DD:EE:01")
+            manager.record_eid_seen(b"\x02", "AA:BB:CC:DD:EE:02")
+            manager.record_eid_seen(b"\x01", "AA:BB:CC:DD:EE:01")
+            manager.record_eid_seen(b"\x03", "AA:BB:CC:DD:EE:03")
+
+        assert manager.get_resolution_status(b"\x02") is None
+        assert manager.get_resolution_status(b"\x01") is not None
+        diagnostics = manager.get_diagnostics_no_redactions()
+        assert diagnostics["stats"]["eids_evicted"] == 1
+        # The evicted EID's only source MAC goes with it
+        assert "AA:BB:CC:DD:EE:02" not in diagnostics["source_macs"]
+
+    def test_source_macs_capped(self) -> None:
+        """Source MAC tracking is capped independently of the EIDs."""
+        manager = BermudaFmdnManager()
+        with patch(f"{MANAGER_MODULE}.FMDN_MAX_SOURCE_MACS", 2):
+            for mac in ("AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:02", "AA:BB:CC:DD:EE:03"):
+                manager.record_eid_seen(b"\x01", mac)
+
+        diagnostics = manager.get_diagnostics_no_redactions()
+        assert sorted(diagnostics["source_macs"]) == ["AA:BB:CC:DD:EE:02", "AA:BB:CC:DD:EE:03"]
+        assert diagnostics["source_macs"]["AA:BB:CC:DD:EE:03"] == {"eid_count": 1, "eids": ["01"]}
+        assert diagnostics["stats"]["macs_evicted"] == 1
+
+    def test_prune_expires_stale_entries(self) -> None:
+        """async_prune drops EIDs and MACs not seen within PRUNE_TIME_FMDN."""
+        manager = BermudaFmdnManager()
+        with patch(f"{MANAGER_MODULE}.monotonic_time_coarse", return_value=1000.0):
+            manager.record_eid_seen(b"\x01", "AA:BB:CC:DD:EE:01")
+        with patch(f"{MANAGER_MODULE}.monotonic_time_coarse", return_value=1000.0 + PRUNE_TIME_FMDN):
+            manager.record_eid_seen(b"\x02", "AA:BB:CC:DD:EE:02")
+        with patch(f"{MANAGER_MODULE}.monotonic_time_coarse", return_value=1001.0 + PRUNE_TIME_FMDN):
+            manager.async_prune()
+
+        diagnostics = manager.get_diagnostics_no_redactions()
+        assert list(diagnostics["unresolved_eids"]) == ["02"]
+        assert list(diagnostics["source_macs"]) == ["AA:BB:CC:DD:EE:02"]
+        assert diagnostics["stats"]["eids_expired"] == 1
+
+
 class TestEIDMatchTypeInProtocol:
     """Tests verifying EIDMatch is used correctly in method signatures."""
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +10,7 @@ from custom_components.bermuda.const import (
     ADDR_TYPE_FMDN_DEVICE,
     DATA_EID_RESOLVER,
     DOMAIN_GOOGLEFINDMY,
+    FMDN_NEGATIVE_CACHE_TIME,
     METADEVICE_FMDN_DEVICE,
     METADEVICE_TYPE_FMDN_SOURCE,
 )
@@ -816,6 +816,203 @@ class TestHandleAdvertisement:
         assert METADEVICE_TYPE_FMDN_SOURCE in device.metadevice_type
 
 
+FMDN_SERVICE_DATA = {"0000feaa-0000-1000-8000-00805f9b34fb": bytes([0x40]) + b"\x11" * 20}
+
+
+def _make_source(address: str) -> MagicMock:
+    device = MagicMock()
+    device.address = address
+    device.metadevice_type = set()
+    return device
+
+
+class TestHandleAdvertisementResolutionCache:
+    """Tests for memoised resolution in handle_advertisement."""
+
+    def _integration(self, resolve_all: MagicMock) -> FmdnIntegration:
+        coordinator = _make_mock_coordinator()
+        resolver = MagicMock()
+        resolver.resolve_eid = MagicMock(return_value=None)
+        resolver.resolve_eid_all = resolve_all
+        coordinator.hass.data[DOMAIN_GOOGLEFINDMY] = {DATA_EID_RESOLVER: resolver}
+        integration = FmdnIntegration(coordinator)
+        integration.register_source = MagicMock()  # type: ignore[method-assign]
+        return integration
+
+    def test_same_payload_resolved_once(self) -> None:
+        """A payload heard via many sources/scanners is resolved once and applied to each."""
+        resolve_all = MagicMock(return_value=[MockRawMatch(device_id="dev_1", canonical_id="uuid_1")])
+        integration = self._integration(resolve_all)
+        source_a = _make_source("aa:bb:cc:dd:ee:01")
+        source_b = _make_source("aa:bb:cc:dd:ee:02")
+
+        with patch.object(integration, "extract_eids", wraps=integration.extract_eids) as extract:
+            for source in (source_a, source_b, source_a):
+                integration.handle_advertisement(source, FMDN_SERVICE_DATA)
+
+        assert resolve_all.call_count == 1
+        assert extract.call_count == 1
+        registered = [call.args[0] for call in integration.register_source.call_args_list]  # type: ignore[attr-defined]
+        assert registered == [source_a, source_b, source_a]
+        assert METADEVICE_TYPE_FMDN_SOURCE in source_b.metadevice_type
+        cache_stats = integration.manager.resolution_cache.to_dict()
+        assert (cache_stats["hits"], cache_stats["misses"], cache_stats["size"]) == (2, 1, 1)
+
+    def test_unresolved_payload_cached_negatively(self) -> None:
+        """A payload with no known EID is not re-resolved while the negative entry lives."""
+        resolve_all = MagicMock(return_value=[])
+        integration = self._integration(resolve_all)
+
+        integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), FMDN_SERVICE_DATA)
+        calls_after_first = resolve_all.call_count
+        integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:02"), FMDN_SERVICE_DATA)
+
+        assert calls_after_first > 0
+        assert resolve_all.call_count == calls_after_first
+        assert integration.manager.resolution_cache.negative_hits == 1
+        integration.register_source.assert_not_called()  # type: ignore[attr-defined]
+        # The second source is still tracked against the unresolved EID
+        assert "aa:bb:cc:dd:ee:02" in integration.manager.get_diagnostics_no_redactions()["source_macs"]
+
+    def test_negative_entry_expires(self) -> None:
+        """Negative entries are re-checked after their short window."""
+        resolve_all = MagicMock(return_value=[])
+        integration = self._integration(resolve_all)
+        module = "custom_components.bermuda.fmdn.integration.monotonic_time_coarse"
+
+        with patch(module, return_value=1000.0):
+            integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), FMDN_SERVICE_DATA)
+        calls_after_first = resolve_all.call_count
+        with patch(module, return_value=1000.0 + FMDN_NEGATIVE_CACHE_TIME + 1):
+            integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), FMDN_SERVICE_DATA)
+
+        assert resolve_all.call_count == 2 * calls_after_first
+        assert integration.manager.resolution_cache.expired == 1
+
+    def test_resolver_unavailable_not_cached(self) -> None:
+        """An unavailable resolver is retried on the next advert."""
+        coordinator = _make_mock_coordinator()
+        integration = FmdnIntegration(coordinator)
+        source = _make_source("aa:bb:cc:dd:ee:01")
+
+        integration.handle_advertisement(source, FMDN_SERVICE_DATA)
+        integration.handle_advertisement(source, FMDN_SERVICE_DATA)
+
+        cache = integration.manager.resolution_cache
+        assert len(cache) == 0
+        assert cache.misses == 2
+
+    def test_diagnostics_include_cache_stats(self) -> None:
+        """FMDN manager diagnostics expose the resolution cache counters."""
+        resolve_all = MagicMock(return_value=[MockRawMatch()])
+        integration = self._integration(resolve_all)
+        integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), FMDN_SERVICE_DATA)
+        integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:02"), FMDN_SERVICE_DATA)
+
+        diagnostics = integration.manager.get_diagnostics_no_redactions()["resolution_cache"]
+
+        assert diagnostics == {
+            "size": 1,
+            "hits": 1,
+            "negative_hits": 0,
+            "misses": 1,
+            "expired": 0,
+            "hit_rate": 0.5,
+        }
+
+
+class TestResolverPipeline:
+    """Tests for queued resolution of unseen payloads."""
+
+    def _integration(self, resolve_all: MagicMock) -> FmdnIntegration:
+        coordinator = _make_mock_coordinator()
+        resolver = MagicMock()
+        resolver.resolve_eid = MagicMock(return_value=None)
+        resolver.resolve_eid_all = resolve_all
+        coordinator.hass.data[DOMAIN_GOOGLEFINDMY] = {DATA_EID_RESOLVER: resolver}
+        coordinator.hass.async_add_executor_job = MagicMock(side_effect=AssertionError("resolver left the event loop"))
+        integration = FmdnIntegration(coordinator)
+        integration.register_source = MagicMock()  # type: ignore[method-assign]
+        return integration
+
+    def test_queued_when_inline_budget_spent(self) -> None:
+        """Past the inline budget, payloads are queued and resolved after the advert loop."""
+        resolve_all = MagicMock(return_value=[MockRawMatch(device_id="dev_1")])
+        integration = self._integration(resolve_all)
+        queue = integration.manager.resolver_queue
+        source_a = _make_source("aa:bb:cc:dd:ee:01")
+        source_b = _make_source("aa:bb:cc:dd:ee:02")
+        integration.coordinator.devices = {source_a.address: source_a, source_b.address: source_b}
+
+        queue.budget_left = 0.0
+        integration.handle_advertisement(source_a, FMDN_SERVICE_DATA)
+        integration.handle_advertisement(source_b, FMDN_SERVICE_DATA)
+
+        resolve_all.assert_not_called()
+        assert queue.depth == 1
+        assert METADEVICE_TYPE_FMDN_SOURCE in source_b.metadevice_type
+
+        integration.register_source.assert_not_called()  # type: ignore[attr-defined]
+        assert integration.drain_pending() == 1
+        integration.begin_cycle()
+
+        assert resolve_all.call_count == 1
+        registered = [call.args[0] for call in integration.register_source.call_args_list]  # type: ignore[attr-defined]
+        assert registered == [source_a, source_b]
+        assert len(integration.manager.resolution_cache) == 1
+        assert queue.budget_left > 0
+        stats = integration.manager.get_diagnostics_no_redactions()["resolver_pipeline"]
+        assert (stats["queue_depth"], stats["batches"], stats["queued_resolutions"]) == (0, 1, 1)
+        assert stats["resolver_latency_ms"]["avg"] is not None
+
+    def test_inline_within_budget(self) -> None:
+        """While the budget lasts, unseen payloads resolve immediately."""
+        resolve_all = MagicMock(return_value=[MockRawMatch(device_id="dev_1")])
+        integration = self._integration(resolve_all)
+
+        integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), FMDN_SERVICE_DATA)
+
+        integration.register_source.assert_called_once()  # type: ignore[attr-defined]
+        assert integration.manager.resolver_queue.inline_resolutions == 1
+        assert integration.manager.resolver_queue.depth == 0
+
+    def test_drain_is_bounded(self) -> None:
+        """Each drain resolves at most a batch, oldest first, and leaves the rest queued."""
+        resolve_all = MagicMock(return_value=[])
+        integration = self._integration(resolve_all)
+        queue = integration.manager.resolver_queue
+        queue.budget_left = 0.0
+        source = _make_source("aa:bb:cc:dd:ee:01")
+        integration.coordinator.devices = {source.address: source}
+        for marker in (b"\x33", b"\x44", b"\x55"):
+            service_data = {"0000feaa-0000-1000-8000-00805f9b34fb": bytes([0x40]) + marker * 20}
+            integration.handle_advertisement(source, service_data)
+
+        with patch("custom_components.bermuda.fmdn.integration.FMDN_RESOLVE_BATCH_SIZE", 2):
+            assert integration.drain_pending() == 2
+            assert queue.depth == 1
+            first_resolved = resolve_all.call_args_list[0].args[0]
+            assert first_resolved.endswith(b"\x33" * 20)
+        with patch("custom_components.bermuda.fmdn.integration.FMDN_QUEUE_DRAIN_BUDGET", 0.0):
+            # Even without budget one payload is resolved, so the queue always moves
+            assert integration.drain_pending() == 1
+        assert integration.drain_pending() == 0
+        assert (queue.depth, queue.queued_resolutions) == (0, 3)
+
+    def test_queue_backpressure(self) -> None:
+        """Unseen payloads beyond the queue limit are dropped and counted."""
+        integration = self._integration(MagicMock(return_value=[]))
+        queue = integration.manager.resolver_queue
+        queue.budget_left = 0.0
+
+        with patch("custom_components.bermuda.fmdn.resolver_queue.FMDN_RESOLVE_QUEUE_MAX", 1):
+            for marker in (b"\x33", b"\x44"):
+                service_data = {"0000feaa-0000-1000-8000-00805f9b34fb": bytes([0x40]) + marker * 20}
+                integration.handle_advertisement(_make_source("aa:bb:cc:dd:ee:01"), service_data)
+
+        assert (queue.depth, queue.dropped) == (1, 1)
+
+
 class TestPruneSource:
     """Tests for prune_source method."""
 
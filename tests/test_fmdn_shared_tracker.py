@@ -221,6 +221,8 @@ class TestSharedTrackerCacheLookup:
         fmdn.handle_advertisement(source_a, fmdn_service_data)
 
         # Process second account
+        # Same payload, different resolver answer: drop the memoised outcome
+        fmdn.manager.resolution_cache.clear()
         resolver.resolve_eid.return_value = match_b
         resolver.resolve_eid_all.return_value = [match_b]
         source_b = coordinator._get_or_create_device(ACCOUNT_B_SOURCE_MAC)
@@ -257,6 +259,8 @@ class TestSharedTrackerCacheLookup:
         source_a = coordinator._get_or_create_device(ACCOUNT_A_SOURCE_MAC)
         fmdn.handle_advertisement(source_a, fmdn_service_data)
 
+        # Same payload, different resolver answer: drop the memoised outcome
+        fmdn.manager.resolution_cache.clear()
         resolver.resolve_eid.return_value = match_b
         resolver.resolve_eid_all.return_value = [match_b]
         source_b = coordinator._get_or_create_device(ACCOUNT_B_SOURCE_MAC)
@@ -307,6 +311,8 @@ class TestSharedTrackerConfigFlowVisibility:
         source_a = coordinator._get_or_create_device(ACCOUNT_A_SOURCE_MAC)
         fmdn.handle_advertisement(source_a, fmdn_service_data)
 
+        # Same payload, different resolver answer: drop the memoised outcome
+        fmdn.manager.resolution_cache.clear()
         resolver.resolve_eid.return_value = match_b
         resolver.resolve_eid_all.return_value = [match_b]
         source_b = coordinator._get_or_create_device(ACCOUNT_B_SOURCE_MAC)
@@ -353,6 +359,8 @@ class TestSharedTrackerSourceLinking:
         source_a = coordinator._get_or_create_device(ACCOUNT_A_SOURCE_MAC)
         fmdn.handle_advertisement(source_a, fmdn_service_data)
 
+        # Same payload, different resolver answer: drop the memoised outcome
+        fmdn.manager.resolution_cache.clear()
         resolver.resolve_eid.return_value = match_b
         resolver.resolve_eid_all.return_value = [match_b]
         source_b = coordinator._get_or_create_device(ACCOUNT_B_SOURCE_MAC)
@@ -399,6 +407,8 @@ class TestSharedTrackerMetadeviceAttributes:
         source_a = coordinator._get_or_create_device(ACCOUNT_A_SOURCE_MAC)
         fmdn.handle_advertisement(source_a, fmdn_service_data)
 
+        # Same payload, different resolver answer: drop the memoised outcome
+        fmdn.manager.resolution_cache.clear()
         resolver.resolve_eid.return_value = match_b
         resolver.resolve_eid_all.return_value = [match_b]
         source_b = coordinator._get_or_create_device(ACCOUNT_B_SOURCE_MAC)
@@ -0,0 +1,53 @@
+"""Tests for ingest-time freshness high-water marks."""
+
+from __future__ import annotations
+
+from custom_components.bermuda.freshness import DEVICE_RECENCY_HORIZON, FreshnessIndex
+
+
+class TestFreshnessIndex:
+    """Tests for FreshnessIndex."""
+
+    def test_scanner_high_water_marks(self) -> None:
+        """Per-scanner and global marks only ever move forward."""
+        index = FreshnessIndex()
+        index.record("dev1", 100.0, "scanner_a", 100.0, 101.0)
+        index.record("dev2", 90.0, "scanner_a", 90.0, 101.0)  # older advert
+        index.record_scanner("scanner_b", 105.0)
+
+        assert index.scanner_stamp("scanner_a") == 100.0
+        assert index.scanner_stamp("scanner_b") == 105.0
+        assert index.scanner_stamp("scanner_c") == 0.0
+        assert index.newest_stamp == 105.0
+
+    def test_count_devices_seen_since(self) -> None:
+        """Only devices with a fresh last_seen that still exist are counted."""
+        index = FreshnessIndex()
+        index.record("old", 50.0, "s", 50.0, 51.0)
+        index.record("stale_advert", 80.0, "s", 80.0, 100.0)  # heard now, but last_seen is old
+        index.record("fresh", 99.0, "s", 99.0, 100.0)
+        index.record("pruned", 99.0, "s", 99.0, 100.0)
+
+        assert index.count_devices_seen_since(90.0, {"old", "stale_advert", "fresh"}) == 1
+        assert index.device_seen_since("fresh", 90.0)
+        assert not index.device_seen_since("old", 90.0)
+
+    def test_begin_cycle_drops_old_entries_and_cached_counts(self) -> None:
+        """Devices outside the horizon are forgotten; scanner counts are cached per cycle."""
+        index = FreshnessIndex()
+        index.record("old", 10.0, "s", 10.0, 10.0)
+        index.record("new", 100.0, "s", 100.0, 100.0)
+        calls: list[int] = []
+
+        def _count() -> int:
+            calls.append(1)
+            return 3
+
+        assert index.active_scanner_count(10, _count) == 3
+        assert index.active_scanner_count(10, _count) == 3
+        assert len(calls) == 1
+
+        index.begin_cycle(10.0 + DEVICE_RECENCY_HORIZON + 1)
+        assert index.to_dict()["recent_devices"] == 1
+        assert index.active_scanner_count(10, _count) == 3
+        assert len(calls) == 2
@@ -0,0 +1,49 @@
+"""Tests for the running maximum of advert intervals behind the adaptive timeout."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.bermuda.const import HIST_KEEP_COUNT
+from custom_components.bermuda.interval_window import MaxIntervalWindow
+
+
+def _reference(stamps: list[float]) -> float | None:
+    """The per-check recomputation MaxIntervalWindow replaces."""
+    intervals = [stamps[i] - stamps[i + 1] for i in range(min(10, len(stamps) - 1)) if stamps[i + 1] is not None]
+    return max(intervals) if intervals else None
+
+
+def test_matches_full_recomputation_through_history_changes() -> None:
+    """Inserts, tail trims, clears and skipped checks all give the recomputed maximum."""
+    rng = random.Random(50)
+    window = MaxIntervalWindow()
+    stamps: list[float] = []
+    stamp = 1000.0
+    for _ in range(2000):
+        action = rng.random()
+        if action < 0.02:
+            stamps.clear()
+        for _ in range(rng.choice((0, 0, 1, 1, 1, 2, 3, 12))):
+            stamp += rng.choice((0.5, 1.0, 2.0, 30.0, rng.uniform(0.1, 300.0)))
+            stamps.insert(0, stamp)
+        del stamps[HIST_KEEP_COUNT:]
+        if action < 0.7:
+            assert window.max_interval(stamps) == _reference(stamps)
+
+    assert window.pushes > window.rebuilds > 0
+
+
+def test_replaced_history_is_rebuilt() -> None:
+    """A different list object is recomputed rather than followed, skipping missing stamps."""
+    window = MaxIntervalWindow()
+    assert window.max_interval([100.0]) is None
+    assert window.max_interval([130.0, 100.0]) == 30.0
+
+    stamps = [200.0, 190.0, 120.0, 115.0]
+    assert window.max_interval(stamps) == 70.0
+    stamps.insert(0, 290.0)
+    assert window.max_interval(stamps) == 90.0
+    assert window.to_dict() == {"span": 10, "max_interval": 90.0, "pushes": 1, "rebuilds": 3}
+
+    assert window.max_interval([300.0, 250.0, None]) == 50.0  # type: ignore[list-item]
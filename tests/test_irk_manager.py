@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 import pytest
-from bluetooth_data_tools import monotonic_time_coarse
+from bluetooth_data_tools import get_cipher_for_irk, monotonic_time_coarse, resolve_private_address
 
-from custom_components.bermuda.bermuda_irk import BermudaIrkManager, ResolvableMAC
+from custom_components.bermuda.bermuda_irk import BermudaIrkManager, ResolvableMAC, batch_resolve_private_addresses
 from custom_components.bermuda.const import IrkTypes, PRUNE_TIME_KNOWN_IRK
 
 
@@ -611,3 +612,121 @@ class TestIrkManagerIntegration:
 
         # Step 3: Verify the MAC was matched
         assert mac in matching_macs
+
+
+def _make_rpa(irk: bytes, prand: bytes) -> str:
+    """Build a resolvable private address for irk from a 3-byte prand (top bits 01)."""
+    encryptor = get_cipher_for_irk(irk).encryptor()
+    prand_hash = (encryptor.update(b"\x00" * 13 + prand) + encryptor.finalize())[13:]
+    return ":".join(f"{octet:02X}" for octet in prand + prand_hash)
+
+
+IRK_A = bytes(range(16))
+IRK_B = bytes(range(16, 32))
+
+
+class TestBatchResolvePrivateAddresses:
+    """Tests for the multi-block batch resolver."""
+
+    def test_matches_single_address_resolver(self) -> None:
+        """Batch results agree with resolve_private_address for every pair."""
+        addresses = [
+            _make_rpa(IRK_A, b"\x41\x02\x03"),
+            _make_rpa(IRK_B, b"\x7f\xee\x10"),
+            _make_rpa(IRK_A, b"\x55\x66\x77"),
+            "55:AA:BB:CC:DD:EE",  # RPA that matches neither
+            "00:11:22:33:44:55",  # Not an RPA
+        ]
+        ciphers = {IRK_A: get_cipher_for_irk(IRK_A), IRK_B: get_cipher_for_irk(IRK_B)}
+
+        expected = {
+            address: irk
+            for address in addresses
+            for irk, cipher in ciphers.items()
+            if resolve_private_address(cipher, address)
+        }
+        assert batch_resolve_private_addresses(ciphers, addresses) == expected
+        assert expected == {addresses[0]: IRK_A, addresses[1]: IRK_B, addresses[2]: IRK_A}
+
+    def test_nothing_to_resolve(self) -> None:
+        """No IRKs, no RPAs or malformed input give no matches."""
+        ciphers = {IRK_A: get_cipher_for_irk(IRK_A)}
+
+        assert batch_resolve_private_addresses({}, [_make_rpa(IRK_A, b"\x41\x02\x03")]) == {}
+        assert batch_resolve_private_addresses(ciphers, ["00:11:22:33:44:55", "not-a-mac"]) == {}
+
+
+class TestBatchedResolution:
+    """Tests for queue_mac / resolve_pending."""
+
+    def test_queue_mac_returns_cached_or_queues(self) -> None:
+        """Known MACs answer from the cache, new ones wait for the batch."""
+        manager = BermudaIrkManager()
+        manager._macs["AA:BB:CC:DD:EE:FF"] = ResolvableMAC("AA:BB:CC:DD:EE:FF", 9999999, IRK_A)
+
+        assert manager.queue_mac("AA:BB:CC:DD:EE:FF") == IRK_A
+        assert manager.queue_mac("55:AA:BB:CC:DD:EE") == IrkTypes.ADRESS_NOT_EVALUATED.value
+        assert manager.queue_mac("55:AA:BB:CC:DD:EE") == IrkTypes.ADRESS_NOT_EVALUATED.value
+        assert list(manager._pending) == ["55:AA:BB:CC:DD:EE"]
+
+    def test_resolve_pending_saves_results_and_fires_callbacks(self) -> None:
+        """Matches are saved and announced, misses keep the RPA / non-RPA distinction."""
+        manager = BermudaIrkManager()
+        manager.add_irk(IRK_A)
+        manager.add_irk(IRK_B)
+        manager.fire_callbacks = MagicMock()  # type: ignore[method-assign]
+        match_a = _make_rpa(IRK_A, b"\x41\x02\x03")
+        match_b = _make_rpa(IRK_B, b"\x62\x00\x01")
+
+        for address in (match_a, "55:AA:BB:CC:DD:EE", match_b, "00:11:22:33:44:55"):
+            manager.queue_mac(address)
+
+        assert manager.resolve_pending() == 2
+        assert manager._pending == {}
+        assert manager.check_mac(match_a) == IRK_A
+        assert manager.check_mac(match_b) == IRK_B
+        assert manager._macs["55:AA:BB:CC:DD:EE"].irk == IrkTypes.NO_KNOWN_IRK_MATCH.value
+        assert manager._macs["00:11:22:33:44:55"].irk == IrkTypes.NOT_RESOLVABLE_ADDRESS.value
+        manager.fire_callbacks.assert_any_call(IRK_A, match_a)
+        manager.fire_callbacks.assert_any_call(IRK_B, match_b)
+        assert manager.fire_callbacks.call_count == 2
+
+    def test_large_rescan_is_chunked(self) -> None:
+        """add_irk only checks one chunk now, resolve_pending works through the rest."""
+        manager = BermudaIrkManager()
+        manager.RESCAN_CHUNK_SIZE = 2
+        manager.fire_callbacks = MagicMock()  # type: ignore[method-assign]
+        unresolved = [f"55:AA:BB:CC:DD:{idx:02X}" for idx in range(4)]
+        late_match = _make_rpa(IRK_A, b"\x4c\x4c\x4c")
+        for address in [*unresolved, late_match]:
+            manager._update_saved_mac(address, IrkTypes.NO_KNOWN_IRK_MATCH.value)
+
+        assert manager.add_irk(IRK_A) == []
+        diagnostics = manager.get_diagnostics_no_redactions()["resolver"]
+        assert diagnostics["rescan_macs_remaining"] == 3
+        assert diagnostics["deferred_rescans"] == 1
+
+        # Two per cycle: the match is in the last chunk
+        assert manager.resolve_pending() == 0
+        assert manager.resolve_pending() == 1
+        assert manager._rescans == deque()
+        assert manager._macs[late_match].irk == IRK_A
+        manager.fire_callbacks.assert_called_once_with(IRK_A, late_match)
+
+    def test_diagnostics_include_resolver_stats(self) -> None:
+        """Batch counters are reported in diagnostics."""
+        manager = BermudaIrkManager()
+        manager.add_irk(IRK_A)
+        manager.fire_callbacks = MagicMock()  # type: ignore[method-assign]
+        manager.queue_mac(_make_rpa(IRK_A, b"\x41\x02\x03"))
+        manager.queue_mac("55:AA:BB:CC:DD:EE")
+        manager.resolve_pending()
+        manager.queue_mac("55:AA:BB:CC:DD:EF")
+
+        resolver = manager.get_diagnostics_no_redactions()["resolver"]
+
+        assert resolver["batches"] == 1
+        assert resolver["batched_macs"] == 2
+        assert resolver["batch_matches"] == 1
+        assert resolver["pending_macs"] == 1
+        assert resolver["rescan_macs_remaining"] == 0
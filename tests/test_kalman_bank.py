@@ -0,0 +1,116 @@
+"""Tests for the batched Kalman filter bank used for per-advert RSSI smoothing."""
+
+from __future__ import annotations
+
+import gc
+
+import pytest
+
+from custom_components.bermuda.filters import BankedKalmanFilter, KalmanFilter, KalmanFilterBank
+from custom_components.bermuda.filters import kalman_bank
+from custom_components.bermuda.filters.ukf_numpy import is_numpy_available
+
+READINGS = [
+    # (filter, rssi, ref_power, timestamp)
+    (0, -70.0, -59.0, 100.0),
+    (1, -85.0, -59.0, 100.2),
+    (2, -50.0, -45.0, None),
+    (0, -72.0, -59.0, 101.1),
+    (1, -83.0, -59.0, 101.0),
+    (2, -52.0, -45.0, None),
+    (0, -65.0, -59.0, 140.0),
+    (1, -95.0, 5.0, 102.5),  # invalid ref_power falls back to the default
+]
+
+
+def _reference(readings: list[tuple[int, float, float, float | None]]) -> list[KalmanFilter]:
+    filters = [KalmanFilter(process_noise=1.0, measurement_noise=10.0) for _ in range(3)]
+    for index, rssi, ref_power, stamp in readings:
+        filters[index].update_adaptive(rssi, ref_power, timestamp=stamp)
+    return filters
+
+
+@pytest.mark.parametrize(
+    "use_numpy",
+    [False, pytest.param(True, marks=pytest.mark.skipif(not is_numpy_available(), reason="NumPy not installed"))],
+)
+def test_batched_updates_match_kalman_filter(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:  # noqa: FBT001
+    """Queued readings give the same state as KalmanFilter.update_adaptive, batched when NumPy is used."""
+    monkeypatch.setattr(kalman_bank, "USE_NUMPY_IF_AVAILABLE", use_numpy)
+    bank = KalmanFilterBank()
+    views = [BankedKalmanFilter(bank, process_noise=1.0, measurement_noise=10.0) for _ in range(3)]
+
+    for index, rssi, ref_power, stamp in READINGS:
+        views[index].queue_adaptive(rssi, ref_power, timestamp=stamp)
+    # With NumPy the third round waits for a flush; without it readings apply at once.
+    assert bank.pending == (2 if use_numpy else 0)
+
+    expected = _reference(READINGS)
+    for view, reference in zip(views, expected, strict=True):
+        assert view.estimate == pytest.approx(reference.estimate, rel=1e-12)
+        assert view.variance == pytest.approx(reference.variance, rel=1e-12)
+        assert view.sample_count == reference.sample_count
+        assert view.last_update_time == reference.last_update_time
+        assert view.first_sample_stamp == reference.first_sample_stamp
+    assert bank.pending == 0
+    assert bank.batches == (3 if use_numpy else 0)
+    assert bank.batched_updates == (len(READINGS) if use_numpy else 0)
+
+
+def test_direct_updates_and_reset() -> None:
+    """Immediate updates behave like KalmanFilter, and reset also discards a queued reading."""
+    bank = KalmanFilterBank()
+    view = BankedKalmanFilter(bank, process_noise=1.0, measurement_noise=10.0)
+    reference = KalmanFilter(process_noise=1.0, measurement_noise=10.0)
+
+    assert not view.is_initialized
+    assert view.update(-70.0, timestamp=10.0) == reference.update(-70.0, timestamp=10.0)
+    assert view.update(-74.0, timestamp=12.0) == reference.update(-74.0, timestamp=12.0)
+    assert view.get_diagnostics() == reference.get_diagnostics()
+
+    view.queue_adaptive(-60.0, -59.0, timestamp=13.0)
+    assert view.sample_count == 3
+    view.reset()
+    assert bank.pending == 0
+    assert not view.is_initialized
+    assert view.sample_count == 0
+    assert view.last_update_time is None
+    assert view.variance == view.measurement_noise
+
+
+def test_released_slots_are_reused_fresh() -> None:
+    """A garbage-collected view returns its slot, and the next filter starts from scratch."""
+    bank = KalmanFilterBank()
+    keep = BankedKalmanFilter(bank)
+    gone = BankedKalmanFilter(bank, process_noise=2.0)
+    gone.queue_adaptive(-80.0, -59.0, timestamp=5.0)
+    del gone
+    gc.collect()
+    assert len(bank) == 1
+
+    reused = BankedKalmanFilter(bank, measurement_noise=7.0)
+
+    assert bank.to_dict()["capacity"] == 2
+    assert len(bank) == 2
+    assert not reused.is_initialized
+    assert reused.process_noise == keep.process_noise
+    assert reused.variance == 7.0
+
+
+@pytest.mark.skipif(not is_numpy_available(), reason="NumPy not installed")
+def test_failed_flush_leaves_bank_resizable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A vectorised step that raises must not keep the column arrays exported."""
+    monkeypatch.setattr(kalman_bank, "USE_NUMPY_IF_AVAILABLE", True)
+    bank = KalmanFilterBank()
+    views = [BankedKalmanFilter(bank) for _ in range(2)]
+    for view in views:
+        view.queue_adaptive(-70.0, -59.0, timestamp=1.0)
+    monkeypatch.setattr(kalman_bank, "ADAPTIVE_NOISE_SCALE_PER_10DB", "not a number")
+
+    # Hold on to the traceback (and its frames), as the coordinator's last_exception would.
+    with pytest.raises(TypeError) as failure:
+        bank.flush()
+
+    views.append(BankedKalmanFilter(bank))
+    assert len(bank) == 3
+    assert failure.traceback
@@ -0,0 +1,67 @@
+"""Tests for the BermudaLogSpamLess rate limiter."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.bermuda.log_spam_less import BermudaLogSpamLess
+
+CLOCK = "custom_components.bermuda.log_spam_less.monotonic_time_coarse"
+
+
+@pytest.fixture
+def logger() -> MagicMock:
+    """Logger mock with every level enabled."""
+    mock = MagicMock(spec=logging.Logger)
+    mock.isEnabledFor.return_value = True
+    return mock
+
+
+def test_suppresses_repeats_and_reports_count(logger: MagicMock) -> None:
+    """Repeats within the interval are suppressed and counted on the next emission."""
+    spamless = BermudaLogSpamLess(logger, 10)
+    with patch(CLOCK, return_value=100.0):
+        spamless.warning(("key", "aa:bb"), "msg %s", 1)
+        spamless.warning(("key", "aa:bb"), "msg %s", 2)
+        spamless.warning(("key", "aa:bb"), "msg %s", 3)
+    with patch(CLOCK, return_value=105.0):
+        spamless.warning(("key", "aa:bb"), "msg %s", 4)
+    with patch(CLOCK, return_value=111.0):
+        spamless.warning(("key", "aa:bb"), "msg %s", 5)
+
+    assert logger.log.call_args_list[0].args == (logging.WARNING, "msg %s", 1)
+    assert logger.log.call_args_list[1].args == (logging.WARNING, "msg %s (3 previous messages suppressed)", 5)
+    assert spamless.to_dict()["suppressed"] == 3
+    assert spamless.to_dict()["emitted"] == 2
+
+
+def test_disabled_level_skips_cache(logger: MagicMock) -> None:
+    """Messages for a disabled level never touch the key cache."""
+    logger.isEnabledFor.return_value = False
+    spamless = BermudaLogSpamLess(logger, 10)
+    spamless.debug(("meta", "aa:bb"), "msg")
+
+    logger.log.assert_not_called()
+    assert spamless.to_dict()["keys"] == 0
+
+
+def test_keys_are_per_instance_and_bounded(logger: MagicMock) -> None:
+    """Instances do not share keys; idle keys expire and the cache never exceeds max_keys."""
+    first = BermudaLogSpamLess(logger, 10, max_keys=2)
+    second = BermudaLogSpamLess(logger, 10)
+    with patch(CLOCK, return_value=100.0):
+        first.info("a", "msg")
+        first.info("b", "msg")
+        first.info("c", "msg")
+        second.info("a", "msg")
+    assert first.to_dict()["keys"] == 2
+    assert first.evicted == 1
+    assert logger.log.call_count == 4
+
+    with patch(CLOCK, return_value=120.0):
+        first.info("d", "msg")
+    assert first.expired == 2
+    assert first.to_dict()["keys"] == 1
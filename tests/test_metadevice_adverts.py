@@ -0,0 +1,49 @@
+"""Tests for the merged metadevice advert view."""
+
+from __future__ import annotations
+
+from custom_components.bermuda.metadevice_adverts import MetadeviceAdverts
+
+
+def test_view_presents_sources_without_copying() -> None:
+    """Source adverts appear through the view and track changes to the source dicts."""
+    source_a = {("aa", "s1"): "a1"}
+    source_b = {("bb", "s1"): "b1", ("bb", "s2"): "b2"}
+    view = MetadeviceAdverts({("meta", "s1"): "m1"})
+    view.set_sources({"aa": source_a, "bb": source_b})
+
+    assert len(view) == 4
+    assert view[("bb", "s2")] == "b2"
+    assert ("aa", "s1") in view
+    assert ("aa", "s2") not in view
+    assert sorted(view.values()) == ["a1", "b1", "b2", "m1"]
+    assert dict(view.items())[("meta", "s1")] == "m1"
+
+    source_a[("aa", "s2")] = "a2"
+    assert view[("aa", "s2")] == "a2"
+    assert len(list(view.keys())) == 5
+
+
+def test_writes_go_to_own_adverts() -> None:
+    """Source entries are read-only; writes and deletes apply to the metadevice's own adverts."""
+    source = {("aa", "s1"): "a1"}
+    own: dict = {}
+    view = MetadeviceAdverts(own)
+    view.set_sources({"aa": source})
+
+    view[("meta", "s1")] = "m1"
+    assert own == {("meta", "s1"): "m1"}
+    del view[("meta", "s1")]
+    assert not own
+    assert source == {("aa", "s1"): "a1"}
+
+
+def test_discard_sources() -> None:
+    """Discarded sources (and any own copies of their adverts) leave the view."""
+    view = MetadeviceAdverts({("aa", "s1"): "stale", ("meta", "s1"): "m1"})
+    view.set_sources({"aa": {("aa", "s2"): "a2"}, "bb": {("bb", "s1"): "b1"}})
+
+    view.discard_sources({"aa"})
+
+    assert sorted(view) == [("bb", "s1"), ("meta", "s1")]
+    assert not view.get(("aa", "s2"))
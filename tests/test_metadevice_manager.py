@@ -571,6 +571,54 @@ class TestUpdateMetadevices:
         # Source should have been removed from the list
         assert "source:address" not in source_list
 
+    def test_propagates_identity_fields_only_when_source_changed(self) -> None:
+        """Names fill gaps and beacon fields overwrite, once per source identity_version."""
+        mock_source = MagicMock()
+        mock_source.address = "source:address"
+        mock_source.adverts = {}
+        mock_source.last_seen = 100.0
+        mock_source.ref_power = 0
+        mock_source.identity_version = 1
+        mock_source.name_bt_local_name = "Tag"
+        mock_source.name_bt_serviceinfo = None
+        mock_source.manufacturer = "Acme"
+        mock_source.beacon_major = None
+        mock_source.beacon_minor = None
+        mock_source.beacon_power = -59
+        mock_source.beacon_unique_id = None
+        mock_source.beacon_uuid = None
+
+        mock_metadevice = MagicMock()
+        mock_metadevice.address = "meta_addr"
+        mock_metadevice.metadevice_sources = ["source:address"]
+        mock_metadevice.metadevice_type = set()
+        mock_metadevice.adverts = {}
+        mock_metadevice.last_seen = 0.0
+        mock_metadevice.ref_power = 0
+        mock_metadevice.name_bt_local_name = None
+        mock_metadevice.name_bt_serviceinfo = None
+        mock_metadevice.manufacturer = "Existing"
+        mock_metadevice.beacon_power = None
+
+        manager = self._create_manager(metadevices={"meta_addr": mock_metadevice})
+        manager.coordinator._get_device = MagicMock(return_value=mock_source)
+
+        manager.update_metadevices()
+
+        assert mock_metadevice.name_bt_local_name == "Tag"
+        assert mock_metadevice.manufacturer == "Existing"
+        assert mock_metadevice.beacon_power == -59
+        mock_metadevice.make_name.assert_called_once()
+
+        # Unchanged source: nothing is re-read.
+        mock_metadevice.beacon_power = None
+        manager.update_metadevices()
+        assert mock_metadevice.beacon_power is None
+
+        mock_source.identity_version = 2
+        manager.update_metadevices()
+        assert mock_metadevice.beacon_power == -59
+
 
 class TestAggregateSourceDataToMetadevices:
     """Tests for aggregate_source_data_to_metadevices method."""
@@ -0,0 +1,117 @@
+"""Tests for the time-ordered prune index."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from custom_components.bermuda.const import (
+    BDADDR_TYPE_NOT_MAC48,
+    BDADDR_TYPE_OTHER,
+    BDADDR_TYPE_RANDOM_RESOLVABLE,
+)
+from custom_components.bermuda.prune_index import BUCKET_RPA, BUCKET_STATIC, PruneIndex, prune_bucket
+
+
+class FakeDevice:
+    """Minimal device carrying the fields the index reads."""
+
+    def __init__(self, address_type: str, last_seen: float) -> None:
+        self.address_type = address_type
+        self.last_seen = last_seen
+
+
+def _devices(**stamps: tuple[str, float]) -> dict[str, Any]:
+    return {address: FakeDevice(address_type, stamp) for address, (address_type, stamp) in stamps.items()}
+
+
+def test_prune_bucket() -> None:
+    """Address types map to their pruning bucket; non-MAC48 is never pruned by age."""
+    assert prune_bucket(BDADDR_TYPE_RANDOM_RESOLVABLE) == BUCKET_RPA
+    assert prune_bucket(BDADDR_TYPE_OTHER) == BUCKET_STATIC
+    assert prune_bucket(BDADDR_TYPE_NOT_MAC48) is None
+
+
+class TestPruneIndex:
+    """Tests for PruneIndex."""
+
+    def test_expired_returns_only_stale_entries_oldest_first(self) -> None:
+        """Only devices last seen before the cutoff are returned, per bucket."""
+        devices = _devices(
+            a=(BDADDR_TYPE_OTHER, 50.0),
+            b=(BDADDR_TYPE_OTHER, 10.0),
+            c=(BDADDR_TYPE_OTHER, 500.0),
+            r=(BDADDR_TYPE_RANDOM_RESOLVABLE, 20.0),
+            m=(BDADDR_TYPE_NOT_MAC48, 0.0),
+        )
+        index = PruneIndex()
+        index.sync(devices)
+
+        assert len(index) == 4
+        assert index.expired(BUCKET_STATIC, 100.0, devices) == ["b", "a"]
+        assert index.expired(BUCKET_RPA, 100.0, devices) == ["r"]
+        # Entries are kept until removed()
+        assert index.expired(BUCKET_STATIC, 100.0, devices) == ["b", "a"]
+
+    def test_seen_devices_are_refreshed_lazily(self) -> None:
+        """A device seen since it was indexed is re-pushed, not reported as expired."""
+        devices = _devices(a=(BDADDR_TYPE_OTHER, 10.0), b=(BDADDR_TYPE_OTHER, 20.0))
+        index = PruneIndex()
+        index.sync(devices)
+
+        devices["a"].last_seen = 200.0
+        assert index.expired(BUCKET_STATIC, 100.0, devices) == ["b"]
+        assert index.refreshed == 1
+        assert index.expired(BUCKET_STATIC, 300.0, devices) == ["b", "a"]
+
+    def test_sync_indexes_new_devices_and_removed_forgets(self) -> None:
+        """New devices at the tail are indexed; removed devices drop out."""
+        devices = _devices(a=(BDADDR_TYPE_OTHER, 10.0))
+        index = PruneIndex()
+        index.sync(devices)
+
+        devices["b"] = FakeDevice(BDADDR_TYPE_OTHER, 5.0)
+        index.sync(devices)
+        assert index.expired(BUCKET_STATIC, 100.0, devices) == ["b", "a"]
+
+        del devices["b"]
+        index.removed("b")
+        index.sync(devices)
+        assert index.expired(BUCKET_STATIC, 100.0, devices) == ["a"]
+        assert index.rebuilds == 0
+
+        # Removal behind the index's back forces a rebuild
+        del devices["a"]
+        index.sync(devices)
+        assert index.rebuilds == 1
+        assert len(index) == 0
+
+    def test_oldest_merges_buckets_with_cutoffs(self) -> None:
+        """The overflow path takes the least recently seen accepted devices across buckets."""
+        devices = _devices(
+            s1=(BDADDR_TYPE_OTHER, 30.0),
+            s2=(BDADDR_TYPE_OTHER, 60.0),
+            s3=(BDADDR_TYPE_OTHER, 90.0),
+            r1=(BDADDR_TYPE_RANDOM_RESOLVABLE, 20.0),
+            r2=(BDADDR_TYPE_RANDOM_RESOLVABLE, 70.0),
+        )
+        index = PruneIndex()
+        index.sync(devices)
+
+        # r2 is newer than the RPA cutoff and s1 is rejected by the predicate
+        chosen = index.oldest(devices, 3, {BUCKET_RPA: 50.0}, lambda address: address != "s1")
+        assert chosen == ["r1", "s2", "s3"]
+        # Everything stays indexed
+        assert index.oldest(devices, 10, {}, lambda _address: True) == ["r1", "s1", "s2", "r2", "s3"]
+
+    def test_diagnostics(self) -> None:
+        """Diagnostics summarise index size and maintenance counters."""
+        devices = _devices(a=(BDADDR_TYPE_OTHER, 10.0), r=(BDADDR_TYPE_RANDOM_RESOLVABLE, 10.0))
+        index = PruneIndex()
+        index.sync(devices)
+
+        assert index.to_dict() == {
+            "indexed": 2,
+            "heap_entries": {BUCKET_RPA: 1, BUCKET_STATIC: 1},
+            "rebuilds": 0,
+            "refreshed": 0,
+        }
@@ -0,0 +1,122 @@
+"""Tests for the sensor publishing policy."""
+
+from __future__ import annotations
+
+from custom_components.bermuda.const import (
+    CONF_DISTANCE_DEADBAND,
+    CONF_PUBLISH_MAX_SILENCE,
+    CONF_RSSI_DEADBAND,
+    CONF_STATIONARY_BACKOFF,
+    DEFAULT_DISTANCE_DEADBAND,
+    DEFAULT_PUBLISH_MAX_SILENCE,
+    DEFAULT_STATIONARY_BACKOFF,
+    DISTANCE_RELATIVE_DEADBAND,
+)
+from custom_components.bermuda.publish_policy import (
+    POLICY_DISTANCE,
+    POLICY_INTERVAL,
+    POLICY_RSSI,
+    POLICY_SCANNER_DISTANCE,
+    PublishPolicy,
+    get_publish_policy,
+)
+
+
+def _policy(**kwargs: float) -> PublishPolicy:
+    settings = {"abs_deadband": 0.1, "rel_deadband": 0.05, "max_silence": 300.0, "max_backoff": 8.0}
+    settings.update(kwargs)
+    return PublishPolicy(**settings)
+
+
+class TestPublishPolicy:
+    """Tests for PublishPolicy decisions."""
+
+    def test_deadband_uses_larger_of_absolute_and_relative(self) -> None:
+        """The relative deadband dominates for large values, the absolute one for small."""
+        policy = _policy()
+
+        assert not policy.exceeds_deadband(1.05, 1.0)
+        assert policy.exceeds_deadband(1.1, 1.0)
+        assert not policy.exceeds_deadband(10.4, 10.0)
+        assert policy.exceeds_deadband(10.5, 10.0)
+
+    def test_interval_applies_to_significant_changes(self) -> None:
+        """Significant changes wait for the interval unless a fast path applies."""
+        policy = _policy()
+
+        assert not policy.should_publish(6.0, 5.0, 5.0, 10.0, fast_falling=False, fast_rising=False)
+        assert policy.should_publish(6.0, 5.0, 11.0, 10.0, fast_falling=False, fast_rising=False)
+        assert policy.should_publish(6.0, 5.0, 1.0, 10.0, fast_falling=False, fast_rising=True)
+        assert policy.should_publish(4.0, 5.0, 1.0, 10.0, fast_falling=True, fast_rising=False)
+        assert not policy.should_publish(6.0, 5.0, 1.0, 10.0, fast_falling=True, fast_rising=False)
+
+    def test_heartbeat_inside_deadband(self) -> None:
+        """Values inside the deadband are only published after max_silence."""
+        policy = _policy(max_silence=60.0)
+
+        assert not policy.should_publish(5.1, 5.0, 59.0, 10.0, fast_falling=True, fast_rising=True)
+        assert policy.should_publish(5.1, 5.0, 60.0, 10.0, fast_falling=False, fast_rising=False)
+
+    def test_backoff_doubles_while_stationary_and_caps(self) -> None:
+        """Back-off doubles per publication while stationary, up to max_backoff."""
+        policy = _policy(max_backoff=4.0)
+
+        assert policy.next_backoff(1.0, stationary=True) == 2.0
+        assert policy.next_backoff(2.0, stationary=True) == 4.0
+        assert policy.next_backoff(4.0, stationary=True) == 4.0
+        assert policy.next_backoff(4.0, stationary=False) == 1.0
+
+    def test_backoff_disabled(self) -> None:
+        """A max_backoff of 1 disables back-off."""
+        policy = _policy(max_backoff=1.0)
+
+        assert policy.next_backoff(1.0, stationary=True) == 1.0
+
+
+class TestGetPublishPolicy:
+    """Tests for building policies from options."""
+
+    def test_defaults(self) -> None:
+        """Empty options give the default distance policy."""
+        policy = get_publish_policy(POLICY_DISTANCE, {})
+
+        assert policy.abs_deadband == DEFAULT_DISTANCE_DEADBAND
+        assert policy.rel_deadband == DISTANCE_RELATIVE_DEADBAND
+        assert policy.max_silence == DEFAULT_PUBLISH_MAX_SILENCE
+        assert policy.max_backoff == DEFAULT_STATIONARY_BACKOFF
+
+    def test_options_per_sensor_class(self) -> None:
+        """Distance and RSSI deadbands come from their own options."""
+        options = {
+            CONF_DISTANCE_DEADBAND: 0.5,
+            CONF_RSSI_DEADBAND: 3,
+            CONF_PUBLISH_MAX_SILENCE: 120,
+            CONF_STATIONARY_BACKOFF: 0,
+        }
+
+        distance = get_publish_policy(POLICY_DISTANCE, options)
+        rssi = get_publish_policy(POLICY_RSSI, options)
+        interval = get_publish_policy(POLICY_INTERVAL, options)
+
+        assert distance.abs_deadband == 0.5
+        assert rssi.abs_deadband == 3.0
+        assert rssi.rel_deadband == 0.0
+        assert interval.rel_deadband > 0
+        assert distance.max_silence == 120.0
+        # Back-off multiplier never drops below 1
+        assert distance.max_backoff == 1.0
+
+    def test_scanner_distance_policy(self) -> None:
+        """Per-scanner ranges use the absolute distance deadband only and never back off."""
+        options = {CONF_DISTANCE_DEADBAND: 0.5, CONF_STATIONARY_BACKOFF: 8}
+
+        policy = get_publish_policy(POLICY_SCANNER_DISTANCE, options)
+
+        assert policy.abs_deadband == 0.5
+        assert policy.rel_deadband == 0.0
+        assert policy.max_backoff == 1.0
+        assert get_publish_policy(POLICY_DISTANCE, options).max_backoff == 8.0
+
+    def test_policies_are_shared(self) -> None:
+        """Identical settings return the same policy object."""
+        assert get_publish_policy(POLICY_RSSI, {}) is get_publish_policy(POLICY_RSSI, {})
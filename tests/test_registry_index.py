@@ -0,0 +1,64 @@
+"""Tests for the device/entity registry reverse indexes."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.bermuda.registry_index import RegistryIndex
+
+
+def _entry(entity_id: str, unique_id: str | None) -> SimpleNamespace:
+    return SimpleNamespace(entity_id=entity_id, unique_id=unique_id)
+
+
+class TestRegistryIndex:
+    """Tests for RegistryIndex."""
+
+    def test_device_for_entry_validates_device(self) -> None:
+        """Stale entry_ids (pruned or re-pointed devices) are dropped on lookup."""
+        index = RegistryIndex()
+        device = SimpleNamespace(entry_id="entry-1")
+        devices = {"aa:bb:cc:dd:ee:ff": device}
+        index.set_device_entry("aa:bb:cc:dd:ee:ff", None, "entry-1")
+
+        assert index.device_for_entry("entry-1", devices) is device
+        assert index.device_for_entry("entry-2", devices) is None
+
+        device.entry_id = "entry-2"
+        assert index.device_for_entry("entry-1", devices) is None
+        assert index.to_dict()["device_entries"] == 0
+
+    def test_entities_with_prefix(self) -> None:
+        """Prefix queries return every matching entity, including shared unique_ids across platforms."""
+        index = RegistryIndex()
+        index.rebuild_entities(
+            [
+                _entry("sensor.tag_area", "fmdn:abc"),
+                _entry("device_tracker.tag", "fmdn:abc"),
+                _entry("sensor.tag_range", "fmdn:abc_range"),
+                _entry("sensor.other", "fmdn:abd_range"),
+                _entry("sensor.no_unique", None),
+            ]
+        )
+
+        assert {entity_id for _uid, entity_id in index.entities_with_prefix("fmdn:abc")} == {
+            "sensor.tag_area",
+            "device_tracker.tag",
+            "sensor.tag_range",
+        }
+        assert index.entities_with_prefix("fmdn:zzz") == []
+
+    def test_add_and_discard_entities(self) -> None:
+        """Registry events add, re-point and remove entities."""
+        index = RegistryIndex()
+        index.rebuild_entities([])
+        index.add_entity("aa:bb_range", "sensor.a")
+        index.add_entity("aa:bb_rssi", "sensor.a")  # unique_id changed
+        index.add_entity("aa:bb_floor", "sensor.b")
+
+        assert index.entities_with_prefix("aa:bb") == [("aa:bb_floor", "sensor.b"), ("aa:bb_rssi", "sensor.a")]
+
+        index.discard_entity("sensor.a")
+        index.discard_entity("sensor.unknown")
+        assert index.entities_with_prefix("aa:bb") == [("aa:bb_floor", "sensor.b")]
+        assert index.to_dict() == {"device_entries": 0, "entities": 1, "entities_built": True, "rebuilds": 1}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 import pytest
+from bluetooth_data_tools import monotonic_time_coarse
 
 from custom_components.bermuda.filters import (
     CALIBRATION_MIN_PAIRS,
@@ -333,6 +334,26 @@ class MockDevice:
         self.ref_power = ref_power
 
 
+def run_calibration_cycles(
+    manager: ScannerCalibrationManager,
+    scanner_list: set[str],
+    devices: dict[str, Any],
+    cycles: int,
+) -> dict[str, float]:
+    """Simulate coordinator cycles: ingest every advert with a fresh stamp, then calibrate."""
+    base = monotonic_time_coarse()
+    offsets: dict[str, float] = {}
+    for cycle in range(cycles):
+        # The coordinator refreshes the MAC lookup during calibration; do it up
+        # front so the first cycle's adverts are indexed as well.
+        manager.refresh_scanner_macs(scanner_list, devices)
+        for device in devices.values():
+            for (sender, receiver), advert in device.adverts.items():
+                manager.record_scanner_advert(sender, receiver, advert.rssi, base + cycle)
+        offsets = update_scanner_calibration(manager, scanner_list, devices)
+    return offsets
+
+
 class TestUpdateScannerCalibration:
     """Test the update_scanner_calibration function."""
 
@@ -444,8 +465,7 @@ class TestUpdateScannerCalibration:
         }
 
         # Need to call update_scanner_calibration more times for confidence threshold
-        for _ in range(150):
-            offsets = update_scanner_calibration(manager, scanner_list, devices)
+        offsets = run_calibration_cycles(manager, scanner_list, devices, 150)
 
         assert "aa:aa:aa:aa:aa:aa" in offsets
         assert "bb:bb:bb:bb:bb:bb" in offsets
@@ -515,8 +535,7 @@ class TestUpdateScannerCalibration:
         }
 
         # Need more iterations for confidence threshold
-        for _ in range(150):
-            offsets = update_scanner_calibration(manager, scanner_list, devices)
+        offsets = run_calibration_cycles(manager, scanner_list, devices, 150)
 
         # Should still work with raw RSSI fallback
         assert "aa:aa:aa:aa:aa:aa" in offsets
@@ -587,8 +606,7 @@ class TestUpdateScannerCalibration:
         }
 
         # Need more iterations for confidence threshold
-        for _ in range(150):
-            offsets = update_scanner_calibration(manager, scanner_list, devices)
+        offsets = run_calibration_cycles(manager, scanner_list, devices, 150)
 
         # Should find cross-visibility via metadevice_sources
         assert "aa:aa:aa:aa:aa:aa" in offsets
@@ -1069,8 +1087,7 @@ class TestEdgeCases:
         }
 
         # Need to call more times to accumulate enough samples for confidence threshold
-        for _ in range(150):
-            offsets = update_scanner_calibration(manager, scanner_list, devices)
+        offsets = run_calibration_cycles(manager, scanner_list, devices, 150)
 
         assert offsets.get("aa:aa:aa:aa:aa:aa") == 0
         assert offsets.get("bb:bb:bb:bb:bb:bb") == 0
@@ -1315,8 +1332,7 @@ class TestUpdateScannerCalibrationTxPower:
         }
 
         # Need enough samples for calibration
-        for _ in range(CALIBRATION_MIN_SAMPLES):
-            update_scanner_calibration(manager, scanner_list, devices)
+        run_calibration_cycles(manager, scanner_list, devices, CALIBRATION_MIN_SAMPLES)
 
         # Check that pair has correct TX-corrected difference
         pair = manager.scanner_pairs[("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb")]
@@ -1380,3 +1396,169 @@ class TestLowConfidenceRemovesPreviousSuggestion:
         old_count = len(manager.suggested_offsets)
         manager.suggested_offsets.pop("aa:aa", None)
         assert len(manager.suggested_offsets) == old_count - 1
+
+
+class TestCrossVisibilityIndex:
+    """Test the ingest-time cross-visibility index."""
+
+    def test_mac_lookup_rebuilt_only_on_topology_change(self) -> None:
+        """Test that the MAC lookup is only rebuilt when scanners or their MACs change."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        devices: dict[str, Any] = {
+            "aa:aa:aa:aa:aa:aa": MockDevice("aa:aa:aa:aa:aa:aa"),
+            "bb:bb:bb:bb:bb:bb": MockDevice("bb:bb:bb:bb:bb:bb"),
+        }
+
+        assert manager.refresh_scanner_macs(scanner_list, devices) is True
+        assert manager.refresh_scanner_macs(scanner_list, devices) is False
+
+        # Scanner starts broadcasting an iBeacon from a new MAC
+        devices["bb:bb:bb:bb:bb:bb"].metadevice_sources.append("ee:ee:ee:ee:ee:ee")
+        assert manager.refresh_scanner_macs(scanner_list, devices) is True
+        assert manager.mac_to_scanner["ee:ee:ee:ee:ee:ee"] == "bb:bb:bb:bb:bb:bb"
+
+        # New scanner
+        scanner_list.add("cc:cc:cc:cc:cc:cc")
+        assert manager.refresh_scanner_macs(scanner_list, devices) is True
+        assert manager.mac_to_scanner["cc:cc:cc:cc:cc:cc"] == "cc:cc:cc:cc:cc:cc"
+
+    def test_record_maps_source_mac_to_scanner(self) -> None:
+        """Test that adverts from a scanner's iBeacon MAC are attributed to the scanner."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        devices: dict[str, Any] = {
+            "aa:aa:aa:aa:aa:aa": MockDevice("aa:aa:aa:aa:aa:aa"),
+            "bb:bb:bb:bb:bb:bb": MockDevice("bb:bb:bb:bb:bb:bb", metadevice_sources=["ee:ee:ee:ee:ee:ee"]),
+        }
+        manager.refresh_scanner_macs(scanner_list, devices)
+
+        assert manager.record_scanner_advert("ee:ee:ee:ee:ee:ee", "aa:aa:aa:aa:aa:aa", -60.0, 100.0)
+        assert manager.pending_visibility == {("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"): (-60.0, 100.0)}
+
+    def test_record_ignores_non_scanner_adverts(self) -> None:
+        """Test that ordinary devices, self-sightings and missing RSSI are not indexed."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        manager.refresh_scanner_macs(scanner_list, {})
+
+        assert not manager.record_scanner_advert("11:22:33:44:55:66", "aa:aa:aa:aa:aa:aa", -60.0, 100.0)
+        assert not manager.record_scanner_advert("aa:aa:aa:aa:aa:aa", "aa:aa:aa:aa:aa:aa", -60.0, 100.0)
+        assert not manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", None, 100.0)
+        assert not manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "99:99:99:99:99:99", -60.0, 100.0)
+        assert manager.pending_visibility == {}
+
+    def test_redelivered_advert_not_counted_twice(self) -> None:
+        """Test that only adverts with a newer stamp produce calibration samples."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        manager.refresh_scanner_macs(scanner_list, {})
+        stamp = monotonic_time_coarse()
+
+        assert manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -60.0, stamp)
+        assert manager.apply_pending_visibility() == 1
+        # Same advert delivered again on the next cycle: no new data
+        assert not manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -60.0, stamp)
+        assert manager.apply_pending_visibility() == 0
+
+        pair = manager.scanner_pairs[("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb")]
+        assert pair.sample_count_ab == 1
+        assert pair.last_update_ab == stamp
+
+    def test_only_latest_sample_per_pair_applied(self) -> None:
+        """Test that multiple sightings between calibration runs fold into one update."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        manager.refresh_scanner_macs(scanner_list, {})
+        stamp = monotonic_time_coarse()
+
+        manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -60.0, stamp)
+        manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -62.0, stamp + 1)
+        manager.record_scanner_advert("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb", -70.0, stamp + 1)
+
+        assert manager.apply_pending_visibility() == 2
+        pair = manager.scanner_pairs[("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb")]
+        assert pair.rssi_history_ab == [-62.0]
+        assert pair.rssi_history_ba == [-70.0]
+
+    def test_removed_scanner_dropped_from_index(self) -> None:
+        """Test that pending sightings for a removed scanner are discarded."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        manager.refresh_scanner_macs(scanner_list, {})
+        manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -60.0, 100.0)
+
+        manager.refresh_scanner_macs({"aa:aa:aa:aa:aa:aa"}, {})
+
+        assert manager.pending_visibility == {}
+        assert "bb:bb:bb:bb:bb:bb" not in manager.mac_to_scanner
+
+
+class TestIncrementalOffsets:
+    """Test change-driven recomputation of suggested offsets."""
+
+    @staticmethod
+    def _feed(manager: ScannerCalibrationManager, nowstamp: float, rounds: int = 150) -> None:
+        """Feed consistent data where A receives 5 dB stronger than B, C and D."""
+        for i in range(rounds):
+            for other in ("bb:bb", "cc:cc", "dd:dd"):
+                manager.update_cross_visibility("aa:aa", other, -55.0, timestamp=nowstamp + i)
+                manager.update_cross_visibility(other, "aa:aa", -65.0, timestamp=nowstamp + i)
+            manager.update_cross_visibility("bb:bb", "cc:cc", -60.0, timestamp=nowstamp + i)
+            manager.update_cross_visibility("cc:cc", "bb:bb", -60.0, timestamp=nowstamp + i)
+
+    def test_unchanged_scanners_not_recomputed(self) -> None:
+        """Test that only scanners with new pair data are recomputed."""
+        manager = ScannerCalibrationManager()
+        nowstamp = 1000.0
+        self._feed(manager, nowstamp)
+        offsets = manager.calculate_suggested_offsets(nowstamp=nowstamp + 150)
+        assert offsets["aa:aa"] == -5
+
+        # Tamper with a stored result: with no new data nothing is recomputed
+        manager.offset_confidence["dd:dd"] = 0.0
+        manager.calculate_suggested_offsets(nowstamp=nowstamp + 151)
+        assert manager.offset_confidence["dd:dd"] == 0.0
+
+        # New sample on B <-> C only touches B and C
+        manager.offset_confidence["bb:bb"] = 0.0
+        manager.update_cross_visibility("bb:bb", "cc:cc", -60.0, timestamp=nowstamp + 152)
+        manager.calculate_suggested_offsets(nowstamp=nowstamp + 152)
+        assert manager.offset_confidence["bb:bb"] > 0.0
+        assert manager.offset_confidence["dd:dd"] == 0.0
+
+    def test_offline_transition_recomputes_partners(self) -> None:
+        """Test that a scanner going offline triggers recomputation of its partners."""
+        manager = ScannerCalibrationManager()
+        nowstamp = 1000.0
+        self._feed(manager, nowstamp)
+        manager.calculate_suggested_offsets(nowstamp=nowstamp + 150)
+        confidence_before = manager.offset_confidence["bb:bb"]
+
+        # Keep everything but A alive, then let A time out
+        later = nowstamp + 150 + CALIBRATION_SCANNER_TIMEOUT
+        for addr in ("bb:bb", "cc:cc", "dd:dd"):
+            manager.scanner_last_seen[addr] = later
+        manager._dirty_scanners.clear()
+        manager.calculate_suggested_offsets(nowstamp=later)
+
+        # B lost its A pair, so its confidence was recomputed from B <-> C only
+        assert manager.offset_confidence["bb:bb"] != confidence_before
+
+    def test_offset_interval_throttles_recomputation(self) -> None:
+        """Test that update_scanner_calibration only recomputes offsets at the configured interval."""
+        manager = ScannerCalibrationManager()
+        scanner_list = {"aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb"}
+        manager.refresh_scanner_macs(scanner_list, {})
+        stamp = monotonic_time_coarse()
+
+        update_scanner_calibration(manager, scanner_list, {}, offset_interval=3600)
+        first_stamp = manager.last_offsets_stamp
+        assert first_stamp is not None
+
+        # Samples are still folded in between recomputations
+        manager.record_scanner_advert("bb:bb:bb:bb:bb:bb", "aa:aa:aa:aa:aa:aa", -60.0, stamp)
+        update_scanner_calibration(manager, scanner_list, {}, offset_interval=3600)
+        assert manager.last_offsets_stamp == first_stamp
+        assert manager.scanner_pairs[("aa:aa:aa:aa:aa:aa", "bb:bb:bb:bb:bb:bb")].sample_count_ab == 1
+        assert "aa:aa:aa:aa:aa:aa" in manager._dirty_scanners
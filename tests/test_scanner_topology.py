@@ -0,0 +1,143 @@
+"""Tests for the scanner topology index used by area selection."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.bermuda.area_selection import AreaSelectionHandler
+from custom_components.bermuda.scanner_topology import ScannerTopology
+
+
+class FakeAreaRegistry:
+    """Area registry stand-in that counts lookups."""
+
+    def __init__(self, areas: list[SimpleNamespace]) -> None:
+        self.areas = {area.id: area for area in areas}
+        self.get_calls = 0
+        self.list_calls = 0
+
+    def async_get_area(self, area_id: str) -> SimpleNamespace | None:
+        self.get_calls += 1
+        return self.areas.get(area_id)
+
+    def async_list_areas(self) -> list[SimpleNamespace]:
+        self.list_calls += 1
+        return list(self.areas.values())
+
+
+def _area(area_id: str, name: str, floor_id: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(id=area_id, name=name, floor_id=floor_id)
+
+
+class FakeScanner:
+    """Hashable scanner stand-in (scanners are kept in a set)."""
+
+    def __init__(self, address: str, area_id: str | None, last_seen: float) -> None:
+        self.address = address
+        self.area_id = area_id
+        self.last_seen = last_seen
+
+
+def _scanner(address: str, area_id: str | None, last_seen: float = 0.0) -> FakeScanner:
+    return FakeScanner(address, area_id, last_seen)
+
+
+def _registry() -> FakeAreaRegistry:
+    return FakeAreaRegistry(
+        [
+            _area("kitchen", "Kitchen", "ground"),
+            _area("storage", "Storage", "basement"),
+        ]
+    )
+
+
+class TestScannerTopology:
+    """Tests for ScannerTopology."""
+
+    def test_rebuild_indexes_areas_and_scanners(self) -> None:
+        """Scanners are grouped by area and registry data is cached."""
+        registry = _registry()
+        scanners: set[Any] = {_scanner("s1", "kitchen"), _scanner("s2", "kitchen")}
+        topology = ScannerTopology().ensure(scanners, registry)  # type: ignore[arg-type]
+
+        assert topology.area_has_scanner("kitchen")
+        assert not topology.area_has_scanner("storage")
+        assert {s.address for s in topology.scanners_in_area("kitchen")} == {"s1", "s2"}
+        assert topology.scannerless_areas == frozenset({"storage"})
+        assert topology.floor_id_for_area("storage", registry) == "basement"  # type: ignore[arg-type]
+        assert topology.area_name("kitchen", registry) == "Kitchen"  # type: ignore[arg-type]
+        # Everything came from the single list call
+        assert registry.get_calls == 0
+
+    def test_ensure_only_rebuilds_when_needed(self) -> None:
+        """The index is reused until invalidated or the scanner count changes."""
+        registry = _registry()
+        scanners: set[Any] = {_scanner("s1", "kitchen")}
+        topology = ScannerTopology()
+
+        topology.ensure(scanners, registry)  # type: ignore[arg-type]
+        topology.ensure(scanners, registry)  # type: ignore[arg-type]
+        assert topology.rebuilds == 1
+
+        scanners.add(_scanner("s2", "storage"))
+        topology.ensure(scanners, registry)  # type: ignore[arg-type]
+        assert topology.rebuilds == 2
+        assert topology.area_has_scanner("storage")
+
+        topology.invalidate()
+        topology.ensure(scanners, registry)  # type: ignore[arg-type]
+        assert topology.rebuilds == 3
+
+    def test_unindexed_area_looked_up_once(self) -> None:
+        """Areas created after the last rebuild are fetched once and cached."""
+        registry = _registry()
+        topology = ScannerTopology().ensure(set(), registry)  # type: ignore[arg-type]
+        registry.areas["attic"] = _area("attic", "Attic", "top")
+
+        assert topology.floor_id_for_area("attic", registry) == "top"  # type: ignore[arg-type]
+        assert topology.area_name("attic", registry) == "Attic"  # type: ignore[arg-type]
+        assert topology.area_name("missing", registry) is None  # type: ignore[arg-type]
+        assert topology.area_name("missing", registry) is None  # type: ignore[arg-type]
+        assert registry.get_calls == 2
+
+    def test_no_registry(self) -> None:
+        """Without an area registry only scanner-derived data is available."""
+        topology = ScannerTopology().ensure({_scanner("s1", "kitchen")}, None)  # type: ignore[arg-type]
+
+        assert topology.area_has_scanner("kitchen")
+        assert topology.floor_id_for_area("kitchen", None) is None
+        assert topology.area_name("kitchen", None) is None
+
+
+class TestAreaSelectionUsesTopology:
+    """AreaSelectionHandler registry helpers are served from the index."""
+
+    def test_helpers_read_from_index(self) -> None:
+        """Repeated lookups hit the registry list once and never walk it again."""
+        registry = _registry()
+        coordinator = SimpleNamespace(_scanners={_scanner("s1", "kitchen", last_seen=100.0)}, ar=registry, devices={})
+        handler = AreaSelectionHandler(coordinator)  # type: ignore[arg-type]
+
+        for _ in range(5):
+            assert handler._area_has_scanner("kitchen")
+            assert not handler._area_has_scanner("storage")
+            assert handler._resolve_floor_id_for_area("storage") == "basement"
+            assert handler.resolve_area_name("kitchen") == "Kitchen"
+            assert handler._area_has_active_scanner("kitchen", nowstamp=110.0)
+
+        assert registry.list_calls == 1
+        assert registry.get_calls == 0
+
+    def test_scanner_area_change_after_invalidate(self) -> None:
+        """Moving a scanner to another area is picked up after invalidation."""
+        scanner = _scanner("s1", "kitchen")
+        coordinator = SimpleNamespace(_scanners={scanner}, ar=_registry(), devices={})
+        handler = AreaSelectionHandler(coordinator)  # type: ignore[arg-type]
+        assert handler._area_has_scanner("kitchen")
+
+        scanner.area_id = "storage"
+        handler.topology.invalidate()
+
+        assert not handler._area_has_scanner("kitchen")
+        assert handler._area_has_scanner("storage")
@@ -17,6 +17,7 @@ from homeassistant.core import HomeAssistant
 from custom_components.bermuda.const import (
     ADDR_TYPE_IBEACON,
     ADDR_TYPE_PRIVATE_BLE_DEVICE,
+    CONF_CONSOLIDATED_SCANNER_DISTANCES,
     CONF_RECORDER_FRIENDLY,
 )
 from custom_components.bermuda.sensor import (
@@ -29,6 +30,7 @@ from custom_components.bermuda.sensor import (
     BermudaSensorRange,
     BermudaSensorRssi,
     BermudaSensorScanner,
+    BermudaSensorScannerDistances,
     BermudaSensorScannerRange,
     BermudaSensorScannerRangeRaw,
     BermudaTotalDeviceCount,
@@ -871,6 +873,91 @@ class TestBermudaSensorScannerRangeRaw:
         assert sensor.native_value is None
 
 
+class TestBermudaSensorScannerDistances:
+    """Tests for BermudaSensorScannerDistances class."""
+
+    def _make_advert(self, name: str, distance: float | None, distance_raw: float | None) -> MagicMock:
+        advert = MagicMock()
+        advert.name = name
+        advert.area_id = f"{name.lower()}_area"
+        advert.area_name = f"{name} Area"
+        advert.rssi_distance = distance
+        advert.rssi_distance_raw = distance_raw
+        return advert
+
+    def _create_sensor(self, adverts: dict[str, MagicMock]) -> BermudaSensorScannerDistances:
+        """Create a BermudaSensorScannerDistances instance for testing."""
+        mock_coordinator = MagicMock()
+        mock_coordinator.last_update_success = True
+        mock_coordinator.scanner_list = ["scanner:1", "scanner:2", "scanner:3"]
+
+        mock_device = MagicMock()
+        mock_device.name = "Test Device"
+        mock_device.unique_id = "test_unique_id"
+        mock_device.address = "aa:bb:cc:dd:ee:ff"
+        mock_device.get_scanner = MagicMock(side_effect=adverts.get)
+
+        sensor = object.__new__(BermudaSensorScannerDistances)
+        sensor.coordinator = mock_coordinator
+        sensor.address = "aa:bb:cc:dd:ee:ff"
+        sensor._device = mock_device
+        sensor._lastname = mock_device.name
+        return sensor
+
+    def test_unique_id(self) -> None:
+        """Test that unique_id is correctly formatted."""
+        sensor = self._create_sensor({})
+        assert sensor.unique_id == "test_unique_id_scanner_distances"
+
+    def test_is_enabled_diagnostic(self) -> None:
+        """The opt-in sensor is a diagnostic entity, enabled by default."""
+        sensor = self._create_sensor({})
+        assert sensor._attr_translation_key == "scanner_distances"
+        assert sensor._attr_entity_category == EntityCategory.DIAGNOSTIC
+        assert sensor.entity_registry_enabled_default is True
+
+    def test_attributes_are_never_recorded(self) -> None:
+        """The distance map is excluded from the recorder regardless of options."""
+        assert MATCH_ALL in BermudaSensorScannerDistances._unrecorded_attributes
+
+    def test_distance_map(self) -> None:
+        """Scanners with a distance are listed, others are skipped."""
+        sensor = self._create_sensor(
+            {
+                "scanner:1": self._make_advert("Kitchen", 2.34567, 2.98765),
+                "scanner:2": self._make_advert("Hall", None, 7.5),
+                "scanner:3": self._make_advert("Office", 5.0, None),
+            }
+        )
+
+        assert sensor.native_value == 2
+        assert sensor.extra_state_attributes == {
+            "scanners": {
+                "scanner:1": {
+                    "name": "Kitchen",
+                    "area_id": "kitchen_area",
+                    "area_name": "Kitchen Area",
+                    "distance": 2.346,
+                    "distance_raw": 2.988,
+                },
+                "scanner:3": {
+                    "name": "Office",
+                    "area_id": "office_area",
+                    "area_name": "Office Area",
+                    "distance": 5.0,
+                    "distance_raw": None,
+                },
+            }
+        }
+
+    def test_no_scanners_in_range(self) -> None:
+        """A device no scanner can see reports zero and an empty map."""
+        sensor = self._create_sensor({})
+
+        assert sensor.native_value == 0
+        assert sensor.extra_state_attributes == {"scanners": {}}
+
+
 class TestDeviceNewCallback:
     """Tests for the device_new callback in async_setup_entry."""
 
@@ -1114,6 +1201,65 @@ class TestDeviceNewCallback:
         # Should have scanner entities for the device
         assert any(isinstance(e, BermudaSensorScannerRange) for e in added_entities)
         assert any(isinstance(e, BermudaSensorScannerRangeRaw) for e in added_entities)
+        assert not any(isinstance(e, BermudaSensorScannerDistances) for e in added_entities)
+
+    @pytest.mark.asyncio
+    async def test_consolidated_mode_creates_one_sensor_per_device(self, hass: HomeAssistant) -> None:
+        """With consolidated scanner distances, each device gets one sensor instead of per-scanner ones."""
+        mock_device = MagicMock()
+        mock_device.name = "Test Device"
+        mock_device.unique_id = "test_unique_id"
+        mock_device.address = "aa:bb:cc:dd:ee:ff"
+        mock_device.address_type = "public"
+        mock_device.adverts = {}
+
+        scanners = []
+        for idx in range(3):
+            mock_scanner = MagicMock()
+            mock_scanner.is_remote_scanner = True
+            # No wifi mac yet would block per-scanner entities, but not the consolidated sensor
+            mock_scanner.address_wifi_mac = None
+            mock_scanner.address = f"11:22:33:44:55:6{idx}"
+            scanners.append(mock_scanner)
+
+        mock_coordinator = MagicMock()
+        mock_coordinator.hass = hass
+        mock_coordinator.last_update_success = True
+        mock_coordinator.devices = {"aa:bb:cc:dd:ee:ff": mock_device} | {s.address: s for s in scanners}
+        mock_coordinator.have_floors = False
+        mock_coordinator.scanner_list = [s.address for s in scanners]
+        mock_coordinator.get_scanners = scanners
+        mock_coordinator.check_for_duplicate_entities = MagicMock(return_value=None)
+        mock_coordinator.sensor_created = MagicMock()
+
+        mock_entry = MagicMock()
+        mock_entry.runtime_data = MagicMock()
+        mock_entry.runtime_data.coordinator = mock_coordinator
+        mock_entry.async_on_unload = MagicMock()
+        mock_entry.options = {CONF_CONSOLIDATED_SCANNER_DISTANCES: True}
+
+        added_entities: list = []
+        mock_add_devices = MagicMock(side_effect=lambda entities, update=False: added_entities.extend(entities))
+
+        with (
+            patch("custom_components.bermuda.sensor.async_dispatcher_connect") as mock_dispatcher,
+            patch("custom_components.bermuda.entity.ar.async_get") as mock_ar,
+            patch("custom_components.bermuda.entity.dr.async_get") as mock_dr,
+        ):
+            mock_ar.return_value = MagicMock()
+            mock_dr.return_value = MagicMock()
+
+            await async_setup_entry(hass, mock_entry, mock_add_devices)
+
+            device_new_callback = mock_dispatcher.call_args_list[0][0][2]
+            device_new_callback("aa:bb:cc:dd:ee:ff")
+            device_new_callback("aa:bb:cc:dd:ee:ff")
+            scanners_changed_callback = mock_dispatcher.call_args_list[1][0][2]
+            scanners_changed_callback()
+
+        distance_sensors = [e for e in added_entities if isinstance(e, BermudaSensorScannerDistances)]
+        assert len(distance_sensors) == 1
+        assert not any(isinstance(e, BermudaSensorScannerRange) for e in added_entities)
 
 
 class TestSensorIntegration:
@@ -1814,7 +1960,7 @@ class TestSensorCoverageExtension:
         mock_sensor_data.native_value = "Living Room"
 
         with patch(
-            "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass",
+            "custom_components.bermuda.entity.BermudaEntity.async_added_to_hass",
             new_callable=AsyncMock,
         ):
             sensor.async_get_last_sensor_data = AsyncMock(return_value=mock_sensor_data)
@@ -1835,7 +1981,7 @@ class TestSensorCoverageExtension:
         initial_native_value = getattr(sensor, "_attr_native_value", None)
 
         with patch(
-            "homeassistant.helpers.update_coordinator.CoordinatorEntity.async_added_to_hass",
+            "custom_components.bermuda.entity.BermudaEntity.async_added_to_hass",
             new_callable=AsyncMock,
         ):
             sensor.async_get_last_sensor_data = AsyncMock(return_value=None)
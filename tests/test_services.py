@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-
-from custom_components.bermuda.const import ADDR_TYPE_PRIVATE_BLE_DEVICE, CONF_DEVICES
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.bermuda.const import (
+    ADDR_TYPE_PRIVATE_BLE_DEVICE,
+    CONF_DEVICES,
+    TRAINING_ADVERT_WAIT_TIMEOUT,
+    TRAINING_MAX_TIME_SECONDS,
+    TRAINING_SAMPLE_COUNT,
+)
 from custom_components.bermuda.services import (
     DUMP_DEVICE_SOFT_LIMIT,
     BermudaServiceHandler,
@@ -31,6 +38,7 @@ class TestBermudaServiceHandler:
         mock_coordinator.pb_state_sources = pb_state_sources or {}
         mock_coordinator.count_active_devices = MagicMock(return_value=5)
         mock_coordinator.count_active_scanners = MagicMock(return_value=3)
+        mock_coordinator.area_selection.async_capture_diagnostics = AsyncMock(return_value=True)
 
         return BermudaServiceHandler(mock_coordinator)
 
@@ -271,6 +279,42 @@ class TestBermudaServiceHandler:
         assert "summary" in result
         assert result["summary"]["limited"] is True
 
+    @pytest.mark.asyncio
+    async def test_async_train_fleet(self) -> None:
+        """Test async_train_fleet trains all listed devices in one coordinator pass."""
+        handler = self._create_handler()
+        coordinator = handler.coordinator
+        coordinator.ar.async_get_area = MagicMock(return_value=MagicMock())
+        coordinator.async_train_fleet = AsyncMock(return_value={"aa:bb:cc:dd:ee:01": 60, "aa:bb:cc:dd:ee:02": 0})
+
+        mock_call = MagicMock()
+        mock_call.data = {"addresses": ["AA:BB:CC:DD:EE:01", "aa:bb:cc:dd:ee:02"], "area_id": "kitchen"}
+
+        result = await handler.async_train_fleet(mock_call)
+
+        coordinator.async_train_fleet.assert_awaited_once_with(
+            ["AA:BB:CC:DD:EE:01", "aa:bb:cc:dd:ee:02"],
+            "kitchen",
+            TRAINING_SAMPLE_COUNT,
+            TRAINING_MAX_TIME_SECONDS,
+            TRAINING_ADVERT_WAIT_TIMEOUT,
+        )
+        assert result["samples"] == {"aa:bb:cc:dd:ee:01": 60, "aa:bb:cc:dd:ee:02": 0}
+
+    @pytest.mark.asyncio
+    async def test_async_train_fleet_unknown_area(self) -> None:
+        """Test async_train_fleet rejects an area that does not exist."""
+        handler = self._create_handler()
+        handler.coordinator.ar.async_get_area = MagicMock(return_value=None)
+        handler.coordinator.async_train_fleet = AsyncMock()
+
+        mock_call = MagicMock()
+        mock_call.data = {"addresses": ["aa:bb:cc:dd:ee:01"], "area_id": "nowhere"}
+
+        with pytest.raises(ServiceValidationError):
+            await handler.async_train_fleet(mock_call)
+        handler.coordinator.async_train_fleet.assert_not_awaited()
+
 
 class TestServicesIntegration:
     """Integration tests for services module."""
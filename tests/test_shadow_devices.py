@@ -0,0 +1,87 @@
+"""Tests for the shadow admission tier for untracked private addresses."""
+
+from __future__ import annotations
+
+from custom_components.bermuda.const import SERVICE_UUID_FMDN
+from custom_components.bermuda.shadow_devices import (
+    ShadowDeviceTable,
+    carries_identity_payload,
+    is_shadow_candidate,
+)
+
+IBEACON_DATA = b"\x02\x15" + bytes(16) + b"\x00\x01\x00\x02\xc5"
+
+
+def test_is_shadow_candidate() -> None:
+    """Only resolvable private addresses are shadowed."""
+    assert is_shadow_candidate("4a:bb:cc:dd:ee:ff")
+    assert is_shadow_candidate("7f:bb:cc:dd:ee:ff")
+    assert not is_shadow_candidate("0c:bb:cc:dd:ee:ff")  # public / non-resolvable
+    assert not is_shadow_candidate("c4:bb:cc:dd:ee:ff")  # random static
+    assert not is_shadow_candidate("0123456789abcdef0123456789abcdef")  # IRK metadevice
+
+
+def test_carries_identity_payload() -> None:
+    """FMDN service data and iBeacon manufacturer data make an address interesting."""
+    assert carries_identity_payload({SERVICE_UUID_FMDN: b"\x40" + bytes(20)}, {})
+    assert carries_identity_payload({}, {0x004C: IBEACON_DATA})
+    assert not carries_identity_payload({}, {0x004C: b"\x10\x05\x01"})  # Apple nearby info
+    assert not carries_identity_payload({"0000fe9f-0000-1000-8000-00805f9b34fb": b"\x00"}, {0x00E0: b"\x01"})
+
+
+class TestShadowDeviceTable:
+    """Tests for ShadowDeviceTable."""
+
+    def test_record_keeps_last_sighting_in_seen_order(self) -> None:
+        """Re-sighting updates the record and moves it to the most recent end."""
+        table = ShadowDeviceTable(10)
+        table.record("aa", -80, 1.0, "scanner1")
+        table.record("bb", -70, 2.0, "scanner1")
+        table.record("aa", -60, 3.0, "scanner2")
+
+        assert [address for address, _record in table.items()] == ["bb", "aa"]
+        assert list(table) == ["bb", "aa"]
+        record = table.get("aa")
+        assert record is not None
+        assert (record.rssi, record.stamp, record.scanner) == (-60, 3.0, "scanner2")
+        assert table.admitted == 2
+
+    def test_capacity_evicts_least_recently_seen(self) -> None:
+        """The table never grows beyond max_size."""
+        table = ShadowDeviceTable(2)
+        table.record("aa", -80, 1.0, "s")
+        table.record("bb", -80, 2.0, "s")
+        table.record("aa", -80, 3.0, "s")
+        table.record("cc", -80, 4.0, "s")
+
+        assert len(table) == 2
+        assert "bb" not in table
+        assert table.evicted == 1
+
+    def test_prune_and_count_seen_since(self) -> None:
+        """Pruning drops stale records; counting only visits fresh ones."""
+        table = ShadowDeviceTable(10)
+        for stamp, address in enumerate(("aa", "bb", "cc", "dd")):
+            table.record(address, -80, float(stamp), "s")
+
+        assert table.count_seen_since(1.0) == 2
+        assert table.prune(2.0) == 2
+        assert [address for address, _record in table.items()] == ["cc", "dd"]
+        assert table.expired == 2
+
+    def test_promote_forgets_address(self) -> None:
+        """Promoted addresses leave the table and are counted once."""
+        table = ShadowDeviceTable(10)
+        table.record("aa", -80, 1.0, "s")
+
+        assert table.promote("aa") is not None
+        assert table.promote("aa") is None
+        assert "aa" not in table
+        assert table.to_dict() == {
+            "size": 0,
+            "max_size": 10,
+            "admitted": 1,
+            "promoted": 1,
+            "expired": 0,
+            "evicted": 0,
+        }
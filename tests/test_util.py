@@ -134,6 +134,61 @@ def test_mac_hex_dotted_format() -> None:
     assert result == "aabbccddeeff"
 
 
+class TestAddressRegistry:
+    """Tests for the address interning registry."""
+
+    def test_spellings_share_one_interned_canonical(self) -> None:
+        """Every spelling of an address maps to the same canonical object."""
+        registry = util.AddressRegistry(100)
+        upper = registry.lookup("AA:BB:CC:DD:EE:FF")
+        dashed = registry.lookup("aa-bb-cc-dd-ee-ff")
+        canonical = registry.lookup("aa:bb:cc:dd:ee:ff")
+        other = registry.lookup("12345678-1234-5678-9ABC-DEF012345678_suffix")
+
+        assert upper.canonical == "aa:bb:cc:dd:ee:ff"
+        assert upper.canonical is dashed.canonical is canonical.canonical
+        assert upper.is_mac
+        assert other == ("12345678123456789abcdef012345678_suffix", False)
+        assert registry.lookup("AA:BB:CC:DD:EE:FF") is upper
+        assert registry.to_dict()["misses"] == 3
+        assert len(registry) == 2
+
+    def test_retain_releases_all_spellings(self) -> None:
+        """A released address and its spellings are parsed afresh next time."""
+        registry = util.AddressRegistry(100)
+        first = registry.lookup("AA:BB:CC:DD:EE:01")
+        registry.lookup("aa:bb:cc:dd:ee:02")
+
+        assert registry.retain(lambda address: address != first.canonical) == 1
+        assert len(registry) == 1
+        assert registry.to_dict()["spellings"] == 1
+        assert registry.get("AA:BB:CC:DD:EE:01") is None
+        assert registry.lookup("AA:BB:CC:DD:EE:01") == first
+
+    def test_max_size_evicts_oldest_spellings(self) -> None:
+        """The spelling map never grows beyond max_size."""
+        registry = util.AddressRegistry(2)
+        registry.lookup("AA:BB:CC:DD:EE:01")  # raw + canonical spelling
+
+        registry.lookup("aa:bb:cc:dd:ee:02")
+
+        assert registry.to_dict()["spellings"] == 2
+        assert registry.evicted == 1
+        assert util.normalize_address("AA:BB:CC:DD:EE:01") == "aa:bb:cc:dd:ee:01"
+
+    def test_hit_rate_from_reported_lookups(self) -> None:
+        """The hit rate is derived from caller-reported lookups and the registry's misses."""
+        registry = util.AddressRegistry(100)
+        assert registry.to_dict()["hit_rate"] is None
+
+        for _ in range(4):
+            registry.lookup("aa:bb:cc:dd:ee:01")
+        registry.lookups += 4
+
+        assert registry.hit_rate() == 0.75
+        assert registry.to_dict()["hit_rate"] == 0.75
+
+
 class TestRssiToMetresEdgeCases:
     """Additional edge case tests for rssi_to_metres."""
 